@@ -0,0 +1,7 @@
+"""
+Performance benchmark scripts.
+
+These scripts compare the timing of optional rendering optimizations. They
+are run by hand, since timings on shared CI runners are too noisy to assert
+on in the test suite.
+"""
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark graph generation with and without the figure pool.
+
+Renders the same graph repeatedly with freshly created figures and with
+figures reused from the figure pool, and reports the median time per graph.
+
+Usage Examples:
+    Compare with the default number of graphs:
+        uv run python scripts/benchmarks/figure_pool.py
+
+    Render more graphs per run:
+        uv run python scripts/benchmarks/figure_pool.py --graphs 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import override
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.tgraph_bot.graphs.graph_modules import BaseGraph
+from tests.utils.test_helpers import create_test_config_custom
+
+
+class BenchmarkGraph(BaseGraph):
+    """Line graph with a few series and a legend."""
+
+    @override
+    def generate(self, data: Mapping[str, object]) -> str:
+        """Draw the graph and save it to a temporary file."""
+        try:
+            _, axes = self.setup_figure()
+            for series in range(3):
+                x_data = list(range(100 * (series + 1)))
+                _ = axes.plot(  # pyright: ignore[reportUnknownMemberType]
+                    x_data, [x * (series + 1) for x in x_data], label=f"Series {series}"
+                )
+            _ = axes.set_title(self.get_title())  # pyright: ignore[reportUnknownMemberType]
+            _ = axes.legend()  # pyright: ignore[reportUnknownMemberType]
+
+            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
+                output_path = tmp.name
+            return self.save_figure(output_path=output_path)
+        finally:
+            self.cleanup()
+
+    @override
+    def get_title(self) -> str:
+        """Get the title of the benchmark graph."""
+        return "Figure Pool Benchmark"
+
+
+def benchmark(figure_pool: bool, graphs: int) -> float:
+    """
+    Render graphs and return the median time per graph.
+
+    Args:
+        figure_pool: Whether graphs reuse figures from the figure pool
+        graphs: Number of graphs to render
+
+    Returns:
+        Median seconds per graph, without the first graph
+    """
+    config = create_test_config_custom(
+        graphs_overrides={"rendering": {"figure_pool": figure_pool}}
+    )
+    times: list[float] = []
+    for _ in range(graphs + 1):
+        graph = BenchmarkGraph(config=config)
+        start_time = time.perf_counter()
+        output_path = graph.generate({})
+        times.append(time.perf_counter() - start_time)
+        Path(output_path).unlink(missing_ok=True)
+    # The first graph creates the pooled figure
+    return statistics.median(times[1:])
+
+
+def main() -> int:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    _ = parser.add_argument(
+        "--graphs", type=int, default=20, help="Graphs rendered per run"
+    )
+    _ = parser.add_argument("--runs", type=int, default=3, help="Runs per mode")
+    args = parser.parse_args()
+    graphs = int(args.graphs)  # pyright: ignore[reportAny]
+    runs = int(args.runs)  # pyright: ignore[reportAny]
+
+    _ = benchmark(figure_pool=False, graphs=2)  # warm up matplotlib
+    for run in range(1, runs + 1):
+        created_time = benchmark(figure_pool=False, graphs=graphs)
+        pooled_time = benchmark(figure_pool=True, graphs=graphs)
+        print(
+            f"Run {run}: {created_time * 1000:.1f}ms per created figure, "
+            + f"{pooled_time * 1000:.1f}ms per pooled figure "
+            + f"({(1 - pooled_time / created_time) * 100:+.1f}% saved)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
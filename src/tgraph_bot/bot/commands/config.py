@@ -85,6 +85,7 @@ class ConfigCog(BaseCommandCog):
             "services.tautulli.url",
             "services.discord.token",
             "services.discord.channel_id",
+            "services.discord.edit_graph_messages",
             # Automation configuration
             "automation.scheduling.update_days",
             "automation.scheduling.fixed_update_time",
@@ -93,6 +94,12 @@ class ConfigCog(BaseCommandCog):
             "data_collection.time_ranges.days",
             "data_collection.time_ranges.months",
             "data_collection.privacy.censor_usernames",
+            "data_collection.history_cache.enabled",
+            "data_collection.history_cache.local_user_stats",
+            "data_collection.history_cache.full_sync_interval_days",
+            "data_collection.history_fetch.page_size",
+            "data_collection.history_fetch.max_concurrent_pages",
+            "data_collection.metadata_cache.enabled",
             # System configuration
             "system.localization.language",
             # Graph features configuration
@@ -129,6 +136,16 @@ class ConfigCog(BaseCommandCog):
             "graphs.appearance.palettes.top_10_platforms",
             "graphs.appearance.palettes.top_10_users",
             "graphs.appearance.palettes.play_count_by_month",
+            # Graph rendering configuration
+            "graphs.rendering.workers",
+            "graphs.rendering.cache_enabled",
+            "graphs.rendering.figure_pool",
+            "graphs.rendering.image_format",
+            "graphs.rendering.tight_bbox",
+            "graphs.rendering.png_compress_level",
+            "graphs.rendering.png_quantize",
+            "graphs.rendering.in_memory",
+            "graphs.rendering.archive_graphs",
         ]
 
     async def _config_key_autocomplete(
@@ -10,6 +10,8 @@ Command Design Specifications:
 - Parameters: email (required) - User's Plex account email address
 - Permissions: Available to all users (no restrictions)
 - Cooldowns: 5 minutes per-user, 60 seconds global
+- Queueing: Requests run on a bounded number of workers; repeated requests
+  for the same email share one generation
 - Response: Ephemeral acknowledgment, then private DM with graphs
 - Error Handling: Comprehensive with user-friendly messages
 - Privacy: Email-based user identification for Plex statistics
@@ -17,14 +19,19 @@ Command Design Specifications:
 """
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from ... import i18n
-from ...graphs.user_graph_manager import UserGraphManager
+from ...graphs.user_graph_manager import (
+    UserGraphImages,
+    UserGraphManager,
+    send_user_graph_images_dm,
+)
+from ...graphs.user_stats_queue import UserStatsQueue, UserStatsTicket
 from ...utils.discord.base_command_cog import BaseCommandCog, BaseCooldownConfig
 from ...utils.discord.command_utils import (
     create_error_embed,
@@ -52,6 +59,7 @@ class MyStatsCog(BaseCommandCog):
     - Configurable cooldowns for rate limiting
     - Comprehensive error handling and user feedback
     - Non-blocking graph generation using async threading
+    - Bounded, coalescing request queue (see UserStatsQueue)
     """
 
     def __init__(self, bot: commands.Bot) -> None:
@@ -75,6 +83,41 @@ class MyStatsCog(BaseCommandCog):
             self.tgraph_bot.config_manager
         )
 
+        # Queue of personal graph generations shared by all requests
+        self.stats_queue: UserStatsQueue = UserStatsQueue(self._render_user_graphs)
+
+    @override
+    async def cog_unload(self) -> None:
+        """Drop the personal graphs kept for repeated requests."""
+        self.stats_queue.clear()
+
+    async def _render_user_graphs(self, email: str) -> UserGraphImages:
+        """
+        Generate the personal graphs of an email for the request queue.
+
+        Args:
+            email: The user's Plex email address
+
+        Returns:
+            The generated graph images
+        """
+        async with UserGraphManager(
+            self.tgraph_bot.config_manager,
+            tautulli_client=self.tgraph_bot.tautulli_client,
+        ) as user_graph_manager:
+            return await user_graph_manager.render_user_graph_images(email)
+
+    @staticmethod
+    def _queue_status(ticket: UserStatsTicket) -> str:
+        """Describe where a request stands in the queue."""
+        if ticket.cached:
+            return i18n.translate("Your recent statistics will be sent again")
+        if ticket.position > 0:
+            return i18n.translate(
+                "Position {position} in the queue", position=ticket.position
+            )
+        return i18n.translate("Processing now")
+
     @app_commands.command(
         name="my_stats",
         description=i18n.translate("Get your personal Plex statistics via DM"),
@@ -118,6 +161,9 @@ class MyStatsCog(BaseCommandCog):
                     ),
                 )
 
+            # Queue the request; requests for the same email share one job
+            ticket = self.stats_queue.submit(email)
+
             # Acknowledge the command with informative message
             embed = create_info_embed(
                 title=i18n.translate("Personal Statistics Request"),
@@ -136,78 +182,84 @@ class MyStatsCog(BaseCommandCog):
                 value=i18n.translate("1-3 minutes"),
                 inline=True,
             )
+            _ = embed.add_field(
+                name=i18n.translate("Queue Status"),
+                value=self._queue_status(ticket),
+                inline=False,
+            )
 
             await self.send_ephemeral_response(interaction, embed=embed)
 
             # Update cooldowns after successful acknowledgment
             self.update_cooldowns(interaction)
 
-            # Generate personal graphs using user_graph_manager
-            async with UserGraphManager(
-                self.tgraph_bot.config_manager
-            ) as user_graph_manager:
-                result_stats = await user_graph_manager.process_user_stats_request(
-                    user_id=interaction.user.id, user_email=email, bot=self.bot
+            try:
+                graph_images = await ticket.result()
+            except Exception:
+                logger.exception("Error generating personal graphs")
+                graph_images = None
+
+            sent = False
+            if graph_images is not None and graph_images.graph_files:
+                sent = await send_user_graph_images_dm(
+                    interaction.user.id, graph_images, self.bot
+                )
+
+            if graph_images is not None and sent:
+                # Success - graphs were generated and sent
+                success_embed = create_success_embed(
+                    title=i18n.translate("Personal Statistics Complete"),
+                    description=i18n.translate(
+                        "Your personal Plex statistics have been generated and sent via DM!"
+                    ),
+                )
+
+                _ = success_embed.add_field(
+                    name=i18n.translate("Graphs Generated"),
+                    value=i18n.translate(
+                        "{count} personal graphs",
+                        count=len(graph_images.graph_files),
+                    ),
+                    inline=True,
+                )
+                _ = success_embed.add_field(
+                    name=i18n.translate("Processing Time"),
+                    value=i18n.translate(
+                        "{time:.1f} seconds", time=graph_images.processing_time
+                    ),
+                    inline=True,
+                )
+                _ = success_embed.add_field(
+                    name=i18n.translate("Check Your DMs"),
+                    value=i18n.translate("Your graphs have been sent privately"),
+                    inline=False,
+                )
+
+                await self.send_ephemeral_response(interaction, embed=success_embed)
+            else:
+                # Error occurred during processing
+                error_embed = create_error_embed(
+                    title=i18n.translate("Statistics Generation Failed"),
+                    description=i18n.translate(
+                        "Unable to generate your personal statistics."
+                    ),
+                )
+                _ = error_embed.add_field(
+                    name=i18n.translate("Possible Causes"),
+                    value=i18n.translate(
+                        "• Email not found in Plex server\n• Insufficient data for graphs\n• Temporary server issue"
+                    ),
+                    inline=False,
+                )
+                _ = error_embed.add_field(
+                    name=i18n.translate("Suggested Actions"),
+                    value=i18n.translate(
+                        "• Verify your email is correct\n• Ensure you have Plex activity\n• Try again in a few minutes"
+                    ),
+                    inline=False,
                 )
 
-                if result_stats and result_stats.get("success", False):
-                    # Success - graphs were generated and sent
-                    success_embed = create_success_embed(
-                        title=i18n.translate("Personal Statistics Complete"),
-                        description=i18n.translate(
-                            "Your personal Plex statistics have been generated and sent via DM!"
-                        ),
-                    )
-
-                    # Add statistics from the result
-                    graphs_generated = result_stats.get("graphs_generated", 0)
-                    processing_time = result_stats.get("processing_time", 0)
-
-                    _ = success_embed.add_field(
-                        name=i18n.translate("Graphs Generated"),
-                        value=i18n.translate(
-                            "{count} personal graphs", count=graphs_generated
-                        ),
-                        inline=True,
-                    )
-                    _ = success_embed.add_field(
-                        name=i18n.translate("Processing Time"),
-                        value=i18n.translate(
-                            "{time:.1f} seconds", time=processing_time
-                        ),
-                        inline=True,
-                    )
-                    _ = success_embed.add_field(
-                        name=i18n.translate("Check Your DMs"),
-                        value=i18n.translate("Your graphs have been sent privately"),
-                        inline=False,
-                    )
-
-                    await self.send_ephemeral_response(interaction, embed=success_embed)
-                else:
-                    # Error occurred during processing
-                    error_embed = create_error_embed(
-                        title=i18n.translate("Statistics Generation Failed"),
-                        description=i18n.translate(
-                            "Unable to generate your personal statistics."
-                        ),
-                    )
-                    _ = error_embed.add_field(
-                        name=i18n.translate("Possible Causes"),
-                        value=i18n.translate(
-                            "• Email not found in Plex server\n• Insufficient data for graphs\n• Temporary server issue"
-                        ),
-                        inline=False,
-                    )
-                    _ = error_embed.add_field(
-                        name=i18n.translate("Suggested Actions"),
-                        value=i18n.translate(
-                            "• Verify your email is correct\n• Ensure you have Plex activity\n• Try again in a few minutes"
-                        ),
-                        inline=False,
-                    )
-
-                    await self.send_ephemeral_response(interaction, embed=error_embed)
+                await self.send_ephemeral_response(interaction, embed=error_embed)
 
         except Exception as e:
             # Use base class error handling with additional context
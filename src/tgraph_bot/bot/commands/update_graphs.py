@@ -17,9 +17,7 @@ Command Design Specifications:
 """
 
 import logging
-from pathlib import Path
 from typing import TYPE_CHECKING
-import asyncio
 
 import discord
 from discord import app_commands
@@ -27,6 +25,7 @@ from discord.ext import commands
 
 from ... import i18n
 from ...graphs.graph_manager import GraphManager
+from ..scheduling.persistence import PostedMessageStore
 from ...utils.discord.base_command_cog import BaseCommandCog, BaseCooldownConfig
 from ...utils.discord.command_utils import (
     create_error_embed,
@@ -35,10 +34,10 @@ from ...utils.discord.command_utils import (
     create_cooldown_embed,
 )
 from ...utils.core.config_utils import ConfigurationHelper
-from ...utils.discord.discord_file_utils import (
-    validate_file_for_discord,
-    create_discord_file_safe,
-    create_graph_specific_embed,
+from ...utils.discord.graph_posting import GraphPoster
+from ...utils.discord.message_cleanup import (
+    cleanup_bot_messages,
+    track_posted_graphs,
 )
 from ...utils.core.exceptions import APIError, NetworkError
 from ...utils.core.error_handler import error_handler
@@ -147,7 +146,10 @@ class UpdateGraphsCog(BaseCommandCog):
             await self._cleanup_bot_messages(target_channel)
 
             # Step 2: Generate graphs using GraphManager
-            async with GraphManager(self.tgraph_bot.config_manager) as graph_manager:
+            async with GraphManager(
+                self.tgraph_bot.config_manager,
+                tautulli_client=self.tgraph_bot.tautulli_client,
+            ) as graph_manager:
                 graph_files = await graph_manager.generate_all_graphs(
                     max_retries=3,
                     timeout_seconds=300.0,
@@ -163,7 +165,7 @@ class UpdateGraphsCog(BaseCommandCog):
                     await self.send_ephemeral_response(interaction, embed=warning_embed)
                     return
 
-                # Step 3: Post graphs to configured channel (now posts individual messages)
+                # Step 3: Post graphs to configured channel
                 success_count = await self._post_graphs_to_channel(
                     target_channel, graph_files
                 )
@@ -185,9 +187,7 @@ class UpdateGraphsCog(BaseCommandCog):
                     )
                     _ = success_embed.add_field(
                         name=i18n.translate("Posted Successfully"),
-                        value=i18n.translate(
-                            "{count} individual messages", count=success_count
-                        ),
+                        value=i18n.translate("{count} files", count=success_count),
                         inline=True,
                     )
                 else:
@@ -230,8 +230,9 @@ class UpdateGraphsCog(BaseCommandCog):
         """
         Clean up previous messages posted by the bot in the specified channel.
 
-        This method removes all messages that were posted by this bot instance,
-        implementing the same cleanup logic used during bot startup and automated updates.
+        This method deletes the graph messages tracked for the channel (see
+        cleanup_bot_messages), implementing the same cleanup logic used
+        during bot startup and automated updates.
 
         Args:
             channel: The Discord text channel to clean up
@@ -239,55 +240,21 @@ class UpdateGraphsCog(BaseCommandCog):
         logger.info(f"Starting message cleanup in channel: {channel.name}")
 
         try:
-            # Check bot permissions
-            if not channel.permissions_for(channel.guild.me).manage_messages:
-                logger.warning(
-                    f"Bot lacks 'Manage Messages' permission in {channel.name}"
-                )
-                logger.info("Attempting to delete only bot's own messages...")
-
-            deleted_count = 0
-            error_count = 0
-
-            # Fetch messages in batches and delete bot's own messages
-            async for message in channel.history(limit=None):
-                # Only delete messages from this bot
-                if self.bot.user and message.author.id == self.bot.user.id:
-                    try:
-                        await message.delete()
-                        deleted_count += 1
-
-                        # Rate limit protection - Discord allows 5 deletes per second
-                        if deleted_count % 5 == 0:
-                            await asyncio.sleep(1.0)
-
-                    except discord.Forbidden:
-                        logger.warning(
-                            f"Cannot delete message {message.id} - insufficient permissions"
-                        )
-                        error_count += 1
-                    except discord.NotFound:
-                        # Message already deleted, continue
-                        pass
-                    except discord.HTTPException as e:
-                        logger.error(f"HTTP error deleting message {message.id}: {e}")
-                        error_count += 1
-
-                        # If we hit rate limits, wait longer
-                        if e.status == 429:
-                            retry_after = getattr(e, "retry_after", 5.0)
-                            logger.info(
-                                f"Rate limited, waiting {retry_after} seconds..."
-                            )
-                            await asyncio.sleep(retry_after)
-
-            logger.info(
-                f"Message cleanup completed: {deleted_count} messages deleted, {error_count} errors"
+            edit_graph_messages = (
+                self.get_current_config().services.discord.edit_graph_messages
             )
+        except RuntimeError:
+            # No configuration loaded
+            edit_graph_messages = False
 
-            if error_count > 0:
-                logger.warning(f"Encountered {error_count} errors during cleanup")
-
+        try:
+            bot_user_id = self.bot.user.id if self.bot.user else None
+            _ = await cleanup_bot_messages(
+                channel,
+                bot_user_id,
+                PostedMessageStore(),
+                keep_graph_messages=edit_graph_messages,
+            )
         except Exception as e:
             logger.error(
                 f"Error during message cleanup in {channel.name}: {e}", exc_info=True
@@ -300,7 +267,10 @@ class UpdateGraphsCog(BaseCommandCog):
         self, channel: discord.TextChannel, graph_files: list[str]
     ) -> int:
         """
-        Post generated graph files to a Discord channel as individual messages with specific embeds.
+        Post generated graph files to a Discord channel with graph-specific embeds.
+
+        Graphs are packed into as few messages as Discord allows (see
+        GraphPoster).
 
         Args:
             channel: Discord channel to post to
@@ -310,112 +280,34 @@ class UpdateGraphsCog(BaseCommandCog):
             Number of files successfully posted
 
         Raises:
-            APIError: If Discord API fails
+            APIError: If Discord rejected every graph
             NetworkError: If network issues occur
         """
         if not graph_files:
             logger.warning("No graph files provided for posting")
             return 0
 
-        success_count = 0
-
-        # Get config values and actual next update time from scheduler
         try:
             config = self.get_current_config()
-            update_days = config.automation.scheduling.update_days
-            fixed_update_time = config.automation.scheduling.fixed_update_time
-            timestamp_format = config.services.discord.timestamp_format
         except Exception:
-            # If we can't get config, just use None values
-            update_days = None
-            fixed_update_time = None
-            timestamp_format = "F"
+            # Without a config the graphs are posted without scheduling info
+            config = None
 
         # Get the actual scheduled next update time from the update tracker
         # This prevents race conditions and ensures consistency with scheduler state
         next_update_time = self.tgraph_bot.update_tracker.get_next_update_time()
 
+        store = PostedMessageStore()
+        edit_in_place = (
+            config is not None and config.services.discord.edit_graph_messages
+        )
         try:
-            for graph_file in graph_files:
-                try:
-                    # Validate the file first
-                    validation = validate_file_for_discord(
-                        graph_file, use_nitro_limits=False
-                    )
-                    if not validation.valid:
-                        logger.error(
-                            f"File validation failed for {graph_file}: {validation.error_message}"
-                        )
-                        continue
-
-                    # Create Discord file object
-                    discord_file = create_discord_file_safe(graph_file)
-                    if not discord_file:
-                        logger.error(
-                            f"Failed to create Discord file object for {graph_file}"
-                        )
-                        continue
-
-                    # Create graph-specific embed with actual scheduled next update time
-                    embed = create_graph_specific_embed(
-                        graph_file,
-                        update_days,
-                        fixed_update_time,
-                        next_update_time,
-                        timestamp_format,
-                    )
-
-                    # Post individual message with graph and its specific embed
-                    _ = await channel.send(file=discord_file, embed=embed)
-                    success_count += 1
-
-                    logger.info(f"Successfully posted graph: {Path(graph_file).name}")
-
-                except discord.Forbidden as e:
-                    error_msg = (
-                        f"Permission denied while posting graph {graph_file}: {e}"
-                    )
-                    logger.error(error_msg)
-                    raise APIError(
-                        error_msg,
-                        user_message=i18n.translate(
-                            "Bot lacks permission to post in the configured channel."
-                        ),
-                    ) from e
-
-                except discord.HTTPException as e:
-                    error_msg = (
-                        f"Discord API error while posting graph {graph_file}: {e}"
-                    )
-                    logger.error(error_msg)
-                    if "rate limit" in str(e).lower():
-                        raise APIError(
-                            error_msg,
-                            user_message=i18n.translate(
-                                "Discord rate limit reached. Please try again later."
-                            ),
-                        ) from e
-                    else:
-                        raise APIError(
-                            error_msg,
-                            user_message=i18n.translate(
-                                "Discord API error occurred while posting graphs."
-                            ),
-                        ) from e
-
-                except Exception as e:
-                    logger.error(f"Unexpected error posting graph {graph_file}: {e}")
-                    # Continue with other graphs even if one fails
-                    continue
-
-            logger.info(
-                f"Successfully posted {success_count}/{len(graph_files)} graphs as individual messages"
+            report = await GraphPoster.from_config(
+                channel, config, next_update_time
+            ).post(
+                graph_files,
+                store.get_graph_messages(channel.id) if edit_in_place else None,
             )
-            return success_count
-
-        except (APIError, NetworkError):
-            # Re-raise our custom exceptions
-            raise
         except Exception as e:
             raise NetworkError(
                 f"Unexpected error while posting graphs: {e}",
@@ -424,6 +316,36 @@ class UpdateGraphsCog(BaseCommandCog):
                 ),
             ) from e
 
+        # Track the messages so the next update can delete or edit them by ID
+        await track_posted_graphs(channel, report, store, edited_in_place=edit_in_place)
+
+        # Graphs that were posted are not retried; Discord errors are only
+        # raised when nothing could be posted
+        discord_errors = [
+            failure.error
+            for failure in report.failures
+            if isinstance(failure.error, discord.HTTPException)
+        ]
+        if report.posted_count == 0 and discord_errors:
+            error = discord_errors[0]
+            error_msg = f"Discord API error while posting graphs: {error}"
+            logger.error(error_msg)
+            if isinstance(error, discord.Forbidden):
+                user_message = i18n.translate(
+                    "Bot lacks permission to post in the configured channel."
+                )
+            elif "rate limit" in str(error).lower():
+                user_message = i18n.translate(
+                    "Discord rate limit reached. Please try again later."
+                )
+            else:
+                user_message = i18n.translate(
+                    "Discord API error occurred while posting graphs."
+                )
+            raise APIError(error_msg, user_message=user_message) from error
+
+        return report.posted_count
+
 
 async def setup(bot: commands.Bot) -> None:
     """
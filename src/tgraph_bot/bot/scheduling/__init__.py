@@ -19,7 +19,7 @@ from .types import (
 from .error_handling import ErrorClassifier, CircuitBreaker
 from .task_manager import BackgroundTaskManager
 from .schedule import UpdateSchedule
-from .persistence import StateManager
+from .persistence import PostedMessageStore, StateManager
 from .recovery import RecoveryManager
 
 __all__ = [
@@ -40,5 +40,6 @@ __all__ = [
     "BackgroundTaskManager",
     "UpdateSchedule",
     "StateManager",
+    "PostedMessageStore",
     "RecoveryManager",
 ]
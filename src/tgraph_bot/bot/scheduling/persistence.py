@@ -2,13 +2,17 @@
 State persistence management for the scheduling system.
 
 This module handles saving and loading scheduler state to/from disk,
-including atomic operations and error recovery.
+including atomic operations and error recovery. Next to the scheduler state
+it keeps the IDs of the graph messages the bot posted, so the next update
+can delete exactly those messages instead of scanning the channel history.
 """
 
 import json
 import logging
 import tempfile
+from collections.abc import Iterable, Mapping
 from pathlib import Path
+from typing import cast
 
 from .types import ScheduleState, SchedulingConfig, PersistentScheduleData
 from ...utils.cli.paths import get_path_config
@@ -17,6 +21,40 @@ from ...utils.time import get_system_now
 logger = logging.getLogger(__name__)
 
 
+def _write_json_atomic(path: Path, data: Mapping[str, object]) -> None:
+    """
+    Write JSON data to a file, replacing it atomically.
+
+    The data is written to a temporary file in the same directory, which
+    then replaces the target file, so readers never see a partial file.
+
+    Args:
+        path: File to write
+        data: JSON-serializable data
+    """
+    temp_file = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as temp_file:
+            json.dump(data, temp_file, indent=2, ensure_ascii=False)
+            temp_file.flush()
+            temp_path = Path(temp_file.name)
+
+        # Atomic move
+        _ = temp_path.replace(path)
+    except BaseException:
+        # Clean up temporary file if it exists
+        if temp_file and Path(temp_file.name).exists():
+            Path(temp_file.name).unlink(missing_ok=True)
+        raise
+
+
 class StateManager:
     """Manages persistent state storage and recovery for the scheduler."""
 
@@ -64,34 +102,10 @@ class StateManager:
                 state=state.to_dict(), config=config_dict
             )
 
-            # Atomic save using temporary file
-            temp_file = None
             try:
-                with tempfile.NamedTemporaryFile(
-                    mode="w",
-                    encoding="utf-8",
-                    dir=self.state_file_path.parent,
-                    prefix=f".{self.state_file_path.name}.",
-                    suffix=".tmp",
-                    delete=False,
-                ) as temp_file:
-                    json.dump(
-                        persistent_data.to_dict(),
-                        temp_file,
-                        indent=2,
-                        ensure_ascii=False,
-                    )
-                    temp_file.flush()
-                    temp_path = Path(temp_file.name)
-
-                # Atomic move
-                _ = temp_path.replace(self.state_file_path)
+                _write_json_atomic(self.state_file_path, persistent_data.to_dict())
                 logger.debug(f"State saved successfully to {self.state_file_path}")
-
             except Exception as e:
-                # Clean up temporary file if it exists
-                if temp_file and Path(temp_file.name).exists():
-                    Path(temp_file.name).unlink(missing_ok=True)
                 raise OSError(
                     f"Failed to save state to {self.state_file_path}: {e}"
                 ) from e
@@ -177,3 +191,149 @@ class StateManager:
     def state_exists(self) -> bool:
         """Check if a state file exists."""
         return self.state_file_path.exists()
+
+
+class PostedMessageStore:
+    """
+    Tracks the IDs of the graph messages the bot posted, per channel.
+
+    A channel without an entry has never been tracked (e.g. the bot posted
+    there before tracking was added), so its previous messages are unknown.
+    A channel with an empty entry is tracked and has nothing left to delete.
+    For editing graphs in place, the store also keeps the message each graph
+    type was last posted in.
+    """
+
+    def __init__(self, file_path: Path | None = None) -> None:
+        """
+        Initialize the posted message store.
+
+        Args:
+            file_path: Path to the store file, defaults to data/posted_messages.json
+        """
+        if file_path is None:
+            file_path = get_path_config().get_posted_messages_path()
+        self.file_path: Path = file_path
+
+    def get_message_ids(self, channel_id: int) -> list[int] | None:
+        """
+        Get the IDs of the messages posted in a channel.
+
+        Args:
+            channel_id: Discord channel ID
+
+        Returns:
+            Message IDs in the order they were posted, or None if the
+            channel is not tracked
+        """
+        channels, _ = self._load()
+        return channels.get(str(channel_id))
+
+    def set_message_ids(self, channel_id: int, message_ids: Iterable[int]) -> None:
+        """
+        Replace the tracked messages of a channel.
+
+        Args:
+            channel_id: Discord channel ID
+            message_ids: IDs of the bot's messages still in the channel
+        """
+        channels, graph_messages = self._load()
+        channels[str(channel_id)] = list(dict.fromkeys(message_ids))
+        self._save(channels, graph_messages)
+
+    def add_message_ids(self, channel_id: int, message_ids: Iterable[int]) -> None:
+        """
+        Track newly posted messages of a channel.
+
+        Args:
+            channel_id: Discord channel ID
+            message_ids: IDs of the posted messages
+        """
+        channels, graph_messages = self._load()
+        tracked = channels.get(str(channel_id), [])
+        channels[str(channel_id)] = list(dict.fromkeys([*tracked, *message_ids]))
+        self._save(channels, graph_messages)
+
+    def get_graph_messages(self, channel_id: int) -> dict[str, int]:
+        """
+        Get the message each graph type was last posted in.
+
+        Args:
+            channel_id: Discord channel ID
+
+        Returns:
+            Message ID keyed by graph type, empty if none are known
+        """
+        _, graph_messages = self._load()
+        return graph_messages.get(str(channel_id), {})
+
+    def set_graph_messages(
+        self, channel_id: int, graph_messages: Mapping[str, int]
+    ) -> None:
+        """
+        Replace the message each graph type was last posted in.
+
+        Args:
+            channel_id: Discord channel ID
+            graph_messages: Message ID keyed by graph type
+        """
+        channels, all_graph_messages = self._load()
+        all_graph_messages[str(channel_id)] = dict(graph_messages)
+        self._save(channels, all_graph_messages)
+
+    def _load(self) -> tuple[dict[str, list[int]], dict[str, dict[str, int]]]:
+        """Load the tracked messages and graph messages of all channels."""
+        if not self.file_path.exists():
+            return {}, {}
+
+        try:
+            with self.file_path.open("r", encoding="utf-8") as f:
+                data: dict[str, object] = json.load(f)  # pyright: ignore[reportAny]
+            channels = cast(dict[str, list[int]], data["channels"])
+            graph_messages = cast(
+                dict[str, dict[str, int]], data.get("graph_messages", {})
+            )
+            return (
+                {
+                    str(channel_id): [int(message_id) for message_id in message_ids]
+                    for channel_id, message_ids in channels.items()
+                },
+                {
+                    str(channel_id): {
+                        str(graph): int(message_id)
+                        for graph, message_id in messages.items()
+                    }
+                    for channel_id, messages in graph_messages.items()
+                },
+            )
+        except (
+            OSError,
+            json.JSONDecodeError,
+            AttributeError,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as e:
+            # Untracked channels fall back to scanning the channel history
+            logger.error(f"Failed to load posted messages, ignoring them: {e}")
+            return {}, {}
+
+    def _save(
+        self,
+        channels: dict[str, list[int]],
+        graph_messages: dict[str, dict[str, int]],
+    ) -> None:
+        """Save the tracked messages and graph messages of all channels."""
+        try:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_json_atomic(
+                self.file_path,
+                {
+                    "version": "1.0",
+                    "saved_at": get_system_now().isoformat(),
+                    "channels": channels,
+                    "graph_messages": graph_messages,
+                },
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Failed to save posted messages to {self.file_path}: {e}")
@@ -7,7 +7,6 @@ This module handles the bot's startup sequence which includes:
 3. Setting up scheduler state for proper timing
 """
 
-import asyncio
 import logging
 
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
@@ -15,15 +14,14 @@ from collections.abc import Sequence
 import discord
 
 from ..graphs.graph_manager import GraphManager
-from ..utils.discord.discord_file_utils import (
-    validate_file_for_discord,
-    create_discord_file_safe,
-    create_graph_specific_embed,
-)
+from ..utils.discord.graph_posting import GraphPoster
+from ..utils.discord.message_cleanup import cleanup_bot_messages, track_posted_graphs
+from .scheduling.persistence import PostedMessageStore
 from .permission_checker import PermissionChecker
 
 if TYPE_CHECKING:
     from ..config.manager import ConfigManager
+    from ..graphs.graph_modules.data.tautulli_client import TautulliClient
     from .update_tracker import UpdateTracker
 
 
@@ -33,6 +31,7 @@ class TGraphBotProtocol(Protocol):
 
     config_manager: "ConfigManager"
     update_tracker: "UpdateTracker"
+    tautulli_client: "TautulliClient | None"
 
     @property
     def guilds(self) -> Sequence[discord.Guild]: ...
@@ -148,50 +147,12 @@ class StartupSequence:
                 )
                 return
 
-            # Check bot permissions
-            if not channel.permissions_for(channel.guild.me).manage_messages:
-                logger.warning(
-                    f"Bot lacks 'Manage Messages' permission in {channel.name}"
-                )
-                logger.info("Attempting to delete only bot's own messages...")
-
-            deleted_count = 0
-            error_count = 0
-
-            # Fetch messages in batches
-            async for message in channel.history(limit=None):
-                # Only delete messages from this bot
-                if self.bot.user and message.author.id == self.bot.user.id:
-                    try:
-                        await message.delete()
-                        deleted_count += 1
-
-                        # Rate limit protection - Discord allows 5 deletes per second
-                        if deleted_count % 5 == 0:
-                            await asyncio.sleep(1.0)
-
-                    except discord.Forbidden:
-                        logger.warning(
-                            f"Cannot delete message {message.id} - insufficient permissions"
-                        )
-                        error_count += 1
-                    except discord.NotFound:
-                        # Message already deleted
-                        pass
-                    except discord.HTTPException as e:
-                        logger.error(f"HTTP error deleting message {message.id}: {e}")
-                        error_count += 1
-
-                        # If we hit rate limits, wait longer
-                        if e.status == 429:
-                            retry_after = getattr(e, "retry_after", 5.0)
-                            logger.info(
-                                f"Rate limited, waiting {retry_after} seconds..."
-                            )
-                            await asyncio.sleep(retry_after)
-
-            logger.info(
-                f"Message cleanup completed: {deleted_count} messages deleted, {error_count} errors"
+            bot_user_id = self.bot.user.id if self.bot.user else None
+            _ = await cleanup_bot_messages(
+                channel,
+                bot_user_id,
+                PostedMessageStore(),
+                keep_graph_messages=config.services.discord.edit_graph_messages,
             )
 
             # Document ephemeral message auto-deletion capabilities
@@ -224,7 +185,9 @@ class StartupSequence:
                 return
 
             # Generate all graphs
-            async with GraphManager(self.bot.config_manager) as graph_manager:
+            async with GraphManager(
+                self.bot.config_manager, tautulli_client=self.bot.tautulli_client
+            ) as graph_manager:
                 graph_files = await graph_manager.generate_all_graphs(
                     max_retries=3, timeout_seconds=300.0
                 )
@@ -259,67 +222,24 @@ class StartupSequence:
         Returns:
             Number of successfully posted graphs
         """
-        from pathlib import Path
-
-        success_count = 0
-
-        # Get config values for next update time calculation
         try:
             config = self.bot.config_manager.get_current_config()
-            update_days = config.automation.scheduling.update_days
-            fixed_update_time = config.automation.scheduling.fixed_update_time
-            timestamp_format = config.services.discord.timestamp_format
         except Exception:
-            # If we can't get config, just use None values
-            update_days = None
-            fixed_update_time = None
-            timestamp_format = "F"
-
-        for graph_file in graph_files:
-            try:
-                file_path = Path(graph_file)
-                if not file_path.exists():
-                    logger.warning(f"Graph file not found: {graph_file}")
-                    continue
-
-                # Validate the file
-                validation = validate_file_for_discord(
-                    graph_file, use_nitro_limits=False
-                )
-                if not validation.valid:
-                    logger.error(
-                        f"File validation failed for {graph_file}: {validation.error_message}"
-                    )
-                    continue
-
-                # Create Discord file object
-                discord_file = create_discord_file_safe(graph_file)
-                if not discord_file:
-                    logger.error(
-                        f"Failed to create Discord file object for {graph_file}"
-                    )
-                    continue
-
-                # Create graph-specific embed with scheduling info
-                embed = create_graph_specific_embed(
-                    graph_file,
-                    update_days,
-                    fixed_update_time,
-                    timestamp_format=timestamp_format,
-                )
-
-                # Post the graph
-                _ = await channel.send(file=discord_file, embed=embed)
-                success_count += 1
-                logger.debug(f"Posted graph: {file_path.name}")
-
-                # Small delay to avoid rate limits
-                await asyncio.sleep(0.5)
-
-            except Exception as e:
-                logger.error(f"Failed to post graph {graph_file}: {e}")
-
-        return success_count
+            # Without a config the graphs are posted without scheduling info
+            config = None
+
+        store = PostedMessageStore()
+        edit_in_place = (
+            config is not None and config.services.discord.edit_graph_messages
+        )
+        report = await GraphPoster.from_config(channel, config).post(
+            graph_files,
+            store.get_graph_messages(channel.id) if edit_in_place else None,
+        )
+
+        # Track the messages so the next update can delete or edit them by ID
+        await track_posted_graphs(channel, report, store, edited_in_place=edit_in_place)
+        return report.posted_count
 
     async def update_scheduler_state(self) -> None:
         """
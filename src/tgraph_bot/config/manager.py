@@ -318,6 +318,14 @@ services:
     api_key: "your_tautulli_api_key_here"
     # Tautulli base URL - Include the full URL with protocol and port
     url: "http://localhost:8181/api/v2"
+    # HTTP connection pool shared by all Tautulli requests
+    connection:
+      timeout: 30.0
+      max_connections: 10
+      max_keepalive_connections: 5
+      keepalive_expiry: 60.0
+      # Use HTTP/2 when the h2 package is installed
+      http2: true
 
   discord:
     # Discord bot token - Get this from Discord Developer Portal
@@ -328,6 +336,8 @@ services:
     timestamp_format: "R"
     # Time in seconds after which ephemeral Discord messages are automatically deleted
     ephemeral_message_delete_after: 30.0
+    # Edit the previous graph messages in place on updates instead of deleting them and posting new ones
+    edit_graph_messages: false
 
 # ============================================================================
 # Basic Bot Settings
@@ -359,6 +369,24 @@ data_collection:
     # Whether to censor usernames in graphs
     censor_usernames: true
 
+  history_cache:
+    # Whether to keep a local copy of Tautulli play history and only fetch new plays
+    enabled: true
+    # Whether /my_stats uses the local copy instead of fetching from Tautulli
+    local_user_stats: false
+    # Days between full refetches that drop plays deleted in Tautulli (0-365, 0 disables)
+    full_sync_interval_days: 7
+
+  history_fetch:
+    # Number of play history rows requested per page (100-10000)
+    page_size: 1000
+    # Number of pages fetched at the same time (1-16)
+    max_concurrent_pages: 4
+
+  metadata_cache:
+    # Whether to keep a local copy of media resolutions and only look up new media
+    enabled: true
+
 # ============================================================================
 # System Settings
 # ============================================================================
@@ -440,6 +468,26 @@ graphs:
       top_10_users: ""
       play_count_by_month: ""
 
+  rendering:
+    # Number of worker processes that render graphs in parallel (1-32)
+    workers: 1
+    # Whether to reuse graphs whose data and settings have not changed
+    cache_enabled: true
+    # Whether to reuse matplotlib figures across graphs of the same size
+    figure_pool: false
+    # Image format of graphs (png or webp)
+    image_format: png
+    # Whether to crop graphs to their content (false saves the fixed layout faster)
+    tight_bbox: true
+    # zlib compression level of PNG graphs (0-9)
+    png_compress_level: 6
+    # Whether to reduce PNG graphs to a 256 color palette
+    png_quantize: false
+    # Whether to keep rendered graphs in memory for uploading
+    in_memory: false
+    # Whether graphs rendered in memory are also written to disk in the background
+    archive_graphs: true
+
 # ============================================================================
 # Performance & Rate Limiting
 # ============================================================================
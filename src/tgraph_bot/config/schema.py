@@ -6,6 +6,31 @@ from typing import Annotated, Literal, ClassVar
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 
+class TautulliConnectionConfig(BaseModel):
+    """Tautulli HTTP connection pool configuration."""
+
+    timeout: Annotated[float, Field(gt=0, le=300)] = Field(
+        default=30.0,
+        description="Request timeout in seconds",
+    )
+    max_connections: Annotated[int, Field(ge=1, le=100)] = Field(
+        default=10,
+        description="Maximum number of concurrent connections to Tautulli",
+    )
+    max_keepalive_connections: Annotated[int, Field(ge=0, le=100)] = Field(
+        default=5,
+        description="Maximum number of idle connections kept open for reuse",
+    )
+    keepalive_expiry: Annotated[float, Field(ge=0, le=3600)] = Field(
+        default=60.0,
+        description="Seconds an idle connection is kept open",
+    )
+    http2: bool = Field(
+        default=True,
+        description="Whether to use HTTP/2 when available (requires the h2 package)",
+    )
+
+
 class TautulliConfig(BaseModel):
     """Tautulli service configuration."""
 
@@ -19,6 +44,9 @@ class TautulliConfig(BaseModel):
         description="Base URL for Tautulli API (e.g., http://localhost:8181/api/v2)",
         pattern=r"^https?://.*",
     )
+    connection: TautulliConnectionConfig = Field(
+        default_factory=TautulliConnectionConfig
+    )
 
     @field_validator("url")
     @classmethod
@@ -50,6 +78,10 @@ class DiscordConfig(BaseModel):
         default=30.0,
         description="Time in seconds after which ephemeral Discord messages are automatically deleted",
     )
+    edit_graph_messages: bool = Field(
+        default=False,
+        description="Edit the previous graph messages in place on updates instead of deleting them and posting new ones",
+    )
 
     @field_validator("token")
     @classmethod
@@ -119,11 +151,53 @@ class PrivacyConfig(BaseModel):
     )
 
 
+class HistoryCacheConfig(BaseModel):
+    """Persistent play history cache configuration."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Whether to keep a local copy of Tautulli play history and only fetch new plays on each update",
+    )
+    local_user_stats: bool = Field(
+        default=False,
+        description="Whether /my_stats builds personal graphs from the local play history copy, refreshed by graph updates, without contacting Tautulli",
+    )
+    full_sync_interval_days: Annotated[int, Field(ge=0, le=365)] = Field(
+        default=7,
+        description="Days between full refetches of the cached play history window, which drop plays deleted in Tautulli (0 only fetches new plays)",
+    )
+
+
+class MetadataCacheConfig(BaseModel):
+    """Persistent media resolution cache configuration."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Whether to keep a local copy of media resolutions so resolution graphs only look up new media",
+    )
+
+
+class HistoryFetchConfig(BaseModel):
+    """Play history fetching configuration."""
+
+    page_size: Annotated[int, Field(ge=100, le=10000)] = Field(
+        default=1000,
+        description="Number of play history rows requested from Tautulli per page",
+    )
+    max_concurrent_pages: Annotated[int, Field(ge=1, le=16)] = Field(
+        default=4,
+        description="Maximum number of play history pages fetched from Tautulli at the same time",
+    )
+
+
 class DataCollectionConfig(BaseModel):
     """Data collection configuration."""
 
     time_ranges: TimeRangesConfig = Field(default_factory=TimeRangesConfig)
     privacy: PrivacyConfig = Field(default_factory=PrivacyConfig)
+    history_cache: HistoryCacheConfig = Field(default_factory=HistoryCacheConfig)
+    history_fetch: HistoryFetchConfig = Field(default_factory=HistoryFetchConfig)
+    metadata_cache: MetadataCacheConfig = Field(default_factory=MetadataCacheConfig)
 
 
 class LocalizationConfig(BaseModel):
@@ -393,7 +467,7 @@ class EnabledOnConfig(BaseModel):
         default=True,
         description="Enable annotations on monthly graphs",
     )
-    
+
     # Stream Type Graphs
     daily_play_count_by_stream_type: bool = Field(
         default=True,
@@ -493,12 +567,54 @@ class GraphAppearanceConfig(BaseModel):
     palettes: PalettesConfig = Field(default_factory=PalettesConfig)
 
 
+class GraphRenderingConfig(BaseModel):
+    """Graph rendering configuration."""
+
+    workers: Annotated[int, Field(ge=1, le=32)] = Field(
+        default=1,
+        description="Number of worker processes that render graphs in parallel (1 renders in the bot process)",
+    )
+    cache_enabled: bool = Field(
+        default=True,
+        description="Reuse previously rendered graphs when their data and settings have not changed",
+    )
+    figure_pool: bool = Field(
+        default=False,
+        description="Reuse matplotlib figures across graphs of the same size instead of creating one per graph",
+    )
+    image_format: Literal["png", "webp"] = Field(
+        default="png",
+        description="Image format of rendered graphs (lossless WebP is smaller and faster to encode)",
+    )
+    tight_bbox: bool = Field(
+        default=True,
+        description="Crop graphs to their content, which draws each graph twice (disable to save the fixed figure layout)",
+    )
+    png_compress_level: Annotated[int, Field(ge=0, le=9)] = Field(
+        default=6,
+        description="zlib compression level of PNG graphs (lower is faster, higher is smaller)",
+    )
+    png_quantize: bool = Field(
+        default=False,
+        description="Reduce PNG graphs to a 256 color palette for smaller uploads",
+    )
+    in_memory: bool = Field(
+        default=False,
+        description="Keep rendered graphs in memory and upload them to Discord without reading them back from disk",
+    )
+    archive_graphs: bool = Field(
+        default=True,
+        description="Write graphs rendered in memory to the graph storage in the background",
+    )
+
+
 class GraphsConfig(BaseModel):
     """Graphs configuration."""
 
     features: GraphFeaturesConfig = Field(default_factory=GraphFeaturesConfig)
     appearance: GraphAppearanceConfig = Field(default_factory=GraphAppearanceConfig)
     per_graph: PerGraphConfig = Field(default_factory=PerGraphConfig)
+    rendering: GraphRenderingConfig = Field(default_factory=GraphRenderingConfig)
 
 
 class CommandCooldownConfig(BaseModel):
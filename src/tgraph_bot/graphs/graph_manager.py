@@ -18,18 +18,31 @@ Architecture:
 
 import asyncio
 import logging
+import sqlite3
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 from collections.abc import Mapping
 
+import httpx
+
 from .graph_modules.data.data_fetcher import DataFetcher
+from .graph_modules.data.history_cache import get_play_history_cache
+from .graph_modules.data.response_cache import get_response_cache
+from .graph_modules.data.processed_history import (
+    RESOLUTION_GRAPH_TYPES,
+    with_processed_history,
+    with_resolution_history,
+)
 from .graph_modules.core.graph_factory import GraphFactory
 from .graph_modules.utils.progress_tracker import ProgressTracker
 from .graph_modules.utils.utils import cleanup_old_files, get_current_graph_storage_path
+from ..utils.cli.paths import get_path_config
+from ..utils.core.image_store import get_graph_image_store
 
 if TYPE_CHECKING:
     from ..config.manager import ConfigManager
+    from .graph_modules.data.tautulli_client import TautulliClient
 
 logger = logging.getLogger(__name__)
 
@@ -63,14 +76,21 @@ class GraphManager:
     asyncio.to_thread() to prevent blocking the bot's event loop.
     """
 
-    def __init__(self, config_manager: "ConfigManager") -> None:
+    def __init__(
+        self,
+        config_manager: "ConfigManager",
+        tautulli_client: "TautulliClient | None" = None,
+    ) -> None:
         """
         Initialize the graph manager with configuration.
 
         Args:
             config_manager: Configuration manager instance for accessing bot config
+            tautulli_client: Optional bot-scoped Tautulli HTTP client whose
+                connection pool is reused instead of opening a new one
         """
         self.config_manager: "ConfigManager" = config_manager
+        self.tautulli_client: "TautulliClient | None" = tautulli_client
         self._data_fetcher: DataFetcher | None = None
         self._graph_factory: GraphFactory | None = None
 
@@ -92,12 +112,35 @@ class GraphManager:
         """Initialize DataFetcher and GraphFactory components."""
         config = self.config_manager.get_current_config()
 
+        # Share the persistent play history cache when enabled
+        history_cache = (
+            get_play_history_cache(get_path_config().get_history_cache_path())
+            if config.data_collection.history_cache.enabled
+            else None
+        )
+
         # Initialize DataFetcher with async context manager
         self._data_fetcher = DataFetcher(
             base_url=config.services.tautulli.url,
             api_key=config.services.tautulli.api_key,
             timeout=30.0,
             max_retries=3,
+            history_cache=history_cache,
+            page_size=config.data_collection.history_fetch.page_size,
+            max_concurrent_pages=config.data_collection.history_fetch.max_concurrent_pages,
+            full_sync_interval_days=config.data_collection.history_cache.full_sync_interval_days,
+            response_cache=get_response_cache(),
+            client=(
+                self.tautulli_client.client
+                if self.tautulli_client is not None and self.tautulli_client.is_open
+                else None
+            ),
+            concurrency=(
+                self.tautulli_client.concurrency
+                if self.tautulli_client is not None
+                else None
+            ),
+            compact_history=True,
         )
         _ = await self._data_fetcher.__aenter__()
 
@@ -109,6 +152,9 @@ class GraphManager:
     async def _cleanup_components(self) -> None:
         """Clean up DataFetcher and other resources."""
         if self._data_fetcher is not None:
+            logger.debug(
+                f"Tautulli response cache stats: {get_response_cache().get_stats()}"
+            )
             await self._data_fetcher.__aexit__(None, None, None)
             self._data_fetcher = None
 
@@ -182,12 +228,16 @@ class GraphManager:
             )
             logger.debug("Starting graph generation with timeout protection")
 
+            async def attach_and_generate() -> list[str]:
+                # Resolution metadata is fetched once, within the timeout
+                graph_data = await self._attach_resolution_history(data)
+                return await asyncio.to_thread(
+                    self._generate_graphs_sync, graph_data, progress_tracker
+                )
+
             try:
                 graph_files = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        self._generate_graphs_sync, data, progress_tracker
-                    ),
-                    timeout=timeout_seconds,
+                    attach_and_generate(), timeout=timeout_seconds
                 )
             except asyncio.TimeoutError:
                 error_msg = (
@@ -265,6 +315,13 @@ class GraphManager:
                 "time_range_months": time_range_months,
             }
 
+            # /my_stats finds users in the local copy kept current by updates
+            if config.data_collection.history_cache.local_user_stats:
+                try:
+                    _ = await self._data_fetcher.sync_user_index()
+                except (httpx.HTTPError, sqlite3.Error, ValueError) as e:
+                    logger.warning(f"Failed to refresh the local user index: {e}")
+
             logger.debug("Successfully fetched graph data from Tautulli API")
             return data
 
@@ -392,21 +449,25 @@ class GraphManager:
 
         valid_files: list[str] = []
 
+        image_store = get_graph_image_store()
+
         for file_path in graph_files:
             try:
                 path = Path(file_path)
 
-                if not path.exists():
-                    progress_tracker.add_error(
-                        f"Generated file does not exist: {file_path}"
-                    )
-                    continue
+                # Graphs rendered in memory are uploaded without a file
+                if image_store.get(path) is None:
+                    if not path.exists():
+                        progress_tracker.add_error(
+                            f"Generated file does not exist: {file_path}"
+                        )
+                        continue
 
-                if not path.is_file():
-                    progress_tracker.add_error(f"Path is not a file: {file_path}")
-                    continue
+                    if not path.is_file():
+                        progress_tracker.add_error(f"Path is not a file: {file_path}")
+                        continue
 
-                if path.stat().st_size == 0:
+                if image_store.size(path) == 0:
                     progress_tracker.add_warning(
                         f"Generated file is empty: {file_path}"
                     )
@@ -423,6 +484,36 @@ class GraphManager:
         logger.debug(f"Validated {len(valid_files)}/{len(graph_files)} generated files")
         return valid_files
 
+    async def _attach_resolution_history(
+        self, data: dict[str, object]
+    ) -> dict[str, object]:
+        """
+        Look up media resolutions once for the enabled resolution graphs.
+
+        The lookup runs on the bot's event loop with the manager's
+        DataFetcher before the graphs are rendered, so the source and
+        stream resolution graphs share one set of metadata requests.
+
+        Args:
+            data: Graph data containing the raw play history
+
+        Returns:
+            The graph data, with the resolution-enriched history attached
+            if a resolution graph is enabled
+        """
+        if self._graph_factory is None or self._data_fetcher is None:
+            return data
+
+        enabled_types = self._graph_factory.get_enabled_graph_types()
+        if RESOLUTION_GRAPH_TYPES.isdisjoint(enabled_types):
+            return data
+
+        return await with_resolution_history(
+            data,
+            fetcher=self._data_fetcher,
+            config=self.config_manager.get_current_config(),
+        )
+
     def _generate_graphs_sync(
         self, data: dict[str, object], progress_tracker: ProgressTracker | None = None
     ) -> list[str]:
@@ -452,9 +543,12 @@ class GraphManager:
             # Ensure graph output directory exists using date-based structure
             _ = get_current_graph_storage_path()
 
+            # Process the play history once and share it across all graphs
+            graph_data = with_processed_history(data)
+
             # Use GraphFactory to generate all enabled graphs
             # This method already handles proper resource management and cleanup
-            generated_paths = self._graph_factory.generate_all_graphs(data)
+            generated_paths = self._graph_factory.generate_all_graphs(graph_data)
 
             if progress_tracker:
                 if not generated_paths:
@@ -65,6 +65,8 @@ from .utils import (
     ProgressTracker,
     ProgressTrackerConfig,
     SimpleProgressTracker,
+    PlayRecords,
+    PlayRecordStore,
     ProcessedPlayRecord,
     ProcessedRecords,
     SeparatedPlatformAggregates,
@@ -137,6 +139,8 @@ __all__ = [
     "ProgressTracker",
     "ProgressTrackerConfig",
     "SimpleProgressTracker",
+    "PlayRecords",
+    "PlayRecordStore",
     "ProcessedPlayRecord",
     "ProcessedRecords",
     "SeparatedPlatformAggregates",
@@ -7,6 +7,7 @@ all graph implementations depend on.
 """
 
 from .base_graph import BaseGraph
+from .figure_pool import FigurePool, get_figure_pool
 from .graph_errors import (
     GraphConfigurationError,
     GraphDataError,
@@ -16,9 +17,12 @@ from .graph_errors import (
 )
 from .graph_factory import GraphFactory
 from .graph_type_registry import GraphTypeRegistry, get_graph_type_registry
+from .render_pool import get_render_pool, shutdown_render_pool, warm_up_rendering
 
 __all__ = [
     "BaseGraph",
+    "FigurePool",
+    "get_figure_pool",
     "GraphError",
     "GraphDataError",
     "GraphConfigurationError",
@@ -27,4 +31,7 @@ __all__ = [
     "GraphFactory",
     "GraphTypeRegistry",
     "get_graph_type_registry",
+    "get_render_pool",
+    "shutdown_render_pool",
+    "warm_up_rendering",
 ]
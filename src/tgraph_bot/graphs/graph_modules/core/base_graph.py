@@ -7,8 +7,10 @@ background color, titles), providing a canvas for the high-level Seaborn
 library to draw onto.
 """
 
+import io
 import logging
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from collections.abc import Mapping
 from pathlib import Path
 from types import TracebackType
@@ -20,7 +22,11 @@ import matplotlib.figure
 import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
 
+from ....utils.core.image_store import get_graph_image_store
+from ..data.data_processor import data_processor
+from ..data.processed_history import get_processed_history, get_resolution_history
 from ..utils.utils import (
+    PlayRecords,
     ProcessedRecords,
     apply_modern_seaborn_styling,
     censor_username,
@@ -30,6 +36,13 @@ from ..utils.utils import (
     validate_color,
     validate_graph_data,
 )
+from ..utils.image_output import (
+    DEFAULT_PNG_COMPRESS_LEVEL,
+    ImageOutputOptions,
+    image_format_for_path,
+    save_figure_image,
+)
+from .figure_pool import get_figure_pool
 
 if TYPE_CHECKING:
     from ....config.schema import TGraphBotConfig
@@ -179,6 +192,13 @@ class BaseGraph(ABC):
         Returns:
             Tuple of (figure, axes)
         """
+        # Reuse a figure of the same size from the figure pool if enabled
+        if self.get_figure_pool_enabled():
+            self.figure, self.axes = get_figure_pool().acquire(
+                self.width, self.height, self.dpi, self.background_color
+            )
+            return self.figure, self.axes
+
         # Create figure with specified dimensions
         self.figure, self.axes = plt.subplots(  # pyright: ignore[reportUnknownMemberType]
             figsize=(self.width, self.height),
@@ -202,26 +222,8 @@ class BaseGraph(ABC):
         This method sets up the Seaborn style context for the graph,
         including grid settings and overall aesthetic preferences.
         """
-        import seaborn as sns
-
-        # Apply modern styling
-        apply_modern_seaborn_styling()
-
-        # Set the default Seaborn style with enhanced appearance
-        if self.get_grid_enabled():
-            sns.set_style(
-                "whitegrid",
-                {
-                    "axes.grid": True,
-                    "axes.grid.axis": "y",
-                    "grid.linewidth": 0.5,
-                    "grid.alpha": 0.7,
-                    "axes.edgecolor": "#333333",
-                    "axes.linewidth": 1.2,
-                },
-            )
-        else:
-            sns.set_style("white")
+        # Apply modern styling (cached rc settings, see get_modern_style_rc)
+        apply_modern_seaborn_styling(grid_enabled=self.get_grid_enabled())
 
         # Set color palette based on configuration priority system
         if self.config is not None and self.get_media_type_separation_enabled():
@@ -398,6 +400,50 @@ class BaseGraph(ABC):
         grid_enabled = self.get_config_value("graphs.appearance.grid.enabled", False)
         return bool(grid_enabled)
 
+    def get_in_memory_rendering_enabled(self) -> bool:
+        """
+        Get whether graphs should be kept in memory instead of saved to disk.
+
+        Returns:
+            True if in-memory rendering is enabled, False otherwise
+        """
+        return self.get_config_value("graphs.rendering.in_memory", False) is True
+
+    def get_figure_pool_enabled(self) -> bool:
+        """
+        Get whether figures should be reused from the shared figure pool.
+
+        Returns:
+            True if the figure pool is enabled, False otherwise
+        """
+        return self.get_config_value("graphs.rendering.figure_pool", False) is True
+
+    def get_image_output_options(self) -> ImageOutputOptions:
+        """
+        Get the image format and encoder settings for saving this graph.
+
+        Returns:
+            ImageOutputOptions from the rendering configuration, with defaults
+            for missing or invalid values
+        """
+        image_format = self.get_config_value("graphs.rendering.image_format", "png")
+        compress_level = self.get_config_value(
+            "graphs.rendering.png_compress_level", DEFAULT_PNG_COMPRESS_LEVEL
+        )
+        if not isinstance(compress_level, int) or not 0 <= compress_level <= 9:
+            compress_level = DEFAULT_PNG_COMPRESS_LEVEL
+
+        return ImageOutputOptions(
+            image_format="webp" if image_format == "webp" else "png",
+            tight_bbox=(
+                self.get_config_value("graphs.rendering.tight_bbox", True) is not False
+            ),
+            png_compress_level=compress_level,
+            png_quantize=(
+                self.get_config_value("graphs.rendering.png_quantize", False) is True
+            ),
+        )
+
     def _get_graph_type_key(self) -> str:
         """
         Get the graph type key for this graph class to use in per-graph settings.
@@ -729,6 +775,8 @@ class BaseGraph(ABC):
         if self.figure is None:
             raise ValueError("Figure not initialized. Call setup_figure() first.")
 
+        options = self.get_image_output_options()
+
         # Generate output path if not provided
         if output_path is None:
             if graph_type is None:
@@ -736,20 +784,41 @@ class BaseGraph(ABC):
 
             # Use the new date-based directory structure
             graph_dir = get_current_graph_storage_path(user_email=user_id)
-            filename = generate_graph_filename(graph_type, user_id=user_id)
+            filename = generate_graph_filename(
+                graph_type, user_id=user_id, extension=options.extension
+            )
             output_path = str(graph_dir / filename)
         else:
             # Ensure output directory exists for provided path
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # Save with high quality settings
-        self.figure.savefig(  # pyright: ignore[reportUnknownMemberType]
+            # Provided paths keep the format of their extension
+            options = replace(options, image_format=image_format_for_path(output_path))
+
+        if self.get_in_memory_rendering_enabled():
+            # Keep the image in memory for the upload, archive it in the background
+            buffer = io.BytesIO()
+            save_figure_image(
+                self.figure,
+                buffer,
+                options,
+                dpi=self.dpi,
+                facecolor=self.background_color,
+            )
+            archive = (
+                self.get_config_value("graphs.rendering.archive_graphs", True)
+                is not False
+            )
+            get_graph_image_store().put(output_path, buffer.getvalue(), archive)
+            logger.info(f"Rendered graph in memory: {output_path}")
+            return output_path
+
+        save_figure_image(
+            self.figure,
             output_path,
+            options,
             dpi=self.dpi,
-            bbox_inches="tight",
             facecolor=self.background_color,
-            edgecolor="none",
-            format="png",
         )
 
         logger.info(f"Saved graph to: {output_path}")
@@ -777,8 +846,13 @@ class BaseGraph(ABC):
         """
         if self.figure is not None:
             try:
-                # Close the specific figure to free memory
-                plt.close(self.figure)
+                figure_pool = get_figure_pool()
+                if figure_pool.owns(self.figure):
+                    # Reset the pooled figure for the next graph of this size
+                    figure_pool.release(self.figure)
+                else:
+                    # Close the specific figure to free memory
+                    plt.close(self.figure)
                 logger.debug(f"Closed matplotlib figure for {self.__class__.__name__}")
             except Exception as e:
                 logger.warning(f"Error closing figure: {e}")
@@ -883,6 +957,59 @@ class BaseGraph(ABC):
             # Return empty list for graceful degradation
             return []
 
+    def get_processed_records(self, data: Mapping[str, object]) -> PlayRecords:
+        """
+        Get processed play history records for this graph.
+
+        Uses the shared ProcessedHistory built once per update cycle by the
+        graph managers when it is present in the data. Falls back to
+        processing the raw play history when it is not (e.g. when a graph
+        is generated directly).
+
+        Args:
+            data: Dictionary containing the full graph data structure
+
+        Returns:
+            Processed play history records (a read-only columnar store when
+            the shared history is used)
+        """
+        history = get_processed_history(data)
+        if history is not None:
+            logger.debug(
+                f"Using shared processed history ({len(history)} records) for {self.__class__.__name__}"
+            )
+            return history.get_records()
+
+        _, processed_records = data_processor.extract_and_process_play_history(data)
+        return processed_records
+
+    def get_resolution_records(self, data: Mapping[str, object]) -> PlayRecords:
+        """
+        Get processed play history records enriched with media resolutions.
+
+        Uses the resolution-enriched history looked up once per update cycle
+        by the graph managers. Without it (e.g. when a graph is generated
+        directly, or the metadata lookup failed) the resolutions found in
+        the play history itself are used.
+
+        Args:
+            data: Dictionary containing the full graph data structure
+
+        Returns:
+            Processed play history records with resolution fields
+        """
+        history = get_resolution_history(data)
+        if history is not None:
+            logger.debug(
+                f"Using resolution-enriched history ({len(history)} records) for {self.__class__.__name__}"
+            )
+            return history.get_records()
+
+        logger.info(
+            f"No resolution-enriched history for {self.__class__.__name__}, using play history resolutions"
+        )
+        return self.get_processed_records(data)
+
     def setup_figure_with_styling(self) -> tuple[matplotlib.figure.Figure, Axes]:
         """
         Setup figure and apply common styling patterns.
@@ -0,0 +1,197 @@
+"""
+Figure pool for graph rendering in TGraph Bot.
+
+Every graph used to create a pyplot figure and close it again after saving.
+Most graphs of an update share the same size and dpi, so this module keeps
+their figures after use and hands them to the next graph of the same size
+instead. A reused figure keeps its Agg canvas and renderer, whose pixel
+buffer is the largest allocation of a render.
+
+Figures are reset when they are returned to the pool: every artist and
+axes is removed, the subplot parameters changed by tight_layout() are
+restored and fresh axes are created on the next acquire, so a graph never
+sees anything drawn by the previous one. Pooled figures are created
+without pyplot and therefore never show up in plt.get_fignums().
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure, SubplotParams
+
+logger = logging.getLogger(__name__)
+
+# Idle figures kept per size
+DEFAULT_MAX_IDLE_PER_SIZE = 2
+
+# Uses after which a figure is discarded instead of reused
+DEFAULT_MAX_USES = 100
+
+type FigureKey = tuple[float, float, float]
+
+
+@dataclass
+class _PooledFigure:
+    """A figure owned by the pool and the number of graphs it rendered."""
+
+    figure: Figure
+    key: FigureKey
+    uses: int = 0
+
+
+class FigurePool:
+    """Thread-safe pool of reusable figures keyed by size and dpi."""
+
+    def __init__(
+        self,
+        max_idle_per_size: int = DEFAULT_MAX_IDLE_PER_SIZE,
+        max_uses: int = DEFAULT_MAX_USES,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            max_idle_per_size: Idle figures kept per size and dpi
+            max_uses: Uses after which a figure is discarded instead of reused
+        """
+        self.max_idle_per_size: int = max_idle_per_size
+        self.max_uses: int = max_uses
+        self._idle: dict[FigureKey, list[_PooledFigure]] = {}
+        self._in_use: dict[int, _PooledFigure] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(
+        self, width: float, height: float, dpi: float, facecolor: str
+    ) -> tuple[Figure, Axes]:
+        """
+        Get a figure with a single empty axes.
+
+        Args:
+            width: Figure width in inches
+            height: Figure height in inches
+            dpi: Dots per inch
+            facecolor: Background color of the figure and axes
+
+        Returns:
+            Tuple of (figure, axes); return the figure with release()
+        """
+        key: FigureKey = (float(width), float(height), float(dpi))
+
+        with self._lock:
+            idle = self._idle.get(key)
+            pooled = idle.pop() if idle else None
+            if pooled is None:
+                figure = Figure(figsize=(width, height), dpi=dpi)
+                _ = FigureCanvasAgg(figure)
+                pooled = _PooledFigure(figure=figure, key=key)
+            pooled.uses += 1
+            self._in_use[id(pooled.figure)] = pooled
+
+        figure = pooled.figure
+        figure.set_facecolor(facecolor)
+        axes = figure.add_subplot()
+        axes.set_facecolor(facecolor)
+        return figure, axes
+
+    def owns(self, figure: Figure) -> bool:
+        """
+        Check whether a figure was acquired from this pool.
+
+        Args:
+            figure: Figure to check
+
+        Returns:
+            True if the figure is in use and must be returned with release()
+        """
+        with self._lock:
+            return id(figure) in self._in_use
+
+    def release(self, figure: Figure) -> None:
+        """
+        Reset a figure and return it to the pool.
+
+        Figures that changed size, reached the maximum number
+        of uses or do not fit in the pool are discarded. Figures that were not
+        acquired from this pool are ignored.
+
+        Args:
+            figure: Figure previously returned by acquire()
+        """
+        with self._lock:
+            pooled = self._in_use.pop(id(figure), None)
+        if pooled is None:
+            return
+
+        if pooled.uses >= self.max_uses or not _reset_figure(pooled):
+            return
+
+        with self._lock:
+            idle = self._idle.setdefault(pooled.key, [])
+            if len(idle) < self.max_idle_per_size:
+                idle.append(pooled)
+
+    def idle_count(self) -> int:
+        """
+        Get the number of idle figures.
+
+        Returns:
+            Number of figures waiting to be reused
+        """
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def clear(self) -> None:
+        """Discard all idle figures."""
+        with self._lock:
+            self._idle.clear()
+
+
+def _reset_figure(pooled: _PooledFigure) -> bool:
+    """
+    Remove everything a graph drew on a figure.
+
+    Args:
+        pooled: Pooled figure to reset
+
+    Returns:
+        True if the figure is blank and still has its pooled size
+    """
+    figure = pooled.figure
+    figure.clear()
+
+    # tight_layout() changes the subplot parameters, restore the defaults
+    defaults = SubplotParams()
+    figure.subplots_adjust(
+        left=defaults.left,
+        right=defaults.right,
+        bottom=defaults.bottom,
+        top=defaults.top,
+        wspace=defaults.wspace,
+        hspace=defaults.hspace,
+    )
+
+    size = (figure.get_figwidth(), figure.get_figheight(), figure.get_dpi())
+    size_changed = size != pooled.key
+    return not size_changed and not figure.axes
+
+
+_figure_pool: FigurePool | None = None
+
+
+def get_figure_pool() -> FigurePool:
+    """
+    Get the shared figure pool, creating it on first use.
+
+    Returns:
+        The shared FigurePool
+    """
+    global _figure_pool
+
+    if _figure_pool is None:
+        _figure_pool = FigurePool()
+    return _figure_pool
@@ -6,13 +6,36 @@ graph classes based on the enabled settings in the configuration.
 """
 
 import logging
+import pickle
+import sqlite3
 from collections.abc import Mapping
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
 from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict, cast
 
+from ....i18n import get_current_language
+from ....utils.cli.paths import get_path_config
+from ....utils.core.image_store import get_graph_image_store
 from .base_graph import BaseGraph
+from .graph_errors import GraphGenerationError
 from ..config.config_accessor import ConfigAccessor
+from ..data.aggregation_planner import AggregationPlanner
+from ..data.processed_history import get_processed_history
 from .graph_type_registry import GraphTypeRegistry, get_graph_type_registry
+from .render_cache import (
+    RenderCache,
+    compute_render_key,
+    fingerprint_graph_config,
+    fingerprint_graph_data,
+    get_render_cache,
+)
+from .render_pool import (
+    create_render_payload,
+    get_render_pool,
+    load_render_payload,
+    write_render_payload,
+)
 from ..utils.utils import cleanup_old_files, ensure_graph_directory
 
 if TYPE_CHECKING:
@@ -29,6 +52,44 @@ class GraphDimensions(TypedDict):
     dpi: int
 
 
+def _render_graph_in_worker(
+    payload_path: Path, graph_type: str
+) -> tuple[str, bytes | None]:
+    """
+    Render one graph in a render worker process.
+
+    Args:
+        payload_path: Path of the payload file written for this update
+        graph_type: Type of graph to render
+
+    Returns:
+        Tuple of (path to the generated graph file, the image if it was
+        rendered in memory)
+
+    Raises:
+        GraphGenerationError: If the graph could not be generated
+    """
+    payload = load_render_payload(payload_path)
+    graph = GraphFactory(payload.config).create_graph_by_type(graph_type)
+    try:
+        with graph:
+            output_path = graph.generate(payload.data)
+    except Exception as e:
+        # Reported to the bot process as a failure of this graph only, so it
+        # is not mistaken for a failure of the pool
+        raise GraphGenerationError(
+            f"{graph.__class__.__name__}: {e}",
+            graph_type=graph_type,
+            generation_stage="render_worker",
+        ) from e
+
+    # Images rendered in memory are handed to the bot process, after the
+    # worker finished archiving them so the bot can move or delete the file
+    image_store = get_graph_image_store()
+    image_store.flush()
+    return output_path, image_store.take(output_path)
+
+
 class GraphFactory:
     """Factory class for creating graph instances based on configuration."""
 
@@ -216,12 +277,11 @@ class GraphFactory:
                     f"Excluded {original_count - filtered_count} graph(s) from generation: {exclude_types}"
                 )
 
-        generated_paths: list[str] = []
-
         logger.info(f"Starting generation of {len(graphs)} enabled graphs")
 
         # Pass the full data structure to all graphs - let each graph extract what it needs
         # GraphManager provides: {"play_history": {...}, "monthly_plays": {...}, "time_range_days": int, "time_range_months": int}
+        # plus a shared "processed_history" so play history is only processed once per run
         # Different graphs can extract different parts of this data structure
 
         # Type cast to the expected mapping type for type checker
@@ -229,19 +289,33 @@ class GraphFactory:
 
         logger.debug(f"Passing full data structure with keys: {list(full_data.keys())}")
 
-        for graph in graphs:
-            try:
-                # Use context manager for automatic cleanup
-                with graph:
-                    # Pass the full data structure - each graph will extract what it needs
-                    output_path = graph.generate(full_data)
-                    generated_paths.append(output_path)
-                    logger.debug(f"Generated {graph.__class__.__name__}: {output_path}")
-
-            except Exception as e:
-                logger.error(f"Failed to generate {graph.__class__.__name__}: {e}")
-                # Continue with other graphs even if one fails
-                continue
+        # Reuse graphs whose inputs have not changed since they were last rendered
+        type_names = [self._get_type_name(graph) for graph in graphs]
+        render_keys = self._compute_render_keys(type_names, full_data)
+        output_paths = self._get_cached_graphs(render_keys)
+        pending = [index for index, path in enumerate(output_paths) if path is None]
+        if len(pending) < len(graphs):
+            logger.info(
+                f"Reusing {len(graphs) - len(pending)} unchanged graph(s) from the render cache"
+            )
+        pending_graphs = [graphs[index] for index in pending]
+
+        self._precompute_aggregates(pending_graphs, full_data)
+
+        workers = self._config_accessor.get_int_value("graphs.rendering.workers", 1)
+        if workers > 1 and len(pending_graphs) > 1:
+            rendered_paths = self._render_in_pool(pending_graphs, full_data, workers)
+        else:
+            rendered_paths = self._render_sequentially(pending_graphs, full_data)
+
+        for index, output_path in zip(pending, rendered_paths, strict=True):
+            output_paths[index] = output_path
+        self._cache_rendered_graphs(
+            [render_keys[index] for index in pending],
+            [type_names[index] for index in pending],
+            rendered_paths,
+        )
+        generated_paths = [path for path in output_paths if path is not None]
 
         # Additional cleanup to ensure no matplotlib state remains
         BaseGraph.cleanup_all_figures()
@@ -249,6 +323,263 @@ class GraphFactory:
         logger.info(f"Successfully generated {len(generated_paths)} graphs")
         return generated_paths
 
+    def _get_type_name(self, graph: BaseGraph) -> str | None:
+        """
+        Get the registered type name of a graph instance.
+
+        Args:
+            graph: Graph instance
+
+        Returns:
+            The graph type name, or None for graphs outside the registry
+        """
+        try:
+            return self._graph_registry.get_type_name_from_class(type(graph))
+        except ValueError:
+            return None
+
+    def _get_render_cache(self) -> RenderCache | None:
+        """
+        Get the rendered graph cache if it is enabled.
+
+        Returns:
+            The shared RenderCache, or None if caching is disabled
+        """
+        if not self._config_accessor.get_bool_value(
+            "graphs.rendering.cache_enabled", True
+        ):
+            return None
+        return get_render_cache(get_path_config().get_render_cache_path())
+
+    def _compute_render_keys(
+        self, type_names: list[str | None], data: Mapping[str, object]
+    ) -> list[str | None]:
+        """
+        Compute the render cache key of each graph.
+
+        Args:
+            type_names: Graph type names, None for graphs outside the registry
+            data: Graph data passed to every graph's generate()
+
+        Returns:
+            Cache key per graph, or None for graphs that cannot be cached
+        """
+        no_keys: list[str | None] = [None] * len(type_names)
+        if self._get_render_cache() is None:
+            return no_keys
+
+        try:
+            data_fingerprint = fingerprint_graph_data(data)
+            if data_fingerprint is None:
+                return no_keys
+            config_fingerprint = fingerprint_graph_config(self.config)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Graphs cannot be cached: {e}")
+            return no_keys
+
+        language = get_current_language()
+        today = date.today()
+        return [
+            compute_render_key(
+                type_name, data_fingerprint, config_fingerprint, language, today
+            )
+            if type_name is not None
+            else None
+            for type_name in type_names
+        ]
+
+    def _get_cached_graphs(self, render_keys: list[str | None]) -> list[str | None]:
+        """
+        Look up previously rendered images in the render cache.
+
+        Args:
+            render_keys: Cache key per graph (see _compute_render_keys)
+
+        Returns:
+            Path to the cached image per graph, or None if it must be rendered
+        """
+        cached_paths: list[str | None] = [None] * len(render_keys)
+        render_cache = self._get_render_cache()
+        if render_cache is None or not any(render_keys):
+            return cached_paths
+
+        try:
+            for index, render_key in enumerate(render_keys):
+                if render_key is not None:
+                    cached_paths[index] = render_cache.get(render_key)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to read the render cache: {e}")
+            return [None] * len(render_keys)
+
+        return cached_paths
+
+    def _cache_rendered_graphs(
+        self,
+        render_keys: list[str | None],
+        type_names: list[str | None],
+        output_paths: list[str | None],
+    ) -> None:
+        """
+        Remember newly rendered images in the render cache.
+
+        Args:
+            render_keys: Cache key per graph (see _compute_render_keys)
+            type_names: Graph type name per graph
+            output_paths: Rendered image per graph, None if rendering failed
+        """
+        render_cache = self._get_render_cache()
+        if render_cache is None:
+            return
+
+        try:
+            for render_key, type_name, output_path in zip(
+                render_keys, type_names, output_paths, strict=True
+            ):
+                if render_key is not None and type_name is not None and output_path:
+                    render_cache.store(render_key, type_name, output_path)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to update the render cache: {e}")
+
+    def _render_graph(self, graph: BaseGraph, data: Mapping[str, object]) -> str | None:
+        """
+        Render a single graph in this process.
+
+        Args:
+            graph: Graph instance to render
+            data: Graph data passed to the graph's generate()
+
+        Returns:
+            Path to the generated graph file, or None if generation failed
+        """
+        try:
+            # Use context manager for automatic cleanup
+            with graph:
+                # Pass the full data structure - each graph will extract what it needs
+                output_path = graph.generate(data)
+                logger.debug(f"Generated {graph.__class__.__name__}: {output_path}")
+                return output_path
+
+        except Exception as e:
+            logger.error(f"Failed to generate {graph.__class__.__name__}: {e}")
+            # Continue with other graphs even if one fails
+            return None
+
+    def _render_sequentially(
+        self, graphs: list[BaseGraph], data: Mapping[str, object]
+    ) -> list[str | None]:
+        """
+        Render graphs one after another in this process.
+
+        Args:
+            graphs: Graph instances to render
+            data: Graph data passed to every graph's generate()
+
+        Returns:
+            Path to the generated graph file per graph, None where it failed
+        """
+        return [self._render_graph(graph, data) for graph in graphs]
+
+    def _render_in_pool(
+        self, graphs: list[BaseGraph], data: Mapping[str, object], workers: int
+    ) -> list[str | None]:
+        """
+        Render graphs in parallel in the render worker processes.
+
+        Each registered graph type is rendered by a worker from a payload file
+        holding the config and the graph data, including the precomputed
+        aggregates. Graphs outside the registry are rendered in this process.
+        If the payload cannot be written or the pool breaks, all graphs are
+        rendered sequentially instead.
+
+        Args:
+            graphs: Graph instances to render
+            data: Graph data passed to every graph's generate()
+            workers: Number of worker processes
+
+        Returns:
+            Path to the generated graph file per graph, None where it failed
+        """
+        type_names = [self._get_type_name(graph) for graph in graphs]
+
+        try:
+            payload_path = write_render_payload(
+                create_render_payload(self.config, data)
+            )
+        except (pickle.PicklingError, TypeError, AttributeError, OSError) as e:
+            # Unpicklable graph data raises TypeError or AttributeError
+            logger.warning(f"Could not share graph data with render workers: {e}")
+            return self._render_sequentially(graphs, data)
+
+        try:
+            pool = get_render_pool(workers)
+            futures = {
+                index: pool.submit(_render_graph_in_worker, payload_path, type_name)
+                for index, type_name in enumerate(type_names)
+                if type_name is not None
+            }
+            logger.debug(f"Submitted {len(futures)} graphs to {workers} render workers")
+
+            generated_paths: list[str | None] = []
+            for index, graph in enumerate(graphs):
+                future = futures.get(index)
+                if future is None:
+                    output_path = self._render_graph(graph, data)
+                else:
+                    try:
+                        output_path, image = future.result()
+                        if image is not None:
+                            get_graph_image_store().put(
+                                output_path, image, archive=False
+                            )
+                        logger.debug(
+                            f"Generated {graph.__class__.__name__}: {output_path}"
+                        )
+                    except GraphGenerationError as e:
+                        logger.error(f"Failed to generate {e}")
+                        output_path = None
+
+                generated_paths.append(output_path)
+
+            return generated_paths
+
+        except (BrokenProcessPool, pickle.PicklingError, OSError) as e:
+            logger.warning(f"Render pool failed, rendering graphs sequentially: {e}")
+            return self._render_sequentially(graphs, data)
+
+        finally:
+            payload_path.unlink(missing_ok=True)
+
+    def _precompute_aggregates(
+        self, graphs: list[BaseGraph], data: Mapping[str, object]
+    ) -> None:
+        """
+        Precompute the aggregates of the graphs about to be generated.
+
+        All counters needed by the given graphs are built in a single pass over
+        the shared processed history and cached on it, so the graphs reuse them
+        instead of each scanning the history. Failures are logged and ignored;
+        graphs then compute their aggregates themselves.
+
+        Args:
+            graphs: Graph instances that are about to be generated
+            data: Graph data, possibly containing the shared processed history
+        """
+        history = get_processed_history(data)
+        if history is None:
+            return
+
+        # Graphs outside the registry are not planned
+        graph_types = [
+            type_name
+            for type_name in map(self._get_type_name, graphs)
+            if type_name is not None
+        ]
+
+        try:
+            AggregationPlanner(graph_types).precompute(history.records)
+        except (ValueError, TypeError, LookupError) as e:
+            logger.warning(f"Failed to precompute graph aggregates: {e}")
+
     def cleanup_all_graph_resources(self) -> None:
         """
         Perform comprehensive cleanup of all graph-related resources.
@@ -0,0 +1,253 @@
+"""
+Rendered graph cache for TGraph Bot.
+
+Scheduled updates often run when no new plays have happened, and then
+produce exactly the same images as the previous update. This module keys
+every rendered graph by a hash of its inputs (graph type, graph data,
+graph settings and language) and remembers where the image was saved, so
+an unchanged graph can reuse the image from the dated graph storage instead
+of being rendered again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Mapping
+from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Final
+
+from ....utils.core.image_store import get_graph_image_store
+from ..data.processed_history import (
+    PROCESSED_HISTORY_KEY,
+    RESOLUTION_HISTORY_KEY,
+    get_processed_history,
+    get_resolution_history,
+)
+from ..data.sqlite_store import SQLiteStore, fetch_value
+
+if TYPE_CHECKING:
+    from ....config.schema import TGraphBotConfig
+
+# Graph types that show the days up to today, so they change with the date.
+# They cut off at midnight (get_time_range_cutoff), so the date is all the
+# time they depend on.
+DATE_DEPENDENT_GRAPH_TYPES: Final[frozenset[str]] = frozenset(
+    {
+        "daily_play_count",
+        "daily_play_count_by_stream_type",
+        "daily_concurrent_stream_count_by_stream_type",
+    }
+)
+
+# Seconds a rendered graph is reused at most
+RENDER_CACHE_TTL_SECONDS = 7 * 86_400
+
+# Graph data keys holding the play history, which is identified by the
+# fingerprints of the processed histories instead
+_HISTORY_DATA_KEYS: Final[frozenset[str]] = frozenset(
+    {PROCESSED_HISTORY_KEY, RESOLUTION_HISTORY_KEY, "play_history", "data"}
+)
+
+
+def _hash(*parts: str) -> str:
+    """Hash strings into a hex digest."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def fingerprint_graph_data(data: Mapping[str, object]) -> str | None:
+    """
+    Get a hash of the graph data shared by all graphs of an update.
+
+    Args:
+        data: Graph data including the shared processed history
+
+    Returns:
+        Hex digest of the data, or None if the data has no processed history
+        or cannot be hashed (such graphs are always rendered)
+    """
+    history = get_processed_history(data)
+    if history is None:
+        return None
+
+    other_data = {
+        key: value for key, value in data.items() if key not in _HISTORY_DATA_KEYS
+    }
+    try:
+        encoded = json.dumps(other_data, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+
+    resolution_history = get_resolution_history(data)
+    resolution_fingerprint = (
+        resolution_history.records.fingerprint()
+        if resolution_history is not None
+        else ""
+    )
+    return _hash(history.records.fingerprint(), resolution_fingerprint, encoded)
+
+
+def fingerprint_graph_config(config: TGraphBotConfig) -> str:
+    """
+    Get a hash of the settings that affect how graphs look.
+
+    Args:
+        config: Bot configuration
+
+    Returns:
+        Hex digest of the graph, image output, time range and privacy settings
+    """
+    settings = config.model_dump(
+        mode="json",
+        include={
+            "graphs": True,
+            "data_collection": {"time_ranges": True, "privacy": True},
+        },
+        exclude={
+            "graphs": {
+                "rendering": {
+                    "workers",
+                    "cache_enabled",
+                    "figure_pool",
+                    "in_memory",
+                    "archive_graphs",
+                }
+            }
+        },
+    )
+    return _hash(json.dumps(settings, sort_keys=True))
+
+
+def compute_render_key(
+    graph_type: str,
+    data_fingerprint: str,
+    config_fingerprint: str,
+    language: str,
+    today: date,
+) -> str:
+    """
+    Compute the cache key of a graph.
+
+    Args:
+        graph_type: Type of graph
+        data_fingerprint: Result of fingerprint_graph_data()
+        config_fingerprint: Result of fingerprint_graph_config()
+        language: Language the graph is rendered in
+        today: Current date, part of the key for date dependent graph types
+
+    Returns:
+        Hex digest identifying the rendered graph
+    """
+    parts = [graph_type, data_fingerprint, config_fingerprint, language]
+    if graph_type in DATE_DEPENDENT_GRAPH_TYPES:
+        parts.append(today.isoformat())
+    return _hash(*parts)
+
+
+class RenderCache(SQLiteStore):
+    """SQLite-backed index of rendered graph images keyed by their inputs."""
+
+    SCHEMA: ClassVar[str] = """
+CREATE TABLE IF NOT EXISTS rendered_graph (
+    cache_key TEXT PRIMARY KEY,
+    graph_type TEXT NOT NULL,
+    output_path TEXT NOT NULL,
+    rendered_at INTEGER NOT NULL
+);
+"""
+    SCHEMA_VERSION: ClassVar[int] = 1
+    TABLES: ClassVar[tuple[str, ...]] = ("rendered_graph",)
+
+    def __init__(self, path: Path, ttl: float = RENDER_CACHE_TTL_SECONDS) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: Location of the SQLite database file
+            ttl: Seconds a rendered graph is reused at most
+        """
+        super().__init__(path)
+        self.ttl: float = ttl
+
+    def get(self, cache_key: str, now: float | None = None) -> str | None:
+        """
+        Get the image previously rendered for a cache key.
+
+        Args:
+            cache_key: Result of compute_render_key()
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            Path to the image, or None if it is not cached, has expired or
+            the image is no longer in memory or on disk
+        """
+        now = time.time() if now is None else now
+        with self._connect() as connection:
+            output_path = fetch_value(
+                connection,
+                "SELECT output_path FROM rendered_graph "
+                + "WHERE cache_key = ? AND rendered_at >= ?",
+                (cache_key, now - self.ttl),
+            )
+
+        if output_path is None or not get_graph_image_store().exists(str(output_path)):
+            return None
+        return str(output_path)
+
+    def store(
+        self,
+        cache_key: str,
+        graph_type: str,
+        output_path: str,
+        now: float | None = None,
+    ) -> None:
+        """
+        Remember a rendered image and drop expired entries.
+
+        Args:
+            cache_key: Result of compute_render_key()
+            graph_type: Type of graph
+            output_path: Path of the rendered image
+            now: Current Unix time (defaults to time.time())
+        """
+        now = time.time() if now is None else now
+        with self._connect() as connection:
+            _ = connection.execute(
+                "INSERT OR REPLACE INTO rendered_graph "
+                + "(cache_key, graph_type, output_path, rendered_at) VALUES (?, ?, ?, ?)",
+                (cache_key, graph_type, output_path, int(now)),
+            )
+            _ = connection.execute(
+                "DELETE FROM rendered_graph WHERE rendered_at < ?",
+                (now - self.ttl,),
+            )
+
+    def clear(self) -> None:
+        """Forget all rendered images."""
+        with self._connect() as connection:
+            _ = connection.execute("DELETE FROM rendered_graph")
+
+
+_caches: dict[Path, RenderCache] = {}
+
+
+def get_render_cache(path: Path) -> RenderCache:
+    """
+    Get the shared cache instance for a database file.
+
+    Args:
+        path: Location of the SQLite database file
+
+    Returns:
+        RenderCache for the file
+    """
+    resolved = path.resolve()
+    if resolved not in _caches:
+        _caches[resolved] = RenderCache(resolved)
+    return _caches[resolved]
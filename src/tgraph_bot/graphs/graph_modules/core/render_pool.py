@@ -0,0 +1,229 @@
+"""
+Process pool for parallel graph rendering in TGraph Bot.
+
+Rendering with matplotlib is CPU-bound and holds the GIL, so graphs rendered
+in threads still use a single core. This module keeps a persistent pool of
+worker processes with matplotlib already imported and the Agg backend set,
+so every graph of an update can render on its own core. The bot warms up
+rendering at startup, so the first graph update is as fast as later ones.
+
+The graph data is shared with the workers through a payload file: the data
+is pickled once per update instead of once per graph, and each worker
+unpickles it at most once however many graphs it renders.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import pickle
+import tempfile
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ....config.schema import TGraphBotConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RenderPayload:
+    """Everything a worker process needs to render graphs of one update."""
+
+    config: TGraphBotConfig
+    data: Mapping[str, object]
+    language: str
+    config_file: Path
+    data_folder: Path
+    log_folder: Path
+
+
+def initialize_render_worker() -> None:
+    """
+    Prepare a process for rendering graphs.
+
+    Selects the Agg backend, imports the plotting stack, loads the default
+    fonts and applies the base graph style, then draws a small figure so
+    that the first real graph does not pay for any of it.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot  # pyright: ignore[reportUnusedImport]  # pre-import for faster first render
+    import seaborn  # noqa: F401  # pyright: ignore[reportUnusedImport]  # pre-import for faster first render
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    from ..utils.utils import apply_modern_seaborn_styling
+
+    apply_modern_seaborn_styling()
+
+    figure = Figure(figsize=(1, 1), dpi=50)
+    axes = figure.add_subplot()
+    _ = axes.set_title("TGraph Bot")  # pyright: ignore[reportUnknownMemberType]  # matplotlib stubs
+    _ = axes.bar([0, 1], [1, 2])  # pyright: ignore[reportUnknownMemberType]  # matplotlib stubs
+    FigureCanvasAgg(figure).draw()
+
+
+def _is_worker_ready() -> bool:
+    """Return once a worker process has started and been initialized."""
+    return True
+
+
+def warm_up_rendering(workers: int) -> None:
+    """
+    Prepare graph rendering ahead of the first graph update.
+
+    Initializes rendering in this process, which renders graphs when the
+    pool is not used, and with more than one worker starts the render pool
+    and waits until every worker is ready.
+
+    Args:
+        workers: Number of render worker processes (1 renders in-process)
+    """
+    initialize_render_worker()
+
+    if workers > 1:
+        pool = get_render_pool(workers)
+        _ = wait([pool.submit(_is_worker_ready) for _ in range(workers)])
+
+    logger.info("Graph rendering warmed up")
+
+
+def create_render_payload(
+    config: TGraphBotConfig, data: Mapping[str, object]
+) -> RenderPayload:
+    """
+    Create a payload from the graph data and this process's settings.
+
+    The current paths and language are included so that workers save graphs
+    to the same folders and use the same translations as the bot.
+
+    Args:
+        config: Configuration to render the graphs with
+        data: Graph data passed to every graph's generate()
+
+    Returns:
+        RenderPayload for the workers
+    """
+    from ....i18n import get_current_language
+    from ....utils.cli.paths import get_path_config
+
+    path_config = get_path_config()
+    return RenderPayload(
+        config=config,
+        data=data,
+        language=get_current_language(),
+        config_file=path_config.config_file,
+        data_folder=path_config.data_folder,
+        log_folder=path_config.log_folder,
+    )
+
+
+def write_render_payload(payload: RenderPayload) -> Path:
+    """
+    Pickle a payload to a temporary file.
+
+    The caller is responsible for deleting the file once rendering is done.
+
+    Args:
+        payload: Payload to write
+
+    Returns:
+        Path of the payload file
+    """
+    fd, name = tempfile.mkstemp(prefix="tgraph-render-", suffix=".pickle")
+    with os.fdopen(fd, "wb") as file:
+        pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return Path(name)
+
+
+# Payload most recently loaded by this worker process
+_loaded_payload: tuple[Path, RenderPayload] | None = None
+
+
+def load_render_payload(path: Path) -> RenderPayload:
+    """
+    Load a payload in a worker process and apply its settings.
+
+    The payload is loaded once per worker and update; later graphs of the same
+    update reuse it.
+
+    Args:
+        path: Path of the payload file
+
+    Returns:
+        The loaded RenderPayload
+    """
+    global _loaded_payload
+
+    if _loaded_payload is not None and _loaded_payload[0] == path:
+        return _loaded_payload[1]
+
+    from ....i18n import setup_i18n
+    from ....utils.cli.paths import get_path_config
+
+    with path.open("rb") as file:
+        payload: RenderPayload = pickle.load(file)  # pyright: ignore[reportAny]  # payload written by write_render_payload
+
+    get_path_config().set_paths(
+        payload.config_file, payload.data_folder, payload.log_folder
+    )
+    setup_i18n(payload.language)
+
+    _loaded_payload = (path, payload)
+    return payload
+
+
+_render_pool: ProcessPoolExecutor | None = None
+_render_pool_workers: int = 0
+
+
+def get_render_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Get the persistent render pool, creating it on first use.
+
+    Worker processes are started with the spawn method because the bot runs
+    threads, which are not safe to fork. The pool is recreated if the number
+    of workers changed or a worker died.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        The shared ProcessPoolExecutor
+    """
+    global _render_pool, _render_pool_workers
+
+    if _render_pool is not None and (
+        _render_pool_workers != workers
+        or getattr(_render_pool, "_broken", False)  # set once a worker died
+    ):
+        shutdown_render_pool()
+
+    if _render_pool is None:
+        _render_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initialize_render_worker,
+        )
+        _render_pool_workers = workers
+        logger.info(f"Started graph render pool with {workers} worker processes")
+
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Shut down the render pool and its worker processes, if running."""
+    global _render_pool, _render_pool_workers
+
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=True, cancel_futures=True)
+        _render_pool = None
+        _render_pool_workers = 0
+        logger.info("Graph render pool shut down")
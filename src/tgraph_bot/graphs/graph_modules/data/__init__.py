@@ -5,21 +5,58 @@ This package contains data fetching, processing, validation, and utility
 classes for handling Tautulli API data and graph generation workflows.
 """
 
+from .aggregation_planner import GRAPH_TYPE_COUNTERS, AggregationPlanner
+from .concurrency_controller import AdaptiveConcurrencyController
 from .data_fetcher import DataFetcher
 from .data_processor import DataProcessor, data_processor
 from .empty_data_handler import EmptyDataHandler
+from .history_cache import PlayHistoryCache, get_play_history_cache
+from .history_schema import HISTORY_ROW_SCHEMA, compact_history_row
+from .metadata_cache import ResolutionMetadataCache, get_resolution_metadata_cache
 from .media_type_processor import (
     MediaTypeProcessor,
     MediaTypeInfo,
     MediaTypeDisplayInfo,
 )
+from .response_cache import ResponseCache, get_response_cache
+from .tautulli_client import TautulliClient
+from .processed_history import (
+    PROCESSED_HISTORY_KEY,
+    RESOLUTION_GRAPH_TYPES,
+    RESOLUTION_HISTORY_KEY,
+    ProcessedHistory,
+    get_processed_history,
+    get_resolution_history,
+    with_processed_history,
+    with_resolution_history,
+)
 
 __all__ = [
+    "AdaptiveConcurrencyController",
+    "AggregationPlanner",
+    "GRAPH_TYPE_COUNTERS",
     "DataFetcher",
     "DataProcessor",
     "data_processor",
     "EmptyDataHandler",
+    "PlayHistoryCache",
+    "get_play_history_cache",
+    "HISTORY_ROW_SCHEMA",
+    "compact_history_row",
+    "ResolutionMetadataCache",
+    "get_resolution_metadata_cache",
     "MediaTypeProcessor",
     "MediaTypeInfo",
     "MediaTypeDisplayInfo",
+    "PROCESSED_HISTORY_KEY",
+    "RESOLUTION_GRAPH_TYPES",
+    "RESOLUTION_HISTORY_KEY",
+    "ProcessedHistory",
+    "get_processed_history",
+    "get_resolution_history",
+    "with_processed_history",
+    "with_resolution_history",
+    "ResponseCache",
+    "get_response_cache",
+    "TautulliClient",
 ]
@@ -0,0 +1,74 @@
+"""
+Aggregation planning for TGraph Bot graph generation.
+
+This module maps the enabled graph types to the counters they need from the
+shared processed history and builds all of those counters in a single sweep
+over the columnar record store before any graph is rendered. The results are
+cached on the store, so each graph's regular aggregation call picks up its
+precomputed aggregate instead of scanning the history again.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Mapping
+from typing import Final
+
+from ..utils.record_store import PlayRecordStore
+from ..utils.utils import classify_media_type
+from ..utils.vectorized_aggregation import (
+    COUNTER_HOUR,
+    COUNTER_PLATFORM,
+    COUNTER_PLATFORM_STREAM_TYPE,
+    COUNTER_USER,
+    COUNTER_USER_STREAM_TYPE,
+    COUNTER_WEEKDAY,
+    precompute_counters,
+)
+
+logger = logging.getLogger(__name__)
+
+# Counters each graph type computes from the full shared history.
+# Graphs that aggregate a time-filtered subset (the daily graphs), use other
+# data sources (monthly plays) or need per-record processing (resolution and
+# concurrent stream graphs) are not planned.
+GRAPH_TYPE_COUNTERS: Final[Mapping[str, frozenset[str]]] = {
+    "play_count_by_dayofweek": frozenset({COUNTER_WEEKDAY}),
+    "play_count_by_hourofday": frozenset({COUNTER_HOUR}),
+    "top_10_users": frozenset({COUNTER_USER}),
+    "top_10_platforms": frozenset({COUNTER_PLATFORM}),
+    "play_count_by_platform_and_stream_type": frozenset({COUNTER_PLATFORM_STREAM_TYPE}),
+    "play_count_by_user_and_stream_type": frozenset({COUNTER_USER_STREAM_TYPE}),
+}
+
+
+class AggregationPlanner:
+    """Plans and precomputes the aggregates needed by a set of graph types."""
+
+    def __init__(self, graph_types: Iterable[str]) -> None:
+        """
+        Initialize the planner.
+
+        Args:
+            graph_types: Type names of the graphs that are about to be generated
+        """
+        self.graph_types: tuple[str, ...] = tuple(graph_types)
+        self.required_counters: frozenset[str] = frozenset(
+            counter
+            for graph_type in self.graph_types
+            for counter in GRAPH_TYPE_COUNTERS.get(graph_type, frozenset())
+        )
+
+    def precompute(self, store: PlayRecordStore) -> None:
+        """
+        Build every required counter in one sweep and cache it on the store.
+
+        Args:
+            store: Shared processed play history
+        """
+        if not self.required_counters:
+            return
+
+        precompute_counters(store, self.required_counters, classify_media_type)
+        counters = sorted(self.required_counters)
+        logger.debug(f"Precomputed aggregates for {len(store)} records: {counters}")
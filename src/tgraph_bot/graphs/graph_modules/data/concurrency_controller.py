@@ -0,0 +1,253 @@
+"""
+Adaptive concurrency for bulk Tautulli requests.
+
+Bulk operations, such as looking up the metadata of every played item, send
+many independent requests to Tautulli. A fixed number of requests in flight
+is either too low for a Tautulli server on the same host or too high for a
+remote or busy one. AdaptiveConcurrencyController bounds the number of
+requests in flight and adjusts the bound from what it observes (additive
+increase, multiplicative decrease): fast successful requests raise the limit
+by about one per round of requests, while a slow response, a timeout or an
+overload error halves it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import TypeVar
+
+import httpx
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Requests in flight before anything has been observed
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 32
+
+# Seconds a request may take before it counts as a sign of overload
+DEFAULT_TARGET_LATENCY = 1.0
+
+# Factor the limit is multiplied with on overload
+DECREASE_FACTOR = 0.5
+
+# Seconds of completed requests the throughput is measured over
+THROUGHPUT_WINDOW_SECONDS = 10.0
+
+# HTTP status codes of an overloaded server
+_OVERLOAD_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class Outcome(Enum):
+    """How a request finished, as far as the concurrency limit is concerned."""
+
+    SUCCESS = "success"
+    OVERLOAD = "overload"
+    ERROR = "error"
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """
+    Check whether an error indicates that the server is overloaded.
+
+    Timeouts, connection errors and 429/5xx gateway responses are overload
+    signals. Other errors, such as an API error for a deleted item, say
+    nothing about the server's load.
+
+    Args:
+        error: Exception raised by a request
+
+    Returns:
+        True if the concurrency limit should be lowered
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in _OVERLOAD_STATUS_CODES
+    return isinstance(error, (TimeoutError, httpx.TransportError))
+
+
+class AdaptiveConcurrencyController:
+    """AIMD limit on the number of requests in flight."""
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        target_latency: float = DEFAULT_TARGET_LATENCY,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            initial_limit: Requests in flight before anything has been observed
+            min_limit: Lowest limit
+            max_limit: Highest limit
+            target_latency: Seconds a request may take before it counts as a
+                sign of overload
+        """
+        self.min_limit: int = max(1, min_limit)
+        self.max_limit: int = max(self.min_limit, max_limit)
+        self.target_latency: float = target_latency
+        self._limit: float = float(
+            min(max(initial_limit, self.min_limit), self.max_limit)
+        )
+        self._in_flight: int = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        # Requests started before the last decrease do not lower the limit again
+        self._generation: int = 0
+        self._completed: int = 0
+        self._failed: int = 0
+        self._overloads: int = 0
+        self._average_latency: float = 0.0
+        self._started: float | None = None
+        self._completion_times: deque[float] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight."""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None]:
+        """
+        Hold one of the request slots while a request runs.
+
+        The request's latency and outcome adjust the limit: an exception
+        leaving the block counts as an overload if is_overload_error()
+        says so, and as a neutral error otherwise.
+        """
+        generation = await self._acquire()
+        started = time.monotonic()
+        outcome = Outcome.ERROR
+        try:
+            yield
+            outcome = Outcome.SUCCESS
+        except Exception as e:
+            if is_overload_error(e):
+                outcome = Outcome.OVERLOAD
+            raise
+        finally:
+            self._release(generation, time.monotonic() - started, outcome)
+
+    async def map(
+        self, function: Callable[[T], Awaitable[R]], items: Iterable[T]
+    ) -> list[R | BaseException]:
+        """
+        Run a request for every item within the concurrency limit.
+
+        Args:
+            function: Coroutine function sending the request for one item
+            items: Items to send requests for
+
+        Returns:
+            The result or the exception of each request, in item order
+        """
+
+        async def run(item: T) -> R:
+            async with self.slot():
+                return await function(item)
+
+        return await asyncio.gather(
+            *(run(item) for item in items), return_exceptions=True
+        )
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """
+        Get the controller's metrics.
+
+        Returns:
+            Dictionary with limit, in_flight, completed, failed, overloads,
+            throughput (completed requests per second) and average_latency
+            (seconds)
+        """
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+            "overloads": self._overloads,
+            "throughput": round(self._throughput(time.monotonic()), 2),
+            "average_latency": round(self._average_latency, 3),
+        }
+
+    async def _acquire(self) -> int:
+        """Wait for a free slot and take it, returning the current generation."""
+        if self._started is None:
+            self._started = time.monotonic()
+
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                # Pass on a wake-up this request no longer needs
+                self._wake_waiters()
+                raise
+
+        self._in_flight += 1
+        return self._generation
+
+    def _release(self, generation: int, latency: float, outcome: Outcome) -> None:
+        """Free a slot and adjust the limit from the request's outcome."""
+        self._in_flight -= 1
+
+        if outcome is Outcome.SUCCESS:
+            self._completed += 1
+            self._completion_times.append(time.monotonic())
+            self._average_latency = (
+                latency
+                if self._completed == 1
+                else 0.8 * self._average_latency + 0.2 * latency
+            )
+        else:
+            self._failed += 1
+
+        overloaded = outcome is Outcome.OVERLOAD or (
+            outcome is Outcome.SUCCESS and latency > self.target_latency
+        )
+        if overloaded:
+            self._overloads += 1
+            if generation == self._generation:
+                self._limit = max(float(self.min_limit), self._limit * DECREASE_FACTOR)
+                self._generation += 1
+        elif outcome is Outcome.SUCCESS:
+            # Grows by about one per round of successful requests
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Wake as many waiting requests as there are free slots."""
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def _throughput(self, now: float) -> float:
+        """Completed requests per second over the throughput window."""
+        while (
+            self._completion_times
+            and now - self._completion_times[0] > THROUGHPUT_WINDOW_SECONDS
+        ):
+            _ = self._completion_times.popleft()
+        if self._started is None or not self._completion_times:
+            return 0.0
+
+        span = min(THROUGHPUT_WINDOW_SECONDS, now - self._started)
+        return len(self._completion_times) / span if span > 0 else 0.0
@@ -11,14 +11,22 @@ import asyncio
 import datetime
 import hashlib
 import logging
-from typing import TYPE_CHECKING, TypedDict, cast, TypeAlias
-from collections.abc import Mapping
+import time
+from typing import TYPE_CHECKING, TypedDict, TypeVar, cast, TypeAlias
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 
 import httpx
 
+from .concurrency_controller import AdaptiveConcurrencyController
+from .history_cache import day_start, normalize_email
+from .history_schema import compact_history_row
+from .response_cache import ResponseCache
+
 if TYPE_CHECKING:
     from types import TracebackType
 
+    from .history_cache import HistorySyncState, PlayHistoryCache
+
 
 # Type definitions for API structures
 class TautulliAPIResponse(TypedDict, total=False):
@@ -43,14 +51,27 @@ class PlayHistoryData(TypedDict):
     recordsTotal: int
 
 
+# Days of already cached history that are fetched again on each incremental sync,
+# so rows Tautulli adds or updates late (e.g. grouped sessions) are picked up
+HISTORY_SYNC_OVERLAP_DAYS = 1
+
 # Type aliases for improved readability
 APIParams: TypeAlias = dict[str, str | int | float | bool]
 APIResponseDict: TypeAlias = dict[str, object]
 APIResponseMapping: TypeAlias = Mapping[str, object]
 APIResponseItem: TypeAlias = object  # Type for items in API response lists
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 logger = logging.getLogger(__name__)
 
+# Number of history rows requested per get_history page
+HISTORY_PAGE_LENGTH = 1000
+
+# Number of get_history pages fetched at the same time
+HISTORY_MAX_CONCURRENT_PAGES = 4
+
 
 def calculate_buffer_size(time_range_days: int) -> int:
     """
@@ -113,18 +134,67 @@ class DataFetcher:
         api_key: str,
         timeout: float = 30.0,
         max_retries: int = 3,
+        history_cache: PlayHistoryCache | None = None,
+        page_size: int = HISTORY_PAGE_LENGTH,
+        max_concurrent_pages: int = HISTORY_MAX_CONCURRENT_PAGES,
+        response_cache: ResponseCache | None = None,
+        client: httpx.AsyncClient | None = None,
+        concurrency: AdaptiveConcurrencyController | None = None,
+        compact_history: bool = False,
+        full_sync_interval_days: int = 0,
     ) -> None:
-        """Initialize DataFetcher with connection parameters."""
+        """
+        Initialize DataFetcher with connection parameters.
+
+        Args:
+            base_url: Tautulli base URL
+            api_key: Tautulli API key
+            timeout: Request timeout in seconds
+            max_retries: Number of retries for timed out requests
+            history_cache: Optional persistent play history cache; when set,
+                date-filtered play history is synced incrementally and served
+                from the cache
+            page_size: Number of play history rows requested per page
+            max_concurrent_pages: Maximum number of play history pages fetched
+                concurrently once the total row count is known (1 fetches
+                pages one after another)
+            response_cache: Optional response cache to share with other
+                fetchers; a private cache is used when not given
+            client: Optional long-lived HTTP client to borrow instead of
+                opening a new connection pool; it is not closed on exit
+            concurrency: Optional concurrency controller for bulk requests to
+                share with other fetchers; a private one is used when not given
+            compact_history: Whether to reduce play history rows to the
+                fields the graphs use (see HISTORY_ROW_SCHEMA) as soon as a
+                page is decoded
+            full_sync_interval_days: Days after which the play history cache
+                fetches its whole window again instead of only new rows, so
+                plays deleted in Tautulli are dropped (0 never does)
+        """
         self.base_url: str = base_url.rstrip("/")
         self.api_key: str = api_key
         self.timeout: float = timeout
         self.max_retries: int = max_retries
+        self.history_cache: PlayHistoryCache | None = history_cache
+        self.page_size: int = page_size
+        self.max_concurrent_pages: int = max(1, max_concurrent_pages)
         self._client: httpx.AsyncClient | None = None
-        self._cache: dict[str, Mapping[str, object]] = {}
+        self._borrowed_client: httpx.AsyncClient | None = client
+        self._cache: ResponseCache = (
+            response_cache if response_cache is not None else ResponseCache()
+        )
+        self.compact_history: bool = compact_history
+        self.full_sync_interval_days: int = full_sync_interval_days
+        self.concurrency: AdaptiveConcurrencyController = (
+            concurrency if concurrency is not None else AdaptiveConcurrencyController()
+        )
 
     async def __aenter__(self) -> DataFetcher:
         """Enter async context and initialize HTTP client."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        if self._borrowed_client is not None and not self._borrowed_client.is_closed:
+            self._client = self._borrowed_client
+        else:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
         return self
 
     async def __aexit__(
@@ -135,12 +205,15 @@ class DataFetcher:
     ) -> None:
         """Exit async context and cleanup HTTP client."""
         if self._client is not None:
-            await self._client.aclose()
+            # A borrowed client belongs to its owner and stays open
+            if self._client is not self._borrowed_client:
+                await self._client.aclose()
             self._client = None
 
     def _get_cache_key(self, command: str, params: APIParams | None = None) -> str:
         """Generate cache key for request."""
-        key_data = f"{command}:{params or {}}"
+        # The server URL is part of the key because the cache may be shared
+        key_data = f"{self.base_url}:{command}:{sorted((params or {}).items())}"
         return hashlib.md5(key_data.encode()).hexdigest()
 
     async def _make_request(
@@ -153,9 +226,12 @@ class DataFetcher:
             )
 
         # Check cache first
+        cacheable = self._cache.is_cacheable(command)
         cache_key = self._get_cache_key(command, params)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        if cacheable:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         request_params = {
             "apikey": self.api_key,
@@ -203,7 +279,8 @@ class DataFetcher:
                 )
 
                 # Cache successful response
-                self._cache[cache_key] = result
+                if cacheable:
+                    self._cache.set(cache_key, command, result)
                 return result
 
             except httpx.TimeoutException:
@@ -239,14 +316,16 @@ class DataFetcher:
         Returns:
             PlayHistoryData with fetched records and metadata
         """
-        all_data: list[Mapping[str, object]] = []
-        start = 0
-        length = 1000
-        total_records = 0
+        if self.history_cache is not None and should_use_date_filtering(
+            use_date_filtering
+        ):
+            return await self._get_cached_play_history(
+                self.history_cache, time_range, user_id
+            )
 
         params: APIParams = {
-            "length": length,
-            "start": start,
+            "length": self.page_size,
+            "start": 0,
             "time_range": time_range,
         }
         if user_id is not None:
@@ -260,31 +339,77 @@ class DataFetcher:
                 f"Using API date filtering: after={after_date} (time_range={time_range} days + buffer)"
             )
 
-        while True:
-            params["start"] = start
-            response_data = await self._make_request("get_history", params)
+        # Intelligent stopping for small time ranges
+        return await self._fetch_history_pages(
+            params, max_records=500 if time_range <= 7 else None
+        )
 
-            page_data_raw = response_data.get("data", [])
-            if not isinstance(page_data_raw, list):
-                break
+    async def _fetch_history_pages(
+        self, params: APIParams, max_records: int | None = None
+    ) -> PlayHistoryData:
+        """
+        Fetch all pages of a get_history query.
 
-            # Type-safe iteration over API response list
-            page_items_count = 0
-            for item_raw in page_data_raw:  # pyright: ignore[reportUnknownVariableType] # external API response
-                page_items_count += 1
-                item: APIResponseItem = item_raw  # pyright: ignore[reportUnknownVariableType] # external API response
-                if isinstance(item, dict):
-                    all_data.append(cast(Mapping[str, object], item))
+        The first page reports the number of matching rows (recordsFiltered),
+        so the remaining pages are fetched concurrently, bounded by
+        max_concurrent_pages, and reassembled in order. Responses without a
+        usable row count fall back to fetching page after page.
+
+        Args:
+            params: get_history parameters including the page "length"
+            max_records: Optional number of records after which to stop early
 
-            records_filtered_raw = response_data.get("recordsFiltered", 0)
+        Returns:
+            PlayHistoryData with fetched records and metadata
+        """
+        length = int(params["length"])
+
+        first_page = await self._fetch_history_page(params, 0)
+        if first_page is None:
+            return PlayHistoryData(data=[], recordsFiltered=0, recordsTotal=0)
+        page_rows, total_records = first_page
+        all_data = list(page_rows)
+        has_more = len(page_rows) >= length
+        start = length
+
+        if has_more and self.max_concurrent_pages > 1 and total_records > start:
+            # Only the pages needed to reach max_records are requested
+            end = (
+                total_records
+                if max_records is None
+                else min(total_records, max_records)
+            )
+            offsets = range(start, end, length)
+            semaphore = asyncio.Semaphore(self.max_concurrent_pages)
 
-            if isinstance(records_filtered_raw, int):
-                total_records = records_filtered_raw
+            async def fetch_page(
+                offset: int,
+            ) -> tuple[list[Mapping[str, object]], int] | None:
+                async with semaphore:
+                    return await self._fetch_history_page(params, offset)
 
-            # Stop if we got less than a full page or intelligent stopping for small time ranges
-            if page_items_count < length or (time_range <= 7 and len(all_data) >= 500):
+            pages = await asyncio.gather(*(fetch_page(offset) for offset in offsets))
+            logger.debug(
+                f"Fetched {len(pages) + 1} history pages concurrently ({total_records} rows)"
+            )
+            for page in pages:
+                if page is None:
+                    has_more = False
+                    break
+                all_data.extend(page[0])
+                has_more = len(page[0]) >= length
+            start += len(offsets) * length
+
+        # Continue page by page until a short page, e.g. when the row count
+        # was missing or new plays arrived while the pages were being fetched
+        while has_more and (max_records is None or len(all_data) < max_records):
+            page = await self._fetch_history_page(params, start)
+            if page is None:
                 break
-
+            page_rows, page_total = page
+            all_data.extend(page_rows)
+            total_records = page_total or total_records
+            has_more = len(page_rows) >= length
             start += length
 
         return PlayHistoryData(
@@ -293,6 +418,157 @@ class DataFetcher:
             recordsTotal=total_records,
         )
 
+    async def _fetch_history_page(
+        self, params: APIParams, start: int
+    ) -> tuple[list[Mapping[str, object]], int] | None:
+        """
+        Fetch a single get_history page.
+
+        Args:
+            params: get_history parameters including the page "length"
+            start: Offset of the first row of the page
+
+        Returns:
+            The page's rows and the reported number of matching rows (0 if
+            missing), or None if the response did not contain a row list
+        """
+        response_data = await self._make_request(
+            "get_history", {**params, "start": start}
+        )
+
+        page_data_raw = response_data.get("data", [])
+        if not isinstance(page_data_raw, list):
+            return None
+
+        # Type-safe iteration over API response list
+        rows: list[Mapping[str, object]] = []
+        for item_raw in page_data_raw:  # pyright: ignore[reportUnknownVariableType] # external API response
+            item: APIResponseItem = item_raw  # pyright: ignore[reportUnknownVariableType] # external API response
+            if isinstance(item, dict):
+                row = cast(Mapping[str, object], item)
+                rows.append(compact_history_row(row) if self.compact_history else row)
+
+        records_filtered_raw = response_data.get("recordsFiltered", 0)
+        total_records = (
+            records_filtered_raw if isinstance(records_filtered_raw, int) else 0
+        )
+        return rows, total_records
+
+    async def _get_cached_play_history(
+        self, history_cache: PlayHistoryCache, time_range: int, user_id: int | None
+    ) -> PlayHistoryData:
+        """
+        Serve play history from the persistent cache after syncing it.
+
+        The cache is synced for all users, so per-user requests reuse the rows
+        fetched for server-wide graphs.
+
+        Args:
+            history_cache: Persistent play history cache
+            time_range: Time range in days (the API date buffer is added)
+            user_id: Optional user ID to filter by
+
+        Returns:
+            PlayHistoryData with cached records, newest first
+        """
+        after_date = calculate_api_date_filter(time_range)
+        _ = await self.sync_history_cache(history_cache, after_date)
+        return await _read_cached_history(history_cache, after_date, user_id)
+
+    async def get_local_play_history(
+        self, time_range: int, user_id: int | None = None
+    ) -> PlayHistoryData | None:
+        """
+        Serve play history from the persistent cache without syncing it.
+
+        Nothing is requested from Tautulli, so plays since the last sync are
+        missing. The cache's (user_id, started) index keeps per-user reads
+        cheap regardless of the number of users.
+
+        Args:
+            time_range: Time range in days (the API date buffer is added)
+            user_id: Optional user ID to filter by
+
+        Returns:
+            PlayHistoryData with cached records, newest first, or None if no
+            play history cache is configured or it does not cover the range
+        """
+        if self.history_cache is None:
+            return None
+
+        after_date = calculate_api_date_filter(time_range)
+        state = await asyncio.to_thread(self.history_cache.get_sync_state)
+        if state.covered_since is None or state.covered_since > after_date:
+            return None
+        return await _read_cached_history(self.history_cache, after_date, user_id)
+
+    async def sync_history_cache(
+        self, history_cache: PlayHistoryCache, after_date: str
+    ) -> int:
+        """
+        Fetch new play history rows into the persistent cache.
+
+        The first sync (or one for a longer window than is cached) fetches the
+        whole window. Later syncs only fetch rows started since the newest
+        cached row, minus a small overlap for late updates, until
+        full_sync_interval_days have passed; the whole window is then fetched
+        again and replaces the cached rows.
+
+        Args:
+            history_cache: Persistent play history cache
+            after_date: Earliest date (YYYY-MM-DD) the cache must cover
+
+        Returns:
+            Number of rows fetched and stored
+        """
+        async with history_cache.sync_lock:
+            state = await asyncio.to_thread(history_cache.get_sync_state)
+            now = time.time()
+
+            sync_after = after_date
+            full_sync = True
+            if (
+                state.covered_since is not None
+                and state.covered_since <= after_date
+                and state.latest_started is not None
+                and not self._full_sync_due(state, now)
+            ):
+                latest_date = datetime.date.fromtimestamp(state.latest_started)
+                overlap = datetime.timedelta(days=HISTORY_SYNC_OVERLAP_DAYS)
+                sync_after = max(after_date, (latest_date - overlap).isoformat())
+                full_sync = False
+
+            logger.debug(
+                f"Syncing play history cache: after={sync_after} "
+                + f"(cached since {state.covered_since}, full sync: {full_sync})"
+            )
+            history = await self._fetch_history_pages(
+                {"length": self.page_size, "start": 0, "after": sync_after}
+            )
+
+            # Only a complete window may replace the cached rows
+            if full_sync and len(history["data"]) < history["recordsFiltered"]:
+                logger.warning(
+                    f"Fetched {len(history['data'])} of {history['recordsFiltered']} "
+                    + "play history rows; keeping the cached rows"
+                )
+                full_sync = False
+
+            stored = await asyncio.to_thread(
+                history_cache.store_rows, history["data"], after_date, full_sync, now
+            )
+
+        logger.info(f"Play history cache synced: {stored} rows since {sync_after}")
+        return stored
+
+    def _full_sync_due(self, state: HistorySyncState, now: float) -> bool:
+        """Check whether the cached window should be fetched again in full."""
+        if self.full_sync_interval_days <= 0:
+            return False
+        if state.full_synced_at is None:
+            return True
+        return now - state.full_synced_at >= self.full_sync_interval_days * 86_400
+
     async def get_plays_per_month(
         self, time_range_months: int = 12
     ) -> Mapping[str, object]:
@@ -309,22 +585,63 @@ class DataFetcher:
         """Fetch library statistics."""
         return await self._make_request("get_libraries")
 
-    async def find_user_by_email(self, email: str) -> Mapping[str, object] | None:
-        """Find user by email address."""
+    async def get_users(self) -> list[Mapping[str, object]]:
+        """Fetch all users known to Tautulli."""
         users_response = await self._make_request("get_users")
         users_data_raw = users_response.get("data", [])
 
+        users: list[Mapping[str, object]] = []
         if isinstance(users_data_raw, list):
             # Type-safe iteration over API response list
             for user_raw in users_data_raw:  # pyright: ignore[reportUnknownVariableType] # external API response
                 user: APIResponseItem = user_raw  # pyright: ignore[reportUnknownVariableType] # external API response
                 if isinstance(user, dict):
-                    user_dict = cast(dict[str, object], user)
-                    if user_dict.get("email") == email:
-                        return cast(Mapping[str, object], user_dict)
+                    users.append(cast(Mapping[str, object], user))
+        return users
+
+    async def find_user_by_email(self, email: str) -> Mapping[str, object] | None:
+        """Find user by email address, ignoring letter case."""
+        normalized = normalize_email(email)
+        for user in await self.get_users():
+            user_email = user.get("email")
+            if (
+                isinstance(user_email, str)
+                and normalize_email(user_email) == normalized
+            ):
+                return user
 
         return None
 
+    async def find_local_user_by_email(self, email: str) -> Mapping[str, object] | None:
+        """
+        Find a user by email address in the persistent cache's user index.
+
+        Args:
+            email: The user's Plex email address
+
+        Returns:
+            The user's fields, or None if no play history cache is configured
+            or the index does not know the email
+        """
+        if self.history_cache is None:
+            return None
+        return await asyncio.to_thread(self.history_cache.find_user, email)
+
+    async def sync_user_index(self) -> int:
+        """
+        Refresh the persistent cache's user index from Tautulli.
+
+        Returns:
+            Number of users stored, 0 if no play history cache is configured
+        """
+        if self.history_cache is None:
+            return 0
+
+        users = await self.get_users()
+        stored = await asyncio.to_thread(self.history_cache.store_users, users)
+        logger.debug(f"User index synced: {stored} users")
+        return stored
+
     async def get_media_metadata(self, rating_key: int) -> Mapping[str, object]:
         """
         Fetch media metadata including resolution information for a specific item.
@@ -366,6 +683,60 @@ class DataFetcher:
 
         return await self._make_request("get_library_media_info", params)
 
+    async def fetch_many(
+        self,
+        fetch: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+    ) -> list[R | BaseException]:
+        """
+        Run a bulk operation with adaptive concurrency.
+
+        Requests are sent concurrently within the limit of the fetcher's
+        AdaptiveConcurrencyController, which adjusts it from the latency,
+        timeouts and errors of the requests.
+
+        Args:
+            fetch: Coroutine function sending the request(s) for one item
+            items: Items to fetch
+
+        Returns:
+            The result or the exception of each item, in item order
+        """
+        return await self.concurrency.map(fetch, items)
+
+    def get_concurrency_stats(self) -> dict[str, int | float]:
+        """
+        Get bulk request concurrency statistics.
+
+        Returns:
+            Dictionary with the current limit, requests in flight, completed
+            and failed requests, overloads, throughput and average latency
+        """
+        return self.concurrency.get_metrics()
+
     def clear_cache(self) -> None:
         """Clear the request cache."""
         self._cache.clear()
+
+    def get_cache_stats(self) -> dict[str, int | float]:
+        """
+        Get request cache statistics.
+
+        Returns:
+            Dictionary with entries, hits, misses and hit_rate
+        """
+        return self._cache.get_stats()
+
+
+async def _read_cached_history(
+    history_cache: PlayHistoryCache, after_date: str, user_id: int | None
+) -> PlayHistoryData:
+    """Read the cached play history rows started since a date."""
+    since = day_start(after_date)
+    rows = await asyncio.to_thread(history_cache.get_rows, since, user_id)
+
+    return PlayHistoryData(
+        data=rows,
+        recordsFiltered=len(rows),
+        recordsTotal=len(rows),
+    )
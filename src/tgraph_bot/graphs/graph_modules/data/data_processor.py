@@ -7,6 +7,7 @@ used across multiple graph classes.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Callable, TypeVar, TYPE_CHECKING, cast
 from collections.abc import Mapping, Sequence
@@ -14,6 +15,7 @@ from collections.abc import Mapping, Sequence
 if TYPE_CHECKING:
     from .data_fetcher import PlayHistoryData, DataFetcher
     from ..utils.utils import ProcessedRecords
+    from ....config.schema import TGraphBotConfig
 
 T = TypeVar("T")
 
@@ -276,9 +278,14 @@ class DataProcessor:
         record_dicts: list[dict[str, object]] = []
         for record in records:  # pyright: ignore[reportUnknownVariableType] # validated sequence
             if isinstance(record, Mapping):
-                # Cast to proper type after validation
+                # Cast to proper type after validation; dicts are only read
+                # during processing, so they are not copied
                 record_mapping = cast(Mapping[str, object], record)
-                record_dicts.append(dict(record_mapping))
+                record_dicts.append(
+                    record_mapping
+                    if isinstance(record_mapping, dict)
+                    else dict(record_mapping)
+                )
 
         raw_data_dict: dict[str, list[dict[str, object]]] = {"data": record_dicts}
         processed_records = process_play_history_data(raw_data_dict)
@@ -390,9 +397,14 @@ class DataProcessor:
         record_dicts: list[dict[str, object]] = []
         for record in records:  # pyright: ignore[reportUnknownVariableType] # validated sequence
             if isinstance(record, Mapping):
-                # Cast to proper type after validation
+                # Cast to proper type after validation; dicts are only read
+                # during processing, so they are not copied
                 record_mapping = cast(Mapping[str, object], record)
-                record_dicts.append(dict(record_mapping))
+                record_dicts.append(
+                    record_mapping
+                    if isinstance(record_mapping, dict)
+                    else dict(record_mapping)
+                )
 
         raw_data_dict: dict[str, list[dict[str, object]]] = {"data": record_dicts}
         processed_records = process_play_history_data_enhanced(raw_data_dict)
@@ -400,7 +412,10 @@ class DataProcessor:
         return records, processed_records  # pyright: ignore[reportUnknownVariableType] # validated sequence return
 
     async def extract_and_process_play_history_with_resolution(
-        self, data: Mapping[str, object] | PlayHistoryData
+        self,
+        data: Mapping[str, object] | PlayHistoryData,
+        fetcher: DataFetcher | None = None,
+        config: TGraphBotConfig | None = None,
     ) -> tuple[Sequence[Mapping[str, object]], ProcessedRecords]:
         """
         Optimized version that efficiently fetches resolution data from media metadata.
@@ -419,12 +434,18 @@ class DataProcessor:
 
         Args:
             data: API response data or PlayHistoryData
+            fetcher: Open DataFetcher to request metadata with (a new one is
+                     opened if not given)
+            config: Bot configuration (loaded from disk if not given)
 
         Returns:
             Tuple of (raw_records, processed_records) with resolution data from metadata
         """
         # Step 1: Get the basic play history data (without resolution)
-        records, _ = self.extract_and_process_play_history(data)
+        # Processing a large history is CPU-bound, so it runs off the event loop
+        records, _ = await asyncio.to_thread(
+            self.extract_and_process_play_history, data
+        )
 
         # Step 2: Extract unique rating_keys from play records (deduplicated)
         rating_keys: set[str] = set()
@@ -438,13 +459,40 @@ class DataProcessor:
         logger.info(f"Processing resolution data for {unique_count} unique media items")
 
         # Step 3: Efficiently fetch media metadata for resolution information
-        resolution_cache = await self._fetch_resolution_metadata_optimized(rating_keys)
+        resolution_cache = await self._fetch_resolution_metadata_optimized(
+            rating_keys, fetcher, config
+        )
 
         logger.info(
             f"Successfully cached resolution data for {len(resolution_cache)} items"
         )
 
         # Step 4: Process records with enhanced resolution data
+        processed_records = await asyncio.to_thread(
+            self._process_records_with_resolution, records, resolution_cache
+        )
+
+        logger.info(
+            f"Enhanced processing completed: {len(processed_records)} records with resolution data"
+        )
+
+        return records, processed_records
+
+    def _process_records_with_resolution(
+        self,
+        records: Sequence[Mapping[str, object]],
+        resolution_cache: Mapping[str, Mapping[str, str]],
+    ) -> ProcessedRecords:
+        """
+        Join resolution data with play records and process them.
+
+        Args:
+            records: Raw play history records
+            resolution_cache: Resolution data by rating key
+
+        Returns:
+            Processed records with resolution data
+        """
         from ..utils.utils import process_play_history_data_enhanced
 
         # Convert records to dict format and add resolution data
@@ -470,28 +518,33 @@ class DataProcessor:
 
         # Process the enriched data
         enriched_raw_data = {"data": enriched_record_dicts}
-        processed_records = process_play_history_data_enhanced(enriched_raw_data)
-
-        logger.info(
-            f"Enhanced processing completed: {len(processed_records)} records with resolution data"
-        )
-
-        return records, processed_records
+        return process_play_history_data_enhanced(enriched_raw_data)
 
     async def _fetch_resolution_metadata_optimized(
-        self, rating_keys: set[str]
+        self,
+        rating_keys: set[str],
+        fetcher: DataFetcher | None = None,
+        config: TGraphBotConfig | None = None,
     ) -> dict[str, dict[str, str]]:
         """
         Optimized metadata fetching with caching, batching, and concurrency.
 
+        Resolutions are kept in a persistent cache, so only rating keys that
+        have not been looked up before (or whose cache entry expired) are
+        fetched from Tautulli.
+
         Args:
             rating_keys: Set of unique rating keys to fetch metadata for
+            fetcher: Open DataFetcher to request metadata with (a new one is
+                     opened if not given)
+            config: Bot configuration (loaded from disk if not given)
 
         Returns:
             Dictionary mapping rating_keys to resolution data
         """
-        import asyncio
         from .data_fetcher import DataFetcher
+        from .metadata_cache import get_resolution_metadata_cache
+        from .response_cache import get_response_cache
         from tgraph_bot.config.manager import ConfigManager
         from tgraph_bot.utils.cli.paths import PathConfig
 
@@ -500,79 +553,103 @@ class DataProcessor:
         if not rating_keys:
             return resolution_cache
 
+        missing_keys = set(rating_keys)
         try:
-            # Load config to get Tautulli connection details
             path_config = PathConfig()
-            config_path = path_config.config_file
-            config_manager = ConfigManager()
-            config = config_manager.load_config(config_path)
-
-            async with DataFetcher(
-                base_url=config.services.tautulli.url,
-                api_key=config.services.tautulli.api_key,
-            ) as fetcher:
-                # Process in batches to avoid overwhelming the API
-                batch_size = 50  # Reasonable batch size
-                rating_keys_list = list(rating_keys)
-
-                for i in range(0, len(rating_keys_list), batch_size):
-                    batch = rating_keys_list[i : i + batch_size]
-                    batch_results = await self._fetch_metadata_batch(fetcher, batch)
-                    resolution_cache.update(batch_results)
-
-                    # Small delay between batches to be respectful to the API
-                    if i + batch_size < len(rating_keys_list):
-                        await asyncio.sleep(0.1)
+            if config is None:
+                # Load config to get Tautulli connection details
+                config = ConfigManager().load_config(path_config.config_file)
+
+            metadata_cache = (
+                get_resolution_metadata_cache(path_config.get_metadata_cache_path())
+                if config.data_collection.metadata_cache.enabled
+                else None
+            )
+            if metadata_cache is not None:
+                cached = await asyncio.to_thread(metadata_cache.get_many, rating_keys)
+                resolution_cache.update(cached)
+                missing_keys.difference_update(cached)
+                logger.info(
+                    f"Resolution metadata cache: {len(cached)} cached, {len(missing_keys)} to fetch"
+                )
+
+            if missing_keys:
+                if fetcher is not None:
+                    fetched = await self._fetch_metadata_concurrently(
+                        fetcher, missing_keys
+                    )
+                else:
+                    async with DataFetcher(
+                        base_url=config.services.tautulli.url,
+                        api_key=config.services.tautulli.api_key,
+                        response_cache=get_response_cache(),
+                    ) as new_fetcher:
+                        fetched = await self._fetch_metadata_concurrently(
+                            new_fetcher, missing_keys
+                        )
+
+                resolution_cache.update(fetched)
+                missing_keys.difference_update(fetched)
+
+                # Failed lookups are not cached so they are retried next time
+                if metadata_cache is not None and fetched:
+                    await asyncio.to_thread(metadata_cache.store_many, fetched)
 
         except Exception as e:
             logger.error(f"Failed to fetch resolution metadata: {e}")
-            # Fall back to using unknown values for all rating keys
-            for rating_key in rating_keys:
-                resolution_cache[rating_key] = {
-                    "video_resolution": "unknown",
-                    "stream_video_resolution": "unknown",
-                }
+
+        # Fall back to unknown values for rating keys that could not be looked up
+        for rating_key in missing_keys:
+            resolution_cache[rating_key] = {
+                "video_resolution": "unknown",
+                "stream_video_resolution": "unknown",
+            }
 
         return resolution_cache
 
-    async def _fetch_metadata_batch(
-        self, fetcher: DataFetcher, rating_keys_batch: list[str]
+    async def _fetch_metadata_concurrently(
+        self, fetcher: DataFetcher, rating_keys: set[str]
     ) -> dict[str, dict[str, str]]:
         """
-        Fetch metadata for a batch of rating keys concurrently.
+        Fetch metadata for rating keys concurrently.
+
+        The number of requests in flight is adjusted by the fetcher's
+        adaptive concurrency controller from the observed latency, timeouts
+        and errors, so a local Tautulli is queried quickly without
+        overwhelming a remote one.
 
         Args:
             fetcher: DataFetcher instance
-            rating_keys_batch: List of rating keys to fetch
+            rating_keys: Rating keys to fetch
 
         Returns:
-            Dictionary mapping rating_keys to resolution data for this batch
+            Dictionary mapping rating_keys to resolution data; rating keys
+            whose metadata request failed are left out
         """
-        import asyncio
+        fetched: dict[str, dict[str, str]] = {}
+        rating_keys_list = list(rating_keys)
 
-        batch_cache: dict[str, dict[str, str]] = {}
+        async def fetch(rating_key: str) -> dict[str, str]:
+            return await self._fetch_single_metadata(fetcher, rating_key)
 
-        # Create concurrent tasks for the batch
-        tasks: list[asyncio.Task[dict[str, str]]] = []
-        for rating_key in rating_keys_batch:
-            task = asyncio.create_task(self._fetch_single_metadata(fetcher, rating_key))
-            tasks.append(task)
+        results = await fetcher.fetch_many(fetch, rating_keys_list)
 
-        # Execute all tasks concurrently
-        results: list[dict[str, str] | BaseException] = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        for rating_key, result in zip(rating_keys_batch, results):
+        for rating_key, result in zip(rating_keys_list, results):
             if isinstance(result, dict):
-                batch_cache[rating_key] = result
+                fetched[rating_key] = result
             else:
-                # Handle exceptions or failed requests
-                batch_cache[rating_key] = {
-                    "video_resolution": "unknown",
-                    "stream_video_resolution": "unknown",
-                }
+                # Log warning but don't fail the entire process
+                logger.debug(
+                    f"Failed to fetch metadata for rating_key {rating_key}: {result}"
+                )
 
-        return batch_cache
+        metrics = fetcher.get_concurrency_stats()
+        logger.info(
+            f"Fetched metadata for {len(fetched)}/{len(rating_keys_list)} items "
+            + f"(concurrency limit {metrics['limit']}, "
+            + f"{metrics['throughput']} requests/s)"
+        )
+        return fetched
 
     async def _fetch_single_metadata(
         self, fetcher: DataFetcher, rating_key: str
@@ -585,11 +662,23 @@ class DataProcessor:
             rating_key: Rating key to fetch metadata for
 
         Returns:
-            Dictionary with resolution data
+            Dictionary with resolution data; resolutions are "unknown" if the
+            item has no resolution information (e.g. it was deleted) or the
+            rating key is not a number
+
+        Raises:
+            Exception: If the metadata request itself failed
         """
         try:
-            metadata = await fetcher.get_media_metadata(int(rating_key))
+            numeric_rating_key = int(rating_key)
+        except ValueError:
+            # Tautulli cannot look the key up, so it is cached as missing
+            # rather than retried on every update
+            logger.debug(f"Skipping metadata lookup for rating_key {rating_key!r}")
+            return {"video_resolution": "unknown", "stream_video_resolution": "unknown"}
 
+        metadata = await fetcher.get_media_metadata(numeric_rating_key)
+        try:
             # Extract resolution info from metadata
             video_resolution = "unknown"
             stream_video_resolution = "unknown"
@@ -682,8 +771,8 @@ class DataProcessor:
             }
 
         except Exception as e:
-            # Log warning but don't fail the entire process
-            logger.debug(f"Failed to fetch metadata for rating_key {rating_key}: {e}")
+            # Malformed metadata counts as an item without resolution information
+            logger.debug(f"Failed to parse metadata for rating_key {rating_key}: {e}")
             return {"video_resolution": "unknown", "stream_video_resolution": "unknown"}
 
     def validate_extracted_data(
@@ -0,0 +1,331 @@
+"""
+Persistent play history cache for TGraph Bot.
+
+This module stores Tautulli play history rows in a local SQLite database,
+keyed by Tautulli's history row id. After the first sync only recent rows
+have to be fetched from the API again, and graph and per-user history
+queries are answered from the local database. Rows that fall out of the
+synced window are dropped; a full sync replaces the whole window, so plays
+deleted in Tautulli disappear from the cache as well. A local copy of the
+Tautulli user list, indexed by email, lets personal statistics find a user's
+plays without asking Tautulli.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import json
+import logging
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar, cast
+
+from .history_schema import compact_history_row, decode_history_payloads
+from .sqlite_store import SQLiteStore, fetch_column, fetch_value
+
+logger = logging.getLogger(__name__)
+
+# Fields of Tautulli get_users rows kept in the user index
+_USER_FIELDS = ("user_id", "username", "friendly_name", "email")
+
+
+@dataclass(frozen=True)
+class HistorySyncState:
+    """What the local history cache currently covers."""
+
+    covered_since: str | None  # earliest "after" date (YYYY-MM-DD) fully synced
+    latest_started: int | None  # newest "started" timestamp stored
+    full_synced_at: int | None = None  # Unix time the whole window was last synced
+
+
+def _int_field(row: Mapping[str, object], *keys: str) -> int | None:
+    """Get the first integer-like field of a history row."""
+    for key in keys:
+        value = row.get(key)
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+    return None
+
+
+def day_start(day: str) -> int:
+    """
+    Get the Unix timestamp of the local midnight starting a day.
+
+    Args:
+        day: Date in YYYY-MM-DD format, like Tautulli's "after" filter
+
+    Returns:
+        Unix timestamp of the start of the day in local time
+    """
+    return int(
+        datetime.datetime.combine(
+            datetime.date.fromisoformat(day), datetime.time()
+        ).timestamp()
+    )
+
+
+def normalize_email(email: str) -> str:
+    """
+    Normalize an email address for lookups.
+
+    Args:
+        email: Email address as entered or reported by Tautulli
+
+    Returns:
+        The address without surrounding whitespace, in lower case
+    """
+    return email.strip().lower()
+
+
+class PlayHistoryCache(SQLiteStore):
+    """SQLite-backed store of Tautulli play history rows."""
+
+    SCHEMA: ClassVar[str] = """
+CREATE TABLE IF NOT EXISTS history (
+    row_id INTEGER PRIMARY KEY,
+    started INTEGER NOT NULL,
+    user_id INTEGER,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_started ON history (started);
+CREATE INDEX IF NOT EXISTS history_user_started ON history (user_id, started);
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    email TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_email ON users (email);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+    SCHEMA_VERSION: ClassVar[int] = 1
+    TABLES: ClassVar[tuple[str, ...]] = (
+        "history",
+        "users",
+        "sync_state",
+    )
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the cache.
+
+        The database file and its parent directory are created on first use.
+
+        Args:
+            path: Location of the SQLite database file
+        """
+        super().__init__(path)
+        # Serializes syncs so concurrent updates do not fetch the same rows twice
+        self.sync_lock: asyncio.Lock = asyncio.Lock()
+
+    def get_sync_state(self) -> HistorySyncState:
+        """
+        Get the range of history covered by the cache.
+
+        Returns:
+            Current sync state
+        """
+        with self._connect() as connection:
+            covered_since = fetch_value(
+                connection, "SELECT value FROM sync_state WHERE key = 'covered_since'"
+            )
+            latest = fetch_value(connection, "SELECT MAX(started) FROM history")
+            full_synced_at = fetch_value(
+                connection, "SELECT value FROM sync_state WHERE key = 'full_synced_at'"
+            )
+
+        return HistorySyncState(
+            covered_since=covered_since if isinstance(covered_since, str) else None,
+            latest_started=latest if isinstance(latest, int) else None,
+            full_synced_at=(
+                int(full_synced_at)
+                if isinstance(full_synced_at, str) and full_synced_at.isdigit()
+                else None
+            ),
+        )
+
+    def store_rows(
+        self,
+        rows: Sequence[Mapping[str, object]],
+        covered_since: str,
+        full_sync: bool = False,
+        now: float | None = None,
+    ) -> int:
+        """
+        Insert or update history rows and record the synced range.
+
+        Rows without a row id or start time cannot be keyed and are skipped.
+        Only the fields the bot uses are stored (see HISTORY_ROW_SCHEMA).
+        Cached rows started before covered_since are dropped.
+
+        Args:
+            rows: Raw history rows from the Tautulli get_history command
+            covered_since: "after" date (YYYY-MM-DD) the cache must cover
+            full_sync: Whether the rows are the whole window since
+                covered_since; they then replace all cached rows, so rows
+                deleted in Tautulli are dropped too
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            Number of rows stored
+        """
+        values: list[tuple[int, int, int | None, str]] = []
+        for row in rows:
+            row_id = _int_field(row, "row_id", "id")
+            started = _int_field(row, "started", "date")
+            if row_id is None or started is None:
+                continue
+            values.append(
+                (
+                    row_id,
+                    started,
+                    _int_field(row, "user_id"),
+                    json.dumps(compact_history_row(row)),
+                )
+            )
+
+        skipped = len(rows) - len(values)
+        if skipped:
+            logger.debug(f"Skipped {skipped} history rows without row id or start time")
+
+        with self._connect() as connection:
+            if full_sync:
+                _ = connection.execute("DELETE FROM history")
+            else:
+                _ = connection.execute(
+                    "DELETE FROM history WHERE started < ?", (day_start(covered_since),)
+                )
+            _ = connection.executemany(
+                "INSERT OR REPLACE INTO history (row_id, started, user_id, payload) "
+                + "VALUES (?, ?, ?, ?)",
+                values,
+            )
+            _ = connection.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) "
+                + "VALUES ('covered_since', ?)",
+                (covered_since,),
+            )
+            if full_sync:
+                _ = connection.execute(
+                    "INSERT OR REPLACE INTO sync_state (key, value) "
+                    + "VALUES ('full_synced_at', ?)",
+                    (str(int(time.time() if now is None else now)),),
+                )
+
+        return len(values)
+
+    def get_rows(
+        self, since: int, user_id: int | None = None
+    ) -> list[Mapping[str, object]]:
+        """
+        Get cached history rows, newest first like the Tautulli API.
+
+        Args:
+            since: Only return rows started at or after this Unix timestamp
+            user_id: Optional user ID to filter by
+
+        Returns:
+            History rows reduced to the fields the bot uses
+        """
+        query = "SELECT payload FROM history WHERE started >= ?"
+        params: tuple[object, ...] = (since,)
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params = (since, user_id)
+        query += " ORDER BY started DESC, row_id DESC"
+
+        with self._connect() as connection:
+            payloads = fetch_column(connection, query, params)
+
+        # Rows stored before compaction are reduced when they are read
+        return list(decode_history_payloads([str(payload) for payload in payloads]))
+
+    def store_users(self, users: Sequence[Mapping[str, object]]) -> int:
+        """
+        Replace the user index with the current Tautulli user list.
+
+        Users without a user ID or email address cannot be looked up and
+        are skipped.
+
+        Args:
+            users: Rows from the Tautulli get_users command
+
+        Returns:
+            Number of users stored
+        """
+        values: list[tuple[int, str, str]] = []
+        for user in users:
+            user_id = _int_field(user, "user_id")
+            email = user.get("email")
+            if user_id is None or not isinstance(email, str) or not email.strip():
+                continue
+            payload = {key: user[key] for key in _USER_FIELDS if key in user}
+            payload["user_id"] = user_id
+            values.append((user_id, normalize_email(email), json.dumps(payload)))
+
+        with self._connect() as connection:
+            _ = connection.execute("DELETE FROM users")
+            _ = connection.executemany(
+                "INSERT OR REPLACE INTO users (user_id, email, payload) "
+                + "VALUES (?, ?, ?)",
+                values,
+            )
+        return len(values)
+
+    def find_user(self, email: str) -> Mapping[str, object] | None:
+        """
+        Look up a user in the user index by email address.
+
+        Args:
+            email: The user's Plex email address, in any letter case
+
+        Returns:
+            The user's get_users fields, or None if no user has the email
+        """
+        with self._connect() as connection:
+            payload = fetch_value(
+                connection,
+                "SELECT payload FROM users WHERE email = ? ORDER BY user_id LIMIT 1",
+                (normalize_email(email),),
+            )
+        if not isinstance(payload, str):
+            return None
+        return cast(Mapping[str, object], json.loads(payload))
+
+    def clear(self) -> None:
+        """Remove all cached rows and sync state."""
+        with self._connect() as connection:
+            _ = connection.execute("DELETE FROM history")
+            _ = connection.execute("DELETE FROM users")
+            _ = connection.execute("DELETE FROM sync_state")
+
+
+_caches: dict[Path, PlayHistoryCache] = {}
+
+
+def get_play_history_cache(path: Path) -> PlayHistoryCache:
+    """
+    Get the shared cache instance for a database file.
+
+    Sharing one instance per file lets concurrent graph updates and
+    /my_stats requests wait for each other's syncs instead of repeating them.
+
+    Args:
+        path: Location of the SQLite database file
+
+    Returns:
+        PlayHistoryCache for the file
+    """
+    resolved = path.resolve()
+    if resolved not in _caches:
+        _caches[resolved] = PlayHistoryCache(resolved)
+    return _caches[resolved]
@@ -0,0 +1,120 @@
+"""
+Compact play history rows for TGraph Bot.
+
+Rows of Tautulli's get_history command have around 60 fields (titles,
+thumbnails, GUIDs, player and network details), of which the graphs use
+about twenty. Keeping whole rows makes every later step pay for the unused
+fields: the play history cache stores and decodes them on each update, and
+large histories hold them in memory for the whole update cycle.
+
+This module describes the fields the bot uses and their types, and reduces
+rows to those fields as soon as a history page is decoded. Integer fields
+that Tautulli reports as numeric strings are converted once here, so later
+processing does not have to.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Final, cast
+
+# Fields of a get_history row used by the bot, with their decoded type
+HISTORY_ROW_SCHEMA: Final[Mapping[str, type[int | str]]] = {
+    # Row identity, used by the play history cache
+    "id": int,
+    "row_id": int,
+    "started": int,
+    "user_id": int,
+    # Processed play record fields
+    "date": int,
+    "stopped": int,
+    "duration": int,
+    "paused_counter": int,
+    "user": str,
+    "platform": str,
+    "media_type": str,
+    "transcode_decision": str,
+    "video_codec": str,
+    "audio_codec": str,
+    "container": str,
+    # Resolutions and the dimensions they fall back to
+    "video_resolution": str,
+    "stream_video_resolution": str,
+    "width": int,
+    "height": int,
+    "stream_video_width": int,
+    "stream_video_height": int,
+    # Media item, used to look up resolutions from metadata
+    "rating_key": int,
+}
+
+
+def _decode_int(value: object) -> object:
+    """Convert a numeric string to an integer, leaving other values as they are."""
+    if isinstance(value, str) and value.isascii() and value.isdigit():
+        return int(value)
+    return value
+
+
+def compact_history_row(row: Mapping[str, object]) -> dict[str, object]:
+    """
+    Reduce a history row to the fields in HISTORY_ROW_SCHEMA.
+
+    Missing fields stay missing. Integer fields given as numeric strings
+    are converted to integers; values that do not match the schema are kept
+    unchanged so processing can report them as before.
+
+    Args:
+        row: History row from the Tautulli get_history command
+
+    Returns:
+        New row holding only the fields the bot uses
+    """
+    compact: dict[str, object] = {}
+    for field, field_type in HISTORY_ROW_SCHEMA.items():
+        if field in row:
+            value = row[field]
+            compact[field] = _decode_int(value) if field_type is int else value
+    return compact
+
+
+def compact_history_rows(
+    rows: Iterable[Mapping[str, object]],
+) -> list[dict[str, object]]:
+    """
+    Reduce history rows to the fields in HISTORY_ROW_SCHEMA.
+
+    Args:
+        rows: History rows from the Tautulli get_history command
+
+    Returns:
+        Compact rows in the same order
+    """
+    return [compact_history_row(row) for row in rows]
+
+
+def decode_history_payloads(payloads: Sequence[str]) -> list[dict[str, object]]:
+    """
+    Decode JSON-encoded history rows into compact rows.
+
+    The payloads are decoded with a single JSON parser call instead of one
+    call per row.
+
+    Args:
+        payloads: History rows, each encoded as a JSON object
+
+    Returns:
+        Compact rows in the same order
+
+    Raises:
+        TypeError: If a payload is not a JSON object
+    """
+    decoded = cast(list[object], json.loads(f"[{','.join(payloads)}]"))
+
+    rows: list[dict[str, object]] = []
+    for value in decoded:
+        if not isinstance(value, dict):
+            raise TypeError(f"Unexpected history payload: {value!r}")
+        rows.append(compact_history_row(value))  # pyright: ignore[reportUnknownArgumentType] # decoded JSON object
+    return rows
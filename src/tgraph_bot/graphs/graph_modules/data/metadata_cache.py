@@ -0,0 +1,160 @@
+"""
+Persistent media resolution cache for TGraph Bot.
+
+This module stores the resolution that Tautulli's get_metadata reports for
+each rating key in a local SQLite database. Media resolution almost never
+changes, so resolution graphs only have to look up rating keys they have
+not seen before. Items without a known resolution (e.g. deleted from Plex)
+are cached as well, for a shorter time, so they are not requested on every
+update.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import ClassVar
+
+from .sqlite_store import SQLiteStore, fetch_rows
+
+UNKNOWN_RESOLUTION = "unknown"
+
+# Seconds before a known resolution is looked up again
+RESOLUTION_TTL_SECONDS = 30 * 86_400
+
+# Seconds before an item without a known resolution is looked up again
+MISSING_RESOLUTION_TTL_SECONDS = 7 * 86_400
+
+# Rating keys per query, well below SQLite's host parameter limit
+_QUERY_CHUNK_SIZE = 500
+
+
+class ResolutionMetadataCache(SQLiteStore):
+    """SQLite-backed cache of media resolutions keyed by rating key."""
+
+    SCHEMA: ClassVar[str] = """
+CREATE TABLE IF NOT EXISTS resolution (
+    rating_key TEXT PRIMARY KEY,
+    video_resolution TEXT NOT NULL,
+    stream_video_resolution TEXT NOT NULL,
+    found INTEGER NOT NULL,
+    fetched_at INTEGER NOT NULL
+);
+"""
+    SCHEMA_VERSION: ClassVar[int] = 1
+    TABLES: ClassVar[tuple[str, ...]] = ("resolution",)
+
+    def __init__(
+        self,
+        path: Path,
+        resolution_ttl: float = RESOLUTION_TTL_SECONDS,
+        missing_ttl: float = MISSING_RESOLUTION_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: Location of the SQLite database file
+            resolution_ttl: Seconds a known resolution stays valid
+            missing_ttl: Seconds an unknown resolution stays valid
+        """
+        super().__init__(path)
+        self.resolution_ttl: float = resolution_ttl
+        self.missing_ttl: float = missing_ttl
+
+    def get_many(
+        self, rating_keys: Iterable[str], now: float | None = None
+    ) -> dict[str, dict[str, str]]:
+        """
+        Get the cached resolutions that have not expired.
+
+        Args:
+            rating_keys: Rating keys to look up
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            Resolution data per cached rating key; keys that are not cached
+            or have expired are left out
+        """
+        now = time.time() if now is None else now
+        keys = list(rating_keys)
+        resolutions: dict[str, dict[str, str]] = {}
+
+        with self._connect() as connection:
+            for start in range(0, len(keys), _QUERY_CHUNK_SIZE):
+                chunk = keys[start : start + _QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = fetch_rows(
+                    connection,
+                    "SELECT rating_key, video_resolution, stream_video_resolution "
+                    + f"FROM resolution WHERE rating_key IN ({placeholders}) "
+                    + "AND fetched_at >= CASE found WHEN 1 THEN ? ELSE ? END",
+                    (*chunk, now - self.resolution_ttl, now - self.missing_ttl),
+                )
+                for rating_key, video_resolution, stream_video_resolution in rows:
+                    resolutions[str(rating_key)] = {
+                        "video_resolution": str(video_resolution),
+                        "stream_video_resolution": str(stream_video_resolution),
+                    }
+
+        return resolutions
+
+    def store_many(
+        self, resolutions: Mapping[str, Mapping[str, str]], now: float | None = None
+    ) -> None:
+        """
+        Store looked up resolutions.
+
+        Entries whose source resolution is unknown are stored as missing and
+        expire after the shorter missing_ttl.
+
+        Args:
+            resolutions: Resolution data per rating key
+            now: Current Unix time (defaults to time.time())
+        """
+        fetched_at = int(time.time() if now is None else now)
+        values = [
+            (
+                rating_key,
+                data.get("video_resolution", UNKNOWN_RESOLUTION),
+                data.get("stream_video_resolution", UNKNOWN_RESOLUTION),
+                int(
+                    data.get("video_resolution", UNKNOWN_RESOLUTION)
+                    != UNKNOWN_RESOLUTION
+                ),
+                fetched_at,
+            )
+            for rating_key, data in resolutions.items()
+        ]
+
+        with self._connect() as connection:
+            _ = connection.executemany(
+                "INSERT OR REPLACE INTO resolution (rating_key, video_resolution, "
+                + "stream_video_resolution, found, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                values,
+            )
+
+    def clear(self) -> None:
+        """Remove all cached resolutions."""
+        with self._connect() as connection:
+            _ = connection.execute("DELETE FROM resolution")
+
+
+_caches: dict[Path, ResolutionMetadataCache] = {}
+
+
+def get_resolution_metadata_cache(path: Path) -> ResolutionMetadataCache:
+    """
+    Get the shared cache instance for a database file.
+
+    Args:
+        path: Location of the SQLite database file
+
+    Returns:
+        ResolutionMetadataCache for the file
+    """
+    resolved = path.resolve()
+    if resolved not in _caches:
+        _caches[resolved] = ResolutionMetadataCache(resolved)
+    return _caches[resolved]
@@ -0,0 +1,211 @@
+"""
+Shared processed play history for TGraph Bot graph generation.
+
+This module provides an immutable container for play history that has
+already been extracted and converted into processed records. The graph
+managers build it once per update cycle so that every graph can consume
+the same parsed history instead of re-processing the raw Tautulli data.
+Processed records are held in a columnar PlayRecordStore to keep the
+shared history compact.
+
+The resolution graphs additionally need the media resolution of each play,
+which is looked up from Tautulli's media metadata. The graph managers look
+it up once per update cycle, on the bot's event loop, and share the
+enriched history under its own key.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+from ..utils.record_store import PlayRecordStore
+from .data_processor import data_processor
+
+if TYPE_CHECKING:
+    from ....config.schema import TGraphBotConfig
+    from ..utils.utils import PlayRecords
+    from .data_fetcher import DataFetcher
+
+logger = logging.getLogger(__name__)
+
+# Key under which the shared processed history is stored in graph data
+PROCESSED_HISTORY_KEY = "processed_history"
+
+# Key under which the history enriched with media resolutions is stored
+RESOLUTION_HISTORY_KEY = "resolution_history"
+
+# Graph types that need the history enriched with media resolutions
+RESOLUTION_GRAPH_TYPES: Final[frozenset[str]] = frozenset(
+    {"play_count_by_source_resolution", "play_count_by_stream_resolution"}
+)
+
+
+@dataclass(frozen=True)
+class ProcessedHistory:
+    """Immutable, already-processed play history shared across graphs."""
+
+    raw_records: tuple[Mapping[str, object], ...]
+    records: PlayRecordStore
+
+    @classmethod
+    def from_graph_data(cls, data: Mapping[str, object]) -> ProcessedHistory:
+        """
+        Build processed history from the graph data structure.
+
+        Args:
+            data: Graph data as assembled by the graph managers
+                 (expects the play history under the 'data' key)
+
+        Returns:
+            ProcessedHistory containing raw and processed records
+        """
+        raw_records, processed_records = (
+            data_processor.extract_and_process_play_history(data)
+        )
+        return cls.from_records(raw_records, processed_records)
+
+    @classmethod
+    def from_records(
+        cls,
+        raw_records: Sequence[Mapping[str, object]],
+        processed_records: PlayRecords,
+    ) -> ProcessedHistory:
+        """
+        Build processed history from already-processed records.
+
+        Args:
+            raw_records: Raw play history records from the Tautulli API
+            processed_records: Processed play history records
+
+        Returns:
+            ProcessedHistory wrapping the given records
+        """
+        return cls(
+            raw_records=tuple(raw_records),
+            records=PlayRecordStore.from_records(processed_records),
+        )
+
+    def get_records(self) -> PlayRecords:
+        """
+        Get the processed records.
+
+        The columnar store is read-only, so it is returned directly and can
+        be shared by all graphs without copying.
+
+        Returns:
+            Processed play history records
+        """
+        return self.records
+
+    def __len__(self) -> int:
+        """Return the number of processed records."""
+        return len(self.records)
+
+
+def get_processed_history(data: Mapping[str, object]) -> ProcessedHistory | None:
+    """
+    Get the shared processed history from graph data if present.
+
+    Args:
+        data: Graph data structure passed to graph generation
+
+    Returns:
+        The shared ProcessedHistory, or None if it has not been built
+    """
+    history = data.get(PROCESSED_HISTORY_KEY)
+    if isinstance(history, ProcessedHistory):
+        return history
+    return None
+
+
+def with_processed_history(data: Mapping[str, object]) -> dict[str, object]:
+    """
+    Return a copy of the graph data with the shared processed history attached.
+
+    The play history is processed at most once; if the data already carries a
+    ProcessedHistory it is reused. If processing fails the data is returned
+    without it and graphs fall back to processing the raw data themselves.
+
+    Args:
+        data: Graph data structure containing raw play history
+
+    Returns:
+        New dictionary containing the original data and the processed history
+    """
+    result = dict(data)
+    if get_processed_history(data) is not None:
+        return result
+
+    try:
+        history = ProcessedHistory.from_graph_data(data)
+    except Exception as e:
+        logger.warning(f"Failed to build shared processed history: {e}")
+        return result
+
+    result[PROCESSED_HISTORY_KEY] = history
+    logger.info(f"Built shared processed history with {len(history)} records")
+    return result
+
+
+def get_resolution_history(data: Mapping[str, object]) -> ProcessedHistory | None:
+    """
+    Get the shared history enriched with media resolutions if present.
+
+    Args:
+        data: Graph data structure passed to graph generation
+
+    Returns:
+        The enriched ProcessedHistory, or None if it has not been built
+    """
+    history = data.get(RESOLUTION_HISTORY_KEY)
+    if isinstance(history, ProcessedHistory):
+        return history
+    return None
+
+
+async def with_resolution_history(
+    data: Mapping[str, object],
+    fetcher: DataFetcher | None = None,
+    config: TGraphBotConfig | None = None,
+) -> dict[str, object]:
+    """
+    Return a copy of the graph data with the resolution-enriched history attached.
+
+    Media metadata is looked up once for all resolution graphs; if the data
+    already carries the enriched history it is reused. If the lookup fails
+    the data is returned without it and the resolution graphs use the
+    resolutions found in the play history itself.
+
+    Args:
+        data: Graph data structure containing raw play history
+        fetcher: Open DataFetcher to request media metadata with
+        config: Bot configuration
+
+    Returns:
+        New dictionary containing the original data and the enriched history
+    """
+    result = dict(data)
+    if get_resolution_history(data) is not None:
+        return result
+
+    try:
+        (
+            raw_records,
+            processed_records,
+        ) = await data_processor.extract_and_process_play_history_with_resolution(
+            data, fetcher=fetcher, config=config
+        )
+        history = await asyncio.to_thread(
+            ProcessedHistory.from_records, raw_records, processed_records
+        )
+    except Exception as e:
+        logger.warning(f"Failed to build resolution-enriched history: {e}")
+        return result
+
+    result[RESOLUTION_HISTORY_KEY] = history
+    logger.info(f"Built resolution-enriched history with {len(history)} records")
+    return result
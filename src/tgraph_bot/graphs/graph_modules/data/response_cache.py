@@ -0,0 +1,183 @@
+"""
+Tautulli API response cache for TGraph Bot.
+
+This module provides a size-bounded LRU cache with per-command expiry for
+Tautulli API responses. A single shared instance is used by the graph
+managers and the resolution metadata lookup, so scheduled updates and
+repeated /my_stats requests reuse each other's responses.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+
+# Seconds a response stays valid, per Tautulli API command. Users and media
+# metadata rarely change. Play history is not cached: its pages hold up to
+# thousands of uncompacted rows, must stay fresh, and repeated reads are
+# served by the play history cache instead.
+DEFAULT_COMMAND_TTLS: dict[str, float] = {
+    "get_history": 0.0,
+    "get_plays_per_month": 300.0,
+    "get_users": 6 * 3600.0,
+    "get_user": 3600.0,
+    "get_metadata": 6 * 3600.0,
+    "get_libraries": 3600.0,
+    "get_library_media_info": 3600.0,
+}
+
+# Expiry for commands without an entry in the TTL table
+DEFAULT_TTL = 300.0
+
+# Maximum number of responses kept before the least recently used are evicted
+DEFAULT_MAX_ENTRIES = 256
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of API responses with per-command TTLs."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        command_ttls: Mapping[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            command_ttls: Seconds a response stays valid, per API command
+                (defaults to DEFAULT_COMMAND_TTLS)
+            default_ttl: Seconds a response stays valid for other commands
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.max_entries: int = max(1, max_entries)
+        self.command_ttls: dict[str, float] = dict(
+            DEFAULT_COMMAND_TTLS if command_ttls is None else command_ttls
+        )
+        self.default_ttl: float = default_ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._clock: Callable[[], float] = clock
+        self._entries: OrderedDict[str, tuple[float, Mapping[str, object]]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached responses, including expired ones."""
+        return len(self._entries)
+
+    def get_ttl(self, command: str) -> float:
+        """
+        Get how long responses to a command stay valid.
+
+        Args:
+            command: Tautulli API command
+
+        Returns:
+            Time to live in seconds
+        """
+        return self.command_ttls.get(command, self.default_ttl)
+
+    def is_cacheable(self, command: str) -> bool:
+        """
+        Check whether responses to a command are cached at all.
+
+        Args:
+            command: Tautulli API command
+
+        Returns:
+            True if the command has a positive time to live
+        """
+        return self.get_ttl(command) > 0
+
+    def get(self, key: str) -> Mapping[str, object] | None:
+        """
+        Get a cached response and count the lookup as a hit or miss.
+
+        Args:
+            key: Cache key of the request
+
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, command: str, value: Mapping[str, object]) -> None:
+        """
+        Cache a response, evicting expired and least recently used entries.
+
+        Args:
+            key: Cache key of the request
+            command: Tautulli API command, which determines the expiry
+            value: Response to cache
+        """
+        if not self.is_cacheable(command):
+            return
+        ttl = self.get_ttl(command)
+
+        now = self._clock()
+        self._entries[key] = (now + ttl, value)
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.max_entries:
+            expired = [
+                entry_key
+                for entry_key, (expires_at, _) in self._entries.items()
+                if expires_at <= now
+            ]
+            for entry_key in expired:
+                del self._entries[entry_key]
+            while len(self._entries) > self.max_entries:
+                _ = self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses. Hit and miss counters are kept."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int | float]:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Dictionary with entries, hits, misses and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_shared_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the response cache shared by all Tautulli clients of the bot.
+
+    Returns:
+        Shared ResponseCache instance
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ResponseCache()
+    return _shared_cache
@@ -0,0 +1,121 @@
+"""
+SQLite storage helpers for TGraph Bot's local caches.
+
+This module provides a small base class for caches that keep their data in
+a SQLite database under the data folder, with schema versioning, and query
+helpers that return typed values.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections.abc import Generator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import ClassVar, cast
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_column(
+    connection: sqlite3.Connection, query: str, params: tuple[object, ...] = ()
+) -> list[object]:
+    """
+    Run a query and return the first column of every result row.
+
+    Args:
+        connection: Open database connection
+        query: SQL query
+        params: Query parameters
+
+    Returns:
+        First column values
+    """
+    rows = cast(list[tuple[object, ...]], connection.execute(query, params).fetchall())
+    return [row[0] for row in rows]
+
+
+def fetch_rows(
+    connection: sqlite3.Connection, query: str, params: tuple[object, ...] = ()
+) -> list[tuple[object, ...]]:
+    """
+    Run a query and return all result rows.
+
+    Args:
+        connection: Open database connection
+        query: SQL query
+        params: Query parameters
+
+    Returns:
+        Result rows
+    """
+    return cast(list[tuple[object, ...]], connection.execute(query, params).fetchall())
+
+
+def fetch_value(
+    connection: sqlite3.Connection, query: str, params: tuple[object, ...] = ()
+) -> object:
+    """
+    Run a query and return the first column of the first row, if any.
+
+    Args:
+        connection: Open database connection
+        query: SQL query
+        params: Query parameters
+
+    Returns:
+        First value, or None if the query returned no rows
+    """
+    values = fetch_column(connection, query, params)
+    return values[0] if values else None
+
+
+class SQLiteStore:
+    """Base class for a cache stored in a versioned SQLite database."""
+
+    # Bump SCHEMA_VERSION when the table layout changes; older databases are
+    # rebuilt by dropping TABLES and running SCHEMA again
+    SCHEMA: ClassVar[str] = ""
+    SCHEMA_VERSION: ClassVar[int] = 1
+    TABLES: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the store.
+
+        The database file and its parent directory are created on first use.
+
+        Args:
+            path: Location of the SQLite database file
+        """
+        self.path: Path = path
+        self._initialized: bool = False
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection]:
+        """Open a connection in a transaction, creating the schema if needed."""
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(sqlite3.connect(self.path, timeout=30.0)) as connection:
+            if not self._initialized:
+                self._initialize_schema(connection)
+                self._initialized = True
+            with connection:
+                yield connection
+
+    def _initialize_schema(self, connection: sqlite3.Connection) -> None:
+        """Create the tables, rebuilding them if the schema version changed."""
+        version = fetch_value(connection, "PRAGMA user_version")
+        if version != self.SCHEMA_VERSION:
+            if version:
+                logger.info(
+                    f"Rebuilding {self.path.name} (schema {version} -> {self.SCHEMA_VERSION})"
+                )
+            for table in self.TABLES:
+                _ = connection.execute(f"DROP TABLE IF EXISTS {table}")
+        _ = connection.executescript(self.SCHEMA)
+        _ = connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        _ = connection.execute("PRAGMA journal_mode = WAL")
+        connection.commit()
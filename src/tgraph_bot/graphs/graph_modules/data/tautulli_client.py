@@ -0,0 +1,105 @@
+"""
+Pooled Tautulli HTTP client for TGraph Bot.
+
+This module provides a long-lived HTTP client that the bot creates once at
+startup and closes at shutdown. Graph managers borrow it for their
+DataFetcher instances, so scheduled updates and /my_stats requests reuse
+open keep-alive connections instead of setting up a new connection pool
+(and TCP/TLS handshake) every time. It also holds the adaptive concurrency
+controller for bulk requests, so the limit it has learned for the server
+carries over from one update to the next.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+
+import httpx
+
+from .concurrency_controller import AdaptiveConcurrencyController
+
+logger = logging.getLogger(__name__)
+
+
+def is_http2_available() -> bool:
+    """
+    Check whether httpx can use HTTP/2, which needs the optional h2 package.
+
+    Returns:
+        True if the h2 package is installed
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+class TautulliClient:
+    """Bot-scoped pool of HTTP connections to Tautulli."""
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
+    ) -> None:
+        """
+        Initialize the client settings. The connection pool is created by start().
+
+        Args:
+            timeout: Request timeout in seconds
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Whether to use HTTP/2 when the h2 package is installed
+        """
+        self.timeout: float = timeout
+        self.limits: httpx.Limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2: bool = http2 and is_http2_available()
+        if http2 and not self.http2:
+            logger.debug("HTTP/2 requested but the h2 package is not installed")
+        self._client: httpx.AsyncClient | None = None
+        self.concurrency: AdaptiveConcurrencyController = (
+            AdaptiveConcurrencyController(max_limit=max_connections)
+        )
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the connection pool is open."""
+        return self._client is not None and not self._client.is_closed
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client.
+
+        Raises:
+            RuntimeError: If the client has not been started or is closed
+        """
+        if self._client is None or self._client.is_closed:
+            raise RuntimeError("TautulliClient is not started")
+        return self._client
+
+    async def start(self) -> None:
+        """Open the connection pool. Does nothing if it is already open."""
+        if self.is_open:
+            return
+
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout, limits=self.limits, http2=self.http2
+        )
+        logger.info(
+            f"Tautulli HTTP client started (max {self.limits.max_connections} "
+            + f"connections, HTTP/2 {'enabled' if self.http2 else 'disabled'})"
+        )
+
+    async def close(self) -> None:
+        """Close the connection pool and all open connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("Tautulli HTTP client closed")
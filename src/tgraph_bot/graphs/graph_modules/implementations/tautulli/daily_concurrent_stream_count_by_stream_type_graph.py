@@ -9,7 +9,6 @@ streams for direct play, transcode, and copy streams on a daily basis.
 
 import logging
 from collections.abc import Mapping
-from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, override
 
 import pandas as pd
@@ -17,9 +16,10 @@ from matplotlib.axes import Axes
 
 from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
-from ...data.data_processor import data_processor
+from ...utils.record_store import filter_records_since
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
+    get_time_range_cutoff,
     ConcurrentStreamAggregates,
     calculate_concurrent_streams_by_date,
     get_stream_type_display_info,
@@ -75,8 +75,8 @@ class DailyConcurrentStreamCountByStreamTypeGraph(BaseGraph, VisualizationMixin)
         )
 
     def _filter_records_by_time_range(
-        self, records: ProcessedRecords, time_range_days: int
-    ) -> ProcessedRecords:
+        self, records: PlayRecords, time_range_days: int
+    ) -> PlayRecords:
         """
         Filter processed records to respect the time_range_days configuration.
 
@@ -90,15 +90,11 @@ class DailyConcurrentStreamCountByStreamTypeGraph(BaseGraph, VisualizationMixin)
         if not records or time_range_days <= 0:
             return records
 
-        # Calculate cutoff date (time_range_days ago from today)
-        cutoff_date = datetime.now() - timedelta(days=time_range_days)
+        # Start at midnight, so the graph does not change during the day
+        cutoff_date = get_time_range_cutoff(time_range_days)
 
         # Filter records to only include those within the time range
-        filtered_records = [
-            record
-            for record in records
-            if "datetime" in record and record["datetime"] >= cutoff_date
-        ]
+        filtered_records = filter_records_since(records, cutoff_date)
 
         logger.info(
             f"Filtered {len(records)} records down to {len(filtered_records)} records within {time_range_days} days"
@@ -185,8 +181,8 @@ class DailyConcurrentStreamCountByStreamTypeGraph(BaseGraph, VisualizationMixin)
         logger.info("Generating daily concurrent stream count by stream type graph")
 
         try:
-            # Step 1: Extract and process play history data using DataProcessor
-            _, processed_records = data_processor.extract_and_process_play_history(data)
+            # Step 1: Get processed play history (shared across graphs when available)
+            processed_records = self.get_processed_records(data)
 
             # Step 2: Extract time range configuration
             time_range_days = self.get_time_range_days_from_config()
@@ -231,7 +227,7 @@ class DailyConcurrentStreamCountByStreamTypeGraph(BaseGraph, VisualizationMixin)
             self.cleanup()
 
     def _generate_concurrent_stream_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate concurrent stream visualization showing peak concurrent streams by type.
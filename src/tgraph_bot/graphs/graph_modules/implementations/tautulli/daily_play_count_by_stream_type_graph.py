@@ -9,7 +9,6 @@ transcoded, or copied on a daily basis.
 
 import logging
 from collections.abc import Mapping
-from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, override
 
 import pandas as pd
@@ -17,9 +16,10 @@ from matplotlib.axes import Axes
 
 from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
-from ...data.data_processor import data_processor
+from ...utils.record_store import filter_records_since
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
+    get_time_range_cutoff,
     get_stream_type_display_info,
 )
 from ...visualization.visualization_mixin import VisualizationMixin
@@ -71,8 +71,8 @@ class DailyPlayCountByStreamTypeGraph(BaseGraph, VisualizationMixin):
         return self.get_enhanced_title_with_timeframe("Daily Play Count by Stream Type")
 
     def _filter_records_by_time_range(
-        self, records: ProcessedRecords, time_range_days: int
-    ) -> ProcessedRecords:
+        self, records: PlayRecords, time_range_days: int
+    ) -> PlayRecords:
         """
         Filter processed records to respect the time_range_days configuration.
 
@@ -86,15 +86,11 @@ class DailyPlayCountByStreamTypeGraph(BaseGraph, VisualizationMixin):
         if not records or time_range_days <= 0:
             return records
 
-        # Calculate cutoff date (time_range_days ago from today)
-        cutoff_date = datetime.now() - timedelta(days=time_range_days)
+        # Start at midnight, so the graph does not change during the day
+        cutoff_date = get_time_range_cutoff(time_range_days)
 
         # Filter records to only include those within the time range
-        filtered_records = [
-            record
-            for record in records
-            if "datetime" in record and record["datetime"] >= cutoff_date
-        ]
+        filtered_records = filter_records_since(records, cutoff_date)
 
         logger.info(
             f"Filtered {len(records)} records down to {len(filtered_records)} records within {time_range_days} days"
@@ -181,8 +177,8 @@ class DailyPlayCountByStreamTypeGraph(BaseGraph, VisualizationMixin):
         logger.info("Generating daily play count by stream type graph")
 
         try:
-            # Step 1: Extract and process play history data using DataProcessor
-            _, processed_records = data_processor.extract_and_process_play_history(data)
+            # Step 1: Get processed play history (shared across graphs when available)
+            processed_records = self.get_processed_records(data)
 
             # Step 2: Extract time range configuration
             time_range_days = self.get_time_range_days_from_config()
@@ -233,7 +229,7 @@ class DailyPlayCountByStreamTypeGraph(BaseGraph, VisualizationMixin):
             self.cleanup()
 
     def _generate_stream_type_separated_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate stream type separated visualization showing different stream types.
@@ -392,7 +388,7 @@ class DailyPlayCountByStreamTypeGraph(BaseGraph, VisualizationMixin):
         )
 
     def _aggregate_by_date_and_stream_type(
-        self, records: ProcessedRecords, time_range_days: int
+        self, records: PlayRecords, time_range_days: int
     ) -> dict[str, dict[str, int]]:
         """
         Aggregate records by date and stream type with date filling.
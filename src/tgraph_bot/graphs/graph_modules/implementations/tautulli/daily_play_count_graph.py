@@ -8,7 +8,6 @@ simplifies the plotting code and produces a more aesthetically pleasing result.
 
 import logging
 from collections.abc import Mapping
-from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, cast, override
 
 import pandas as pd
@@ -16,9 +15,10 @@ from matplotlib.axes import Axes
 
 from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
-from ...data.data_processor import data_processor
+from ...utils.record_store import filter_records_since
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
+    get_time_range_cutoff,
     aggregate_by_date,
     aggregate_by_date_separated,
     handle_empty_data,
@@ -72,8 +72,8 @@ class DailyPlayCountGraph(BaseGraph, VisualizationMixin):
         return self.get_enhanced_title_with_timeframe("Daily Play Count")
 
     def _filter_records_by_time_range(
-        self, records: ProcessedRecords, time_range_days: int
-    ) -> ProcessedRecords:
+        self, records: PlayRecords, time_range_days: int
+    ) -> PlayRecords:
         """
         Filter processed records to respect the time_range_days configuration.
 
@@ -87,15 +87,11 @@ class DailyPlayCountGraph(BaseGraph, VisualizationMixin):
         if not records or time_range_days <= 0:
             return records
 
-        # Calculate cutoff date (time_range_days ago from today)
-        cutoff_date = datetime.now() - timedelta(days=time_range_days)
+        # Start at midnight, so the graph does not change during the day
+        cutoff_date = get_time_range_cutoff(time_range_days)
 
         # Filter records to only include those within the time range
-        filtered_records = [
-            record
-            for record in records
-            if "datetime" in record and record["datetime"] >= cutoff_date
-        ]
+        filtered_records = filter_records_since(records, cutoff_date)
 
         logger.info(
             f"Filtered {len(records)} records down to {len(filtered_records)} records within {time_range_days} days"
@@ -182,8 +178,8 @@ class DailyPlayCountGraph(BaseGraph, VisualizationMixin):
         logger.info("Generating daily play count graph")
 
         try:
-            # Step 1: Extract and process play history data using DataProcessor
-            _, processed_records = data_processor.extract_and_process_play_history(data)
+            # Step 1: Get processed play history (shared across graphs when available)
+            processed_records = self.get_processed_records(data)
 
             # Step 2: Extract time range configuration
             time_range_days = self.get_time_range_days_from_config()
@@ -229,7 +225,7 @@ class DailyPlayCountGraph(BaseGraph, VisualizationMixin):
             self.cleanup()
 
     def _generate_separated_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate separated visualization showing Movies and TV Series separately.
@@ -360,7 +356,7 @@ class DailyPlayCountGraph(BaseGraph, VisualizationMixin):
         )
 
     def _generate_combined_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate traditional combined visualization (backward compatibility).
@@ -19,9 +19,8 @@ from matplotlib.container import BarContainer
 
 from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
-from ...data.data_processor import data_processor
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
     aggregate_by_day_of_week,
     aggregate_by_day_of_week_separated,
 )
@@ -91,8 +90,8 @@ class PlayCountByDayOfWeekGraph(BaseGraph, VisualizationMixin):
         logger.info("Generating play count by day of week graph")
 
         try:
-            # Step 1: Extract and process play history data using DataProcessor
-            _, processed_records = data_processor.extract_and_process_play_history(data)
+            # Step 1: Get processed play history (shared across graphs when available)
+            processed_records = self.get_processed_records(data)
 
             # Step 2: Setup figure with styling using combined utility
             _, ax = self.setup_figure_with_styling()
@@ -129,7 +128,7 @@ class PlayCountByDayOfWeekGraph(BaseGraph, VisualizationMixin):
             self.cleanup()
 
     def _generate_separated_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate separated visualization showing Movies and TV Series separately.
@@ -256,7 +255,7 @@ class PlayCountByDayOfWeekGraph(BaseGraph, VisualizationMixin):
         )
 
     def _generate_stacked_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate stacked bar visualization showing Movies and TV Series in stacked bars.
@@ -397,7 +396,7 @@ class PlayCountByDayOfWeekGraph(BaseGraph, VisualizationMixin):
         )
 
     def _generate_combined_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate traditional combined visualization (backward compatibility).
@@ -16,9 +16,8 @@ from matplotlib.axes import Axes
 
 from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
-from ...data.data_processor import data_processor
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
     aggregate_by_hour_of_day,
     aggregate_by_hour_of_day_separated,
 )
@@ -88,8 +87,8 @@ class PlayCountByHourOfDayGraph(BaseGraph, VisualizationMixin):
         logger.info("Generating play count by hour of day graph")
 
         try:
-            # Step 1: Extract and process play history data using DataProcessor
-            _, processed_records = data_processor.extract_and_process_play_history(data)
+            # Step 1: Get processed play history (shared across graphs when available)
+            processed_records = self.get_processed_records(data)
 
             # Step 2: Setup figure with styling using combined utility
             _, ax = self.setup_figure_with_styling()
@@ -119,7 +118,7 @@ class PlayCountByHourOfDayGraph(BaseGraph, VisualizationMixin):
             self.cleanup()
 
     def _generate_hourly_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate hourly visualization showing play counts by hour of day.
@@ -206,7 +205,7 @@ class PlayCountByHourOfDayGraph(BaseGraph, VisualizationMixin):
             logger.warning("Generated empty hour of day graph due to no data")
 
     def _generate_separated_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate separated visualization showing Movies and TV Series separately.
@@ -308,7 +307,7 @@ class PlayCountByHourOfDayGraph(BaseGraph, VisualizationMixin):
         )
 
     def _generate_stacked_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate stacked visualization showing Movies and TV Series in stacked bars.
@@ -20,7 +20,7 @@ from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
 from ...data.data_processor import data_processor
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
     aggregate_by_month,
     aggregate_by_month_separated,
 )
@@ -585,7 +585,7 @@ class PlayCountByMonthGraph(BaseGraph, VisualizationMixin):
 
     # Keep the old methods for backward compatibility
     def _generate_separated_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate separated visualization showing Movies and TV Series separately using processed play history records.
@@ -720,7 +720,7 @@ class PlayCountByMonthGraph(BaseGraph, VisualizationMixin):
         )
 
     def _generate_combined_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate traditional combined visualization using processed play history records.
@@ -15,9 +15,8 @@ from matplotlib.axes import Axes
 
 from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
-from ...data.data_processor import data_processor
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
     filter_records_by_stream_type,
     get_available_stream_types,
     get_stream_type_display_info,
@@ -89,39 +88,8 @@ class PlayCountByStreamResolutionGraph(BaseGraph, VisualizationMixin):
         logger.info("Generating play count by stream resolution graph")
 
         try:
-            # Step 1: Extract and process play history data with resolution metadata lookup
-            import asyncio
-
-            # Use run_until_complete to handle both cases (existing loop or not)
-            try:
-                # Try to get existing loop
-                _ = asyncio.get_running_loop()
-                # For sync context, we need to create a new thread to run this
-                import concurrent.futures
-
-                def run_in_new_loop():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        return new_loop.run_until_complete(
-                            data_processor.extract_and_process_play_history_with_resolution(
-                                data
-                            )
-                        )
-                    finally:
-                        new_loop.close()
-
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(run_in_new_loop)
-                    _, processed_records = future.result()
-
-            except RuntimeError:
-                # No event loop running, we can use asyncio.run
-                _, processed_records = asyncio.run(
-                    data_processor.extract_and_process_play_history_with_resolution(
-                        data
-                    )
-                )
+            # Step 1: Get the play history enriched with media resolutions
+            processed_records = self.get_resolution_records(data)
 
             # Step 2: Setup figure with styling using combined utility
             _, ax = self.setup_figure_with_styling()
@@ -154,8 +122,8 @@ class PlayCountByStreamResolutionGraph(BaseGraph, VisualizationMixin):
             self.cleanup()
 
     def _apply_stream_type_filtering(
-        self, processed_records: ProcessedRecords
-    ) -> ProcessedRecords:
+        self, processed_records: PlayRecords
+    ) -> PlayRecords:
         """
         Apply stream type filtering to processed records based on configuration.
 
@@ -198,7 +166,7 @@ class PlayCountByStreamResolutionGraph(BaseGraph, VisualizationMixin):
         return filtered_records
 
     def _generate_resolution_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate resolution visualization showing play counts by stream resolution with stream type breakdown.
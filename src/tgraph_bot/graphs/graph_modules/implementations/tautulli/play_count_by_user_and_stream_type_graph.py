@@ -15,9 +15,8 @@ from matplotlib.axes import Axes
 
 from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
-from ...data.data_processor import data_processor
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
     aggregate_by_user_and_stream_type,
     get_stream_type_display_info,
     censor_username,
@@ -90,8 +89,8 @@ class PlayCountByUserAndStreamTypeGraph(BaseGraph, VisualizationMixin):
         logger.info("Generating play count by user and stream type graph")
 
         try:
-            # Step 1: Extract and process play history data using DataProcessor
-            _, processed_records = data_processor.extract_and_process_play_history(data)
+            # Step 1: Get processed play history (shared across graphs when available)
+            processed_records = self.get_processed_records(data)
 
             # Step 2: Setup figure with styling using combined utility
             _, ax = self.setup_figure_with_styling()
@@ -121,7 +120,7 @@ class PlayCountByUserAndStreamTypeGraph(BaseGraph, VisualizationMixin):
             self.cleanup()
 
     def _generate_user_stream_type_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate user and stream type visualization showing stacked bars by user.
@@ -13,9 +13,8 @@ from matplotlib.axes import Axes
 
 from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
-from ...data.data_processor import data_processor
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
     aggregate_top_platforms,
     aggregate_top_platforms_separated,
     handle_empty_data,
@@ -82,8 +81,8 @@ class Top10PlatformsGraph(BaseGraph, VisualizationMixin):
         logger.info("Generating top 10 platforms graph")
 
         try:
-            # Step 1: Extract and process play history data using DataProcessor
-            _, processed_records = data_processor.extract_and_process_play_history(data)
+            # Step 1: Get processed play history (shared across graphs when available)
+            processed_records = self.get_processed_records(data)
 
             # Step 2: Setup figure with styling using combined utility
             _, ax = self.setup_figure_with_styling()
@@ -113,7 +112,7 @@ class Top10PlatformsGraph(BaseGraph, VisualizationMixin):
             self.cleanup()
 
     def _generate_combined_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate combined visualization showing all platforms without media type separation.
@@ -205,7 +204,7 @@ class Top10PlatformsGraph(BaseGraph, VisualizationMixin):
             self.setup_standard_title_and_axes(title=self.get_title())
 
     def _generate_separated_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate separated visualization showing Movies and TV Series platforms separately.
@@ -328,7 +327,7 @@ class Top10PlatformsGraph(BaseGraph, VisualizationMixin):
         )
 
     def _generate_stacked_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate stacked visualization showing Movies and TV Series platforms in stacked bars.
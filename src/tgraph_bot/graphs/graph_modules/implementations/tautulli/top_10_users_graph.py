@@ -15,9 +15,8 @@ from matplotlib.axes import Axes
 
 from ...utils.annotation_helper import AnnotationHelper
 from ...core.base_graph import BaseGraph
-from ...data.data_processor import data_processor
 from ...utils.utils import (
-    ProcessedRecords,
+    PlayRecords,
     aggregate_top_users,
     aggregate_top_users_separated,
     handle_empty_data,
@@ -88,8 +87,8 @@ class Top10UsersGraph(BaseGraph, VisualizationMixin):
         logger.info("Generating top 10 users graph")
 
         try:
-            # Step 1: Extract and process play history data using DataProcessor
-            _, processed_records = data_processor.extract_and_process_play_history(data)
+            # Step 1: Get processed play history (shared across graphs when available)
+            processed_records = self.get_processed_records(data)
 
             # Step 2: Setup figure with styling using combined utility
             _, ax = self.setup_figure_with_styling()
@@ -119,7 +118,7 @@ class Top10UsersGraph(BaseGraph, VisualizationMixin):
             self.cleanup()
 
     def _generate_combined_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate combined visualization showing all users without media type separation.
@@ -213,7 +212,7 @@ class Top10UsersGraph(BaseGraph, VisualizationMixin):
             logger.warning("Generated empty top 10 users graph due to no data")
 
     def _generate_separated_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate separated visualization showing Movies and TV Series users separately.
@@ -328,7 +327,7 @@ class Top10UsersGraph(BaseGraph, VisualizationMixin):
         )
 
     def _generate_stacked_visualization(
-        self, ax: Axes, processed_records: ProcessedRecords
+        self, ax: Axes, processed_records: PlayRecords
     ) -> None:
         """
         Generate stacked visualization showing Movies and TV Series users in stacked bars.
@@ -6,13 +6,16 @@ functionality used across the graph generation system.
 """
 
 from .annotation_helper import AnnotationHelper
+from .image_output import ImageOutputOptions, save_figure_image
 from .progress_tracker import (
     BaseProgressTracker,
     ProgressTracker,
     ProgressTrackerConfig,
     SimpleProgressTracker,
 )
+from .record_store import PlayRecordStore
 from .utils import (
+    PlayRecords,
     ProcessedPlayRecord,
     ProcessedRecords,
     SeparatedPlatformAggregates,
@@ -34,6 +37,7 @@ from .utils import (
     get_available_stream_types,
     get_current_graph_storage_path,
     get_media_type_display_info,
+    get_modern_style_rc,
     get_stream_type_statistics,
     process_play_history_data,
     validate_color,
@@ -42,10 +46,13 @@ from .utils import (
 
 __all__ = [
     "AnnotationHelper",
+    "ImageOutputOptions",
     "BaseProgressTracker",
     "ProgressTracker",
     "ProgressTrackerConfig",
     "SimpleProgressTracker",
+    "PlayRecords",
+    "PlayRecordStore",
     "ProcessedPlayRecord",
     "ProcessedRecords",
     "SeparatedPlatformAggregates",
@@ -67,8 +74,10 @@ __all__ = [
     "get_available_stream_types",
     "get_current_graph_storage_path",
     "get_media_type_display_info",
+    "get_modern_style_rc",
     "get_stream_type_statistics",
     "process_play_history_data",
+    "save_figure_image",
     "validate_color",
     "validate_graph_data",
 ]
@@ -0,0 +1,130 @@
+"""
+Sweep-line engine for concurrent stream calculation.
+
+This module computes peak concurrent streams per time bucket (day or hour)
+with a single global sweep over integer epoch arrays. Sessions are treated
+as half-open intervals [start, end): a stream that ends at the same second
+another one starts is not counted as overlapping it. Bucket boundaries are
+inserted into the event stream, which splits every session at each boundary
+it crosses, so a stream that runs past midnight counts towards the peak of
+every day (or hour) it is active in.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Event kinds, in the order they are processed when they share a timestamp
+_END_EVENT = 0
+_BOUNDARY_EVENT = 1
+_START_EVENT = 2
+
+
+@dataclass(frozen=True)
+class ConcurrencyPeaks:
+    """Peak concurrent streams for each bucket that had active streams."""
+
+    buckets: list[int]  # bucket number, i.e. seconds since epoch // bucket size
+    peaks: list[int]
+    breakdowns: list[list[int]]  # concurrent streams per stream type at the peak
+
+
+def sweep_concurrent_streams(
+    starts: NDArray[np.int64],
+    ends: NDArray[np.int64],
+    stream_types: NDArray[np.int64],
+    stream_type_count: int,
+    bucket_seconds: int,
+) -> ConcurrencyPeaks:
+    """
+    Calculate peak concurrent streams per bucket in one sweep.
+
+    Args:
+        starts: Session start times in seconds
+        ends: Session end times in seconds
+        stream_types: Stream type index (0 <= index < stream_type_count) per session
+        stream_type_count: Number of distinct stream types
+        bucket_seconds: Bucket size in seconds (86400 for days, 3600 for hours)
+
+    Returns:
+        Peaks for every bucket in which at least one stream was active,
+        ordered by bucket. The breakdown is taken at the first moment the
+        bucket's peak is reached.
+    """
+    # Sessions without a positive duration never overlap anything
+    valid = ends > starts
+    starts = starts[valid]
+    ends = ends[valid]
+    stream_types = stream_types[valid]
+    if starts.size == 0:
+        return ConcurrencyPeaks(buckets=[], peaks=[], breakdowns=[])
+
+    # Boundaries strictly inside the covered range split the sessions
+    first_bucket = int(starts.min()) // bucket_seconds
+    last_bucket = (int(ends.max()) - 1) // bucket_seconds
+    boundaries = np.arange(first_bucket + 1, last_bucket + 1, dtype=np.int64) * (
+        bucket_seconds
+    )
+
+    session_count = starts.size
+    times = np.concatenate((ends, boundaries, starts))
+    kinds = np.concatenate(
+        (
+            np.full(session_count, _END_EVENT, dtype=np.int8),
+            np.full(boundaries.size, _BOUNDARY_EVENT, dtype=np.int8),
+            np.full(session_count, _START_EVENT, dtype=np.int8),
+        )
+    )
+    deltas = np.concatenate(
+        (
+            np.full(session_count, -1, dtype=np.int64),
+            np.zeros(boundaries.size, dtype=np.int64),
+            np.ones(session_count, dtype=np.int64),
+        )
+    )
+    event_types = np.concatenate(
+        (stream_types, np.full(boundaries.size, -1, dtype=np.int64), stream_types)
+    )
+
+    order = np.lexsort((kinds, times))
+    deltas = deltas[order]
+    event_types = event_types[order]
+    levels = np.cumsum(deltas)
+    event_buckets = times[order] // bucket_seconds
+
+    # The level can only rise at a start or a boundary, so end events are left
+    # out of the peak. Otherwise a bucket that opens with sessions ending on
+    # its boundary would pick up the level from before they ended.
+    candidate_levels = np.where(kinds[order] == _END_EVENT, -1, levels)
+
+    # Events are sorted by time, so each bucket is a contiguous run
+    buckets, bucket_starts, bucket_sizes = np.unique(
+        event_buckets, return_index=True, return_counts=True
+    )
+    peaks = np.maximum.reduceat(candidate_levels, bucket_starts)
+
+    # First start or boundary event in each bucket at which the peak is reached
+    is_peak = cast(
+        NDArray[np.bool_], candidate_levels == np.repeat(peaks, bucket_sizes)
+    )
+    peak_positions = np.flatnonzero(is_peak)
+    _, first_peaks = np.unique(event_buckets[peak_positions], return_index=True)
+    peak_positions = peak_positions[first_peaks]
+
+    # Per-type levels are only needed at the peak events
+    breakdown = np.empty((peak_positions.size, stream_type_count), dtype=np.int64)
+    for stream_type in range(stream_type_count):
+        is_type = cast(NDArray[np.bool_], event_types == stream_type)
+        type_deltas = np.where(is_type, deltas, 0)
+        breakdown[:, stream_type] = np.cumsum(type_deltas)[peak_positions]
+
+    active = peaks > 0
+    return ConcurrencyPeaks(
+        buckets=cast(list[int], buckets[active].tolist()),
+        peaks=cast(list[int], peaks[active].tolist()),
+        breakdowns=cast(list[list[int]], breakdown[active].tolist()),
+    )
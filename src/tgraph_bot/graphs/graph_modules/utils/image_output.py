@@ -0,0 +1,124 @@
+"""
+Image output for TGraph Bot graphs.
+
+Saving a graph is a large part of its render time: cropping the image to
+its content (bbox_inches="tight") draws the figure twice, and the PNG
+encoder's compression level trades CPU time for file size. This module
+saves figures according to ImageOutputOptions, which selects between the
+cropped and the fixed figure layout, the zlib level of PNG images, palette
+quantization of PNG images and lossless WebP output.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Final, Literal
+
+from PIL import Image
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+type ImageFormat = Literal["png", "webp"]
+
+IMAGE_FORMATS: Final[tuple[ImageFormat, ...]] = ("png", "webp")
+
+# zlib level used by Pillow when none is configured
+DEFAULT_PNG_COMPRESS_LEVEL = 6
+
+# Colors of quantized PNG images
+QUANTIZE_COLORS = 256
+
+# WebP encoder effort (0-6); higher levels are slower for little gain on graphs
+WEBP_METHOD = 2
+
+
+@dataclass(frozen=True)
+class ImageOutputOptions:
+    """How rendered graphs are encoded and saved."""
+
+    image_format: ImageFormat = "png"
+    tight_bbox: bool = True
+    png_compress_level: int = DEFAULT_PNG_COMPRESS_LEVEL
+    png_quantize: bool = False
+
+    @property
+    def extension(self) -> str:
+        """File extension of images saved with these options."""
+        return f".{self.image_format}"
+
+
+def image_format_for_path(path: str | Path) -> ImageFormat:
+    """
+    Get the image format matching a file's extension.
+
+    Args:
+        path: Path of the image file
+
+    Returns:
+        "webp" for .webp files, "png" otherwise
+    """
+    return "webp" if Path(path).suffix.lower() == ".webp" else "png"
+
+
+def save_figure_image(
+    figure: Figure,
+    output_path: str | Path | BinaryIO,
+    options: ImageOutputOptions,
+    *,
+    dpi: float,
+    facecolor: str,
+) -> None:
+    """
+    Save a figure as an image file.
+
+    Args:
+        figure: Figure to save
+        output_path: Path of the image file, or a binary stream to write to
+        options: Image format and encoder settings
+        dpi: Resolution of the image
+        facecolor: Background color of the image
+    """
+    bbox_inches = "tight" if options.tight_bbox else None
+
+    if options.image_format == "webp":
+        figure.savefig(  # pyright: ignore[reportUnknownMemberType]
+            output_path,
+            dpi=dpi,
+            bbox_inches=bbox_inches,
+            facecolor=facecolor,
+            edgecolor="none",
+            format="webp",
+            pil_kwargs={"lossless": True, "method": WEBP_METHOD},
+        )
+        return
+
+    if not options.png_quantize:
+        figure.savefig(  # pyright: ignore[reportUnknownMemberType]
+            output_path,
+            dpi=dpi,
+            bbox_inches=bbox_inches,
+            facecolor=facecolor,
+            edgecolor="none",
+            format="png",
+            pil_kwargs={"compress_level": options.png_compress_level},
+        )
+        return
+
+    # Render without compression, then reduce the image to a palette
+    buffer = io.BytesIO()
+    figure.savefig(  # pyright: ignore[reportUnknownMemberType]
+        buffer,
+        dpi=dpi,
+        bbox_inches=bbox_inches,
+        facecolor=facecolor,
+        edgecolor="none",
+        format="png",
+        pil_kwargs={"compress_level": 0},
+    )
+    _ = buffer.seek(0)
+    with Image.open(buffer) as image:
+        quantized = image.quantize(QUANTIZE_COLORS, method=Image.Quantize.FASTOCTREE)
+    quantized.save(output_path, format="PNG", compress_level=options.png_compress_level)
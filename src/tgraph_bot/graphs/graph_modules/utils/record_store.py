@@ -0,0 +1,545 @@
+"""
+Columnar play record store for TGraph Bot graph modules.
+
+This module provides a compact, array-backed alternative to a list of
+ProcessedPlayRecord dictionaries. Timestamps and durations are stored in
+NumPy integer arrays and repeated string fields (user, platform, media type,
+transcode decision, resolutions, codecs, container) are dictionary-encoded,
+so large histories only need a few bytes per record.
+
+The store behaves as a read-only sequence of ProcessedPlayRecord
+dictionaries, which are materialized on access, so every aggregation
+function that iterates over records also accepts a PlayRecordStore.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Final, TypeVar, cast, overload, override
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from .record_types import PlayRecords, ProcessedPlayRecord
+
+T = TypeVar("T")
+
+# Code used in categorical columns for records that do not have the field
+MISSING_CODE: Final[int] = -1
+
+SECONDS_PER_DAY: Final[int] = 86_400
+
+# Key under which a store caches its content fingerprint
+_FINGERPRINT_KEY: Final[tuple[str]] = ("fingerprint",)
+
+# Dictionary-encoded string fields, in ProcessedPlayRecord order
+CATEGORICAL_FIELDS: Final[tuple[str, ...]] = (
+    "user",
+    "platform",
+    "media_type",
+    "transcode_decision",
+    "video_resolution",
+    "stream_video_resolution",
+    "video_codec",
+    "audio_codec",
+    "container",
+)
+
+
+def _int_at(array: NDArray[np.int32] | NDArray[np.int64], index: int) -> int:
+    """Read a single array element as a Python int."""
+    return int(array[index])  # pyright: ignore[reportAny] # NumPy scalar indexing is untyped
+
+
+def _to_local_seconds(timestamps: NDArray[np.int64]) -> NDArray[np.int64]:
+    """
+    Shift epoch timestamps by the local UTC offset in effect at each time.
+
+    The offset is looked up once per UTC day; only days on which the offset
+    changes (daylight saving transitions) are resolved per timestamp.
+
+    Args:
+        timestamps: Epoch timestamps in seconds
+
+    Returns:
+        New array of local wall-clock seconds since the epoch
+    """
+    if timestamps.size == 0:
+        return timestamps.copy()
+
+    days, inverse = np.unique(timestamps // SECONDS_PER_DAY, return_inverse=True)
+    offsets = np.empty(days.size, dtype=np.int64)
+    changes_during_day = np.zeros(days.size, dtype=np.bool_)
+    for position, day in enumerate(cast(list[int], days.tolist())):
+        day_start = day * SECONDS_PER_DAY
+        start_offset = time.localtime(day_start).tm_gmtoff
+        end_offset = time.localtime(day_start + SECONDS_PER_DAY - 1).tm_gmtoff
+        offsets[position] = start_offset
+        changes_during_day[position] = start_offset != end_offset
+
+    local_seconds = timestamps + offsets[inverse]
+    for position in np.flatnonzero(changes_during_day[inverse]).tolist():
+        timestamp = _int_at(timestamps, position)
+        local_seconds[position] = timestamp + time.localtime(timestamp).tm_gmtoff
+
+    return local_seconds
+
+
+@dataclass(frozen=True, eq=False)
+class CategoricalColumn:
+    """Dictionary-encoded string column."""
+
+    codes: NDArray[np.int32]
+    categories: tuple[str, ...]
+
+    @classmethod
+    def encode(cls, values: Iterable[str | None]) -> CategoricalColumn:
+        """
+        Dictionary-encode a sequence of string values.
+
+        Args:
+            values: String values to encode; None marks a missing value
+
+        Returns:
+            CategoricalColumn with one code per value
+        """
+        lookup: dict[str, int] = {}
+        codes: list[int] = []
+        for value in values:
+            if value is None:
+                codes.append(MISSING_CODE)
+                continue
+            code = lookup.get(value)
+            if code is None:
+                code = len(lookup)
+                lookup[value] = code
+            codes.append(code)
+
+        return cls(
+            codes=np.asarray(codes, dtype=np.int32),
+            categories=tuple(lookup),
+        )
+
+    def value_at(self, index: int) -> str | None:
+        """
+        Decode the value at the given position.
+
+        Args:
+            index: Position of the value in the column
+
+        Returns:
+            The decoded string, or None if the value is missing
+        """
+        code = _int_at(self.codes, index)
+        if code == MISSING_CODE:
+            return None
+        return self.categories[code]
+
+    def take(self, indices: NDArray[np.intp]) -> CategoricalColumn:
+        """
+        Select rows from the column, sharing the category table.
+
+        Args:
+            indices: Positions of the rows to keep
+
+        Returns:
+            New CategoricalColumn containing only the selected rows
+        """
+        return CategoricalColumn(codes=self.codes[indices], categories=self.categories)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the codes and category strings."""
+        return int(self.codes.nbytes) + sum(len(value) for value in self.categories)
+
+
+class PlayRecordStore(Sequence["ProcessedPlayRecord"]):
+    """
+    Immutable columnar storage for processed play history records.
+
+    Records are stored as parallel arrays: int64 epoch timestamps, int32
+    durations, int64 stop times, int32 pause counters and dictionary-encoded
+    categorical columns. Indexing or iterating yields ProcessedPlayRecord
+    dictionaries equivalent to the ones the store was built from.
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_aggregate_cache",
+        "_columns",
+        "_date_overrides",
+        "_durations",
+        "_local_timestamps",
+        "_paused_counters",
+        "_stopped",
+        "_timestamps",
+    )
+
+    def __init__(
+        self,
+        timestamps: NDArray[np.int64],
+        durations: NDArray[np.int32],
+        stopped: NDArray[np.int64],
+        paused_counters: NDArray[np.int32],
+        columns: Mapping[str, CategoricalColumn],
+        date_overrides: Mapping[int, str] | None = None,
+    ) -> None:
+        """
+        Initialize the store from pre-built columns.
+
+        Args:
+            timestamps: Play start times as epoch seconds
+            durations: Play durations in seconds
+            stopped: Play stop times as epoch seconds
+            paused_counters: Paused time counters in seconds
+            columns: Categorical columns keyed by field name
+            date_overrides: Original 'date' strings for records where it differs
+                from the timestamp (keyed by row position)
+
+        Raises:
+            ValueError: If the columns have different lengths or a categorical
+                field is missing
+        """
+        size = len(timestamps)
+        missing_fields = [field for field in CATEGORICAL_FIELDS if field not in columns]
+        if missing_fields:
+            raise ValueError(f"Missing categorical columns: {missing_fields}")
+
+        lengths = {
+            len(durations),
+            len(stopped),
+            len(paused_counters),
+            *(len(columns[field].codes) for field in CATEGORICAL_FIELDS),
+        }
+        if lengths - {size}:
+            raise ValueError("All columns of a PlayRecordStore must have equal length")
+
+        self._timestamps: NDArray[np.int64] = timestamps
+        self._durations: NDArray[np.int32] = durations
+        self._stopped: NDArray[np.int64] = stopped
+        self._paused_counters: NDArray[np.int32] = paused_counters
+        self._columns: dict[str, CategoricalColumn] = {
+            field: columns[field] for field in CATEGORICAL_FIELDS
+        }
+        self._date_overrides: dict[int, str] = dict(date_overrides or {})
+        self._local_timestamps: NDArray[np.int64] | None = None
+        self._aggregate_cache: dict[Hashable, object] = {}
+
+        # Freeze the arrays so shared stores cannot be modified in place
+        for array in (
+            self._timestamps,
+            self._durations,
+            self._stopped,
+            self._paused_counters,
+            *(column.codes for column in self._columns.values()),
+        ):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_records(cls, records: Iterable[ProcessedPlayRecord]) -> PlayRecordStore:
+        """
+        Build a columnar store from processed play records.
+
+        Args:
+            records: Processed play history records
+
+        Returns:
+            PlayRecordStore containing the same records
+        """
+        if isinstance(records, PlayRecordStore):
+            return records
+
+        timestamps: list[int] = []
+        durations: list[int] = []
+        stopped: list[int] = []
+        paused_counters: list[int] = []
+        field_values: dict[str, list[str | None]] = {
+            field: [] for field in CATEGORICAL_FIELDS
+        }
+        date_overrides: dict[int, str] = {}
+
+        for index, record in enumerate(records):
+            # Widen to a plain mapping so optional fields can be read uniformly
+            values = cast(Mapping[str, object], record)
+            timestamp = int(record["datetime"].timestamp())
+            timestamps.append(timestamp)
+            durations.append(record["duration"])
+            stopped.append(record["stopped"])
+            paused_counters.append(record["paused_counter"])
+
+            if record["date"] != str(timestamp):
+                date_overrides[index] = record["date"]
+
+            for field in CATEGORICAL_FIELDS:
+                value = values.get(field)
+                field_values[field].append(None if value is None else str(value))
+
+        return cls(
+            timestamps=np.asarray(timestamps, dtype=np.int64),
+            durations=np.asarray(durations, dtype=np.int32),
+            stopped=np.asarray(stopped, dtype=np.int64),
+            paused_counters=np.asarray(paused_counters, dtype=np.int32),
+            columns={
+                field: CategoricalColumn.encode(values)
+                for field, values in field_values.items()
+            },
+            date_overrides=date_overrides,
+        )
+
+    @classmethod
+    def empty(cls) -> PlayRecordStore:
+        """Create an empty store."""
+        return cls.from_records(())
+
+    @property
+    def timestamps(self) -> NDArray[np.int64]:
+        """Play start times as int64 epoch seconds (read-only)."""
+        return self._timestamps
+
+    @property
+    def durations(self) -> NDArray[np.int32]:
+        """Play durations in seconds as int32 (read-only)."""
+        return self._durations
+
+    def local_timestamps(self) -> NDArray[np.int64]:
+        """
+        Get play start times as local wall-clock seconds since the epoch.
+
+        These match the naive local datetimes of the materialized records
+        (datetime.fromtimestamp), including daylight saving time changes,
+        and are computed once per store.
+
+        Returns:
+            Read-only int64 array of local timestamps
+        """
+        if self._local_timestamps is None:
+            local_timestamps = _to_local_seconds(self._timestamps)
+            local_timestamps.flags.writeable = False
+            self._local_timestamps = local_timestamps
+        return self._local_timestamps
+
+    def memoize(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Get a derived value for this store, computing it on first use.
+
+        Because the store is immutable, values derived from it (such as
+        aggregation results) can be cached for its lifetime. Callers must not
+        modify the returned value.
+
+        Args:
+            key: Hashable key identifying the derived value
+            compute: Function computing the value on a cache miss
+
+        Returns:
+            The cached or newly computed value
+        """
+        if key in self._aggregate_cache:
+            return cast(T, self._aggregate_cache[key])
+
+        value = compute()
+        self._aggregate_cache[key] = value
+        return value
+
+    def prime(self, key: Hashable, value: object) -> None:
+        """
+        Store a precomputed derived value for later memoize() calls.
+
+        Args:
+            key: Hashable key identifying the derived value
+            value: The precomputed value
+        """
+        self._aggregate_cache[key] = value
+
+    def column(self, field: str) -> CategoricalColumn:
+        """
+        Get a dictionary-encoded column by field name.
+
+        Args:
+            field: One of CATEGORICAL_FIELDS
+
+        Returns:
+            The CategoricalColumn for the field
+
+        Raises:
+            KeyError: If the field is not a categorical column
+        """
+        return self._columns[field]
+
+    def take(self, indices: NDArray[np.intp] | NDArray[np.bool_]) -> PlayRecordStore:
+        """
+        Select a subset of records.
+
+        Args:
+            indices: Row positions or a boolean mask of the records to keep
+
+        Returns:
+            New PlayRecordStore containing only the selected records
+        """
+        positions: NDArray[np.intp] = (
+            np.flatnonzero(indices)
+            if indices.dtype == np.bool_
+            else np.asarray(indices, dtype=np.intp)
+        )
+        date_overrides: dict[int, str] = {}
+        if self._date_overrides:
+            old_indices = cast(list[int], positions.tolist())
+            for new_index, old_index in enumerate(old_indices):
+                override_value = self._date_overrides.get(old_index)
+                if override_value is not None:
+                    date_overrides[new_index] = override_value
+
+        subset = PlayRecordStore(
+            timestamps=self._timestamps[positions],
+            durations=self._durations[positions],
+            stopped=self._stopped[positions],
+            paused_counters=self._paused_counters[positions],
+            columns={
+                field: column.take(positions)
+                for field, column in self._columns.items()
+            },
+            date_overrides=date_overrides,
+        )
+        if self._local_timestamps is not None:
+            # Reuse the already resolved local times instead of looking them up again
+            local_timestamps = self._local_timestamps[positions]
+            local_timestamps.flags.writeable = False
+            subset._local_timestamps = local_timestamps
+        return subset
+
+    def filter_since(self, cutoff: datetime) -> PlayRecordStore:
+        """
+        Select records that started at or after the cutoff time.
+
+        Args:
+            cutoff: Naive local datetime (as used by processed records)
+
+        Returns:
+            New PlayRecordStore containing only the matching records
+        """
+        return self.take(self._timestamps >= cutoff.timestamp())
+
+    def to_records(self) -> list[ProcessedPlayRecord]:
+        """Materialize all records as ProcessedPlayRecord dictionaries."""
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the store's columns."""
+        return (
+            int(self._timestamps.nbytes)
+            + int(self._durations.nbytes)
+            + int(self._stopped.nbytes)
+            + int(self._paused_counters.nbytes)
+            + sum(column.nbytes for column in self._columns.values())
+        )
+
+    def fingerprint(self) -> str:
+        """
+        Get a hash of the store's contents.
+
+        Stores built from the same records in the same order have the same
+        fingerprint, also in other processes, so it can key persistent caches
+        of results derived from the records.
+
+        Returns:
+            Hex digest identifying the records
+        """
+        return self.memoize(_FINGERPRINT_KEY, self._compute_fingerprint)
+
+    def _compute_fingerprint(self) -> str:
+        """Hash all columns of the store."""
+        digest = hashlib.blake2b(str(len(self)).encode(), digest_size=16)
+        for array in (
+            self._timestamps,
+            self._durations,
+            self._stopped,
+            self._paused_counters,
+        ):
+            digest.update(array.tobytes())
+        for field, column in self._columns.items():
+            digest.update(field.encode())
+            digest.update(column.codes.tobytes())
+            digest.update(json.dumps(column.categories).encode())
+        digest.update(json.dumps(sorted(self._date_overrides.items())).encode())
+        return digest.hexdigest()
+
+    def _record_at(self, index: int) -> ProcessedPlayRecord:
+        """Materialize the record at a non-negative position."""
+        timestamp = _int_at(self._timestamps, index)
+        record: dict[str, object] = {
+            "date": self._date_overrides.get(index, str(timestamp)),
+            "duration": _int_at(self._durations, index),
+            "stopped": _int_at(self._stopped, index),
+            "paused_counter": _int_at(self._paused_counters, index),
+            "datetime": datetime.fromtimestamp(timestamp),
+        }
+        for field, column in self._columns.items():
+            value = column.value_at(index)
+            if value is not None:
+                record[field] = value
+
+        return record  # pyright: ignore[reportReturnType] # fields built from the typed columns above
+
+    @overload
+    def __getitem__(self, index: int) -> ProcessedPlayRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> PlayRecordStore: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> ProcessedPlayRecord | PlayRecordStore:
+        """Get a record by position, or a sub-store for a slice."""
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self), dtype=np.intp)[index])
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("PlayRecordStore index out of range")
+        return self._record_at(index)
+
+    @override
+    def __iter__(self) -> Iterator[ProcessedPlayRecord]:
+        """Iterate over the records, materializing one dictionary at a time."""
+        for index in range(len(self)):
+            yield self._record_at(index)
+
+    @override
+    def __len__(self) -> int:
+        """Return the number of records in the store."""
+        return len(self._timestamps)
+
+    @override
+    def __repr__(self) -> str:
+        """Return a short description of the store."""
+        return f"PlayRecordStore(records={len(self)}, nbytes={self.nbytes})"
+
+
+def filter_records_since(records: PlayRecords, cutoff: datetime) -> PlayRecords:
+    """
+    Filter records to those that started at or after a cutoff time.
+
+    Columnar stores are filtered on their timestamp column without
+    materializing individual records.
+
+    Args:
+        records: Processed play history records
+        cutoff: Earliest play start time to keep
+
+    Returns:
+        Records within the time range (a PlayRecordStore for store input)
+    """
+    if isinstance(records, PlayRecordStore):
+        return records.filter_since(cutoff)
+
+    return [
+        record
+        for record in records
+        if "datetime" in record and record["datetime"] >= cutoff
+    ]
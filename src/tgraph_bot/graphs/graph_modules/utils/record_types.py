@@ -0,0 +1,38 @@
+"""
+Processed play record types for TGraph Bot graph modules.
+
+This module defines the structure of processed play history records and the
+container aliases used by the aggregation functions. It has no dependencies
+on the rest of the utils package so that both the list-based and columnar
+record implementations can share it.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import NotRequired, TypedDict
+
+
+class ProcessedPlayRecord(TypedDict):
+    """Structure for processed play history records."""
+
+    date: str
+    user: str
+    platform: str
+    media_type: str
+    duration: int
+    stopped: int
+    paused_counter: int
+    datetime: datetime
+    # Stream type fields for new graph types (optional for backward compatibility)
+    transcode_decision: NotRequired[str]  # direct play, copy, transcode
+    video_resolution: NotRequired[str]  # source resolution (e.g., "1920x1080")
+    stream_video_resolution: NotRequired[str]  # transcoded output resolution
+    video_codec: NotRequired[str]  # video codec (h264, hevc, etc.)
+    audio_codec: NotRequired[str]  # audio codec (aac, ac3, dts, etc.)
+    container: NotRequired[str]  # file container format (mp4, mkv, etc.)
+
+
+ProcessedRecords = list[ProcessedPlayRecord]
+# Read-only record container accepted by the aggregation functions: a list of
+# processed records or a columnar PlayRecordStore (see record_store.py)
+PlayRecords = Sequence[ProcessedPlayRecord]
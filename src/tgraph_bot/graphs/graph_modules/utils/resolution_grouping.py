@@ -18,7 +18,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .utils import (
-        ProcessedRecords,
+        PlayRecords,
         ResolutionAggregates,
         ResolutionStreamTypeAggregates,
     )
@@ -301,7 +301,7 @@ def sort_resolutions_by_quality(resolutions: list[str]) -> list[str]:
 
 
 def aggregate_by_resolution_grouped(
-    records: "ProcessedRecords",
+    records: "PlayRecords",
     resolution_field: str = "video_resolution",
     grouping_strategy: str = "standard",
 ) -> "ResolutionAggregates":
@@ -360,7 +360,7 @@ def aggregate_by_resolution_grouped(
 
 
 def aggregate_by_resolution_and_stream_type_grouped(
-    records: "ProcessedRecords",
+    records: "PlayRecords",
     resolution_field: str = "video_resolution",
     grouping_strategy: str = "standard",
 ) -> "ResolutionStreamTypeAggregates":
@@ -6,42 +6,41 @@ such as date formatting, folder management, username censoring,
 and data processing utilities.
 """
 
+import functools
 import logging
 import re
 from collections import defaultdict
 from collections.abc import Mapping
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, TypedDict, TypeVar
-from typing_extensions import NotRequired
+from typing import TYPE_CHECKING, TypedDict, TypeVar, cast
+
+import numpy as np
+from numpy.typing import NDArray
 
 from ....utils.cli.paths import get_path_config
+from .concurrent_streams import ConcurrencyPeaks, sweep_concurrent_streams
+from .record_store import MISSING_CODE, SECONDS_PER_DAY, PlayRecordStore
+# Record types are re-exported here for existing imports from this module
+from .record_types import PlayRecords as PlayRecords
+from .record_types import ProcessedPlayRecord as ProcessedPlayRecord
+from .record_types import ProcessedRecords as ProcessedRecords
+from .vectorized_aggregation import (
+    SECONDS_PER_HOUR,
+    count_by_date,
+    count_by_hour,
+    count_by_month,
+    count_by_weekday,
+    count_value_pairs,
+    count_values,
+    split_by_category,
+)
 
 if TYPE_CHECKING:
     pass
 
 
 # Type definitions for processed data structures
-class ProcessedPlayRecord(TypedDict):
-    """Structure for processed play history records."""
-
-    date: str
-    user: str
-    platform: str
-    media_type: str
-    duration: int
-    stopped: int
-    paused_counter: int
-    datetime: datetime
-    # Stream type fields for new graph types (optional for backward compatibility)
-    transcode_decision: NotRequired[str]  # direct play, copy, transcode
-    video_resolution: NotRequired[str]  # source resolution (e.g., "1920x1080")
-    stream_video_resolution: NotRequired[str]  # transcoded output resolution
-    video_codec: NotRequired[str]  # video codec (h264, hevc, etc.)
-    audio_codec: NotRequired[str]  # audio codec (aac, ac3, dts, etc.)
-    container: NotRequired[str]  # file container format (mp4, mkv, etc.)
-
-
 class UserAggregateRecord(TypedDict):
     """Structure for aggregated user data."""
 
@@ -89,6 +88,15 @@ class ConcurrentStreamRecord(TypedDict):
     stream_type_breakdown: dict[str, int]  # concurrent count per stream type
 
 
+class ConcurrentStreamHourRecord(TypedDict):
+    """Structure for hourly concurrent stream count data."""
+
+    date: str
+    hour: int  # local hour of day, 0-23
+    peak_concurrent: int
+    stream_type_breakdown: dict[str, int]  # concurrent count per stream type
+
+
 class ResolutionStreamTypeAggregateRecord(TypedDict):
     """Structure for aggregated resolution and stream type data."""
 
@@ -101,13 +109,13 @@ class ResolutionStreamTypeAggregateRecord(TypedDict):
 
 # Type aliases for common data structures
 GraphData = dict[str, int] | dict[int, int] | list[dict[str, object]]
-ProcessedRecords = list[ProcessedPlayRecord]
 UserAggregates = list[UserAggregateRecord]
 PlatformAggregates = list[PlatformAggregateRecord]
 MediaTypeAggregates = list[MediaTypeAggregateRecord]
 StreamTypeAggregates = list[StreamTypeAggregateRecord]
 ResolutionAggregates = list[ResolutionAggregateRecord]
 ConcurrentStreamAggregates = list[ConcurrentStreamRecord]
+ConcurrentStreamHourAggregates = list[ConcurrentStreamHourRecord]
 ResolutionStreamTypeAggregates = dict[str, list[ResolutionStreamTypeAggregateRecord]]
 SeparatedGraphData = dict[str, dict[str, int]]
 SeparatedUserAggregates = dict[str, UserAggregates]
@@ -148,6 +156,24 @@ def parse_date(date_string: str, format_string: str = "%Y-%m-%d") -> datetime:
     return datetime.strptime(date_string, format_string)
 
 
+def get_time_range_cutoff(days: int) -> datetime:
+    """
+    Get the start of a time range of whole days ending today.
+
+    The range starts at midnight, so graphs filtered with it show the same
+    days all day long, matching the dates filled in by the aggregation
+    functions and the days of play history fetched from Tautulli.
+
+    Args:
+        days: Number of days in the range, including today
+
+    Returns:
+        Midnight of the first day in the range
+    """
+    first_day = datetime.now().date() - timedelta(days=max(days, 1) - 1)
+    return datetime.combine(first_day, datetime.min.time())
+
+
 def get_date_range(days: int) -> tuple[datetime, datetime]:
     """
     Get a date range from today going back the specified number of days.
@@ -310,7 +336,10 @@ def sanitize_filename(filename: str) -> str:
 
 
 def generate_graph_filename(
-    graph_type: str, timestamp: datetime | None = None, user_id: str | None = None
+    graph_type: str,
+    timestamp: datetime | None = None,
+    user_id: str | None = None,
+    extension: str = ".png",
 ) -> str:
     """
     Generate a standardized filename for a graph.
@@ -319,6 +348,7 @@ def generate_graph_filename(
         graph_type: Type of graph (e.g., "daily_play_count")
         timestamp: Timestamp to include in filename (defaults to now)
         user_id: User ID for personal graphs
+        extension: File extension of the image format (e.g., ".png")
 
     Returns:
         Generated filename
@@ -329,9 +359,9 @@ def generate_graph_filename(
     timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
 
     if user_id:
-        filename = f"{graph_type}_user_{user_id}_{timestamp_str}.png"
+        filename = f"{graph_type}_user_{user_id}_{timestamp_str}{extension}"
     else:
-        filename = f"{graph_type}_{timestamp_str}.png"
+        filename = f"{graph_type}_{timestamp_str}{extension}"
 
     return sanitize_filename(filename)
 
@@ -478,30 +508,22 @@ def process_play_history_data(raw_data: Mapping[str, object]) -> ProcessedRecord
 
         try:
             # Extract and validate required fields with proper type conversion
-            date_value = safe_get_nested_value(record, ["date"], "")
-            user_value = safe_get_nested_value(record, ["user"], "")
-            platform_value = safe_get_nested_value(record, ["platform"], "")
-            media_type_value = safe_get_nested_value(record, ["media_type"], "")
-            duration_value = safe_get_nested_value(record, ["duration"], 0)
-            stopped_value = safe_get_nested_value(record, ["stopped"], 0)
-            paused_counter_value = safe_get_nested_value(record, ["paused_counter"], 0)
+            date_value = record.get("date", "")
+            user_value = record.get("user", "")
+            platform_value = record.get("platform", "")
+            media_type_value = record.get("media_type", "")
+            duration_value = record.get("duration", 0)
+            stopped_value = record.get("stopped", 0)
+            paused_counter_value = record.get("paused_counter", 0)
             # Extract stream type fields (for new stream type graphs)
-            transcode_decision_value = safe_get_nested_value(
-                record, ["transcode_decision"], "unknown"
-            )
-            video_resolution_value = safe_get_nested_value(
-                record, ["video_resolution"], "unknown"
-            )
-            stream_video_resolution_value = safe_get_nested_value(
-                record, ["stream_video_resolution"], "unknown"
-            )
-            video_codec_value = safe_get_nested_value(
-                record, ["video_codec"], "unknown"
-            )
-            audio_codec_value = safe_get_nested_value(
-                record, ["audio_codec"], "unknown"
+            transcode_decision_value = record.get("transcode_decision", "unknown")
+            video_resolution_value = record.get("video_resolution", "unknown")
+            stream_video_resolution_value = record.get(
+                "stream_video_resolution", "unknown"
             )
-            container_value = safe_get_nested_value(record, ["container"], "unknown")
+            video_codec_value = record.get("video_codec", "unknown")
+            audio_codec_value = record.get("audio_codec", "unknown")
+            container_value = record.get("container", "unknown")
 
             # Convert timestamps to datetime objects if they're valid
             if date_value:
@@ -579,13 +601,13 @@ def _extract_resolution_with_fallback(
         Resolution string (e.g., "1920x1080") or "unknown" if not available
     """
     # Try primary resolution field first
-    resolution_value = safe_get_nested_value(record, [resolution_field], "unknown")
+    resolution_value = record.get(resolution_field, "unknown")
     if resolution_value and str(resolution_value) != "unknown":
         return str(resolution_value)
 
     # Fallback to width/height combination
-    width_value = safe_get_nested_value(record, [width_field], None)
-    height_value = safe_get_nested_value(record, [height_field], None)
+    width_value = record.get(width_field, None)
+    height_value = record.get(height_field, None)
 
     # Validate width and height values
     try:
@@ -679,24 +701,18 @@ def process_play_history_data_enhanced(
 
         try:
             # Extract and validate required fields with proper type conversion
-            date_value = safe_get_nested_value(record, ["date"], "")
-            user_value = safe_get_nested_value(record, ["user"], "")
-            platform_value = safe_get_nested_value(record, ["platform"], "")
-            media_type_value = safe_get_nested_value(record, ["media_type"], "")
-            duration_value = safe_get_nested_value(record, ["duration"], 0)
-            stopped_value = safe_get_nested_value(record, ["stopped"], 0)
-            paused_counter_value = safe_get_nested_value(record, ["paused_counter"], 0)
+            date_value = record.get("date", "")
+            user_value = record.get("user", "")
+            platform_value = record.get("platform", "")
+            media_type_value = record.get("media_type", "")
+            duration_value = record.get("duration", 0)
+            stopped_value = record.get("stopped", 0)
+            paused_counter_value = record.get("paused_counter", 0)
             # Extract stream type fields
-            transcode_decision_value = safe_get_nested_value(
-                record, ["transcode_decision"], "unknown"
-            )
-            video_codec_value = safe_get_nested_value(
-                record, ["video_codec"], "unknown"
-            )
-            audio_codec_value = safe_get_nested_value(
-                record, ["audio_codec"], "unknown"
-            )
-            container_value = safe_get_nested_value(record, ["container"], "unknown")
+            transcode_decision_value = record.get("transcode_decision", "unknown")
+            video_codec_value = record.get("video_codec", "unknown")
+            audio_codec_value = record.get("audio_codec", "unknown")
+            container_value = record.get("container", "unknown")
 
             # Enhanced resolution extraction with fallback logic
             video_resolution_value = _extract_resolution_with_fallback(
@@ -767,7 +783,7 @@ def process_play_history_data_enhanced(
 
 
 def aggregate_by_date(
-    records: ProcessedRecords,
+    records: PlayRecords,
     fill_missing_dates: bool = True,
     time_range_days: int = 30,
 ) -> dict[str, int]:
@@ -782,12 +798,15 @@ def aggregate_by_date(
     Returns:
         Dictionary mapping date strings to play counts
     """
-    date_counts: dict[str, int] = defaultdict(int)
-
-    for record in records:
-        if "datetime" in record:
-            date_str = record["datetime"].strftime("%Y-%m-%d")
-            date_counts[date_str] += 1
+    date_counts: dict[str, int]
+    if isinstance(records, PlayRecordStore):
+        date_counts = count_by_date(records)
+    else:
+        date_counts = defaultdict(int)
+        for record in records:
+            if "datetime" in record:
+                date_str = record["datetime"].strftime("%Y-%m-%d")
+                date_counts[date_str] += 1
 
     # Fill in missing dates with zero counts if requested
     if fill_missing_dates:
@@ -810,7 +829,7 @@ def aggregate_by_date(
     return dict(date_counts)
 
 
-def aggregate_by_day_of_week(records: ProcessedRecords) -> dict[str, int]:
+def aggregate_by_day_of_week(records: PlayRecords) -> dict[str, int]:
     """
     Aggregate play records by day of week.
 
@@ -829,6 +848,9 @@ def aggregate_by_day_of_week(records: ProcessedRecords) -> dict[str, int]:
         "Saturday",
         "Sunday",
     ]
+    if isinstance(records, PlayRecordStore):
+        return dict(zip(day_names, count_by_weekday(records)))
+
     day_counts: dict[str, int] = {day: 0 for day in day_names}
 
     for record in records:
@@ -839,7 +861,7 @@ def aggregate_by_day_of_week(records: ProcessedRecords) -> dict[str, int]:
     return day_counts
 
 
-def aggregate_by_hour_of_day(records: ProcessedRecords) -> dict[int, int]:
+def aggregate_by_hour_of_day(records: PlayRecords) -> dict[int, int]:
     """
     Aggregate play records by hour of day.
 
@@ -849,6 +871,9 @@ def aggregate_by_hour_of_day(records: ProcessedRecords) -> dict[int, int]:
     Returns:
         Dictionary mapping hour (0-23) to play counts
     """
+    if isinstance(records, PlayRecordStore):
+        return dict(enumerate(count_by_hour(records)))
+
     hour_counts: dict[int, int] = {hour: 0 for hour in range(24)}
 
     for record in records:
@@ -859,7 +884,7 @@ def aggregate_by_hour_of_day(records: ProcessedRecords) -> dict[int, int]:
     return hour_counts
 
 
-def aggregate_by_month(records: ProcessedRecords) -> dict[str, int]:
+def aggregate_by_month(records: PlayRecords) -> dict[str, int]:
     """
     Aggregate play records by month.
 
@@ -869,6 +894,9 @@ def aggregate_by_month(records: ProcessedRecords) -> dict[str, int]:
     Returns:
         Dictionary mapping month strings (YYYY-MM) to play counts
     """
+    if isinstance(records, PlayRecordStore):
+        return count_by_month(records)
+
     month_counts: dict[str, int] = defaultdict(int)
 
     for record in records:
@@ -880,7 +908,7 @@ def aggregate_by_month(records: ProcessedRecords) -> dict[str, int]:
 
 
 def aggregate_top_users(
-    records: ProcessedRecords, limit: int = 10, censor: bool = True
+    records: PlayRecords, limit: int = 10, censor: bool = True
 ) -> UserAggregates:
     """
     Aggregate play records to get top users by play count.
@@ -893,12 +921,16 @@ def aggregate_top_users(
     Returns:
         List of user dictionaries with username and play count
     """
-    user_counts: dict[str, int] = defaultdict(int)
-
-    for record in records:
-        username = record.get("user", "Unknown")
-        if username:
-            user_counts[username] += 1
+    user_counts: dict[str, int]
+    if isinstance(records, PlayRecordStore):
+        user_counts = count_values(records, "user", missing_value="Unknown")
+        _ = user_counts.pop("", None)
+    else:
+        user_counts = defaultdict(int)
+        for record in records:
+            username = record.get("user", "Unknown")
+            if username:
+                user_counts[username] += 1
 
     # Sort by play count and take top N
     sorted_users = sorted(user_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
@@ -912,7 +944,7 @@ def aggregate_top_users(
 
 
 def aggregate_top_platforms(
-    records: ProcessedRecords, limit: int = 10
+    records: PlayRecords, limit: int = 10
 ) -> PlatformAggregates:
     """
     Aggregate play records to get top platforms by play count.
@@ -924,12 +956,16 @@ def aggregate_top_platforms(
     Returns:
         List of platform dictionaries with platform name and play count
     """
-    platform_counts: dict[str, int] = defaultdict(int)
-
-    for record in records:
-        platform = record.get("platform", "Unknown")
-        if platform:
-            platform_counts[platform] += 1
+    platform_counts: dict[str, int]
+    if isinstance(records, PlayRecordStore):
+        platform_counts = count_values(records, "platform", missing_value="Unknown")
+        _ = platform_counts.pop("", None)
+    else:
+        platform_counts = defaultdict(int)
+        for record in records:
+            platform = record.get("platform", "Unknown")
+            if platform:
+                platform_counts[platform] += 1
 
     # Sort by play count and take top N
     sorted_platforms = sorted(
@@ -1005,7 +1041,7 @@ def get_media_type_display_info() -> dict[str, dict[str, str]]:
 
 
 def aggregate_by_date_separated(
-    records: ProcessedRecords,
+    records: PlayRecords,
     fill_missing_dates: bool = True,
     time_range_days: int = 30,
 ) -> SeparatedGraphData:
@@ -1022,20 +1058,26 @@ def aggregate_by_date_separated(
     """
     separated_data: SeparatedGraphData = {}
 
-    for record in records:
-        if "datetime" not in record:
-            continue
+    if isinstance(records, PlayRecordStore):
+        for media_type, type_records in split_by_category(
+            records, "media_type", classify_media_type
+        ).items():
+            separated_data[media_type] = count_by_date(type_records)
+    else:
+        for record in records:
+            if "datetime" not in record:
+                continue
 
-        date_str = record["datetime"].strftime("%Y-%m-%d")
-        media_type = classify_media_type(record.get("media_type", ""))
+            date_str = record["datetime"].strftime("%Y-%m-%d")
+            media_type = classify_media_type(record.get("media_type", ""))
 
-        if media_type not in separated_data:
-            separated_data[media_type] = {}
+            if media_type not in separated_data:
+                separated_data[media_type] = {}
 
-        if date_str not in separated_data[media_type]:
-            separated_data[media_type][date_str] = 0
+            if date_str not in separated_data[media_type]:
+                separated_data[media_type][date_str] = 0
 
-        separated_data[media_type][date_str] += 1
+            separated_data[media_type][date_str] += 1
 
     # Fill in missing dates with zero counts if requested
     if fill_missing_dates:
@@ -1062,7 +1104,7 @@ def aggregate_by_date_separated(
     return separated_data
 
 
-def aggregate_by_day_of_week_separated(records: ProcessedRecords) -> SeparatedGraphData:
+def aggregate_by_day_of_week_separated(records: PlayRecords) -> SeparatedGraphData:
     """
     Aggregate play records by day of week with media type separation.
 
@@ -1083,6 +1125,15 @@ def aggregate_by_day_of_week_separated(records: ProcessedRecords) -> SeparatedGr
     ]
     separated_data: SeparatedGraphData = {}
 
+    if isinstance(records, PlayRecordStore):
+        for media_type, type_records in split_by_category(
+            records, "media_type", classify_media_type
+        ).items():
+            separated_data[media_type] = dict(
+                zip(day_names, count_by_weekday(type_records))
+            )
+        return separated_data
+
     for record in records:
         if "datetime" not in record:
             continue
@@ -1099,7 +1150,7 @@ def aggregate_by_day_of_week_separated(records: ProcessedRecords) -> SeparatedGr
 
 
 def aggregate_by_hour_of_day_separated(
-    records: ProcessedRecords,
+    records: PlayRecords,
 ) -> dict[str, dict[int, int]]:
     """
     Aggregate play records by hour of day with media type separation.
@@ -1112,6 +1163,13 @@ def aggregate_by_hour_of_day_separated(
     """
     separated_data: dict[str, dict[int, int]] = {}
 
+    if isinstance(records, PlayRecordStore):
+        for media_type, type_records in split_by_category(
+            records, "media_type", classify_media_type
+        ).items():
+            separated_data[media_type] = dict(enumerate(count_by_hour(type_records)))
+        return separated_data
+
     for record in records:
         if "datetime" not in record:
             continue
@@ -1127,7 +1185,7 @@ def aggregate_by_hour_of_day_separated(
     return separated_data
 
 
-def aggregate_by_month_separated(records: ProcessedRecords) -> SeparatedGraphData:
+def aggregate_by_month_separated(records: PlayRecords) -> SeparatedGraphData:
     """
     Aggregate play records by month with media type separation.
 
@@ -1139,6 +1197,13 @@ def aggregate_by_month_separated(records: ProcessedRecords) -> SeparatedGraphDat
     """
     separated_data: SeparatedGraphData = {}
 
+    if isinstance(records, PlayRecordStore):
+        for media_type, type_records in split_by_category(
+            records, "media_type", classify_media_type
+        ).items():
+            separated_data[media_type] = count_by_month(type_records)
+        return separated_data
+
     for record in records:
         if "datetime" not in record:
             continue
@@ -1158,7 +1223,7 @@ def aggregate_by_month_separated(records: ProcessedRecords) -> SeparatedGraphDat
 
 
 def aggregate_top_users_separated(
-    records: ProcessedRecords, limit: int = 10, censor: bool = True
+    records: PlayRecords, limit: int = 10, censor: bool = True
 ) -> SeparatedUserAggregates:
     """
     Aggregate play records to get top users by play count with media type separation.
@@ -1172,11 +1237,17 @@ def aggregate_top_users_separated(
         Dictionary mapping media types to lists of user dictionaries with username and play count
     """
     # Group records by media type first
-    media_type_records: dict[str, ProcessedRecords] = defaultdict(list)
-
-    for record in records:
-        media_type = classify_media_type(record.get("media_type", ""))
-        media_type_records[media_type].append(record)
+    media_type_records: Mapping[str, PlayRecords]
+    if isinstance(records, PlayRecordStore):
+        media_type_records = split_by_category(
+            records, "media_type", classify_media_type
+        )
+    else:
+        grouped_records: dict[str, ProcessedRecords] = defaultdict(list)
+        for record in records:
+            media_type = classify_media_type(record.get("media_type", ""))
+            grouped_records[media_type].append(record)
+        media_type_records = grouped_records
 
     # Aggregate users for each media type
     separated_data: SeparatedUserAggregates = {}
@@ -1190,7 +1261,7 @@ def aggregate_top_users_separated(
 
 
 def aggregate_top_platforms_separated(
-    records: ProcessedRecords, limit: int = 10
+    records: PlayRecords, limit: int = 10
 ) -> SeparatedPlatformAggregates:
     """
     Aggregate play records to get top platforms by play count with media type separation.
@@ -1203,11 +1274,17 @@ def aggregate_top_platforms_separated(
         Dictionary mapping media types to lists of platform dictionaries with platform and play count
     """
     # Group records by media type first
-    media_type_records: dict[str, ProcessedRecords] = defaultdict(list)
-
-    for record in records:
-        media_type = classify_media_type(record.get("media_type", ""))
-        media_type_records[media_type].append(record)
+    media_type_records: Mapping[str, PlayRecords]
+    if isinstance(records, PlayRecordStore):
+        media_type_records = split_by_category(
+            records, "media_type", classify_media_type
+        )
+    else:
+        grouped_records: dict[str, ProcessedRecords] = defaultdict(list)
+        for record in records:
+            media_type = classify_media_type(record.get("media_type", ""))
+            grouped_records[media_type].append(record)
+        media_type_records = grouped_records
 
     # Aggregate platforms for each media type
     separated_data: SeparatedPlatformAggregates = {}
@@ -1254,47 +1331,77 @@ def create_seaborn_style_context(enable_grid: bool = True) -> dict[str, object]:
     }
 
 
-def apply_modern_seaborn_styling() -> None:
+# Axes style, palette and font sizes of the modern graph style
+MODERN_AXES_STYLE: dict[str, object] = {
+    "axes.grid": True,
+    "axes.grid.axis": "y",
+    "grid.linewidth": 0.5,
+    "grid.alpha": 0.7,
+    "axes.edgecolor": "#333333",
+    "axes.linewidth": 1.2,
+}
+MODERN_PALETTE: list[str] = [
+    "#1f77b4",
+    "#ff7f0e",
+    "#2ca02c",
+    "#d62728",
+    "#9467bd",
+    "#8c564b",
+]
+MODERN_FONT_RC: dict[str, object] = {
+    "font.size": 11,
+    "axes.titlesize": 16,
+    "axes.titleweight": "bold",
+    "axes.labelsize": 12,
+    "legend.fontsize": 11,
+    "xtick.labelsize": 10,
+    "ytick.labelsize": 10,
+    "figure.titlesize": 18,
+    "legend.frameon": True,
+    "legend.fancybox": True,
+    "legend.shadow": True,
+    "legend.framealpha": 0.9,
+}
+
+
+@functools.cache
+def get_modern_style_rc(grid_enabled: bool = True) -> Mapping[str, object]:
+    """
+    Get the matplotlib rc settings of the modern Seaborn style.
+
+    Seaborn rebuilds a style's settings on every set_style() call. They are
+    built once per process here, so applying the style to each graph is a
+    plain rcParams update.
+
+    Args:
+        grid_enabled: Whether to use the modern whitegrid axes style instead
+                      of Seaborn's plain white style
+
+    Returns:
+        rc settings for the axes style, palette and font sizes
+    """
+    import seaborn as sns
+    from cycler import cycler
+
+    if grid_enabled:
+        rc: dict[str, object] = dict(sns.axes_style("whitegrid", MODERN_AXES_STYLE))
+    else:
+        rc = dict(sns.axes_style("white"))
+    rc["axes.prop_cycle"] = cycler(color=sns.color_palette(MODERN_PALETTE))
+    rc.update(MODERN_FONT_RC)
+    return rc
+
+
+def apply_modern_seaborn_styling(grid_enabled: bool = True) -> None:
     """
     Apply modern Seaborn styling for professional-looking graphs.
+
+    Args:
+        grid_enabled: Whether to show horizontal grid lines
     """
     import matplotlib.pyplot as plt
-    import seaborn as sns
 
-    # Set the modern style
-    sns.set_style(
-        "whitegrid",
-        {
-            "axes.grid": True,
-            "axes.grid.axis": "y",
-            "grid.linewidth": 0.5,
-            "grid.alpha": 0.7,
-            "axes.edgecolor": "#333333",
-            "axes.linewidth": 1.2,
-        },
-    )
-
-    # Set modern color palette
-    colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"]
-    sns.set_palette(colors)
-
-    # Configure matplotlib parameters for better appearance
-    plt.rcParams.update(
-        {
-            "font.size": 11,
-            "axes.titlesize": 16,
-            "axes.titleweight": "bold",
-            "axes.labelsize": 12,
-            "legend.fontsize": 11,
-            "xtick.labelsize": 10,
-            "ytick.labelsize": 10,
-            "figure.titlesize": 18,
-            "legend.frameon": True,
-            "legend.fancybox": True,
-            "legend.shadow": True,
-            "legend.framealpha": 0.9,
-        }
-    )
+    plt.rcParams.update(get_modern_style_rc(grid_enabled))  # pyright: ignore[reportCallIssue, reportArgumentType]  # keys are valid rc names from seaborn
 
 
 # Stream Type Aggregation Functions
@@ -1302,7 +1409,7 @@ def apply_modern_seaborn_styling() -> None:
 
 
 def aggregate_by_stream_type(
-    records: ProcessedRecords, use_separated_visualization: bool = False
+    records: PlayRecords, use_separated_visualization: bool = False
 ) -> StreamTypeAggregates | SeparatedStreamTypeAggregates:
     """
     Aggregate play records by stream type (transcode decision).
@@ -1372,7 +1479,7 @@ def aggregate_by_stream_type(
 
 
 def aggregate_by_resolution(
-    records: ProcessedRecords, resolution_field: str = "video_resolution"
+    records: PlayRecords, resolution_field: str = "video_resolution"
 ) -> ResolutionAggregates:
     """
     Aggregate play records by resolution.
@@ -1426,7 +1533,7 @@ def aggregate_by_resolution(
 
 
 def aggregate_by_resolution_and_stream_type(
-    records: ProcessedRecords, resolution_field: str = "video_resolution"
+    records: PlayRecords, resolution_field: str = "video_resolution"
 ) -> ResolutionStreamTypeAggregates:
     """
     Aggregate play records by resolution with stream type breakdown.
@@ -1507,8 +1614,27 @@ def aggregate_by_resolution_and_stream_type(
     return {resolution: result[resolution] for resolution in sorted_resolutions}
 
 
+def _top_value_pairs(
+    pair_counts: dict[str, dict[str, int]], limit: int
+) -> dict[str, dict[str, int]]:
+    """
+    Keep the values with the most plays from a nested count dictionary.
+
+    Args:
+        pair_counts: Nested counts, e.g. stream type counts per platform
+        limit: Maximum number of outer values to keep
+
+    Returns:
+        The top outer values ordered by total plays, ties in first-seen order
+    """
+    ranked = sorted(
+        pair_counts.items(), key=lambda item: sum(item[1].values()), reverse=True
+    )
+    return dict(ranked[:limit])
+
+
 def aggregate_by_platform_and_stream_type(
-    records: ProcessedRecords, limit: int = 10
+    records: PlayRecords, limit: int = 10
 ) -> dict[str, StreamTypeAggregates]:
     """
     Aggregate play records by platform with stream type breakdown.
@@ -1520,27 +1646,33 @@ def aggregate_by_platform_and_stream_type(
     Returns:
         Dictionary mapping platform names to stream type aggregates
     """
-    # First count total plays per platform to determine top platforms
-    platform_totals: dict[str, int] = defaultdict(int)
-    for record in records:
-        platform_totals[record["platform"]] += 1
+    platform_stream_counts: dict[str, dict[str, int]]
+    if isinstance(records, PlayRecordStore):
+        platform_stream_counts = _top_value_pairs(
+            count_value_pairs(records, "platform", "transcode_decision"), limit
+        )
+    else:
+        # First count total plays per platform to determine top platforms
+        platform_totals: dict[str, int] = defaultdict(int)
+        for record in records:
+            platform_totals[record["platform"]] += 1
 
-    # Get top platforms
-    top_platforms = sorted(platform_totals.items(), key=lambda x: x[1], reverse=True)[
-        :limit
-    ]
-    top_platform_names = {platform for platform, _ in top_platforms}
+        # Get top platforms
+        top_platforms = sorted(
+            platform_totals.items(), key=lambda x: x[1], reverse=True
+        )[:limit]
+        top_platform_names = {platform for platform, _ in top_platforms}
 
-    # Count stream types for each top platform
-    platform_stream_counts: dict[str, dict[str, int]] = {}
-    for platform in top_platform_names:
-        platform_stream_counts[platform] = defaultdict(int)
+        # Count stream types for each top platform
+        platform_stream_counts = {}
+        for platform in top_platform_names:
+            platform_stream_counts[platform] = defaultdict(int)
 
-    for record in records:
-        platform = record["platform"]
-        if platform in top_platform_names:
-            stream_type = record.get("transcode_decision", "unknown")
-            platform_stream_counts[platform][stream_type] += 1
+        for record in records:
+            platform = record["platform"]
+            if platform in top_platform_names:
+                stream_type = record.get("transcode_decision", "unknown")
+                platform_stream_counts[platform][stream_type] += 1
 
     # Convert to aggregate format
     result: dict[str, StreamTypeAggregates] = {}
@@ -1565,7 +1697,7 @@ def aggregate_by_platform_and_stream_type(
 
 
 def aggregate_by_user_and_stream_type(
-    records: ProcessedRecords, limit: int = 10
+    records: PlayRecords, limit: int = 10
 ) -> dict[str, StreamTypeAggregates]:
     """
     Aggregate play records by user with stream type breakdown.
@@ -1577,25 +1709,33 @@ def aggregate_by_user_and_stream_type(
     Returns:
         Dictionary mapping usernames to stream type aggregates
     """
-    # First count total plays per user to determine top users
-    user_totals: dict[str, int] = defaultdict(int)
-    for record in records:
-        user_totals[record["user"]] += 1
+    user_stream_counts: dict[str, dict[str, int]]
+    if isinstance(records, PlayRecordStore):
+        user_stream_counts = _top_value_pairs(
+            count_value_pairs(records, "user", "transcode_decision"), limit
+        )
+    else:
+        # First count total plays per user to determine top users
+        user_totals: dict[str, int] = defaultdict(int)
+        for record in records:
+            user_totals[record["user"]] += 1
 
-    # Get top users
-    top_users = sorted(user_totals.items(), key=lambda x: x[1], reverse=True)[:limit]
-    top_user_names = {user for user, _ in top_users}
+        # Get top users
+        top_users = sorted(user_totals.items(), key=lambda x: x[1], reverse=True)[
+            :limit
+        ]
+        top_user_names = {user for user, _ in top_users}
 
-    # Count stream types for each top user
-    user_stream_counts: dict[str, dict[str, int]] = {}
-    for user in top_user_names:
-        user_stream_counts[user] = defaultdict(int)
+        # Count stream types for each top user
+        user_stream_counts = {}
+        for user in top_user_names:
+            user_stream_counts[user] = defaultdict(int)
 
-    for record in records:
-        user = record["user"]
-        if user in top_user_names:
-            stream_type = record.get("transcode_decision", "unknown")
-            user_stream_counts[user][stream_type] += 1
+        for record in records:
+            user = record["user"]
+            if user in top_user_names:
+                stream_type = record.get("transcode_decision", "unknown")
+                user_stream_counts[user][stream_type] += 1
 
     # Convert to aggregate format
     result: dict[str, StreamTypeAggregates] = {}
@@ -1619,80 +1759,164 @@ def aggregate_by_user_and_stream_type(
     return result
 
 
+def _concurrent_stream_inputs(
+    records: PlayRecords,
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64], list[str]]:
+    """
+    Build the sweep-line inputs for concurrent stream calculation.
+
+    Args:
+        records: Processed play history records
+
+    Returns:
+        Tuple of (local start seconds, local end seconds, stream type index
+        per record, stream type names by index)
+    """
+    stream_type_names: list[str] = []
+    stream_type_ids: dict[str, int] = {}
+
+    def stream_type_id(stream_type: str) -> int:
+        if stream_type not in stream_type_ids:
+            stream_type_ids[stream_type] = len(stream_type_names)
+            stream_type_names.append(stream_type)
+        return stream_type_ids[stream_type]
+
+    if isinstance(records, PlayRecordStore):
+        starts = records.local_timestamps()
+        column = records.column("transcode_decision")
+        # One extra slot at the end holds the id for missing stream types
+        id_of_code = np.array(
+            [stream_type_id(value) for value in (*column.categories, "unknown")],
+            dtype=np.int64,
+        )
+        is_missing = cast(NDArray[np.bool_], column.codes == MISSING_CODE)
+        codes = np.where(is_missing, len(id_of_code) - 1, column.codes)
+        return (
+            starts,
+            starts + records.durations.astype(np.int64),
+            id_of_code[codes],
+            stream_type_names,
+        )
+
+    # Naive local wall-clock seconds, matching PlayRecordStore.local_timestamps()
+    epoch = datetime(1970, 1, 1)
+    starts = np.array(
+        [(record["datetime"] - epoch) // timedelta(seconds=1) for record in records],
+        dtype=np.int64,
+    )
+    durations = np.array([record["duration"] for record in records], dtype=np.int64)
+    stream_types = np.array(
+        [
+            stream_type_id(record.get("transcode_decision", "unknown"))
+            for record in records
+        ],
+        dtype=np.int64,
+    )
+    return starts, starts + durations, stream_types, stream_type_names
+
+
+def _concurrent_stream_peaks(
+    records: PlayRecords, bucket_seconds: int
+) -> tuple[ConcurrencyPeaks, list[str]]:
+    """
+    Calculate peak concurrent streams per bucket for processed records.
+
+    Args:
+        records: Processed play history records
+        bucket_seconds: Bucket size in seconds
+
+    Returns:
+        Tuple of (peaks per bucket, stream type names by breakdown index)
+    """
+    starts, ends, stream_types, stream_type_names = _concurrent_stream_inputs(records)
+    peaks = sweep_concurrent_streams(
+        starts, ends, stream_types, len(stream_type_names), bucket_seconds
+    )
+    return peaks, stream_type_names
+
+
+def _stream_type_breakdown(
+    counts: list[int], stream_type_names: list[str]
+) -> dict[str, int]:
+    """Map per-type concurrent counts to stream type names, dropping zeros."""
+    return {
+        stream_type: count
+        for stream_type, count in zip(stream_type_names, counts)
+        if count > 0
+    }
+
+
 def calculate_concurrent_streams_by_date(
-    records: ProcessedRecords, separate_by_stream_type: bool = True
+    records: PlayRecords, separate_by_stream_type: bool = True
 ) -> ConcurrentStreamAggregates:
     """
     Calculate peak concurrent streams per date.
 
+    Streams are split at midnight, so a stream that runs past midnight
+    counts towards the peak of every date it is active on. A stream that
+    ends in the same second another starts does not overlap it.
+
     Args:
         records: List of processed play history records
         separate_by_stream_type: Whether to track concurrent streams by stream type
 
     Returns:
-        List of concurrent stream records per date
+        List of concurrent stream records per date, sorted by date
     """
-    from datetime import timedelta
-
-    # Group records by date
-    records_by_date: dict[str, list[ProcessedPlayRecord]] = defaultdict(list)
-    for record in records:
-        date_key = record["datetime"].strftime("%Y-%m-%d")
-        records_by_date[date_key].append(record)
+    peaks, stream_type_names = _concurrent_stream_peaks(records, SECONDS_PER_DAY)
+    dates = cast(
+        list[str],
+        np.datetime_as_string(np.asarray(peaks.buckets, dtype="datetime64[D]")).tolist(),
+    )
 
-    concurrent_aggregates: ConcurrentStreamAggregates = []
+    return [
+        ConcurrentStreamRecord(
+            date=date_str,
+            peak_concurrent=peak,
+            stream_type_breakdown=_stream_type_breakdown(breakdown, stream_type_names)
+            if separate_by_stream_type
+            else {},
+        )
+        for date_str, peak, breakdown in zip(dates, peaks.peaks, peaks.breakdowns)
+    ]
 
-    for date_str, day_records in records_by_date.items():
-        # Create list of stream events (start and end times)
-        stream_events: list[
-            tuple[datetime, str, str]
-        ] = []  # (time, event_type, stream_type)
 
-        for record in day_records:
-            start_time = record["datetime"]
-            end_time = start_time + timedelta(seconds=record["duration"])
-            stream_type = record.get("transcode_decision", "unknown")
+def calculate_concurrent_streams_by_hour(
+    records: PlayRecords, separate_by_stream_type: bool = True
+) -> ConcurrentStreamHourAggregates:
+    """
+    Calculate peak concurrent streams per hour.
 
-            stream_events.append((start_time, "start", stream_type))
-            stream_events.append((end_time, "end", stream_type))
+    Streams are split at every hour boundary they cross, so long streams
+    count towards the peak of every hour they are active in.
 
-        # Sort events by time
-        stream_events.sort(key=lambda x: x[0])
+    Args:
+        records: List of processed play history records
+        separate_by_stream_type: Whether to track concurrent streams by stream type
 
-        # Calculate peak concurrent streams
-        current_concurrent = 0
-        peak_concurrent = 0
-        stream_type_concurrent: dict[str, int] = defaultdict(int)
-        peak_stream_type_breakdown: dict[str, int] = defaultdict(int)
+    Returns:
+        List of concurrent stream records per hour, sorted by date and hour
+    """
+    peaks, stream_type_names = _concurrent_stream_peaks(records, SECONDS_PER_HOUR)
+    days = np.asarray(peaks.buckets, dtype=np.int64) // 24
+    dates = cast(
+        list[str],
+        np.datetime_as_string(days.astype("datetime64[D]")).tolist(),
+    )
 
-        for _, event_type, stream_type in stream_events:
-            if event_type == "start":
-                current_concurrent += 1
-                if separate_by_stream_type:
-                    stream_type_concurrent[stream_type] += 1
-            else:
-                current_concurrent -= 1
-                if separate_by_stream_type:
-                    stream_type_concurrent[stream_type] -= 1
-
-            # Track peak
-            if current_concurrent > peak_concurrent:
-                peak_concurrent = current_concurrent
-                if separate_by_stream_type:
-                    peak_stream_type_breakdown = dict(stream_type_concurrent)
-
-        concurrent_aggregates.append(
-            ConcurrentStreamRecord(
-                date=date_str,
-                peak_concurrent=peak_concurrent,
-                stream_type_breakdown=peak_stream_type_breakdown if separate_by_stream_type else {},
-            )
+    return [
+        ConcurrentStreamHourRecord(
+            date=date_str,
+            hour=bucket % 24,
+            peak_concurrent=peak,
+            stream_type_breakdown=_stream_type_breakdown(breakdown, stream_type_names)
+            if separate_by_stream_type
+            else {},
         )
-
-    # Sort by date
-    concurrent_aggregates.sort(key=lambda x: x["date"])
-
-    return concurrent_aggregates
+        for date_str, bucket, peak, breakdown in zip(
+            dates, peaks.buckets, peaks.peaks, peaks.breakdowns
+        )
+    ]
 
 
 # Stream Type Filtering Functions
@@ -1700,7 +1924,7 @@ def calculate_concurrent_streams_by_date(
 
 
 def filter_records_by_stream_type(
-    records: ProcessedRecords,
+    records: PlayRecords,
     stream_types: list[str] | str | None = None,
     exclude_unknown: bool = True,
 ) -> ProcessedRecords:
@@ -1760,7 +1984,7 @@ def filter_records_by_stream_type(
     return filtered_records
 
 
-def get_available_stream_types(records: ProcessedRecords) -> list[str]:
+def get_available_stream_types(records: PlayRecords) -> list[str]:
     """
     Get list of unique stream types present in the records.
 
@@ -1783,7 +2007,7 @@ def get_available_stream_types(records: ProcessedRecords) -> list[str]:
 
 
 def get_stream_type_statistics(
-    records: ProcessedRecords,
+    records: PlayRecords,
 ) -> dict[str, dict[str, int | float]]:
     """
     Get statistics about stream type distribution in the records.
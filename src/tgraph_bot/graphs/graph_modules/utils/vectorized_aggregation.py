@@ -0,0 +1,487 @@
+"""
+Vectorized aggregation kernels for columnar play records.
+
+This module implements the group-by counting behind the date, day-of-week,
+hour-of-day, month, top-N and stream type breakdown aggregations for a
+PlayRecordStore using NumPy unique/bincount primitives instead of per-record
+Python loops. The public aggregation functions in utils.py dispatch here when
+they receive a store, so results keep the exact structure and key order of
+the list-based path: keys appear in the order they are first seen in the
+records.
+
+Kernel results are memoized on the (immutable) store, and precompute_counters()
+can fill those caches for several counters and every media type group in a
+single sweep, so graphs that aggregate the same store reuse the results.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from typing import Final, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .record_store import (
+    MISSING_CODE,
+    SECONDS_PER_DAY,
+    CategoricalColumn,
+    PlayRecordStore,
+)
+
+SECONDS_PER_HOUR: Final[int] = 3_600
+
+# 1970-01-01 was a Thursday (Monday == 0, as returned by datetime.weekday())
+EPOCH_WEEKDAY: Final[int] = 3
+
+# Counters that precompute_counters() knows how to build
+COUNTER_DATE: Final[str] = "date"
+COUNTER_MONTH: Final[str] = "month"
+COUNTER_WEEKDAY: Final[str] = "weekday"
+COUNTER_HOUR: Final[str] = "hour"
+COUNTER_USER: Final[str] = "user"
+COUNTER_PLATFORM: Final[str] = "platform"
+COUNTER_USER_STREAM_TYPE: Final[str] = "user_stream_type"
+COUNTER_PLATFORM_STREAM_TYPE: Final[str] = "platform_stream_type"
+
+# Values used for records that do not have a field, matching the list-based
+# aggregation functions
+UNKNOWN_VALUE: Final[str] = "Unknown"
+UNKNOWN_STREAM_TYPE: Final[str] = "unknown"
+
+IntArray = NDArray[np.int64] | NDArray[np.int32]
+
+
+def _first_seen_counts(keys: IntArray) -> tuple[list[int], list[int]]:
+    """
+    Count occurrences of each key, ordered by first occurrence.
+
+    Args:
+        keys: Integer keys, one per record
+
+    Returns:
+        Tuple of (unique keys, counts) in first-seen order
+    """
+    if keys.size == 0:
+        return [], []
+
+    unique_keys, first_positions, counts = np.unique(
+        keys, return_index=True, return_counts=True
+    )
+    order = np.argsort(first_positions, kind="stable")
+    return (
+        cast(list[int], unique_keys[order].tolist()),
+        cast(list[int], counts[order].tolist()),
+    )
+
+
+def _grouped_first_seen_counts(
+    group_ids: NDArray[np.int64], keys: IntArray
+) -> dict[int, tuple[list[int], list[int]]]:
+    """
+    Count keys separately for each group with a single joint unique.
+
+    Args:
+        group_ids: Non-negative group id per record
+        keys: Integer keys, one per record
+
+    Returns:
+        Mapping of group id to (unique keys, counts) in first-seen order
+    """
+    if keys.size == 0:
+        return {}
+
+    key_offset = int(keys.min())
+    key_span = int(keys.max()) - key_offset + 1
+    joint_keys = group_ids * key_span + (keys.astype(np.int64) - key_offset)
+    joint, counts = _first_seen_counts(joint_keys)
+
+    grouped: dict[int, tuple[list[int], list[int]]] = {}
+    for joint_key, count in zip(joint, counts):
+        group, key = divmod(joint_key, key_span)
+        group_keys, group_counts = grouped.setdefault(group, ([], []))
+        group_keys.append(key + key_offset)
+        group_counts.append(count)
+    return grouped
+
+
+def _label_counts(
+    column: CategoricalColumn,
+    codes: list[int],
+    counts: list[int],
+    missing_value: str,
+) -> dict[str, int]:
+    """Translate per-code counts into per-value counts, keeping key order."""
+    value_counts: dict[str, int] = {}
+    for code, count in zip(codes, counts):
+        value = missing_value if code == MISSING_CODE else column.categories[code]
+        value_counts[value] = value_counts.get(value, 0) + count
+    return value_counts
+
+
+def _format_days(days: list[int]) -> list[str]:
+    """Format day numbers (days since 1970-01-01) as YYYY-MM-DD strings."""
+    if not days:
+        return []
+
+    formatted = np.datetime_as_string(np.asarray(days, dtype="datetime64[D]"))
+    return cast(list[str], formatted.tolist())
+
+
+def _format_months(months: list[int]) -> list[str]:
+    """Format month numbers (months since 1970-01) as YYYY-MM strings."""
+    if not months:
+        return []
+
+    formatted = np.datetime_as_string(np.asarray(months, dtype="datetime64[M]"))
+    return cast(list[str], formatted.tolist())
+
+
+def _local_days(store: PlayRecordStore) -> NDArray[np.int64]:
+    """Get local calendar days (days since 1970-01-01) for each record."""
+    return store.local_timestamps() // SECONDS_PER_DAY
+
+
+def _local_months(store: PlayRecordStore) -> NDArray[np.int64]:
+    """Get local calendar months (months since 1970-01) for each record."""
+    return (
+        _local_days(store)
+        .astype("datetime64[D]")
+        .astype("datetime64[M]")
+        .astype(np.int64)
+    )
+
+
+def _local_weekdays(store: PlayRecordStore) -> NDArray[np.int64]:
+    """Get the local day of week (Monday == 0) for each record."""
+    return (_local_days(store) + EPOCH_WEEKDAY) % 7
+
+
+def _local_hours(store: PlayRecordStore) -> NDArray[np.int64]:
+    """Get the local hour of day for each record."""
+    return (store.local_timestamps() % SECONDS_PER_DAY) // SECONDS_PER_HOUR
+
+
+def _date_counts(store: PlayRecordStore) -> dict[str, int]:
+    days, counts = _first_seen_counts(_local_days(store))
+    return dict(zip(_format_days(days), counts))
+
+
+def _month_counts(store: PlayRecordStore) -> dict[str, int]:
+    months, counts = _first_seen_counts(_local_months(store))
+    return dict(zip(_format_months(months), counts))
+
+
+def _weekday_counts(store: PlayRecordStore) -> list[int]:
+    return np.bincount(_local_weekdays(store), minlength=7).tolist()
+
+
+def _hour_counts(store: PlayRecordStore) -> list[int]:
+    return np.bincount(_local_hours(store), minlength=24).tolist()
+
+
+def _value_counts(
+    store: PlayRecordStore, field: str, missing_value: str
+) -> dict[str, int]:
+    column = store.column(field)
+    codes, counts = _first_seen_counts(column.codes)
+    return _label_counts(column, codes, counts, missing_value)
+
+
+def _value_pair_counts(
+    store: PlayRecordStore,
+    field: str,
+    other_field: str,
+    missing_value: str,
+    other_missing_value: str,
+) -> dict[str, dict[str, int]]:
+    column = store.column(field)
+    other_column = store.column(other_field)
+    # Shift the outer codes by one so missing values get a non-negative group
+    grouped = _grouped_first_seen_counts(
+        column.codes.astype(np.int64) + 1, other_column.codes
+    )
+    first_codes, _ = _first_seen_counts(column.codes)
+
+    pair_counts: dict[str, dict[str, int]] = {}
+    for code in first_codes:
+        other_codes, counts = grouped[code + 1]
+        value = missing_value if code == MISSING_CODE else column.categories[code]
+        inner = pair_counts.setdefault(value, {})
+        for other_value, count in _label_counts(
+            other_column, other_codes, counts, other_missing_value
+        ).items():
+            inner[other_value] = inner.get(other_value, 0) + count
+    return pair_counts
+
+
+def count_by_date(store: PlayRecordStore) -> dict[str, int]:
+    """
+    Count plays per local date.
+
+    Args:
+        store: Columnar play records
+
+    Returns:
+        Dictionary mapping YYYY-MM-DD strings to play counts
+    """
+    return dict(store.memoize((COUNTER_DATE,), lambda: _date_counts(store)))
+
+
+def count_by_month(store: PlayRecordStore) -> dict[str, int]:
+    """
+    Count plays per local month.
+
+    Args:
+        store: Columnar play records
+
+    Returns:
+        Dictionary mapping YYYY-MM strings to play counts
+    """
+    return dict(store.memoize((COUNTER_MONTH,), lambda: _month_counts(store)))
+
+
+def count_by_weekday(store: PlayRecordStore) -> list[int]:
+    """
+    Count plays per local day of week.
+
+    Args:
+        store: Columnar play records
+
+    Returns:
+        Seven counts, Monday first
+    """
+    return list(store.memoize((COUNTER_WEEKDAY,), lambda: _weekday_counts(store)))
+
+
+def count_by_hour(store: PlayRecordStore) -> list[int]:
+    """
+    Count plays per local hour of day.
+
+    Args:
+        store: Columnar play records
+
+    Returns:
+        Twenty-four counts, hour 0 first
+    """
+    return list(store.memoize((COUNTER_HOUR,), lambda: _hour_counts(store)))
+
+
+def count_values(
+    store: PlayRecordStore, field: str, missing_value: str
+) -> dict[str, int]:
+    """
+    Count plays per value of a categorical field.
+
+    Args:
+        store: Columnar play records
+        field: Name of the categorical field (e.g. "user", "platform")
+        missing_value: Value to count records without the field under
+
+    Returns:
+        Dictionary mapping field values to play counts in first-seen order
+    """
+    return dict(
+        store.memoize(
+            ("values", field, missing_value),
+            lambda: _value_counts(store, field, missing_value),
+        )
+    )
+
+
+def count_value_pairs(
+    store: PlayRecordStore,
+    field: str,
+    other_field: str,
+    missing_value: str = UNKNOWN_VALUE,
+    other_missing_value: str = UNKNOWN_STREAM_TYPE,
+) -> dict[str, dict[str, int]]:
+    """
+    Count plays per combination of two categorical fields.
+
+    Args:
+        store: Columnar play records
+        field: Outer categorical field (e.g. "user")
+        other_field: Inner categorical field (e.g. "transcode_decision")
+        missing_value: Value for records without the outer field
+        other_missing_value: Value for records without the inner field
+
+    Returns:
+        Nested dictionary of counts; both levels are in first-seen order
+    """
+    pair_counts = store.memoize(
+        ("pairs", field, other_field, missing_value, other_missing_value),
+        lambda: _value_pair_counts(
+            store, field, other_field, missing_value, other_missing_value
+        ),
+    )
+    return {value: dict(inner) for value, inner in pair_counts.items()}
+
+
+def _group_records(
+    store: PlayRecordStore,
+    field: str,
+    classify: Callable[[str], str],
+    missing_value: str,
+) -> tuple[list[str], NDArray[np.int64]]:
+    """
+    Assign every record to a group by classifying a categorical field.
+
+    The classifier is called once per distinct value rather than per record.
+
+    Returns:
+        Tuple of (group names, group id per record)
+    """
+    column = store.column(field)
+    group_names: list[str] = []
+    group_ids: dict[str, int] = {}
+
+    # One extra slot at the end holds the group for missing values
+    values = [*column.categories, missing_value]
+    group_of_code = np.empty(len(values), dtype=np.int64)
+    for code, value in enumerate(values):
+        group = classify(value)
+        if group not in group_ids:
+            group_ids[group] = len(group_names)
+            group_names.append(group)
+        group_of_code[code] = group_ids[group]
+
+    is_missing = cast(NDArray[np.bool_], column.codes == MISSING_CODE)
+    codes = np.where(is_missing, len(values) - 1, column.codes)
+    return group_names, group_of_code[codes]
+
+
+SplitResult = tuple[dict[str, PlayRecordStore], NDArray[np.int64], dict[str, int]]
+
+
+def _split(
+    store: PlayRecordStore,
+    field: str,
+    classify: Callable[[str], str],
+    missing_value: str,
+) -> SplitResult:
+    """
+    Split a store into groups, memoized on the store.
+
+    Returns:
+        Tuple of (stores by group name, group id per record, group ids by name)
+    """
+
+    def compute() -> SplitResult:
+        group_names, record_groups = _group_records(
+            store, field, classify, missing_value
+        )
+        groups, _ = _first_seen_counts(record_groups)
+        stores = {
+            group_names[group]: store.take(
+                cast(NDArray[np.bool_], record_groups == group)
+            )
+            for group in groups
+        }
+        return stores, record_groups, {group_names[group]: group for group in groups}
+
+    return store.memoize(("split", field, classify, missing_value), compute)
+
+
+def split_by_category(
+    store: PlayRecordStore,
+    field: str,
+    classify: Callable[[str], str],
+    missing_value: str = "",
+) -> dict[str, PlayRecordStore]:
+    """
+    Split records into groups by a classification of a categorical field.
+
+    Args:
+        store: Columnar play records
+        field: Name of the categorical field to classify (e.g. "media_type")
+        classify: Function mapping a field value to its group name
+        missing_value: Value to classify for records without the field
+
+    Returns:
+        Dictionary mapping group names to stores, in first-seen order
+    """
+    stores, _, _ = _split(store, field, classify, missing_value)
+    return dict(stores)
+
+
+def precompute_counters(
+    store: PlayRecordStore,
+    counters: Collection[str],
+    classify_media_type: Callable[[str], str],
+) -> None:
+    """
+    Compute several counters in one sweep and cache them on the store.
+
+    Each time-based and top-N counter is computed for the whole store and,
+    with a single joint group-by, for every media type group returned by
+    split_by_category(), so both combined and media-type-separated
+    aggregations become cache hits.
+
+    Args:
+        store: Columnar play records
+        counters: Names of the counters to build (COUNTER_* constants)
+        classify_media_type: Media type classifier used for the groups
+    """
+    if not counters or len(store) == 0:
+        return
+
+    groups, record_groups, group_ids = _split(
+        store, "media_type", classify_media_type, ""
+    )
+    group_count = max(group_ids.values()) + 1
+
+    def prime_fixed(name: str, keys: NDArray[np.int64], size: int) -> None:
+        """Prime a fixed-size counter (weekday, hour) for all groups."""
+        joint = np.bincount(record_groups * size + keys, minlength=group_count * size)
+        per_group: list[list[int]] = joint.reshape(group_count, size).tolist()
+        store.prime((name,), [sum(column) for column in zip(*per_group)])
+        for group_name, group_store in groups.items():
+            group_store.prime((name,), per_group[group_ids[group_name]])
+
+    def prime_first_seen(
+        key: tuple[str, ...],
+        keys: IntArray,
+        label: Callable[[list[int], list[int]], dict[str, int]],
+    ) -> None:
+        """Prime a first-seen ordered counter (date, month, values) for all groups."""
+        store.prime(key, label(*_first_seen_counts(keys)))
+        grouped = _grouped_first_seen_counts(record_groups, keys)
+        for group_name, group_store in groups.items():
+            group_store.prime(key, label(*grouped[group_ids[group_name]]))
+
+    def label_column(
+        column: CategoricalColumn,
+    ) -> Callable[[list[int], list[int]], dict[str, int]]:
+        return lambda codes, counts: _label_counts(column, codes, counts, UNKNOWN_VALUE)
+
+    if COUNTER_WEEKDAY in counters:
+        prime_fixed(COUNTER_WEEKDAY, _local_weekdays(store), 7)
+    if COUNTER_HOUR in counters:
+        prime_fixed(COUNTER_HOUR, _local_hours(store), 24)
+    if COUNTER_DATE in counters:
+        prime_first_seen(
+            (COUNTER_DATE,),
+            _local_days(store),
+            lambda days, counts: dict(zip(_format_days(days), counts)),
+        )
+    if COUNTER_MONTH in counters:
+        prime_first_seen(
+            (COUNTER_MONTH,),
+            _local_months(store),
+            lambda months, counts: dict(zip(_format_months(months), counts)),
+        )
+
+    for counter, field in ((COUNTER_USER, "user"), (COUNTER_PLATFORM, "platform")):
+        if counter in counters:
+            column = store.column(field)
+            prime_first_seen(
+                ("values", field, UNKNOWN_VALUE), column.codes, label_column(column)
+            )
+
+    for counter, field in (
+        (COUNTER_USER_STREAM_TYPE, "user"),
+        (COUNTER_PLATFORM_STREAM_TYPE, "platform"),
+    ):
+        if counter in counters:
+            _ = count_value_pairs(store, field, "transcode_decision")
@@ -8,37 +8,89 @@ personalized graphs for a user.
 """
 
 import asyncio
+import io
 import logging
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
 
 from .. import i18n
 from .graph_modules.data.data_fetcher import DataFetcher
+from .graph_modules.data.history_cache import get_play_history_cache
+from .graph_modules.data.response_cache import get_response_cache
+from .graph_modules.data.processed_history import (
+    RESOLUTION_GRAPH_TYPES,
+    with_processed_history,
+    with_resolution_history,
+)
 from .graph_modules.core.graph_factory import GraphFactory
 from .graph_modules.utils.utils import cleanup_old_files, get_current_graph_storage_path
+from ..utils.cli.paths import get_path_config
+from ..utils.core.image_store import get_graph_image_store
 
 # Import shared classes from graph_manager and progress tracker utility
 from .graph_manager import GraphGenerationError, ResourceCleanupError
 from .graph_modules.utils.progress_tracker import ProgressTracker
 
 if TYPE_CHECKING:
+    import discord
+
     from ..config.manager import ConfigManager
+    from ..utils.discord.discord_file_utils import DiscordUploadResult
+    from .graph_modules.data.tautulli_client import TautulliClient
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class UserGraphImages:
+    """
+    Personal graphs of a user, kept in memory after their files are removed.
+
+    The images can be sent again, e.g. to a repeated /my_stats request,
+    without generating the graphs again.
+    """
+
+    user_email: str
+    graph_files: tuple[str, ...]
+    images: tuple[bytes, ...]
+    processing_time: float
+
+    def to_discord_files(self) -> list["discord.File"]:
+        """
+        Create Discord files that upload the images from memory.
+
+        Returns:
+            One Discord file per graph, named after its graph file
+        """
+        import discord
+
+        return [
+            discord.File(io.BytesIO(image), filename=Path(graph_file).name)
+            for graph_file, image in zip(self.graph_files, self.images, strict=True)
+        ]
+
+
 class UserGraphManager:
     """Handles graph generation for personal user statistics."""
 
-    def __init__(self, config_manager: "ConfigManager") -> None:
+    def __init__(
+        self,
+        config_manager: "ConfigManager",
+        tautulli_client: "TautulliClient | None" = None,
+    ) -> None:
         """
         Initialize the user graph manager.
 
         Args:
             config_manager: Configuration manager instance
+            tautulli_client: Optional bot-scoped Tautulli HTTP client whose
+                connection pool is reused instead of opening a new one
         """
         self.config_manager: "ConfigManager" = config_manager
+        self.tautulli_client: "TautulliClient | None" = tautulli_client
         self._data_fetcher: DataFetcher | None = None
         self._graph_factory: GraphFactory | None = None
 
@@ -60,12 +112,35 @@ class UserGraphManager:
         """Initialize DataFetcher and GraphFactory components."""
         config = self.config_manager.get_current_config()
 
+        # Share the persistent play history cache when enabled
+        history_cache = (
+            get_play_history_cache(get_path_config().get_history_cache_path())
+            if config.data_collection.history_cache.enabled
+            else None
+        )
+
         # Initialize DataFetcher with async context manager
         self._data_fetcher = DataFetcher(
             base_url=config.services.tautulli.url,
             api_key=config.services.tautulli.api_key,
             timeout=30.0,
             max_retries=3,
+            history_cache=history_cache,
+            page_size=config.data_collection.history_fetch.page_size,
+            max_concurrent_pages=config.data_collection.history_fetch.max_concurrent_pages,
+            full_sync_interval_days=config.data_collection.history_cache.full_sync_interval_days,
+            response_cache=get_response_cache(),
+            client=(
+                self.tautulli_client.client
+                if self.tautulli_client is not None and self.tautulli_client.is_open
+                else None
+            ),
+            concurrency=(
+                self.tautulli_client.concurrency
+                if self.tautulli_client is not None
+                else None
+            ),
+            compact_history=True,
         )
         _ = await self._data_fetcher.__aenter__()
 
@@ -77,6 +152,9 @@ class UserGraphManager:
     async def _cleanup_components(self) -> None:
         """Clean up DataFetcher and other resources."""
         if self._data_fetcher is not None:
+            logger.debug(
+                f"Tautulli response cache stats: {get_response_cache().get_stats()}"
+            )
             await self._data_fetcher.__aexit__(None, None, None)
             self._data_fetcher = None
 
@@ -119,11 +197,7 @@ class UserGraphManager:
         progress_tracker = ProgressTracker(progress_callback)
 
         try:
-            # Step 1: Clear cache to ensure fresh data respecting current time_range_days
-            self._data_fetcher.clear_cache()
-            logger.debug("Cleared DataFetcher cache for fresh user statistics")
-
-            # Step 2: Fetch user-specific data with retry logic
+            # Step 1: Fetch user-specific data with retry logic
             progress_tracker.update("Fetching user data from Tautulli API", 2, 4)
             config = self.config_manager.get_current_config()
 
@@ -134,26 +208,30 @@ class UserGraphManager:
                 progress_tracker,
             )
 
-            # Step 3: Validate user data
+            # Step 2: Validate user data
             progress_tracker.update("Validating user data", 3, 4)
             if not self._validate_user_graph_data(user_data, progress_tracker):
                 raise GraphGenerationError(
                     f"Invalid or insufficient data for user {user_email}"
                 )
 
-            # Step 4: Generate graphs with timeout protection
+            # Step 3: Generate graphs with timeout protection
             progress_tracker.update("Generating user graphs in separate thread", 4, 4)
             logger.debug("Starting user graph generation with timeout protection")
 
+            async def attach_and_generate() -> list[str]:
+                # Resolution metadata is fetched once, within the timeout
+                graph_data = await self._attach_resolution_history(user_data)
+                return await asyncio.to_thread(
+                    self._generate_user_graphs_sync,
+                    user_email,
+                    graph_data,
+                    progress_tracker,
+                )
+
             try:
                 graph_files = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        self._generate_user_graphs_sync,
-                        user_email,
-                        user_data,
-                        progress_tracker,
-                    ),
-                    timeout=timeout_seconds,
+                    attach_and_generate(), timeout=timeout_seconds
                 )
             except asyncio.TimeoutError:
                 error_msg = f"User graph generation exceeded timeout of {timeout_seconds} seconds"
@@ -196,6 +274,10 @@ class UserGraphManager:
         """
         Fetch user-specific data for graph generation from Tautulli API.
 
+        With history_cache.local_user_stats enabled, the data is read from
+        the local play history cache instead, falling back to Tautulli if
+        the cache does not know the user or cover the time range.
+
         Args:
             user_email: The user's Plex email address
             time_range_days: Number of days to fetch data for
@@ -213,6 +295,17 @@ class UserGraphManager:
             f"Fetching user graph data for {user_email} ({time_range_days} days)"
         )
 
+        config = self.config_manager.get_current_config()
+        if config.data_collection.history_cache.local_user_stats:
+            local_data = await self._fetch_local_user_graph_data(
+                user_email, time_range_days
+            )
+            if local_data is not None:
+                return local_data
+            logger.info(
+                f"No local play history for {user_email}, fetching it from Tautulli"
+            )
+
         try:
             # Look up user by email to get user ID
             user_info = await self._data_fetcher.find_user_by_email(user_email)
@@ -249,6 +342,52 @@ class UserGraphManager:
             logger.exception(f"Error fetching user graph data for {user_email}: {e}")
             raise
 
+    async def _fetch_local_user_graph_data(
+        self, user_email: str, time_range_days: int
+    ) -> dict[str, object] | None:
+        """
+        Read user-specific graph data from the local play history cache.
+
+        Nothing is requested from Tautulli: the user is found in the cache's
+        user index and their plays are filtered from the shared history
+        kept current by scheduled graph updates.
+
+        Args:
+            user_email: The user's Plex email address
+            time_range_days: Number of days to read data for
+
+        Returns:
+            Dictionary containing user-specific data needed for graph
+            generation, or None if the cache cannot serve the request
+        """
+        if self._data_fetcher is None:
+            raise RuntimeError("DataFetcher not initialized")
+
+        user_info = await self._data_fetcher.find_local_user_by_email(user_email)
+        if user_info is None:
+            return None
+        user_id = user_info.get("user_id")
+        if not isinstance(user_id, int):
+            return None
+
+        play_history = await self._data_fetcher.get_local_play_history(
+            time_range=time_range_days, user_id=user_id
+        )
+        if play_history is None:
+            return None
+
+        logger.debug(
+            f"Read {len(play_history['data'])} plays for {user_email} from the "
+            + "local play history"
+        )
+        return {
+            "data": play_history,
+            "time_range_days": time_range_days,
+            "user_email": user_email,
+            "user_id": user_id,
+            "user_info": user_info,
+        }
+
     async def _fetch_user_graph_data_with_retry(
         self,
         user_email: str,
@@ -366,23 +505,27 @@ class UserGraphManager:
         """
         valid_files: list[str] = []
 
+        image_store = get_graph_image_store()
+
         for file_path in graph_files:
             try:
                 path = Path(file_path)
 
-                if not path.exists():
-                    progress_tracker.add_error(
-                        f"Generated user file does not exist for {user_email}: {file_path}"
-                    )
-                    continue
+                # Graphs rendered in memory are uploaded without a file
+                if image_store.get(path) is None:
+                    if not path.exists():
+                        progress_tracker.add_error(
+                            f"Generated user file does not exist for {user_email}: {file_path}"
+                        )
+                        continue
 
-                if not path.is_file():
-                    progress_tracker.add_error(
-                        f"User path is not a file for {user_email}: {file_path}"
-                    )
-                    continue
+                    if not path.is_file():
+                        progress_tracker.add_error(
+                            f"User path is not a file for {user_email}: {file_path}"
+                        )
+                        continue
 
-                if path.stat().st_size == 0:
+                if image_store.size(path) == 0:
                     progress_tracker.add_warning(
                         f"Generated user file is empty for {user_email}: {file_path}"
                     )
@@ -403,6 +546,36 @@ class UserGraphManager:
         )
         return valid_files
 
+    async def _attach_resolution_history(
+        self, data: dict[str, object]
+    ) -> dict[str, object]:
+        """
+        Look up media resolutions once for the enabled resolution graphs.
+
+        The lookup runs on the bot's event loop with the manager's
+        DataFetcher before the graphs are rendered, so the source and
+        stream resolution graphs share one set of metadata requests.
+
+        Args:
+            data: User graph data containing the user's play history
+
+        Returns:
+            The graph data, with the resolution-enriched history attached
+            if a resolution graph is enabled
+        """
+        if self._graph_factory is None or self._data_fetcher is None:
+            return data
+
+        enabled_types = self._graph_factory.get_enabled_graph_types()
+        if RESOLUTION_GRAPH_TYPES.isdisjoint(enabled_types):
+            return data
+
+        return await with_resolution_history(
+            data,
+            fetcher=self._data_fetcher,
+            config=self.config_manager.get_current_config(),
+        )
+
     def _generate_user_graphs_sync(
         self,
         user_email: str,
@@ -440,10 +613,13 @@ class UserGraphManager:
             # GraphFactory should be initialized in __aenter__
             assert self._graph_factory is not None, "GraphFactory not initialized"
 
+            # Process the user's play history once and share it across all graphs
+            graph_data = with_processed_history(data)
+
             # Use GraphFactory to generate user-appropriate graphs with user-specific data
             # Exclude "Top 10 Users" graph as it's irrelevant for personal statistics
             generated_paths = self._graph_factory.generate_graphs_with_exclusions(
-                data, exclude_types=["top_10_users"]
+                graph_data, exclude_types=["top_10_users"]
             )
 
             # Move generated graphs to user-specific directory
@@ -458,8 +634,8 @@ class UserGraphManager:
                         )
                         user_path = user_graph_dir / user_filename
 
-                        # Move file to user directory
-                        _ = Path(path).rename(user_path)
+                        # Move file (or in-memory image) to user directory
+                        get_graph_image_store().move(path, user_path)
                         user_specific_paths.append(str(user_path))
                     except Exception as e:
                         error_msg = f"Failed to move graph file {path} for user {user_email}: {e}"
@@ -505,113 +681,62 @@ class UserGraphManager:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"Sending {len(graph_files)} personal graphs to user {user_id}")
-
-        try:
-            import discord
-            from ..utils.discord.discord_file_utils import upload_files_to_user_dm
-
-            # Get the Discord user - try fetch_user first for uncached users, fallback to get_user
-            fetch_user_func = getattr(bot, "fetch_user", None)
-            get_user_func = getattr(bot, "get_user", None)
-
-            user = None
-
-            # Try fetch_user first (makes API request, works for any valid user)
-            if fetch_user_func is not None:
-                try:
-                    user = await fetch_user_func(user_id)  # pyright: ignore[reportAny]
-                    logger.debug(f"Found Discord user {user_id} via fetch_user")
-                except Exception as e:
-                    logger.warning(f"fetch_user failed for {user_id}: {e}")
-
-            # Fallback to get_user (cached users only)
-            if user is None and get_user_func is not None:
-                user = get_user_func(user_id)  # pyright: ignore[reportAny]
-                if user is not None:
-                    logger.debug(f"Found Discord user {user_id} via get_user (cached)")
-
-            if user is None:
-                logger.error(
-                    f"Could not find Discord user with ID {user_id} (tried both fetch_user and get_user)"
-                )
-                return False
-
-            # Create embed for the personal statistics
-            embed = discord.Embed(
-                title=i18n.translate("📊 Your Personal Plex Statistics"),
-                description=i18n.translate(
-                    "Here are your personalized viewing statistics!"
-                ),
-                color=discord.Color.blue(),
-            )
-
-            # Add metadata about the graphs
-            _ = embed.add_field(
-                name=i18n.translate("Generated Graphs"),
-                value=i18n.translate(
-                    "{count} graphs generated", count=len(graph_files)
-                ),
-                inline=True,
-            )
-            _ = embed.add_field(
-                name=i18n.translate("Privacy Notice"),
-                value=i18n.translate("These statistics are private to you"),
-                inline=True,
-            )
-            _ = embed.set_footer(text=i18n.translate("Generated by TGraph Bot"))
+        from ..utils.discord.discord_file_utils import upload_files_to_user_dm
 
+        async def upload(
+            user: "discord.User", embed: "discord.Embed"
+        ) -> "DiscordUploadResult":
             # Use the enhanced file upload utility with validation
-            upload_result = await upload_files_to_user_dm(
-                user=user,  # pyright: ignore[reportAny]
+            return await upload_files_to_user_dm(
+                user=user,
                 file_paths=graph_files,
                 embed=embed,
                 use_nitro_limits=False,  # Use regular Discord limits for DMs
             )
 
-            if upload_result.success:
-                logger.info(
-                    f"Successfully sent {upload_result.files_uploaded}/{len(graph_files)} graphs to user {user_id}"
-                )
-                return True
-            else:
-                logger.error(
-                    f"Failed to send graphs to user {user_id}: {upload_result.error_message}"
-                )
+        return await _send_graphs_dm(user_id, len(graph_files), bot, upload)
 
-                # Try to send just the embed with error information if file upload failed
-                try:
-                    error_embed = discord.Embed(
-                        title=i18n.translate("📊 Personal Statistics - Upload Issue"),
-                        description=i18n.translate(
-                            "Your statistics were generated but couldn't be uploaded."
-                        ),
-                        color=discord.Color.orange(),
-                    )
-                    _ = error_embed.add_field(
-                        name=i18n.translate("Issue Details"),
-                        value=upload_result.error_message
-                        or i18n.translate("Unknown upload error occurred"),
-                        inline=False,
-                    )
-                    _ = error_embed.add_field(
-                        name=i18n.translate("Next Steps"),
-                        value=i18n.translate(
-                            "Please try the command again or contact support if the issue persists."
-                        ),
-                        inline=False,
-                    )
-                    _ = await user.send(embed=error_embed)  # pyright: ignore[reportAny]
-                    return False
-                except Exception as fallback_error:
-                    logger.error(
-                        f"Failed to send fallback error message to user {user_id}: {fallback_error}"
-                    )
-                    return False
+    async def render_user_graph_images(self, user_email: str) -> UserGraphImages:
+        """
+        Generate a user's personal graphs and keep them in memory.
 
-        except Exception as e:
-            logger.exception(f"Error sending graphs to user {user_id}: {e}")
-            return False
+        The graph files are removed as after a regular request; their
+        images are returned so they can be sent to the user, possibly more
+        than once.
+
+        Args:
+            user_email: The user's Plex email address
+
+        Returns:
+            The generated graph images
+
+        Raises:
+            GraphGenerationError: If graph generation fails
+            asyncio.TimeoutError: If generation exceeds the timeout
+        """
+        start_time = time.time()
+        graph_files = await self.generate_user_graphs(user_email)
+
+        def read_images() -> tuple[bytes, ...]:
+            image_store = get_graph_image_store()
+            images: list[bytes] = []
+            for graph_file in graph_files:
+                with image_store.open(graph_file) as f:
+                    images.append(f.read())
+            return tuple(images)
+
+        try:
+            images = await asyncio.to_thread(read_images)
+        finally:
+            _ = await self.cleanup_user_graphs(graph_files)
+            await self.cleanup_old_user_graphs(user_email)
+
+        return UserGraphImages(
+            user_email=user_email,
+            graph_files=tuple(graph_files),
+            images=images,
+            processing_time=time.time() - start_time,
+        )
 
     async def cleanup_user_graphs(
         self, graph_files: list[str], timeout_seconds: float = 30.0
@@ -686,10 +811,17 @@ class UserGraphManager:
         """
         deleted_count = 0
 
+        image_store = get_graph_image_store()
+
         for file_path in graph_files:
             try:
                 path_obj = Path(file_path)
-                if path_obj.exists() and path_obj.is_file():
+                if image_store.get(path_obj) is not None:
+                    # Also deletes the archived file once it has been written
+                    image_store.delete(path_obj)
+                    deleted_count += 1
+                    logger.debug(f"Deleted in-memory user graph: {file_path}")
+                elif path_obj.exists() and path_obj.is_file():
                     path_obj.unlink()
                     deleted_count += 1
                     logger.debug(f"Deleted user graph file: {file_path}")
@@ -880,3 +1012,154 @@ class UserGraphManager:
             f"Cleaned up {total_deleted} files for user {user_email} from date-based graph structure"
         )
         return total_deleted
+
+
+async def send_user_graph_images_dm(
+    user_id: int,
+    graph_images: UserGraphImages,
+    bot: object,  # Discord bot instance
+) -> bool:
+    """
+    Send graph images kept in memory via Discord DM.
+
+    The images are uploaded straight from memory, so no UserGraphManager
+    is needed to send graphs that were generated earlier.
+
+    Args:
+        user_id: Discord user ID
+        graph_images: Graph images from render_user_graph_images()
+        bot: Discord bot instance for sending messages
+
+    Returns:
+        True if successful, False otherwise
+    """
+    from ..utils.discord.discord_file_utils import upload_discord_files_to_user_dm
+
+    async def upload(
+        user: "discord.User", embed: "discord.Embed"
+    ) -> "DiscordUploadResult":
+        return await upload_discord_files_to_user_dm(
+            user, graph_images.to_discord_files(), embed=embed
+        )
+
+    return await _send_graphs_dm(user_id, len(graph_images.images), bot, upload)
+
+
+async def _send_graphs_dm(
+    user_id: int,
+    graph_count: int,
+    bot: object,  # Discord bot instance
+    upload: Callable[
+        ["discord.User", "discord.Embed"], Awaitable["DiscordUploadResult"]
+    ],
+) -> bool:
+    """
+    Look up a Discord user and send them their personal graphs.
+
+    Args:
+        user_id: Discord user ID
+        graph_count: Number of graphs being sent
+        bot: Discord bot instance for sending messages
+        upload: Uploads the graphs with the given embed to the user's DM
+
+    Returns:
+        True if successful, False otherwise
+    """
+    logger.info(f"Sending {graph_count} personal graphs to user {user_id}")
+
+    try:
+        import discord
+
+        # Get the Discord user - try fetch_user first for uncached users, fallback to get_user
+        fetch_user_func = getattr(bot, "fetch_user", None)
+        get_user_func = getattr(bot, "get_user", None)
+
+        user = None
+
+        # Try fetch_user first (makes API request, works for any valid user)
+        if fetch_user_func is not None:
+            try:
+                user = await fetch_user_func(user_id)  # pyright: ignore[reportAny]
+                logger.debug(f"Found Discord user {user_id} via fetch_user")
+            except Exception as e:
+                logger.warning(f"fetch_user failed for {user_id}: {e}")
+
+        # Fallback to get_user (cached users only)
+        if user is None and get_user_func is not None:
+            user = get_user_func(user_id)  # pyright: ignore[reportAny]
+            if user is not None:
+                logger.debug(f"Found Discord user {user_id} via get_user (cached)")
+
+        if user is None:
+            logger.error(
+                f"Could not find Discord user with ID {user_id} (tried both fetch_user and get_user)"
+            )
+            return False
+
+        # Create embed for the personal statistics
+        embed = discord.Embed(
+            title=i18n.translate("📊 Your Personal Plex Statistics"),
+            description=i18n.translate(
+                "Here are your personalized viewing statistics!"
+            ),
+            color=discord.Color.blue(),
+        )
+
+        # Add metadata about the graphs
+        _ = embed.add_field(
+            name=i18n.translate("Generated Graphs"),
+            value=i18n.translate("{count} graphs generated", count=graph_count),
+            inline=True,
+        )
+        _ = embed.add_field(
+            name=i18n.translate("Privacy Notice"),
+            value=i18n.translate("These statistics are private to you"),
+            inline=True,
+        )
+        _ = embed.set_footer(text=i18n.translate("Generated by TGraph Bot"))
+
+        upload_result = await upload(user, embed)  # pyright: ignore[reportAny]
+
+        if upload_result.success:
+            logger.info(
+                f"Successfully sent {upload_result.files_uploaded}/{graph_count} graphs to user {user_id}"
+            )
+            return True
+        else:
+            logger.error(
+                f"Failed to send graphs to user {user_id}: {upload_result.error_message}"
+            )
+
+            # Try to send just the embed with error information if file upload failed
+            try:
+                error_embed = discord.Embed(
+                    title=i18n.translate("📊 Personal Statistics - Upload Issue"),
+                    description=i18n.translate(
+                        "Your statistics were generated but couldn't be uploaded."
+                    ),
+                    color=discord.Color.orange(),
+                )
+                _ = error_embed.add_field(
+                    name=i18n.translate("Issue Details"),
+                    value=upload_result.error_message
+                    or i18n.translate("Unknown upload error occurred"),
+                    inline=False,
+                )
+                _ = error_embed.add_field(
+                    name=i18n.translate("Next Steps"),
+                    value=i18n.translate(
+                        "Please try the command again or contact support if the issue persists."
+                    ),
+                    inline=False,
+                )
+                _ = await user.send(embed=error_embed)  # pyright: ignore[reportAny]
+                return False
+            except Exception as fallback_error:
+                logger.error(
+                    f"Failed to send fallback error message to user {user_id}: {fallback_error}"
+                )
+                return False
+
+    except Exception as e:
+        logger.exception(f"Error sending graphs to user {user_id}: {e}")
+        return False
@@ -0,0 +1,229 @@
+"""
+Personal statistics job queue for TGraph Bot.
+
+Each /my_stats request fetches a user's play history and renders their
+graphs, which costs Tautulli requests and CPU time. A burst of requests,
+e.g. right after the command is announced, would otherwise all run at
+once. UserStatsQueue runs the requests in arrival order on a bounded
+number of workers:
+
+- A request for an email that is already queued or being generated joins
+  that job instead of starting another one.
+- Finished graphs are kept for a few minutes, so a repeated request is
+  answered without generating them again.
+- Each request learns its position in the queue when it is submitted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Final
+
+from .graph_modules.data.history_cache import normalize_email
+from .user_graph_manager import UserGraphImages
+
+logger = logging.getLogger(__name__)
+
+# Personal statistics generated at the same time
+DEFAULT_MAX_WORKERS: Final[int] = 2
+
+# Seconds finished graphs answer repeated requests for the same email
+DEFAULT_RESULT_TTL: Final[float] = 300.0
+
+type GenerateUserGraphs = Callable[[str], Awaitable[UserGraphImages]]
+
+
+@dataclass(frozen=True)
+class UserStatsTicket:
+    """A submitted personal statistics request."""
+
+    email: str
+    # Place among the waiting jobs (1 is next), 0 if the job is running or done
+    position: int
+    # Whether the request joined a job that was already queued or running
+    coalesced: bool
+    # Whether the request is answered with recently generated graphs
+    cached: bool
+    future: asyncio.Future[UserGraphImages]
+
+    async def result(self) -> UserGraphImages:
+        """
+        Wait for the graphs of the request.
+
+        Cancelling the wait does not cancel the job, which other requests
+        may share.
+
+        Returns:
+            The generated graph images
+
+        Raises:
+            Exception: The error the graph generation failed with
+        """
+        return await asyncio.shield(self.future)
+
+
+class UserStatsQueue:
+    """Bounded, coalescing queue of personal statistics jobs."""
+
+    def __init__(
+        self,
+        generate: GenerateUserGraphs,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        result_ttl: float = DEFAULT_RESULT_TTL,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            generate: Coroutine function generating the graphs of an email
+            max_workers: Jobs running at the same time
+            result_ttl: Seconds finished graphs answer repeated requests
+        """
+        self._generate: GenerateUserGraphs = generate
+        self.max_workers: int = max(1, max_workers)
+        self.result_ttl: float = result_ttl
+        self._waiting: deque[str] = deque()
+        self._jobs: dict[str, asyncio.Future[UserGraphImages]] = {}
+        # Email as first submitted for each job; the normalized key is only
+        # used to coalesce requests and cache results
+        self._emails: dict[str, str] = {}
+        self._results: dict[str, UserGraphImages] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._timers: set[asyncio.TimerHandle] = set()
+
+    @property
+    def running(self) -> int:
+        """Number of jobs being generated."""
+        return len(self._tasks)
+
+    @property
+    def waiting(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return len(self._waiting)
+
+    def submit(self, email: str) -> UserStatsTicket:
+        """
+        Request the personal graphs of an email.
+
+        Args:
+            email: The user's Plex email address
+
+        Returns:
+            Ticket to wait for the graphs with
+        """
+        key = normalize_email(email)
+
+        cached = self._results.get(key)
+        if cached is not None:
+            future: asyncio.Future[UserGraphImages] = (
+                asyncio.get_running_loop().create_future()
+            )
+            future.set_result(cached)
+            logger.debug("Answering personal statistics request from recent graphs")
+            return UserStatsTicket(
+                email=email, position=0, coalesced=False, cached=True, future=future
+            )
+
+        job = self._jobs.get(key)
+        if job is not None:
+            logger.debug("Joining queued personal statistics request")
+            return UserStatsTicket(
+                email=email,
+                position=self.position(email),
+                coalesced=True,
+                cached=False,
+                future=job,
+            )
+
+        job = asyncio.get_running_loop().create_future()
+        # Failures reach every waiter; nobody may be waiting anymore
+        job.add_done_callback(_retrieve_exception)
+        self._jobs[key] = job
+        self._emails[key] = email
+        self._waiting.append(key)
+        self._start_jobs()
+        return UserStatsTicket(
+            email=email,
+            position=self.position(email),
+            coalesced=False,
+            cached=False,
+            future=job,
+        )
+
+    def position(self, email: str) -> int:
+        """
+        Get the queue position of an email's job.
+
+        Args:
+            email: The user's Plex email address
+
+        Returns:
+            Place among the waiting jobs (1 is next), 0 if not waiting
+        """
+        try:
+            return self._waiting.index(normalize_email(email)) + 1
+        except ValueError:
+            return 0
+
+    def clear(self) -> None:
+        """Drop the recently generated graphs."""
+        for timer in self._timers:
+            timer.cancel()
+        self._timers.clear()
+        self._results.clear()
+
+    def _start_jobs(self) -> None:
+        """Start waiting jobs while workers are free."""
+        while self._waiting and len(self._tasks) < self.max_workers:
+            key = self._waiting.popleft()
+            task = asyncio.create_task(self._run(key), name="user-stats-job")
+            self._tasks.add(task)
+            task.add_done_callback(self._job_done)
+
+    async def _run(self, key: str) -> None:
+        """Generate the graphs of a job and resolve its future."""
+        job = self._jobs[key]
+        try:
+            images = await self._generate(self._emails[key])
+        except asyncio.CancelledError:
+            _ = job.cancel()
+            raise
+        except Exception as e:  # noqa: BLE001
+            job.set_exception(e)
+        else:
+            self._results[key] = images
+            self._call_later(self._expire, key, images)
+            job.set_result(images)
+        finally:
+            _ = self._jobs.pop(key, None)
+            _ = self._emails.pop(key, None)
+
+    def _job_done(self, task: asyncio.Task[None]) -> None:
+        """Free the worker of a finished job and start the next one."""
+        self._tasks.discard(task)
+        self._start_jobs()
+
+    def _expire(self, key: str, images: UserGraphImages) -> None:
+        """Stop answering requests with graphs older than the result TTL."""
+        if self._results.get(key) is images:
+            del self._results[key]
+
+    def _call_later(self, callback: Callable[..., None], *args: object) -> None:
+        """Run a callback once the result TTL has passed."""
+
+        def run() -> None:
+            self._timers.discard(timer)
+            callback(*args)
+
+        timer = asyncio.get_running_loop().call_later(self.result_ttl, run)
+        self._timers.add(timer)
+
+
+def _retrieve_exception(future: asyncio.Future[UserGraphImages]) -> None:
+    """Mark a job's exception as retrieved, so it is not logged as unhandled."""
+    if not future.cancelled():
+        _ = future.exception()
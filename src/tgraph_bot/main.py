@@ -14,7 +14,7 @@ import sys
 from collections.abc import Coroutine
 from datetime import datetime
 from pathlib import Path
-from typing import override
+from typing import TYPE_CHECKING, override
 
 # Configure matplotlib backend before any imports that use matplotlib
 import matplotlib
@@ -30,6 +30,9 @@ from .bot.extensions import load_extensions
 from .utils.cli.args import get_parsed_args
 from .utils.cli.paths import get_path_config
 
+if TYPE_CHECKING:
+    from .graphs.graph_modules.data.tautulli_client import TautulliClient
+
 
 def rotate_logs_on_startup(logs_dir: Path) -> None:
     """
@@ -202,6 +205,9 @@ class TGraphBot(commands.Bot):
         self._shutdown_event: asyncio.Event = asyncio.Event()
         self._is_shutting_down: bool = False
 
+        # Pooled Tautulli HTTP client, created in setup_hook and closed in close()
+        self.tautulli_client: "TautulliClient | None" = None
+
         # Initialize update tracker for automated scheduling
         from .bot.update_tracker import UpdateTracker
 
@@ -242,6 +248,12 @@ class TGraphBot(commands.Bot):
                 # Continue with default language
                 logger.warning("Continuing with default language settings")
 
+            # Open the Tautulli connection pool shared by all graph managers
+            await self.setup_tautulli_client()
+
+            # Load the plotting stack before the first graph update needs it
+            await self.warm_up_graph_rendering()
+
             # Load command extensions
             try:
                 extension_results = await load_extensions(self)
@@ -285,6 +297,43 @@ class TGraphBot(commands.Bot):
             self._shutdown_event.set()
             raise
 
+    async def setup_tautulli_client(self) -> None:
+        """
+        Create and start the bot-scoped Tautulli HTTP client.
+
+        Graph managers borrow this client, so its keep-alive connections are
+        reused across scheduled updates and user requests.
+        """
+        from .graphs.graph_modules.data.tautulli_client import TautulliClient
+
+        config = self.config_manager.get_current_config()
+        connection = config.services.tautulli.connection
+        self.tautulli_client = TautulliClient(
+            timeout=connection.timeout,
+            max_connections=connection.max_connections,
+            max_keepalive_connections=connection.max_keepalive_connections,
+            keepalive_expiry=connection.keepalive_expiry,
+            http2=connection.http2,
+        )
+        await self.tautulli_client.start()
+
+    async def warm_up_graph_rendering(self) -> None:
+        """
+        Warm up graph rendering in a worker thread.
+
+        Imports matplotlib and seaborn, loads fonts and applies the base graph
+        style once, and starts the render worker processes if configured, so
+        the first graph update after startup is as fast as later ones.
+        Failures are logged; rendering then warms up on first use.
+        """
+        from .graphs.graph_modules.core.render_pool import warm_up_rendering
+
+        try:
+            config = self.config_manager.get_current_config()
+            await asyncio.to_thread(warm_up_rendering, config.graphs.rendering.workers)
+        except Exception as e:
+            logger.warning(f"Failed to warm up graph rendering: {e}")
+
     async def setup_background_tasks(self) -> None:
         """
         Setup background tasks for the bot.
@@ -378,7 +427,9 @@ class TGraphBot(commands.Bot):
             await self._cleanup_bot_messages(target_channel)
 
             # Step 2: Generate graphs
-            async with GraphManager(self.config_manager) as graph_manager:
+            async with GraphManager(
+                self.config_manager, tautulli_client=self.tautulli_client
+            ) as graph_manager:
                 graph_files = await graph_manager.generate_all_graphs(
                     max_retries=3, timeout_seconds=300.0
                 )
@@ -404,64 +455,32 @@ class TGraphBot(commands.Bot):
         """
         Clean up previous messages posted by the bot in the specified channel.
 
-        This method removes all messages that were posted by this bot instance,
-        implementing the same cleanup logic used during bot startup.
+        This method deletes the graph messages tracked for the channel (see
+        cleanup_bot_messages), implementing the same cleanup logic used
+        during bot startup.
 
         Args:
             channel: The Discord text channel to clean up
         """
+        from .bot.scheduling.persistence import PostedMessageStore
+        from .utils.discord.message_cleanup import cleanup_bot_messages
+
         logger.info(f"Starting message cleanup in channel: {channel.name}")
 
         try:
-            # Check bot permissions
-            if not channel.permissions_for(channel.guild.me).manage_messages:
-                logger.warning(
-                    f"Bot lacks 'Manage Messages' permission in {channel.name}"
-                )
-                logger.info("Attempting to delete only bot's own messages...")
-
-            deleted_count = 0
-            error_count = 0
-
-            # Fetch messages in batches and delete bot's own messages
-            async for message in channel.history(limit=None):
-                # Only delete messages from this bot
-                if self.user and message.author.id == self.user.id:
-                    try:
-                        await message.delete()
-                        deleted_count += 1
-
-                        # Rate limit protection - Discord allows 5 deletes per second
-                        if deleted_count % 5 == 0:
-                            await asyncio.sleep(1.0)
-
-                    except discord.Forbidden:
-                        logger.warning(
-                            f"Cannot delete message {message.id} - insufficient permissions"
-                        )
-                        error_count += 1
-                    except discord.NotFound:
-                        # Message already deleted, continue
-                        pass
-                    except discord.HTTPException as e:
-                        logger.error(f"HTTP error deleting message {message.id}: {e}")
-                        error_count += 1
-
-                        # If we hit rate limits, wait longer
-                        if e.status == 429:
-                            retry_after = getattr(e, "retry_after", 5.0)
-                            logger.info(
-                                f"Rate limited, waiting {retry_after} seconds..."
-                            )
-                            await asyncio.sleep(retry_after)
+            config = self.config_manager.get_current_config()
+            edit_graph_messages = config.services.discord.edit_graph_messages
+        except RuntimeError:
+            # No configuration loaded
+            edit_graph_messages = False
 
-            logger.info(
-                f"Message cleanup completed: {deleted_count} messages deleted, {error_count} errors"
+        try:
+            _ = await cleanup_bot_messages(
+                channel,
+                self.user.id if self.user else None,
+                PostedMessageStore(),
+                keep_graph_messages=edit_graph_messages,
             )
-
-            if error_count > 0:
-                logger.warning(f"Encountered {error_count} errors during cleanup")
-
         except Exception as e:
             logger.error(
                 f"Error during message cleanup in {channel.name}: {e}", exc_info=True
@@ -498,7 +517,10 @@ class TGraphBot(commands.Bot):
         self, channel: "discord.TextChannel", graph_files: list[str]
     ) -> int:
         """
-        Post generated graph files to a Discord channel as individual messages with specific embeds.
+        Post generated graph files to a Discord channel with graph-specific embeds.
+
+        Graphs are packed into as few messages as Discord allows (see
+        GraphPoster).
 
         Args:
             channel: Discord text channel to post to
@@ -507,73 +529,32 @@ class TGraphBot(commands.Bot):
         Returns:
             Number of successfully posted graphs
         """
-        from pathlib import Path
-        from .utils.discord.discord_file_utils import (
-            validate_file_for_discord,
-            create_discord_file_safe,
-            create_graph_specific_embed,
-        )
-
-        success_count = 0
+        from .bot.scheduling.persistence import PostedMessageStore
+        from .utils.discord.graph_posting import GraphPoster
+        from .utils.discord.message_cleanup import track_posted_graphs
 
-        # Get config values and actual next update time from scheduler
         try:
             config = self.config_manager.get_current_config()
-            update_days = config.automation.scheduling.update_days
-            fixed_update_time = config.automation.scheduling.fixed_update_time
-            timestamp_format = config.services.discord.timestamp_format
         except Exception:
-            # If we can't get config, just use None values
-            update_days = None
-            fixed_update_time = None
-            timestamp_format = "F"
+            # Without a config the graphs are posted without scheduling info
+            config = None
 
         # Get the actual scheduled next update time from the update tracker
         next_update_time = self.update_tracker.get_next_update_time()
 
-        for graph_file in graph_files:
-            try:
-                file_path = Path(graph_file)
-                if not file_path.exists():
-                    logger.warning(f"Graph file not found: {graph_file}")
-                    continue
-
-                # Validate the file first
-                validation = validate_file_for_discord(
-                    graph_file, use_nitro_limits=False
-                )
-                if not validation.valid:
-                    logger.error(
-                        f"File validation failed for {graph_file}: {validation.error_message}"
-                    )
-                    continue
-
-                # Create Discord file object
-                discord_file = create_discord_file_safe(graph_file)
-                if not discord_file:
-                    logger.error(
-                        f"Failed to create Discord file object for {graph_file}"
-                    )
-                    continue
-
-                # Create graph-specific embed with actual scheduled next update time
-                embed = create_graph_specific_embed(
-                    graph_file,
-                    update_days,
-                    fixed_update_time,
-                    next_update_time,
-                    timestamp_format,
-                )
-
-                # Post individual message with graph and its specific embed
-                _ = await channel.send(file=discord_file, embed=embed)
-                success_count += 1
-                logger.debug(f"Posted graph with embed: {file_path.name}")
-
-            except Exception as e:
-                logger.error(f"Failed to post graph {graph_file}: {e}")
+        store = PostedMessageStore()
+        edit_in_place = (
+            config is not None and config.services.discord.edit_graph_messages
+        )
+        poster = GraphPoster.from_config(channel, config, next_update_time)
+        report = await poster.post(
+            graph_files,
+            store.get_graph_messages(channel.id) if edit_in_place else None,
+        )
 
-        return success_count
+        # Track the messages so the next update can delete or edit them by ID
+        await track_posted_graphs(channel, report, store, edited_in_place=edit_in_place)
+        return report.posted_count
 
     def create_background_task(
         self, coro: Coroutine[object, object, None], name: str | None = None
@@ -721,6 +702,31 @@ class TGraphBot(commands.Bot):
             # Clean up background tasks
             await self.cleanup_background_tasks()
 
+            # Close the Tautulli connection pool
+            if self.tautulli_client is not None:
+                try:
+                    await self.tautulli_client.close()
+                except Exception as e:
+                    logger.error(f"Error closing Tautulli HTTP client: {e}")
+
+            # Stop the graph render worker processes
+            try:
+                from .graphs.graph_modules.core.render_pool import (
+                    shutdown_render_pool,
+                )
+
+                await asyncio.to_thread(shutdown_render_pool)
+            except Exception as e:
+                logger.error(f"Error shutting down graph render pool: {e}")
+
+            # Finish writing graphs rendered in memory to the graph storage
+            try:
+                from .utils.core.image_store import get_graph_image_store
+
+                await asyncio.to_thread(get_graph_image_store().shutdown)
+            except Exception as e:
+                logger.error(f"Error archiving graphs rendered in memory: {e}")
+
             # Close the bot connection
             await super().close()
 
@@ -83,6 +83,42 @@ class PathConfig:
         """
         return self._data_folder / "scheduler_state.json"
 
+    def get_posted_messages_path(self) -> Path:
+        """
+        Get the path for the file tracking the graph messages posted by the bot.
+
+        Returns:
+            Path to the posted messages file
+        """
+        return self._data_folder / "posted_messages.json"
+
+    def get_history_cache_path(self) -> Path:
+        """
+        Get the path for the persistent play history cache database.
+
+        Returns:
+            Path to the play history cache database file
+        """
+        return self._data_folder / "cache" / "play_history.sqlite3"
+
+    def get_metadata_cache_path(self) -> Path:
+        """
+        Get the path for the persistent media resolution cache database.
+
+        Returns:
+            Path to the media resolution cache database file
+        """
+        return self._data_folder / "cache" / "resolution_metadata.sqlite3"
+
+    def get_render_cache_path(self) -> Path:
+        """
+        Get the path for the rendered graph cache database.
+
+        Returns:
+            Path to the rendered graph cache database file
+        """
+        return self._data_folder / "cache" / "render_cache.sqlite3"
+
 
 # Global instance for easy access
 _path_config = PathConfig()
@@ -0,0 +1,258 @@
+"""
+In-memory graph images for TGraph Bot.
+
+Graphs are normally written to the dated graph storage, read back for the
+Discord upload and, for personal statistics, renamed into the user's
+folder. When in-memory rendering is enabled, graphs keep their usual path
+as an identifier but their encoded image is held in this store, so uploads
+are built straight from memory. Writing the images to disk becomes an
+optional background step: a single archive thread writes, renames and
+deletes files in the order they were requested, so a rename or delete
+always happens after the write it refers to.
+
+The store is bounded by size; the least recently added images are dropped
+first, after which they are only available from the archive.
+"""
+
+import io
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Bytes of images kept in memory
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class GraphImageStore:
+    """Thread-safe in-memory images keyed by their graph file path."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            max_bytes: Bytes of images kept in memory
+        """
+        self.max_bytes: int = max_bytes
+        self._images: OrderedDict[str, bytes] = OrderedDict()
+        self._size: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._archiver: ThreadPoolExecutor | None = None
+        self._pending: set[Future[None]] = set()
+
+    def put(self, path: str | Path, data: bytes, archive: bool = True) -> None:
+        """
+        Keep an image in memory and optionally write it to disk.
+
+        Args:
+            path: Graph file path identifying the image
+            data: Encoded image
+            archive: Whether to write the image to its path in the background
+        """
+        key = str(path)
+        with self._lock:
+            self._remove(key)
+            self._images[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes and len(self._images) > 1:
+                _, evicted = self._images.popitem(last=False)
+                self._size -= len(evicted)
+
+        if archive:
+            self._submit(_write_file, Path(key), data)
+
+    def get(self, path: str | Path) -> bytes | None:
+        """
+        Get an image held in memory.
+
+        Args:
+            path: Graph file path identifying the image
+
+        Returns:
+            The encoded image, or None if it is not in memory
+        """
+        with self._lock:
+            return self._images.get(str(path))
+
+    def take(self, path: str | Path) -> bytes | None:
+        """
+        Remove an image from memory, keeping its archived file.
+
+        Args:
+            path: Graph file path identifying the image
+
+        Returns:
+            The encoded image, or None if it was not in memory
+        """
+        with self._lock:
+            data = self._images.get(str(path))
+            self._remove(str(path))
+            return data
+
+    def exists(self, path: str | Path) -> bool:
+        """
+        Check whether an image is available from memory or disk.
+
+        Args:
+            path: Graph file path identifying the image
+
+        Returns:
+            True if the image is in memory or the file exists
+        """
+        return self.get(path) is not None or Path(path).exists()
+
+    def size(self, path: str | Path) -> int:
+        """
+        Get the size of an image in memory or on disk.
+
+        Args:
+            path: Graph file path identifying the image
+
+        Returns:
+            Size of the image in bytes
+
+        Raises:
+            OSError: If the image is neither in memory nor on disk
+        """
+        data = self.get(path)
+        return len(data) if data is not None else Path(path).stat().st_size
+
+    def open(self, path: str | Path) -> io.BufferedIOBase:
+        """
+        Open an image for reading from memory or disk.
+
+        Args:
+            path: Graph file path identifying the image
+
+        Returns:
+            Readable binary stream; the caller closes it
+
+        Raises:
+            OSError: If the image is neither in memory nor on disk
+        """
+        data = self.get(path)
+        return io.BytesIO(data) if data is not None else Path(path).open("rb")
+
+    def move(self, source: str | Path, destination: str | Path) -> None:
+        """
+        Move an image to a new path in memory and on disk.
+
+        Images in memory are renamed immediately and their archived file is
+        renamed in the background; other images are renamed on disk directly.
+
+        Args:
+            source: Current graph file path
+            destination: New graph file path
+
+        Raises:
+            OSError: If an image that is not in memory cannot be renamed
+        """
+        with self._lock:
+            data = self._images.pop(str(source), None)
+            if data is not None:
+                self._images[str(destination)] = data
+
+        if data is None:
+            _ = Path(source).rename(destination)
+        else:
+            self._submit(_rename_file, Path(source), Path(destination))
+
+    def delete(self, path: str | Path) -> None:
+        """
+        Drop an image from memory and delete its archived file.
+
+        Args:
+            path: Graph file path identifying the image
+        """
+        with self._lock:
+            self._remove(str(path))
+        self._submit(_delete_file, Path(path))
+
+    def flush(self, timeout: float | None = None) -> None:
+        """
+        Wait until pending archive operations are done.
+
+        Args:
+            timeout: Seconds to wait at most (None waits until done)
+        """
+        with self._lock:
+            pending = list(self._pending)
+        _ = wait(pending, timeout=timeout)
+
+    def clear(self) -> None:
+        """Drop all images from memory; archived files are kept."""
+        with self._lock:
+            self._images.clear()
+            self._size = 0
+
+    def shutdown(self) -> None:
+        """Finish pending archive operations and stop the archive thread."""
+        with self._lock:
+            archiver = self._archiver
+            self._archiver = None
+        if archiver is not None:
+            archiver.shutdown(wait=True)
+
+    def _remove(self, key: str) -> None:
+        """Drop an image from memory (the lock must be held)."""
+        data = self._images.pop(key, None)
+        if data is not None:
+            self._size -= len(data)
+
+    def _submit(self, function: Callable[..., None], *args: Path | bytes) -> None:
+        """Queue an archive operation on the archive thread."""
+        with self._lock:
+            if self._archiver is None:
+                self._archiver = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="graph-archive"
+                )
+            future = self._archiver.submit(function, *args)
+            self._pending.add(future)
+        future.add_done_callback(self._archived)
+
+    def _archived(self, future: Future[None]) -> None:
+        """Forget a finished archive operation and log its failure."""
+        with self._lock:
+            self._pending.discard(future)
+        error = future.exception()
+        if error is not None:
+            logger.warning(f"Failed to archive graph image: {error}")
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write an image to disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_bytes(data)
+
+
+def _rename_file(source: Path, destination: Path) -> None:
+    """Rename an archived image if it was written."""
+    if source.is_file():
+        _ = source.rename(destination)
+
+
+def _delete_file(path: Path) -> None:
+    """Delete an archived image if it exists."""
+    path.unlink(missing_ok=True)
+
+
+_graph_image_store: GraphImageStore | None = None
+
+
+def get_graph_image_store() -> GraphImageStore:
+    """
+    Get the shared graph image store, creating it on first use.
+
+    Returns:
+        The shared GraphImageStore
+    """
+    global _graph_image_store
+
+    if _graph_image_store is None:
+        _graph_image_store = GraphImageStore()
+    return _graph_image_store
@@ -12,6 +12,7 @@ from typing import NamedTuple, Literal
 
 import discord
 
+from ..core.image_store import get_graph_image_store
 from ..time import format_for_discord, TimestampCalculator
 
 logger = logging.getLogger(__name__)
@@ -245,6 +246,8 @@ def validate_file_for_discord(
     """
     Validate a file for Discord upload compatibility.
 
+    Graphs rendered in memory are validated without accessing the disk.
+
     Args:
         file_path: Path to the file to validate
         use_nitro_limits: Whether to use Nitro file size limits (25MB vs 8MB)
@@ -257,9 +260,11 @@ def validate_file_for_discord(
 
     try:
         path = Path(file_path)
+        image_store = get_graph_image_store()
+        in_memory = image_store.get(path) is not None
 
         # Check if file exists
-        if not path.exists():
+        if not in_memory and not path.exists():
             return FileValidationResult(
                 valid=False,
                 error_message=translate(
@@ -268,7 +273,7 @@ def validate_file_for_discord(
             )
 
         # Check if it's actually a file
-        if not path.is_file():
+        if not in_memory and not path.is_file():
             return FileValidationResult(
                 valid=False,
                 error_message=translate(
@@ -277,7 +282,7 @@ def validate_file_for_discord(
             )
 
         # Get file size
-        file_size = path.stat().st_size
+        file_size = image_store.size(path)
 
         # Check if file is empty
         if file_size == 0:
@@ -341,6 +346,8 @@ def create_discord_file_safe(
     """
     Safely create a Discord File object with validation.
 
+    Graphs rendered in memory are uploaded from memory instead of the disk.
+
     Args:
         file_path: Path to the file
         filename: Optional custom filename for Discord
@@ -363,7 +370,7 @@ def create_discord_file_safe(
         display_filename = filename or path.name
 
         # Create Discord file object
-        with path.open("rb") as f:
+        with get_graph_image_store().open(path) as f:
             discord_file = discord.File(f, filename=display_filename)
 
         logger.debug(
@@ -376,6 +383,21 @@ def create_discord_file_safe(
         return None
 
 
+def close_discord_files(files: list[discord.File]) -> None:
+    """
+    Close Discord file objects and the streams they read from.
+
+    discord.py only closes streams it opened itself, so the image streams
+    passed in by create_discord_file_safe() stay open until closed here.
+
+    Args:
+        files: Discord file objects, sent or not
+    """
+    for discord_file in files:
+        discord_file.close()
+        discord_file.fp.close()
+
+
 async def upload_files_to_channel(
     channel: discord.TextChannel,
     file_paths: list[str],
@@ -538,23 +560,7 @@ async def upload_files_to_user_dm(
             )
 
         # Upload files to user DM
-        try:
-            if embed:
-                message = await user.send(embed=embed, files=discord_files)
-            else:
-                message = await user.send(files=discord_files)
-
-            logger.info(
-                f"Successfully uploaded {len(discord_files)} files to user {user.id} DM"
-            )
-            return DiscordUploadResult(
-                success=True, message_id=message.id, files_uploaded=len(discord_files)
-            )
-
-        except discord.HTTPException as e:
-            error_msg = f"Discord DM upload failed: {e}"
-            logger.error(error_msg)
-            return DiscordUploadResult(success=False, error_message=error_msg)
+        return await upload_discord_files_to_user_dm(user, discord_files, embed)
 
     except Exception as e:
         error_msg = f"Unexpected error during DM upload: {e}"
@@ -562,6 +568,44 @@ async def upload_files_to_user_dm(
         return DiscordUploadResult(success=False, error_message=error_msg)
 
 
+async def upload_discord_files_to_user_dm(
+    user: discord.User | discord.Member,
+    discord_files: list[discord.File],
+    embed: discord.Embed | None = None,
+) -> DiscordUploadResult:
+    """
+    Upload Discord file objects to a user's DM and close them.
+
+    Args:
+        user: Discord user to send DM to
+        discord_files: Discord file objects to upload
+        embed: Optional embed to send with files
+
+    Returns:
+        DiscordUploadResult with upload status and details
+    """
+    try:
+        if embed:
+            message = await user.send(embed=embed, files=discord_files)
+        else:
+            message = await user.send(files=discord_files)
+
+        logger.info(
+            f"Successfully uploaded {len(discord_files)} files to user {user.id} DM"
+        )
+        return DiscordUploadResult(
+            success=True, message_id=message.id, files_uploaded=len(discord_files)
+        )
+
+    except discord.HTTPException as e:
+        error_msg = f"Discord DM upload failed: {e}"
+        logger.error(error_msg)
+        return DiscordUploadResult(success=False, error_message=error_msg)
+
+    finally:
+        close_discord_files(discord_files)
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
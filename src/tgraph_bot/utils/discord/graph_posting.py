@@ -0,0 +1,452 @@
+"""
+Graph posting for TGraph Bot.
+
+This module posts generated graphs to a Discord channel for the scheduled
+updates, the startup sequence and the /update_graphs command. Instead of one
+message per graph, graphs are packed into as few messages as Discord allows:
+up to 10 attachments, each shown in its own graph-specific embed, within the
+upload size and embed text limits of a single message. Messages are sent
+concurrently, bounded so they stay within the channel's rate limit, and the
+result of each graph file is reported.
+
+Graphs can also replace the graphs of earlier messages in place: given the
+message each graph type was last posted in, the message is edited with the
+new attachments and embeds, and only graphs without a previous message are
+posted as new messages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from collections.abc import Coroutine, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import discord
+
+from .discord_file_utils import (
+    DISCORD_FILE_SIZE_LIMIT_REGULAR,
+    TimestampStyle,
+    close_discord_files,
+    create_discord_file_safe,
+    create_graph_specific_embed,
+    validate_file_for_discord,
+)
+
+if TYPE_CHECKING:
+    from ...config.schema import TGraphBotConfig
+
+logger = logging.getLogger(__name__)
+
+# Discord's limits for a single message
+MAX_ATTACHMENTS_PER_MESSAGE: Final[int] = 10
+MAX_EMBED_CHARACTERS_PER_MESSAGE: Final[int] = 6000
+
+# Messages sent at the same time; Discord allows 5 messages per 5 seconds
+# in a channel before rate limiting
+DEFAULT_MAX_CONCURRENT_MESSAGES: Final[int] = 3
+
+# Timestamp suffix of generated graph file names (see generate_graph_filename)
+_GRAPH_FILE_TIMESTAMP: Final[re.Pattern[str]] = re.compile(r"_\d{8}_\d{6}$")
+
+
+def graph_key(graph_file: str) -> str:
+    """
+    Get the graph type of a graph file, which stays the same across updates.
+
+    Args:
+        graph_file: Path of a generated graph image
+
+    Returns:
+        File name without extension and generation timestamp
+    """
+    return _GRAPH_FILE_TIMESTAMP.sub("", Path(graph_file).stem)
+
+
+@dataclass(frozen=True)
+class GraphPostOutcome:
+    """Result of posting a single graph file."""
+
+    graph_file: str
+    posted: bool
+    message_id: int | None = None
+    error: Exception | None = None
+    # Whether the graph replaced an earlier graph in an existing message
+    edited: bool = False
+
+
+@dataclass(frozen=True)
+class GraphPostReport:
+    """Results of posting a set of graph files, in the order they were given."""
+
+    outcomes: tuple[GraphPostOutcome, ...]
+
+    @property
+    def posted_count(self) -> int:
+        """Number of graphs that were posted."""
+        return sum(outcome.posted for outcome in self.outcomes)
+
+    @property
+    def failures(self) -> list[GraphPostOutcome]:
+        """Outcomes of the graphs that could not be posted."""
+        return [outcome for outcome in self.outcomes if not outcome.posted]
+
+    @property
+    def message_ids(self) -> list[int]:
+        """IDs of the messages the graphs were posted in, without duplicates."""
+        return list(
+            dict.fromkeys(
+                outcome.message_id
+                for outcome in self.outcomes
+                if outcome.message_id is not None
+            )
+        )
+
+    @property
+    def graph_messages(self) -> dict[str, int]:
+        """Message ID of each posted graph, keyed by graph type."""
+        return {
+            graph_key(outcome.graph_file): outcome.message_id
+            for outcome in self.outcomes
+            if outcome.message_id is not None
+        }
+
+
+@dataclass(frozen=True)
+class _PreparedGraph:
+    """Graph file that passed validation, with its embed."""
+
+    index: int
+    graph_file: str
+    size: int
+    embed: discord.Embed
+
+
+class GraphPoster:
+    """Posts graph files to a channel in batched, concurrently sent messages."""
+
+    def __init__(
+        self,
+        channel: discord.abc.Messageable,
+        update_days: int | None = None,
+        fixed_update_time: str | None = None,
+        next_update_time: datetime | None = None,
+        timestamp_format: TimestampStyle = "F",
+        max_concurrent_messages: int = DEFAULT_MAX_CONCURRENT_MESSAGES,
+        max_attachments_per_message: int = MAX_ATTACHMENTS_PER_MESSAGE,
+        max_message_bytes: int = DISCORD_FILE_SIZE_LIMIT_REGULAR,
+    ) -> None:
+        """
+        Initialize the poster.
+
+        Args:
+            channel: Channel to post the graphs to
+            update_days: Number of days between updates (for the next update time)
+            fixed_update_time: Fixed time for updates or "XX:XX" for interval-based
+            next_update_time: Actual scheduled next update time (overrides calculation)
+            timestamp_format: Discord timestamp format of the next update time
+            max_concurrent_messages: Messages sent at the same time
+            max_attachments_per_message: Graphs packed into one message at most
+            max_message_bytes: Total size of the graphs of one message at most
+        """
+        self.channel: discord.abc.Messageable = channel
+        self.update_days: int | None = update_days
+        self.fixed_update_time: str | None = fixed_update_time
+        self.next_update_time: datetime | None = next_update_time
+        self.timestamp_format: TimestampStyle = timestamp_format
+        self.max_concurrent_messages: int = max(1, max_concurrent_messages)
+        self.max_attachments_per_message: int = min(
+            max(1, max_attachments_per_message), MAX_ATTACHMENTS_PER_MESSAGE
+        )
+        self.max_message_bytes: int = max_message_bytes
+
+    @classmethod
+    def from_config(
+        cls,
+        channel: discord.abc.Messageable,
+        config: TGraphBotConfig | None,
+        next_update_time: datetime | None = None,
+    ) -> GraphPoster:
+        """
+        Create a poster using the scheduling and timestamp settings of a config.
+
+        Args:
+            channel: Channel to post the graphs to
+            config: Bot configuration, or None to post without scheduling info
+            next_update_time: Actual scheduled next update time
+
+        Returns:
+            GraphPoster for the channel
+        """
+        if config is None:
+            return cls(channel, next_update_time=next_update_time)
+
+        return cls(
+            channel,
+            update_days=config.automation.scheduling.update_days,
+            fixed_update_time=config.automation.scheduling.fixed_update_time,
+            next_update_time=next_update_time,
+            timestamp_format=config.services.discord.timestamp_format,
+        )
+
+    async def post(
+        self,
+        graph_files: Sequence[str],
+        previous_messages: Mapping[str, int] | None = None,
+    ) -> GraphPostReport:
+        """
+        Post graph files, packing them into as few messages as possible.
+
+        Graphs that fail validation are reported without being sent. If a
+        message with several graphs is rejected for another reason than
+        missing permissions, its graphs are sent one by one so a single bad
+        file does not fail the others. Messages are sent concurrently, so
+        with more than one message their order in the channel may vary.
+
+        With previous messages, the graphs of each previous message are
+        edited into it instead, replacing its attachments and embeds. Graphs
+        without a previous message, or whose message no longer exists or
+        cannot be edited, are posted as new messages.
+
+        Args:
+            graph_files: Paths of the graph images to post
+            previous_messages: Message ID each graph type was last posted
+                in (see GraphPostReport.graph_messages)
+
+        Returns:
+            Outcome of every graph file, in the given order
+        """
+        outcomes: dict[int, GraphPostOutcome] = {}
+        prepared: list[_PreparedGraph] = []
+        for index, graph_file in enumerate(graph_files):
+            result = self._prepare(index, graph_file)
+            if isinstance(result, GraphPostOutcome):
+                outcomes[index] = result
+            else:
+                prepared.append(result)
+
+        edits: dict[int, list[_PreparedGraph]] = {}
+        new_graphs: list[_PreparedGraph] = []
+        for graph in prepared:
+            message_id = (previous_messages or {}).get(graph_key(graph.graph_file))
+            if message_id is None:
+                new_graphs.append(graph)
+            else:
+                edits.setdefault(message_id, []).append(graph)
+
+        requests: list[Coroutine[object, object, dict[int, GraphPostOutcome]]] = []
+        for message_id, graphs in edits.items():
+            # Graphs that grew past the message limits move to new messages
+            first, *overflow = self._pack(graphs)
+            requests.append(self._edit_message(message_id, first))
+            new_graphs.extend(graph for graphs in overflow for graph in graphs)
+        new_graphs.sort(key=lambda graph: graph.index)
+        requests.extend(self._send_message(graphs) for graphs in self._pack(new_graphs))
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_messages)
+
+        async def send(
+            request: Coroutine[object, object, dict[int, GraphPostOutcome]],
+        ) -> dict[int, GraphPostOutcome]:
+            async with semaphore:
+                return await request
+
+        for message_outcomes in await asyncio.gather(
+            *(send(request) for request in requests)
+        ):
+            outcomes.update(message_outcomes)
+
+        report = GraphPostReport(
+            outcomes=tuple(outcomes[index] for index in range(len(graph_files)))
+        )
+        edited = sum(outcome.edited for outcome in report.outcomes)
+        logger.info(
+            f"Posted {report.posted_count}/{len(graph_files)} graphs "
+            + f"in {len(report.message_ids)} messages ({edited} edited in place)"
+        )
+        return report
+
+    def _prepare(
+        self, index: int, graph_file: str
+    ) -> _PreparedGraph | GraphPostOutcome:
+        """Validate a graph file and create its embed."""
+        validation = validate_file_for_discord(graph_file, use_nitro_limits=False)
+        if not validation.valid:
+            logger.error(
+                f"File validation failed for {graph_file}: {validation.error_message}"
+            )
+            return GraphPostOutcome(
+                graph_file,
+                posted=False,
+                error=ValueError(validation.error_message or "Invalid graph file"),
+            )
+
+        embed = create_graph_specific_embed(
+            graph_file,
+            self.update_days,
+            self.fixed_update_time,
+            self.next_update_time,
+            self.timestamp_format,
+        )
+        size = validation.file_size if isinstance(validation.file_size, int) else 0
+        return _PreparedGraph(index, graph_file, size, embed)
+
+    def _pack(self, graphs: list[_PreparedGraph]) -> list[list[_PreparedGraph]]:
+        """Pack graphs into messages in order, within Discord's per-message limits."""
+        messages: list[list[_PreparedGraph]] = []
+        current: list[_PreparedGraph] = []
+        size = 0
+        characters = 0
+        for graph in graphs:
+            graph_characters = len(graph.embed)
+            if current and (
+                len(current) >= self.max_attachments_per_message
+                or size + graph.size > self.max_message_bytes
+                or characters + graph_characters > MAX_EMBED_CHARACTERS_PER_MESSAGE
+            ):
+                messages.append(current)
+                current, size, characters = [], 0, 0
+            current.append(graph)
+            size += graph.size
+            characters += graph_characters
+        if current:
+            messages.append(current)
+        return messages
+
+    async def _send_message(
+        self, graphs: list[_PreparedGraph]
+    ) -> dict[int, GraphPostOutcome]:
+        """
+        Send one message with the given graphs, splitting it up if rejected.
+
+        Returns:
+            Outcome of each graph, keyed by its position in the posted files
+        """
+        files = _create_files(graphs)
+        if isinstance(files, _PreparedGraph):
+            unreadable = files
+            logger.error(
+                f"Failed to create Discord file object for {unreadable.graph_file}"
+            )
+            outcomes = await self._send_separately(
+                [other for other in graphs if other is not unreadable]
+            )
+            outcomes[unreadable.index] = GraphPostOutcome(
+                unreadable.graph_file,
+                posted=False,
+                error=OSError(f"Cannot read graph file {unreadable.graph_file}"),
+            )
+            return outcomes
+
+        try:
+            message = await self.channel.send(
+                files=files, embeds=[graph.embed for graph in graphs]
+            )
+        except discord.HTTPException as e:
+            if len(graphs) > 1 and not isinstance(e, discord.Forbidden):
+                logger.warning(
+                    f"Failed to post {len(graphs)} graphs in one message ({e}); "
+                    + "posting them separately"
+                )
+                return await self._send_separately(graphs)
+            logger.error(f"Failed to post graphs: {e}")
+            return _failed(graphs, e)
+        except Exception as e:
+            logger.exception("Unexpected error while posting graphs")
+            return _failed(graphs, e)
+        finally:
+            close_discord_files(files)
+
+        for graph in graphs:
+            logger.debug(f"Posted graph with embed: {Path(graph.graph_file).name}")
+        return {
+            graph.index: GraphPostOutcome(
+                graph.graph_file, posted=True, message_id=message.id
+            )
+            for graph in graphs
+        }
+
+    async def _edit_message(
+        self, message_id: int, graphs: list[_PreparedGraph]
+    ) -> dict[int, GraphPostOutcome]:
+        """
+        Replace the attachments and embeds of a previous message with graphs.
+
+        Returns:
+            Outcome of each graph, keyed by its position in the posted files
+        """
+        if not isinstance(self.channel, discord.TextChannel | discord.Thread):
+            return await self._send_message(graphs)
+
+        files = _create_files(graphs)
+        if isinstance(files, _PreparedGraph):
+            # Posting reports the unreadable file and sends the others
+            return await self._send_message(graphs)
+
+        try:
+            message = await self.channel.get_partial_message(message_id).edit(
+                attachments=files, embeds=[graph.embed for graph in graphs]
+            )
+        except discord.Forbidden as e:
+            logger.error(f"Failed to edit graph message {message_id}: {e}")
+            return _failed(graphs, e)
+        except discord.HTTPException as e:
+            # Deleted messages (NotFound) and rejected edits get new messages
+            logger.warning(
+                f"Failed to edit graph message {message_id} ({e}); "
+                + "posting its graphs in a new message"
+            )
+            return await self._send_message(graphs)
+        except Exception as e:
+            logger.exception("Unexpected error while editing graph message")
+            return _failed(graphs, e)
+        finally:
+            close_discord_files(files)
+
+        return {
+            graph.index: GraphPostOutcome(
+                graph.graph_file, posted=True, message_id=message.id, edited=True
+            )
+            for graph in graphs
+        }
+
+    async def _send_separately(
+        self, graphs: list[_PreparedGraph]
+    ) -> dict[int, GraphPostOutcome]:
+        """Send each graph in a message of its own."""
+        outcomes: dict[int, GraphPostOutcome] = {}
+        for graph in graphs:
+            outcomes.update(await self._send_message([graph]))
+        return outcomes
+
+
+def _create_files(graphs: list[_PreparedGraph]) -> list[discord.File] | _PreparedGraph:
+    """
+    Create the Discord files to upload graphs with.
+
+    Returns:
+        One file per graph, or the first graph whose image cannot be read;
+        the files created before it are closed
+    """
+    files: list[discord.File] = []
+    for graph in graphs:
+        discord_file = create_discord_file_safe(graph.graph_file)
+        if discord_file is None:
+            close_discord_files(files)
+            return graph
+        files.append(discord_file)
+    return files
+
+
+def _failed(
+    graphs: list[_PreparedGraph], error: Exception
+) -> dict[int, GraphPostOutcome]:
+    """Report graphs as failed with the same error."""
+    return {
+        graph.index: GraphPostOutcome(graph.graph_file, posted=False, error=error)
+        for graph in graphs
+    }
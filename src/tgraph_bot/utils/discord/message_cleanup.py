@@ -0,0 +1,237 @@
+"""
+Message cleanup for TGraph Bot.
+
+Before new graphs are posted, the bot deletes the graph messages it posted
+before. The IDs of those messages are tracked in a PostedMessageStore, so
+cleanup deletes exactly those messages: messages younger than 14 days are
+deleted with Discord's bulk delete (up to 100 per request), and only older
+messages are deleted one at a time. Channels the bot posted in before their
+messages were tracked fall back to scanning the channel history once.
+
+When graphs are edited in place, cleanup keeps the graph messages; after
+posting, only tracked messages that no longer hold a graph are deleted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import TYPE_CHECKING, Final
+
+import discord
+
+if TYPE_CHECKING:
+    from ...bot.scheduling.persistence import PostedMessageStore
+    from .graph_posting import GraphPostReport
+
+logger = logging.getLogger(__name__)
+
+# Discord only bulk deletes messages younger than 14 days, at most 100 at once
+BULK_DELETE_MAX_AGE: Final[timedelta] = timedelta(days=14)
+BULK_DELETE_MAX_MESSAGES: Final[int] = 100
+
+# Keeps messages close to the age limit out of bulk deletes, so they do not
+# pass it while the cleanup runs
+BULK_DELETE_AGE_MARGIN: Final[timedelta] = timedelta(minutes=10)
+
+
+@dataclass
+class CleanupReport:
+    """Result of a message cleanup."""
+
+    deleted: int = 0
+    errors: int = 0
+    # Messages that could not be deleted and should be retried next time
+    remaining_ids: list[int] = field(default_factory=list)
+
+
+async def cleanup_bot_messages(
+    channel: discord.TextChannel,
+    bot_user_id: int | None,
+    store: PostedMessageStore,
+    keep_graph_messages: bool = False,
+) -> CleanupReport:
+    """
+    Delete the graph messages the bot previously posted in a channel.
+
+    Tracked messages are deleted by ID. If the channel is not tracked yet,
+    the channel history is scanned for the bot's messages instead. Either
+    way the channel is tracked afterwards, with the messages that could not
+    be deleted left to retry.
+
+    Args:
+        channel: The Discord text channel to clean up
+        bot_user_id: ID of the bot user, used when scanning the history
+        store: Store with the IDs of the bot's posted messages
+        keep_graph_messages: Keep the messages if their graphs are going to
+            be edited in place (see track_posted_graphs)
+
+    Returns:
+        Result of the cleanup
+    """
+    if keep_graph_messages and store.get_graph_messages(channel.id):
+        logger.info(f"Keeping graph messages in {channel.name} to edit them in place")
+        return CleanupReport()
+
+    can_bulk_delete = channel.permissions_for(channel.guild.me).manage_messages
+    if not can_bulk_delete:
+        logger.warning(f"Bot lacks 'Manage Messages' permission in {channel.name}")
+        logger.info("Attempting to delete only bot's own messages...")
+
+    message_ids = store.get_message_ids(channel.id)
+    if message_ids is None:
+        logger.info(f"No tracked messages for {channel.name}, scanning channel history")
+        report = await delete_bot_messages_from_history(channel, bot_user_id)
+    else:
+        report = await delete_messages_by_id(
+            channel, message_ids, can_bulk_delete=can_bulk_delete
+        )
+
+    store.set_message_ids(channel.id, report.remaining_ids)
+    logger.info(
+        f"Message cleanup completed: {report.deleted} messages deleted, "
+        + f"{report.errors} errors"
+    )
+    if report.errors > 0:
+        logger.warning(f"Encountered {report.errors} errors during cleanup")
+    return report
+
+
+async def track_posted_graphs(
+    channel: discord.TextChannel,
+    report: GraphPostReport,
+    store: PostedMessageStore,
+    edited_in_place: bool = False,
+) -> None:
+    """
+    Track the messages graphs were posted in, for the next cleanup or edit.
+
+    After graphs were edited in place, tracked messages that no longer hold
+    any graph (e.g. of a graph type that was disabled) are deleted.
+
+    Args:
+        channel: Channel the graphs were posted in
+        report: Result of posting the graphs
+        store: Store with the IDs of the bot's posted messages
+        edited_in_place: Whether the graphs were posted with their previous
+            messages to edit
+    """
+    if edited_in_place:
+        posted = set(report.message_ids)
+        stale_ids = [
+            message_id
+            for message_id in store.get_message_ids(channel.id) or []
+            if message_id not in posted
+        ]
+        remaining_ids: list[int] = []
+        if stale_ids:
+            can_bulk_delete = channel.permissions_for(channel.guild.me).manage_messages
+            cleanup = await delete_messages_by_id(
+                channel, stale_ids, can_bulk_delete=can_bulk_delete
+            )
+            logger.info(f"Deleted {cleanup.deleted} messages without graphs")
+            remaining_ids = cleanup.remaining_ids
+        store.set_message_ids(channel.id, [*report.message_ids, *remaining_ids])
+    else:
+        store.add_message_ids(channel.id, report.message_ids)
+    store.set_graph_messages(channel.id, report.graph_messages)
+
+
+async def delete_messages_by_id(
+    channel: discord.TextChannel,
+    message_ids: Sequence[int],
+    *,
+    can_bulk_delete: bool,
+) -> CleanupReport:
+    """
+    Delete messages by ID, bulk deleting those young enough.
+
+    Args:
+        channel: Channel the messages were posted in
+        message_ids: IDs of the messages to delete
+        can_bulk_delete: Whether the bot may bulk delete (Manage Messages)
+
+    Returns:
+        Result of the deletion
+    """
+    report = CleanupReport()
+    oldest_bulk = discord.utils.utcnow() - BULK_DELETE_MAX_AGE + BULK_DELETE_AGE_MARGIN
+    bulk_ids: list[int] = []
+    single_ids: list[int] = []
+    for message_id in message_ids:
+        young = discord.utils.snowflake_time(message_id) > oldest_bulk
+        (bulk_ids if can_bulk_delete and young else single_ids).append(message_id)
+
+    for start in range(0, len(bulk_ids), BULK_DELETE_MAX_MESSAGES):
+        batch = bulk_ids[start : start + BULK_DELETE_MAX_MESSAGES]
+        try:
+            await channel.delete_messages(
+                [discord.Object(id=message_id) for message_id in batch]
+            )
+            report.deleted += len(batch)
+        except discord.HTTPException as e:
+            logger.warning(
+                f"Bulk delete of {len(batch)} messages failed ({e}); "
+                + "deleting them one by one"
+            )
+            single_ids.extend(batch)
+
+    for message_id in single_ids:
+        _ = await _delete_message(channel.get_partial_message(message_id), report)
+    return report
+
+
+async def delete_bot_messages_from_history(
+    channel: discord.TextChannel, bot_user_id: int | None
+) -> CleanupReport:
+    """
+    Delete the bot's messages found in the whole channel history.
+
+    Args:
+        channel: Channel to scan
+        bot_user_id: ID of the bot user, nothing is deleted if None
+
+    Returns:
+        Result of the deletion
+    """
+    report = CleanupReport()
+    async for message in channel.history(limit=None):
+        # Only delete messages from this bot
+        if bot_user_id is not None and message.author.id == bot_user_id:
+            deleted = await _delete_message(message, report)
+
+            # Rate limit protection - Discord allows 5 deletes per second
+            if deleted and report.deleted % 5 == 0:
+                await asyncio.sleep(1.0)
+    return report
+
+
+async def _delete_message(
+    message: discord.Message | discord.PartialMessage, report: CleanupReport
+) -> bool:
+    """Delete a single message, recording the result in the report."""
+    try:
+        await message.delete()
+        report.deleted += 1
+        return True
+    except discord.Forbidden:
+        logger.warning(f"Cannot delete message {message.id} - insufficient permissions")
+        report.errors += 1
+        report.remaining_ids.append(message.id)
+    except discord.NotFound:
+        # Message already deleted
+        pass
+    except discord.HTTPException as e:
+        logger.error(f"HTTP error deleting message {message.id}: {e}")
+        report.errors += 1
+        report.remaining_ids.append(message.id)
+
+        # If we hit rate limits, wait longer
+        if e.status == 429:
+            retry_after = getattr(e, "retry_after", 5.0)
+            logger.info(f"Rate limited, waiting {retry_after} seconds...")
+            await asyncio.sleep(retry_after)
+    return False
@@ -169,6 +169,42 @@ class TestGraphManagerErrorHandling:
                     with pytest.raises(asyncio.TimeoutError):
                         _ = await graph_manager.generate_all_graphs(timeout_seconds=0.1)
 
+    @pytest.mark.asyncio
+    async def test_resolution_lookup_counts_towards_timeout(self) -> None:
+        """Test that a slow resolution metadata lookup hits the timeout."""
+        config = create_test_config()
+        mock_config_manager = create_config_manager_with_config(config)
+
+        graph_manager = GraphManager(mock_config_manager)
+
+        with (
+            patch.object(graph_manager, "_initialize_components"),
+            patch.object(graph_manager, "_cleanup_components"),
+        ):
+            mock_data_fetcher = AsyncMock()
+            graph_manager._data_fetcher = mock_data_fetcher  # pyright: ignore[reportPrivateUsage]
+            graph_manager._graph_factory = MagicMock()  # pyright: ignore[reportPrivateUsage]
+
+            mock_data_fetcher.get_play_history.return_value = {"data": []}  # pyright: ignore[reportAny]
+            mock_data_fetcher.get_plays_per_month.return_value = {  # pyright: ignore[reportAny]
+                "monthly_data": "test"
+            }
+
+            async def slow_lookup(data: dict[str, object]) -> dict[str, object]:
+                await asyncio.sleep(2.0)
+                return data
+
+            generate = MagicMock(return_value=["test.png"])
+            with (
+                patch.object(graph_manager, "_attach_resolution_history", slow_lookup),
+                patch.object(graph_manager, "_generate_graphs_sync", generate),
+            ):
+                async with graph_manager:
+                    with pytest.raises(asyncio.TimeoutError):
+                        _ = await graph_manager.generate_all_graphs(timeout_seconds=0.1)
+
+            generate.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_fetch_graph_data_with_retry_failure(self) -> None:
         """Test data fetch retry logic with eventual failure."""
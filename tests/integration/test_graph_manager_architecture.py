@@ -11,6 +11,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.tgraph_bot.graphs.graph_manager import GraphManager
+from src.tgraph_bot.graphs.graph_modules.data.history_cache import (
+    get_play_history_cache,
+)
+from src.tgraph_bot.graphs.graph_modules.data.response_cache import get_response_cache
+from src.tgraph_bot.utils.cli.paths import get_path_config
 from src.tgraph_bot.config.schema import TGraphBotConfig
 from tests.utils.test_helpers import (
     create_config_manager_with_config,
@@ -73,6 +78,16 @@ class TestGraphManagerArchitecture:
                         api_key="test_key",
                         timeout=30.0,
                         max_retries=3,
+                        history_cache=get_play_history_cache(
+                            get_path_config().get_history_cache_path()
+                        ),
+                        page_size=1000,
+                        max_concurrent_pages=4,
+                        full_sync_interval_days=7,
+                        response_cache=get_response_cache(),
+                        client=None,
+                        concurrency=None,
+                        compact_history=True,
                     )
 
                     # Verify GraphFactory was created - the factory uses ConfigAccessor internally
@@ -354,7 +354,7 @@ class TestUpdateGraphsCog:
                 type(update_graphs_cog.bot), "user", new_callable=lambda: mock_bot_user
             ),
             patch(
-                "src.tgraph_bot.bot.commands.update_graphs.asyncio.sleep",
+                "src.tgraph_bot.utils.discord.message_cleanup.asyncio.sleep",
                 new_callable=AsyncMock,
             ) as mock_sleep,
         ):
@@ -440,7 +440,7 @@ class TestUpdateGraphsCog:
                 type(update_graphs_cog.bot), "user", new_callable=lambda: mock_bot_user
             ),
             patch(
-                "src.tgraph_bot.bot.commands.update_graphs.asyncio.sleep",
+                "src.tgraph_bot.utils.discord.message_cleanup.asyncio.sleep",
                 new_callable=AsyncMock,
             ) as mock_sleep,
         ):
@@ -40,6 +40,9 @@ def mock_bot() -> MagicMock:
     update_tracker_mock = MagicMock()
     bot.update_tracker = update_tracker_mock
 
+    # No pooled Tautulli client, so graph managers open their own
+    bot.tautulli_client = None
+
     bot._shutdown_event = asyncio.Event()
     bot.get_channel = MagicMock()
     return bot
@@ -231,13 +234,13 @@ class TestStartupSequence:
 
             # Mock file utilities
             with patch(
-                "src.tgraph_bot.bot.startup_sequence.validate_file_for_discord"
+                "src.tgraph_bot.utils.discord.graph_posting.validate_file_for_discord"
             ) as mock_validate:
                 with patch(
-                    "src.tgraph_bot.bot.startup_sequence.create_discord_file_safe"
+                    "src.tgraph_bot.utils.discord.graph_posting.create_discord_file_safe"
                 ) as mock_create_file:
                     with patch(
-                        "src.tgraph_bot.bot.startup_sequence.create_graph_specific_embed"
+                        "src.tgraph_bot.utils.discord.graph_posting.create_graph_specific_embed"
                     ) as mock_create_embed:
                         # Setup file validation
                         mock_validation = MagicMock()
@@ -257,7 +260,9 @@ class TestStartupSequence:
         # Verify
         assert startup_sequence.initial_post_completed is True
         send_mock = cast(AsyncMock, mock_channel.send)
-        assert send_mock.call_count == 2  # Two graphs posted
+        # Both graphs are posted in one message
+        assert send_mock.call_count == 1
+        assert len(send_mock.call_args.kwargs["files"]) == 2  # pyright: ignore[reportAny]
 
     @pytest.mark.asyncio
     async def test_update_scheduler_state(
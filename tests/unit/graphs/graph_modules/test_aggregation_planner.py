@@ -0,0 +1,167 @@
+"""
+Tests for the aggregation planner in TGraph Bot.
+
+This module tests that precomputed aggregates are identical to the ones the
+aggregation functions compute on their own, that they are served from the
+store cache, and that the planner only builds the counters it needs.
+"""
+
+import random
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.data.aggregation_planner import (
+    GRAPH_TYPE_COUNTERS,
+    AggregationPlanner,
+)
+from src.tgraph_bot.graphs.graph_modules.utils import vectorized_aggregation
+from src.tgraph_bot.graphs.graph_modules.utils.record_store import PlayRecordStore
+from src.tgraph_bot.graphs.graph_modules.utils.utils import (
+    ProcessedPlayRecord,
+    ProcessedRecords,
+    aggregate_by_day_of_week,
+    aggregate_by_day_of_week_separated,
+    aggregate_by_hour_of_day,
+    aggregate_by_hour_of_day_separated,
+    aggregate_by_month_separated,
+    aggregate_by_platform_and_stream_type,
+    aggregate_by_user_and_stream_type,
+    aggregate_top_platforms,
+    aggregate_top_platforms_separated,
+    aggregate_top_users,
+    aggregate_top_users_separated,
+    classify_media_type,
+)
+from src.tgraph_bot.graphs.graph_modules.utils.vectorized_aggregation import (
+    COUNTER_DATE,
+    COUNTER_MONTH,
+    count_by_date,
+    count_by_month,
+    precompute_counters,
+)
+
+
+def _make_records(count: int, seed: int) -> ProcessedRecords:
+    """Create random records with a mix of users, platforms and stream types."""
+    rng = random.Random(seed)
+    start = int(datetime(2024, 1, 1).timestamp())
+
+    records: ProcessedRecords = []
+    for _ in range(count):
+        timestamp = start + rng.randrange(0, 90 * 86_400)
+        record: ProcessedPlayRecord = {
+            "date": str(timestamp),
+            "user": rng.choice(["alice", "bob", "carol", "dave"]),
+            "platform": rng.choice(["Roku", "Android", "Plex Web"]),
+            "media_type": rng.choice(["movie", "episode", "track", "live"]),
+            "duration": 1800,
+            "stopped": timestamp + 1800,
+            "paused_counter": 0,
+            "datetime": datetime.fromtimestamp(timestamp),
+        }
+        decision = rng.choice(["direct play", "copy", "transcode", None])
+        if decision is not None:
+            record["transcode_decision"] = decision
+        records.append(record)
+    return records
+
+
+@pytest.fixture
+def records() -> ProcessedRecords:
+    """Create a random play history."""
+    return _make_records(1000, seed=5)
+
+
+class TestAggregationPlanner:
+    """Test cases for AggregationPlanner."""
+
+    def test_required_counters_follow_graph_types(self) -> None:
+        """Test that only counters of known, planned graph types are required."""
+        planner = AggregationPlanner(
+            ["top_10_users", "daily_play_count", "unknown_graph"]
+        )
+
+        assert planner.required_counters == GRAPH_TYPE_COUNTERS["top_10_users"]
+
+    def test_precomputed_aggregates_match(self, records: ProcessedRecords) -> None:
+        """Test that planned aggregates equal independently computed ones."""
+        planned = PlayRecordStore.from_records(records)
+        AggregationPlanner(GRAPH_TYPE_COUNTERS).precompute(planned)
+        unplanned = PlayRecordStore.from_records(records)
+
+        for aggregate in (
+            aggregate_by_day_of_week,
+            aggregate_by_day_of_week_separated,
+            aggregate_by_hour_of_day,
+            aggregate_by_hour_of_day_separated,
+            aggregate_top_users,
+            aggregate_top_users_separated,
+            aggregate_top_platforms,
+            aggregate_top_platforms_separated,
+            aggregate_by_platform_and_stream_type,
+            aggregate_by_user_and_stream_type,
+        ):
+            assert aggregate(planned) == aggregate(unplanned)
+            assert repr(aggregate(planned)) == repr(aggregate(unplanned))
+
+    def test_stream_type_breakdowns_match_records(
+        self, records: ProcessedRecords
+    ) -> None:
+        """Test that the stream type breakdowns match the list-based path."""
+        store = PlayRecordStore.from_records(records)
+        AggregationPlanner(GRAPH_TYPE_COUNTERS).precompute(store)
+
+        assert aggregate_by_user_and_stream_type(
+            store, limit=3
+        ) == aggregate_by_user_and_stream_type(records, limit=3)
+        assert aggregate_by_platform_and_stream_type(
+            store
+        ) == aggregate_by_platform_and_stream_type(records)
+
+    def test_planned_aggregates_are_served_from_cache(
+        self, records: ProcessedRecords
+    ) -> None:
+        """Test that graphs do not recount after the planner has run."""
+        store = PlayRecordStore.from_records(records)
+        AggregationPlanner(GRAPH_TYPE_COUNTERS).precompute(store)
+
+        with patch.object(
+            vectorized_aggregation,
+            "_first_seen_counts",
+            side_effect=AssertionError("aggregate was recomputed"),
+        ):
+            _ = aggregate_top_users_separated(store)
+            _ = aggregate_by_hour_of_day_separated(store)
+            _ = aggregate_by_user_and_stream_type(store)
+
+    def test_cached_results_cannot_be_mutated(self, records: ProcessedRecords) -> None:
+        """Test that callers get copies of the cached aggregates."""
+        store = PlayRecordStore.from_records(records)
+        AggregationPlanner(["play_count_by_hourofday"]).precompute(store)
+
+        first = aggregate_by_hour_of_day(store)
+        first[0] = -1
+
+        assert aggregate_by_hour_of_day(store)[0] != -1
+
+    def test_date_and_month_counters(self, records: ProcessedRecords) -> None:
+        """Test the time counters that are not tied to a planned graph type."""
+        planned = PlayRecordStore.from_records(records)
+        precompute_counters(planned, {COUNTER_DATE, COUNTER_MONTH}, classify_media_type)
+        unplanned = PlayRecordStore.from_records(records)
+
+        assert repr(count_by_date(planned)) == repr(count_by_date(unplanned))
+        assert repr(count_by_month(planned)) == repr(count_by_month(unplanned))
+        assert repr(aggregate_by_month_separated(planned)) == repr(
+            aggregate_by_month_separated(unplanned)
+        )
+
+    def test_empty_store(self) -> None:
+        """Test that planning an empty history is a no-op."""
+        store = PlayRecordStore.empty()
+
+        AggregationPlanner(GRAPH_TYPE_COUNTERS).precompute(store)
+
+        assert aggregate_top_users(store) == []
@@ -0,0 +1,135 @@
+"""
+Tests for the adaptive concurrency controller in TGraph Bot.
+
+This module tests that the controller bounds the requests in flight, raises
+its limit while requests are fast, halves it once per overload and that
+DataFetcher runs bulk operations through it.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.data.concurrency_controller import (
+    AdaptiveConcurrencyController,
+    is_overload_error,
+)
+from src.tgraph_bot.graphs.graph_modules.data.data_fetcher import DataFetcher
+
+
+class TestAdaptiveConcurrencyController:
+    """Test cases for AdaptiveConcurrencyController."""
+
+    @pytest.mark.asyncio
+    async def test_requests_in_flight_stay_within_limit(self) -> None:
+        """Test that no more requests than the limit run at the same time."""
+        controller = AdaptiveConcurrencyController(initial_limit=3, max_limit=3)
+        peak = 0
+
+        async def request(item: int) -> int:
+            nonlocal peak
+            peak = max(peak, controller.in_flight)
+            await asyncio.sleep(0.01)
+            return item * 2
+
+        results = await controller.map(request, range(20))
+
+        assert results == [item * 2 for item in range(20)]
+        assert peak == 3
+        assert controller.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_fast_requests_raise_the_limit(self) -> None:
+        """Test that the limit grows additively while requests are fast."""
+        controller = AdaptiveConcurrencyController(initial_limit=2, max_limit=6)
+
+        async def request(_item: int) -> None:
+            await asyncio.sleep(0)
+
+        _ = await controller.map(request, range(100))
+
+        assert controller.limit == 6
+        metrics = controller.get_metrics()
+        assert metrics["completed"] == 100
+        assert metrics["failed"] == 0
+        assert metrics["throughput"] > 0
+
+    @pytest.mark.asyncio
+    async def test_overload_halves_the_limit_once(self) -> None:
+        """Test that concurrent timeouts of one round halve the limit once."""
+        controller = AdaptiveConcurrencyController(initial_limit=8)
+
+        async def request(_item: int) -> None:
+            await asyncio.sleep(0.01)
+            raise httpx.ReadTimeout("Tautulli did not respond")
+
+        results = await controller.map(request, range(8))
+
+        assert all(isinstance(result, httpx.ReadTimeout) for result in results)
+        assert controller.limit == 4
+        assert controller.get_metrics()["overloads"] == 8
+
+    @pytest.mark.asyncio
+    async def test_slow_responses_lower_the_limit(self) -> None:
+        """Test that responses slower than the target latency count as overload."""
+        controller = AdaptiveConcurrencyController(initial_limit=4, target_latency=0.0)
+
+        async def request(_item: int) -> None:
+            await asyncio.sleep(0.001)
+
+        _ = await controller.map(request, range(1))
+
+        assert controller.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_api_errors_do_not_change_the_limit(self) -> None:
+        """Test that errors unrelated to load leave the limit unchanged."""
+        controller = AdaptiveConcurrencyController(initial_limit=4)
+
+        async def request(_item: int) -> None:
+            raise ValueError("API error: Invalid rating_key")
+
+        _ = await controller.map(request, range(4))
+
+        assert controller.limit == 4
+        assert controller.get_metrics()["failed"] == 4
+
+    def test_overload_errors(self) -> None:
+        """Test which errors count as signs of overload."""
+        request = httpx.Request("GET", "http://tautulli")
+
+        def status_error(status_code: int) -> httpx.HTTPStatusError:
+            response = httpx.Response(status_code, request=request)
+            return httpx.HTTPStatusError("error", request=request, response=response)
+
+        assert is_overload_error(TimeoutError())
+        assert is_overload_error(httpx.ConnectError("refused"))
+        assert is_overload_error(status_error(503))
+        assert not is_overload_error(status_error(404))
+        assert not is_overload_error(ValueError("API error"))
+
+
+class TestDataFetcherBulkRequests:
+    """Test cases for bulk requests through DataFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_uses_shared_controller(self) -> None:
+        """Test that fetchers sharing a controller report its metrics."""
+        controller = AdaptiveConcurrencyController()
+        fetcher = DataFetcher("http://tautulli", "key", concurrency=controller)
+
+        async def fetch(item: int) -> int:
+            if item == 2:
+                raise ValueError("API error")
+            return item
+
+        results = await fetcher.fetch_many(fetch, [1, 2, 3])
+
+        assert results[0] == 1
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 3
+        assert fetcher.concurrency is controller
+        stats = fetcher.get_concurrency_stats()
+        assert stats["completed"] == 2
+        assert stats["failed"] == 1
@@ -0,0 +1,252 @@
+"""
+Tests for the sweep-line concurrent stream calculation in TGraph Bot.
+
+This module tests peak concurrent stream detection per day and per hour,
+including streams that cross midnight, back-to-back streams and stream type
+breakdowns, and checks the sweep against a brute-force reference.
+"""
+
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.tgraph_bot.graphs.graph_modules.utils.concurrent_streams import (
+    sweep_concurrent_streams,
+)
+from src.tgraph_bot.graphs.graph_modules.utils.record_store import PlayRecordStore
+from src.tgraph_bot.graphs.graph_modules.utils.utils import (
+    ProcessedPlayRecord,
+    ProcessedRecords,
+    calculate_concurrent_streams_by_date,
+    calculate_concurrent_streams_by_hour,
+)
+
+
+def _make_record(
+    start: datetime, duration: int, transcode_decision: str | None = "direct play"
+) -> ProcessedPlayRecord:
+    """Create a processed record starting at a local time."""
+    timestamp = int(start.timestamp())
+    record: ProcessedPlayRecord = {
+        "date": str(timestamp),
+        "user": "alice",
+        "platform": "Roku",
+        "media_type": "movie",
+        "duration": duration,
+        "stopped": timestamp + duration,
+        "paused_counter": 0,
+        "datetime": start,
+    }
+    if transcode_decision is not None:
+        record["transcode_decision"] = transcode_decision
+    return record
+
+
+def _brute_force_peaks(
+    starts: list[int], ends: list[int], bucket_seconds: int
+) -> dict[int, int]:
+    """Find peaks by counting active sessions at every candidate instant."""
+    candidates: defaultdict[int, set[int]] = defaultdict(set)
+    for start, end in zip(starts, ends):
+        if end <= start:
+            continue
+        for bucket in range(start // bucket_seconds, (end - 1) // bucket_seconds + 1):
+            candidates[bucket].add(max(start, bucket * bucket_seconds))
+
+    peaks: dict[int, int] = {}
+    for bucket, instants in candidates.items():
+        peaks[bucket] = max(
+            sum(1 for start, end in zip(starts, ends) if start <= instant < end)
+            for instant in instants
+        )
+    return peaks
+
+
+class TestSweepConcurrentStreams:
+    """Test cases for the sweep-line engine."""
+
+    def test_matches_brute_force(self) -> None:
+        """Test random sessions against a brute-force count."""
+        rng = random.Random(42)
+        starts = [rng.randrange(0, 5 * 86_400) for _ in range(300)]
+        ends = [start + rng.randrange(0, 20_000) for start in starts]
+
+        for bucket_seconds in (86_400, 3_600):
+            result = sweep_concurrent_streams(
+                np.array(starts, dtype=np.int64),
+                np.array(ends, dtype=np.int64),
+                np.zeros(len(starts), dtype=np.int64),
+                1,
+                bucket_seconds,
+            )
+
+            expected = _brute_force_peaks(starts, ends, bucket_seconds)
+            assert dict(zip(result.buckets, result.peaks)) == expected
+            assert result.buckets == sorted(expected)
+            assert [breakdown[0] for breakdown in result.breakdowns] == result.peaks
+
+    def test_matches_brute_force_on_bucket_boundaries(self) -> None:
+        """Test random sessions whose times fall on hour and day boundaries."""
+        rng = random.Random(11)
+        starts = [rng.randrange(0, 5 * 48) * 1_800 for _ in range(200)]
+        ends = [start + rng.randrange(0, 12) * 1_800 for start in starts]
+
+        for bucket_seconds in (86_400, 3_600):
+            result = sweep_concurrent_streams(
+                np.array(starts, dtype=np.int64),
+                np.array(ends, dtype=np.int64),
+                np.zeros(len(starts), dtype=np.int64),
+                1,
+                bucket_seconds,
+            )
+
+            expected = _brute_force_peaks(starts, ends, bucket_seconds)
+            assert dict(zip(result.buckets, result.peaks)) == expected
+            assert [breakdown[0] for breakdown in result.breakdowns] == result.peaks
+
+    def test_sessions_ending_at_midnight(self) -> None:
+        """Test that sessions ending at midnight do not count on the next day."""
+        result = sweep_concurrent_streams(
+            np.array([0, 0, 0], dtype=np.int64),
+            np.array([86_400, 86_400, 100_000], dtype=np.int64),
+            np.array([0, 0, 1], dtype=np.int64),
+            2,
+            86_400,
+        )
+
+        assert result.buckets == [0, 1]
+        assert result.peaks == [3, 1]
+        assert result.breakdowns == [[2, 1], [0, 1]]
+
+    def test_sessions_ending_at_top_of_hour(self) -> None:
+        """Test that sessions ending on the hour add no extra hour."""
+        result = sweep_concurrent_streams(
+            np.array([1_800, 1_800, 2_000], dtype=np.int64),
+            np.array([3_600, 3_600, 3_600], dtype=np.int64),
+            np.zeros(3, dtype=np.int64),
+            1,
+            3_600,
+        )
+
+        assert result.buckets == [0]
+        assert result.peaks == [3]
+
+    def test_empty_input(self) -> None:
+        """Test that no sessions produce no peaks."""
+        empty = np.array([], dtype=np.int64)
+
+        result = sweep_concurrent_streams(empty, empty, empty, 0, 86_400)
+
+        assert result.buckets == []
+        assert result.peaks == []
+
+
+class TestCalculateConcurrentStreams:
+    """Test cases for the concurrent stream aggregation functions."""
+
+    def test_overlapping_streams_by_type(self) -> None:
+        """Test the peak and its stream type breakdown on a single day."""
+        base = datetime(2024, 5, 1, 20, 0)
+        records = [
+            _make_record(base, 3600, "direct play"),
+            _make_record(base + timedelta(minutes=10), 3600, "transcode"),
+            _make_record(base + timedelta(minutes=20), 600, "transcode"),
+            _make_record(base + timedelta(hours=3), 600, "copy"),
+        ]
+
+        result = calculate_concurrent_streams_by_date(records)
+
+        assert result == [
+            {
+                "date": "2024-05-01",
+                "peak_concurrent": 3,
+                "stream_type_breakdown": {"direct play": 1, "transcode": 2},
+            }
+        ]
+
+    def test_stream_crossing_midnight_counts_on_both_days(self) -> None:
+        """Test that a late-night stream adds to the next day's peak."""
+        records = [
+            _make_record(datetime(2024, 5, 1, 23, 30), 7200),
+            _make_record(datetime(2024, 5, 2, 0, 30), 600, "transcode"),
+        ]
+
+        result = calculate_concurrent_streams_by_date(records)
+
+        assert [(r["date"], r["peak_concurrent"]) for r in result] == [
+            ("2024-05-01", 1),
+            ("2024-05-02", 2),
+        ]
+        assert result[1]["stream_type_breakdown"] == {
+            "direct play": 1,
+            "transcode": 1,
+        }
+
+    def test_back_to_back_streams_do_not_overlap(self) -> None:
+        """Test that a stream starting as another ends is not concurrent."""
+        base = datetime(2024, 5, 1, 12, 0)
+        records = [
+            _make_record(base, 1800),
+            _make_record(base + timedelta(seconds=1800), 1800),
+        ]
+
+        result = calculate_concurrent_streams_by_date(records)
+
+        assert result[0]["peak_concurrent"] == 1
+
+    def test_missing_stream_type_is_unknown(self) -> None:
+        """Test that records without a transcode decision count as unknown."""
+        records = [_make_record(datetime(2024, 5, 1, 12, 0), 600, None)]
+
+        result = calculate_concurrent_streams_by_date(records)
+
+        assert result[0]["stream_type_breakdown"] == {"unknown": 1}
+
+    def test_without_stream_type_breakdown(self) -> None:
+        """Test that the breakdown is empty when not requested."""
+        records = [_make_record(datetime(2024, 5, 1, 12, 0), 600)]
+
+        result = calculate_concurrent_streams_by_date(
+            records, separate_by_stream_type=False
+        )
+
+        assert result[0]["stream_type_breakdown"] == {}
+
+    def test_hourly_peaks(self) -> None:
+        """Test peaks per hour for a stream spanning several hours."""
+        base = datetime(2024, 5, 1, 22, 30)
+        records = [
+            _make_record(base, 2 * 3600),
+            _make_record(base + timedelta(minutes=45), 600, "transcode"),
+        ]
+
+        result = calculate_concurrent_streams_by_hour(records)
+
+        assert [(r["date"], r["hour"], r["peak_concurrent"]) for r in result] == [
+            ("2024-05-01", 22, 1),
+            ("2024-05-01", 23, 2),
+            ("2024-05-02", 0, 1),
+        ]
+
+    def test_store_and_list_match(self) -> None:
+        """Test that a PlayRecordStore gives the same result as a list."""
+        rng = random.Random(7)
+        base = datetime(2024, 3, 1)
+        records: ProcessedRecords = [
+            _make_record(
+                base + timedelta(seconds=rng.randrange(0, 30 * 86_400)),
+                rng.randrange(60, 10_800),
+                rng.choice(["direct play", "copy", "transcode", None]),
+            )
+            for _ in range(500)
+        ]
+        store = PlayRecordStore.from_records(records)
+
+        assert calculate_concurrent_streams_by_date(
+            store
+        ) == calculate_concurrent_streams_by_date(records)
+        assert calculate_concurrent_streams_by_hour(
+            store
+        ) == calculate_concurrent_streams_by_hour(records)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -53,7 +54,7 @@ class TestDataFetcher:
         assert data_fetcher.timeout == 30.0
         assert data_fetcher.max_retries == 3
         assert data_fetcher._client is None  # pyright: ignore[reportPrivateUsage]
-        assert data_fetcher._cache == {}  # pyright: ignore[reportPrivateUsage]
+        assert len(data_fetcher._cache) == 0  # pyright: ignore[reportPrivateUsage]
 
     def test_init_strips_trailing_slash(self) -> None:
         """Test that trailing slash is stripped from base URL."""
@@ -398,6 +399,65 @@ class TestDataFetcher:
             assert isinstance(result_data, list)
             assert len(result_data) >= 500
 
+    @pytest.mark.asyncio
+    async def test_get_play_history_concurrent_pages_in_order(self) -> None:
+        """Test that concurrently fetched pages are bounded and kept in order."""
+        fetcher = DataFetcher(
+            base_url="http://localhost:8181",
+            api_key="test_api_key",
+            page_size=100,
+            max_concurrent_pages=3,
+        )
+        total = 950
+        active = 0
+        max_active = 0
+
+        async def fake_request(
+            command: str, params: dict[str, object] | None = None
+        ) -> dict[str, object]:
+            nonlocal active, max_active
+            assert command == "get_history"
+            assert params is not None
+            start = params["start"]
+            assert isinstance(start, int)
+            active += 1
+            max_active = max(max_active, active)
+            # Later pages finish first to check the reassembly order
+            await asyncio.sleep(0.001 * (total - start) / 100)
+            active -= 1
+            return {
+                "recordsFiltered": total,
+                "data": [{"id": i} for i in range(start, min(start + 100, total))],
+            }
+
+        with patch.object(fetcher, "_make_request", side_effect=fake_request):
+            async with fetcher:
+                result = await fetcher.get_play_history(time_range=90)
+
+        assert [row["id"] for row in result["data"]] == list(range(total))
+        assert result["recordsFiltered"] == total
+        assert 1 < max_active <= 3
+
+    @pytest.mark.asyncio
+    async def test_get_play_history_without_row_count(
+        self, data_fetcher: DataFetcher
+    ) -> None:
+        """Test that pages are fetched one by one when no row count is reported."""
+        pages = [
+            {"data": [{"id": i} for i in range(1000)]},
+            {"data": [{"id": i} for i in range(1000, 1200)]},
+        ]
+
+        with patch.object(
+            data_fetcher, "_make_request", side_effect=pages
+        ) as mock_make_request:
+            async with data_fetcher:
+                result = await data_fetcher.get_play_history(time_range=90)
+
+        starts = [call[0][1]["start"] for call in mock_make_request.call_args_list]
+        assert starts == [0, 1000]
+        assert len(result["data"]) == 1200
+
     @pytest.mark.asyncio
     async def test_get_user_stats(
         self, data_fetcher: DataFetcher, mock_successful_response: dict[str, object]
@@ -437,7 +497,7 @@ class TestDataFetcher:
     def test_clear_cache(self, data_fetcher: DataFetcher) -> None:
         """Test cache clearing functionality."""
         # Add some data to cache
-        data_fetcher._cache["test_key"] = {"test": "data"}  # pyright: ignore[reportPrivateUsage]
+        data_fetcher._cache.set("test_key", "get_users", {"test": "data"})  # pyright: ignore[reportPrivateUsage]
         assert len(data_fetcher._cache) == 1  # pyright: ignore[reportPrivateUsage]
 
         # Clear cache
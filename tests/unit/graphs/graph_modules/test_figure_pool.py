@@ -0,0 +1,132 @@
+"""
+Tests for the figure pool in TGraph Bot.
+
+This module tests that figures are reused per size and dpi, that returned
+figures are reset before the next graph draws on them and that BaseGraph
+takes its figures from the pool when enabled.
+"""
+
+from collections.abc import Mapping
+from typing import override
+
+import matplotlib.pyplot as plt
+from matplotlib.figure import SubplotParams
+
+from src.tgraph_bot.graphs.graph_modules import BaseGraph
+from src.tgraph_bot.graphs.graph_modules.core.figure_pool import (
+    FigurePool,
+    get_figure_pool,
+)
+from tests.utils.test_helpers import create_test_config_custom
+
+
+class PooledTestGraph(BaseGraph):
+    """Minimal graph for figure pool tests."""
+
+    @override
+    def generate(self, data: Mapping[str, object]) -> str:
+        """Not used by these tests."""
+        return ""
+
+    @override
+    def get_title(self) -> str:
+        """Get the title of the test graph."""
+        return "Pooled Test Graph"
+
+
+class TestFigurePool:
+    """Test cases for FigurePool."""
+
+    def test_figures_are_reused_per_size(self) -> None:
+        """Test that a returned figure is reused for the same size and dpi."""
+        pool = FigurePool()
+
+        figure, _ = pool.acquire(12, 8, 100, "#ffffff")
+        pool.release(figure)
+
+        reused, _ = pool.acquire(12, 8, 100, "#000000")
+        other, _ = pool.acquire(14, 8, 100, "#ffffff")
+
+        assert reused is figure
+        assert other is not figure
+        assert reused.get_facecolor() == (0.0, 0.0, 0.0, 1.0)
+
+    def test_released_figures_are_reset(self) -> None:
+        """Test that nothing drawn by a graph survives on the reused figure."""
+        pool = FigurePool()
+
+        figure, axes = pool.acquire(12, 8, 100, "#ffffff")
+        _ = axes.bar([0, 1], [1, 2])  # pyright: ignore[reportUnknownMemberType]
+        _ = axes.legend(["plays"])  # pyright: ignore[reportUnknownMemberType]
+        _ = figure.suptitle("Title")  # pyright: ignore[reportUnknownMemberType]
+        figure.tight_layout()
+        _ = figure.add_axes((0.7, 0.7, 0.2, 0.2))  # pyright: ignore[reportUnknownMemberType]
+        pool.release(figure)
+
+        reused, reused_axes = pool.acquire(12, 8, 100, "#ffffff")
+
+        defaults = SubplotParams()
+        assert reused.axes == [reused_axes]
+        assert not reused.texts
+        assert not reused_axes.patches
+        assert reused_axes.get_legend() is None
+        assert reused.subplotpars.left == defaults.left
+        assert reused.subplotpars.top == defaults.top
+
+    def test_worn_and_resized_figures_are_discarded(self) -> None:
+        """Test that figures are not reused past max_uses or after resizing."""
+        pool = FigurePool(max_uses=1)
+        figure, _ = pool.acquire(12, 8, 100, "#ffffff")
+        pool.release(figure)
+        assert pool.idle_count() == 0
+
+        pool = FigurePool()
+        figure, _ = pool.acquire(12, 8, 100, "#ffffff")
+        figure.set_size_inches(6, 4)
+        pool.release(figure)
+        assert pool.idle_count() == 0
+
+    def test_foreign_figures_are_ignored(self) -> None:
+        """Test that figures not acquired from the pool are not pooled."""
+        pool = FigurePool()
+        figure = plt.figure()  # pyright: ignore[reportUnknownMemberType]
+
+        try:
+            assert not pool.owns(figure)
+            pool.release(figure)
+            assert pool.idle_count() == 0
+        finally:
+            plt.close(figure)
+
+
+class TestBaseGraphFigurePool:
+    """Test cases for BaseGraph with the figure pool enabled."""
+
+    def test_setup_figure_uses_pool(self) -> None:
+        """Test that graphs of the same size share a pooled figure."""
+        config = create_test_config_custom(
+            graphs_overrides={"rendering": {"figure_pool": True}}
+        )
+
+        first = PooledTestGraph(config=config, width=13, height=7)
+        figure, _ = first.setup_figure()
+        assert get_figure_pool().owns(figure)
+        first.cleanup()
+
+        second = PooledTestGraph(config=config, width=13, height=7)
+        reused, _ = second.setup_figure()
+        second.cleanup()
+
+        assert reused is figure
+        assert second.figure is None
+
+    def test_pool_is_disabled_by_default(self) -> None:
+        """Test that graphs create pyplot figures unless the pool is enabled."""
+        graph = PooledTestGraph(config=create_test_config_custom())
+        figure, _ = graph.setup_figure()
+
+        try:
+            assert not get_figure_pool().owns(figure)
+            assert figure.number in plt.get_fignums()
+        finally:
+            graph.cleanup()
@@ -7,10 +7,15 @@ based on configuration settings.
 
 import tempfile
 from pathlib import Path
+from typing import cast
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.tgraph_bot.graphs.graph_modules import GraphFactory
+from src.tgraph_bot.graphs.graph_modules.data.processed_history import (
+    with_processed_history,
+)
 from src.tgraph_bot.config.schema import TGraphBotConfig
 from tests.utils.test_helpers import create_test_config, create_test_config_custom
 
@@ -588,6 +593,38 @@ class TestGraphFactory:
             # If graphs don't handle empty data gracefully, that's a separate issue
             pass
 
+    def test_precompute_aggregates_plans_generated_graph_types(self) -> None:
+        """Test that aggregates are planned for the graphs being generated."""
+        factory = GraphFactory(create_test_config())
+        graphs = [
+            factory.create_graph_by_type("top_10_users"),
+            factory.create_graph_by_type("play_count_by_hourofday"),
+        ]
+        data = with_processed_history({"play_history": {"data": []}})
+
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.core.graph_factory.AggregationPlanner"
+        ) as mock_planner:
+            factory._precompute_aggregates(graphs, data)  # pyright: ignore[reportPrivateUsage]
+
+        mock_planner.assert_called_once_with(
+            ["top_10_users", "play_count_by_hourofday"]
+        )
+        planner = cast(MagicMock, mock_planner.return_value)
+        cast(MagicMock, planner.precompute).assert_called_once()
+
+    def test_precompute_aggregates_without_processed_history(self) -> None:
+        """Test that nothing is planned when there is no shared history."""
+        factory = GraphFactory(create_test_config())
+        graphs = [factory.create_graph_by_type("top_10_users")]
+
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.core.graph_factory.AggregationPlanner"
+        ) as mock_planner:
+            factory._precompute_aggregates(graphs, {"play_history": {"data": []}})  # pyright: ignore[reportPrivateUsage]
+
+        mock_planner.assert_not_called()
+
     def test_cleanup_all_graph_resources(self) -> None:
         """Test cleanup_all_graph_resources method."""
         config = create_test_config()
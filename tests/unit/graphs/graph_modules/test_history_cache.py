@@ -0,0 +1,345 @@
+"""
+Tests for the persistent play history cache in TGraph Bot.
+
+This module tests the SQLite-backed PlayHistoryCache, its user index, the
+incremental sync that DataFetcher performs when a cache is configured and
+serving personal history from the cache without contacting Tautulli.
+"""
+
+import datetime
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.data.data_fetcher import (
+    APIParams,
+    DataFetcher,
+)
+from src.tgraph_bot.graphs.graph_modules.data.history_cache import (
+    PlayHistoryCache,
+    get_play_history_cache,
+)
+
+
+def _row(row_id: int, started: datetime.datetime, user_id: int) -> dict[str, object]:
+    """Create a history row like Tautulli's get_history returns."""
+    timestamp = int(started.timestamp())
+    return {
+        "row_id": row_id,
+        "id": row_id,
+        "date": timestamp,
+        "started": timestamp,
+        "stopped": timestamp + 1800,
+        "user_id": user_id,
+        "user": f"user{user_id}",
+        "media_type": "movie",
+    }
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> PlayHistoryCache:
+    """Create a cache in a temporary directory."""
+    return PlayHistoryCache(tmp_path / "cache" / "play_history.sqlite3")
+
+
+class TestPlayHistoryCache:
+    """Test cases for PlayHistoryCache."""
+
+    def test_empty_cache_state(self, cache: PlayHistoryCache) -> None:
+        """Test the sync state of a new cache."""
+        state = cache.get_sync_state()
+
+        assert state.covered_since is None
+        assert state.latest_started is None
+        assert cache.path.exists()
+
+    def test_rows_are_keyed_by_row_id(self, cache: PlayHistoryCache) -> None:
+        """Test that storing a row again updates it instead of duplicating it."""
+        started = datetime.datetime(2024, 5, 1, 20, 0)
+        _ = cache.store_rows([_row(1, started, 10)], "2024-04-01")
+
+        updated = _row(1, started, 10) | {"stopped": 0}
+        _ = cache.store_rows([updated, _row(2, started, 11)], "2024-04-15")
+
+        rows = cache.get_rows(since=0)
+        assert len(rows) == 2
+        assert {row["row_id"]: row["stopped"] for row in rows}[1] == 0
+
+    def test_rows_before_the_window_are_dropped(self, cache: PlayHistoryCache) -> None:
+        """Test that the covered range follows the window and old rows go."""
+        started = datetime.datetime(2024, 5, 1, 20, 0)
+        _ = cache.store_rows([_row(1, started, 10)], "2024-04-01")
+        _ = cache.store_rows([], "2024-05-01")
+
+        state = cache.get_sync_state()
+        assert state.covered_since == "2024-05-01"
+        assert state.latest_started == int(started.timestamp())
+
+        _ = cache.store_rows([], "2024-05-02")
+
+        assert cache.get_rows(since=0) == []
+        assert cache.get_sync_state().covered_since == "2024-05-02"
+
+    def test_full_sync_replaces_rows(self, cache: PlayHistoryCache) -> None:
+        """Test that a full sync drops rows that are no longer in Tautulli."""
+        started = datetime.datetime(2024, 5, 1, 20, 0)
+        _ = cache.store_rows([_row(1, started, 10), _row(2, started, 11)], "2024-04-01")
+
+        _ = cache.store_rows([_row(2, started, 11)], "2024-04-01", True, now=1000)
+
+        assert [row["row_id"] for row in cache.get_rows(since=0)] == [2]
+        assert cache.get_sync_state().full_synced_at == 1000
+
+    def test_get_rows_filters_and_orders(self, cache: PlayHistoryCache) -> None:
+        """Test time and user filtering, newest rows first."""
+        base = datetime.datetime(2024, 5, 1)
+        rows = [
+            _row(index, base + datetime.timedelta(days=index), index % 2)
+            for index in range(6)
+        ]
+        _ = cache.store_rows(rows, "2024-05-01")
+
+        since = int((base + datetime.timedelta(days=2)).timestamp())
+
+        assert [row["row_id"] for row in cache.get_rows(since)] == [5, 4, 3, 2]
+        assert [row["row_id"] for row in cache.get_rows(since, user_id=1)] == [5, 3]
+
+    def test_rows_without_keys_are_skipped(self, cache: PlayHistoryCache) -> None:
+        """Test that rows missing a row id or start time are not stored."""
+        stored = cache.store_rows([{"user": "alice"}, {"row_id": 3}], "2024-05-01")
+
+        assert stored == 0
+        assert cache.get_rows(since=0) == []
+
+    def test_shared_instance_per_path(self, tmp_path: Path) -> None:
+        """Test that the same database file gives the same cache instance."""
+        path = tmp_path / "history.sqlite3"
+
+        assert get_play_history_cache(path) is get_play_history_cache(path)
+
+
+class TestUserIndex:
+    """Test cases for the user index of PlayHistoryCache."""
+
+    def test_users_are_found_by_email(self, cache: PlayHistoryCache) -> None:
+        """Test that users are looked up by email regardless of letter case."""
+        stored = cache.store_users(
+            [
+                {"user_id": "10", "email": "Alice@Example.com", "thumb": "x"},
+                {"user_id": 11, "email": ""},
+                {"email": "nobody@example.com"},
+            ]
+        )
+
+        assert stored == 1
+        assert cache.find_user(" alice@example.COM") == {
+            "user_id": 10,
+            "email": "Alice@Example.com",
+        }
+        assert cache.find_user("nobody@example.com") is None
+
+    def test_users_are_replaced(self, cache: PlayHistoryCache) -> None:
+        """Test that storing the user list drops users no longer listed."""
+        _ = cache.store_users([{"user_id": 10, "email": "alice@example.com"}])
+        _ = cache.store_users([{"user_id": 11, "email": "bob@example.com"}])
+
+        assert cache.find_user("alice@example.com") is None
+        assert cache.find_user("bob@example.com") is not None
+
+
+class TestDataFetcherHistoryCache:
+    """Test cases for DataFetcher with a persistent history cache."""
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync(self, cache: PlayHistoryCache) -> None:
+        """Test a full first sync followed by an incremental sync."""
+        now = datetime.datetime.now().replace(microsecond=0)
+        old_row = _row(1, now - datetime.timedelta(days=10), 10)
+        new_row = _row(2, now - datetime.timedelta(hours=1), 11)
+        requests: list[APIParams] = []
+        pages = [[old_row], [new_row]]
+
+        async def fake_request(
+            command: str, params: APIParams | None = None
+        ) -> dict[str, object]:
+            assert command == "get_history"
+            assert params is not None
+            requests.append(dict(params))
+            page = pages[len(requests) - 1]
+            return {"data": page, "recordsFiltered": len(page)}
+
+        fetcher = DataFetcher(
+            base_url="http://localhost:8181", api_key="key", history_cache=cache
+        )
+        with patch.object(fetcher, "_make_request", side_effect=fake_request):
+            async with fetcher:
+                first = await fetcher.get_play_history(time_range=30)
+                second = await fetcher.get_play_history(time_range=30)
+
+        # The first sync covers the whole window, the second only recent days
+        first_after = datetime.date.fromisoformat(str(requests[0]["after"]))
+        second_after = datetime.date.fromisoformat(str(requests[1]["after"]))
+        assert first_after <= now.date() - datetime.timedelta(days=30)
+        assert second_after == _start_date(old_row) - datetime.timedelta(days=1)
+        assert "user_id" not in requests[0]
+
+        assert [row["row_id"] for row in first["data"]] == [1]
+        assert [row["row_id"] for row in second["data"]] == [2, 1]
+        assert second["recordsFiltered"] == 2
+
+    @pytest.mark.asyncio
+    async def test_window_is_fetched_again_when_due(
+        self, cache: PlayHistoryCache
+    ) -> None:
+        """Test that a due full sync drops plays deleted in Tautulli."""
+        now = datetime.datetime.now().replace(microsecond=0)
+        kept_row = _row(1, now - datetime.timedelta(days=10), 10)
+        deleted_row = _row(2, now - datetime.timedelta(days=5), 11)
+        _ = cache.store_rows(
+            [kept_row, deleted_row], "2000-01-01", True, now=time.time() - 86_400
+        )
+
+        fetcher = DataFetcher(
+            base_url="http://localhost:8181",
+            api_key="key",
+            history_cache=cache,
+            full_sync_interval_days=1,
+        )
+        with patch.object(
+            fetcher,
+            "_make_request",
+            return_value={"data": [kept_row], "recordsFiltered": 1},
+        ) as mock_make_request:
+            async with fetcher:
+                result = await fetcher.get_play_history(time_range=30)
+
+        params: APIParams = mock_make_request.call_args[0][1]  # pyright: ignore[reportAny] # mock call args
+        assert datetime.date.fromisoformat(str(params["after"])) <= (
+            now.date() - datetime.timedelta(days=30)
+        )
+        assert [row["row_id"] for row in result["data"]] == [1]
+        full_synced_at = cache.get_sync_state().full_synced_at
+        assert full_synced_at is not None
+        assert full_synced_at >= time.time() - 60
+
+    @pytest.mark.asyncio
+    async def test_incomplete_window_keeps_cached_rows(
+        self, cache: PlayHistoryCache
+    ) -> None:
+        """Test that a full sync missing rows does not replace the cache."""
+        now = datetime.datetime.now().replace(microsecond=0)
+        rows = [
+            _row(1, now - datetime.timedelta(days=10), 10),
+            _row(2, now - datetime.timedelta(days=5), 11),
+        ]
+        _ = cache.store_rows(rows, "2000-01-01", True, now=0)
+
+        fetcher = DataFetcher(
+            base_url="http://localhost:8181",
+            api_key="key",
+            history_cache=cache,
+            full_sync_interval_days=1,
+        )
+        with patch.object(
+            fetcher,
+            "_make_request",
+            return_value={"data": rows[:1], "recordsFiltered": 2},
+        ):
+            async with fetcher:
+                result = await fetcher.get_play_history(time_range=30)
+
+        assert [row["row_id"] for row in result["data"]] == [2, 1]
+        assert cache.get_sync_state().full_synced_at == 0
+
+    @pytest.mark.asyncio
+    async def test_user_history_served_from_cache(
+        self, cache: PlayHistoryCache
+    ) -> None:
+        """Test that per-user history is filtered locally from the synced rows."""
+        now = datetime.datetime.now().replace(microsecond=0)
+        rows = [
+            _row(1, now - datetime.timedelta(days=2), 10),
+            _row(2, now - datetime.timedelta(days=1), 11),
+        ]
+
+        fetcher = DataFetcher(
+            base_url="http://localhost:8181", api_key="key", history_cache=cache
+        )
+        with patch.object(
+            fetcher,
+            "_make_request",
+            return_value={"data": rows, "recordsFiltered": 2},
+        ) as mock_make_request:
+            async with fetcher:
+                result = await fetcher.get_play_history(time_range=30, user_id=11)
+
+        params: APIParams = mock_make_request.call_args[0][1]  # pyright: ignore[reportAny] # mock call args
+        assert "user_id" not in params
+        assert [row["row_id"] for row in result["data"]] == [2]
+
+    @pytest.mark.asyncio
+    async def test_cache_bypassed_without_date_filtering(
+        self, cache: PlayHistoryCache
+    ) -> None:
+        """Test that unfiltered history requests go straight to the API."""
+        fetcher = DataFetcher(
+            base_url="http://localhost:8181", api_key="key", history_cache=cache
+        )
+        with patch.object(
+            fetcher, "_make_request", return_value={"data": [], "recordsFiltered": 0}
+        ):
+            async with fetcher:
+                _ = await fetcher.get_play_history(
+                    time_range=30, use_date_filtering=False
+                )
+
+        assert cache.get_sync_state().covered_since is None
+
+    @pytest.mark.asyncio
+    async def test_local_history_skips_tautulli(self, cache: PlayHistoryCache) -> None:
+        """Test that local history is read without syncing the cache."""
+        now = datetime.datetime.now().replace(microsecond=0)
+        _ = cache.store_rows(
+            [
+                _row(1, now - datetime.timedelta(days=2), 10),
+                _row(2, now - datetime.timedelta(days=1), 11),
+            ],
+            (now - datetime.timedelta(days=60)).date().isoformat(),
+        )
+        _ = cache.store_users([{"user_id": 11, "email": "bob@example.com"}])
+
+        fetcher = DataFetcher(
+            base_url="http://localhost:8181", api_key="key", history_cache=cache
+        )
+        with patch.object(fetcher, "_make_request") as mock_make_request:
+            async with fetcher:
+                user = await fetcher.find_local_user_by_email("Bob@example.com")
+                result = await fetcher.get_local_play_history(time_range=30, user_id=11)
+
+        mock_make_request.assert_not_called()
+        assert user is not None
+        assert user["user_id"] == 11
+        assert result is not None
+        assert [row["row_id"] for row in result["data"]] == [2]
+
+    @pytest.mark.asyncio
+    async def test_local_history_needs_covered_range(
+        self, cache: PlayHistoryCache
+    ) -> None:
+        """Test that local history is unavailable for a range never synced."""
+        _ = cache.store_rows([], datetime.date.today().isoformat())
+
+        fetcher = DataFetcher(
+            base_url="http://localhost:8181", api_key="key", history_cache=cache
+        )
+        async with fetcher:
+            assert await fetcher.get_local_play_history(time_range=30) is None
+
+
+def _start_date(row: dict[str, object]) -> datetime.date:
+    """Get the local start date of a history row."""
+    started = row["started"]
+    assert isinstance(started, int)
+    return datetime.date.fromtimestamp(started)
@@ -0,0 +1,119 @@
+"""
+Tests for compact play history rows in TGraph Bot.
+
+This module tests that history rows are reduced to the fields the graphs
+use, that the play history cache stores compact rows and that DataFetcher
+compacts history pages when configured to.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.data.data_fetcher import DataFetcher
+from src.tgraph_bot.graphs.graph_modules.data.data_processor import data_processor
+from src.tgraph_bot.graphs.graph_modules.data.history_cache import PlayHistoryCache
+from src.tgraph_bot.graphs.graph_modules.data.history_schema import (
+    HISTORY_ROW_SCHEMA,
+    compact_history_row,
+    decode_history_payloads,
+)
+
+TAUTULLI_ROW: dict[str, object] = {
+    "row_id": 7,
+    "id": 7,
+    "date": 1704100000,
+    "started": 1704100000,
+    "stopped": "1704103600",
+    "duration": 3600,
+    "paused_counter": 0,
+    "user_id": "12",
+    "user": "alice",
+    "friendly_name": "Alice",
+    "platform": "Roku",
+    "media_type": "movie",
+    "rating_key": "4242",
+    "full_title": "A Movie",
+    "thumb": "/library/metadata/4242/thumb/1700000000",
+    "guid": "plex://movie/5d776b59ad5437001f79c6f8",
+    "ip_address": "10.0.0.2",
+    "transcode_decision": "direct play",
+}
+
+
+class TestCompactHistoryRow:
+    """Test cases for compact_history_row()."""
+
+    def test_unused_fields_are_dropped(self) -> None:
+        """Test that only fields of the schema are kept."""
+        row = compact_history_row(TAUTULLI_ROW)
+
+        assert set(row) <= set(HISTORY_ROW_SCHEMA)
+        assert "full_title" not in row
+        assert "friendly_name" not in row
+        assert row["user"] == "alice"
+
+    def test_numeric_strings_become_integers(self) -> None:
+        """Test that integer fields given as strings are decoded once."""
+        row = compact_history_row(TAUTULLI_ROW)
+
+        assert row["stopped"] == 1704103600
+        assert row["user_id"] == 12
+        assert row["rating_key"] == 4242
+
+    def test_unexpected_values_are_kept(self) -> None:
+        """Test that values not matching the schema are left for processing."""
+        row = compact_history_row({"date": "2024-01-01", "duration": None})
+
+        assert row == {"date": "2024-01-01", "duration": None}
+
+    def test_processing_is_unchanged(self) -> None:
+        """Test that compact rows process into the same play records."""
+        data = {"data": [TAUTULLI_ROW]}
+        compact = {"data": [compact_history_row(TAUTULLI_ROW)]}
+
+        _, expected = data_processor.extract_and_process_play_history(data)
+        _, actual = data_processor.extract_and_process_play_history(compact)
+
+        # Tautulli's string "stopped" value is now decoded instead of dropped
+        assert expected[0]["stopped"] == 0
+        assert actual[0]["stopped"] == 1704103600
+        assert {**actual[0], "stopped": 0} == expected[0]
+
+    def test_decode_history_payloads(self) -> None:
+        """Test decoding stored rows with a single parser call."""
+        payloads = [json.dumps(TAUTULLI_ROW), json.dumps({"id": 8})]
+
+        rows = decode_history_payloads(payloads)
+
+        assert rows == [compact_history_row(TAUTULLI_ROW), {"id": 8}]
+        with pytest.raises(TypeError):
+            _ = decode_history_payloads(["[1, 2]"])
+
+
+class TestCompactHistoryStorage:
+    """Test cases for compact rows in the cache and the fetcher."""
+
+    def test_cache_stores_compact_rows(self, tmp_path: Path) -> None:
+        """Test that the play history cache drops unused fields."""
+        cache = PlayHistoryCache(tmp_path / "play_history.sqlite3")
+
+        _ = cache.store_rows([TAUTULLI_ROW], "2024-01-01")
+
+        assert cache.get_rows(since=0) == [compact_history_row(TAUTULLI_ROW)]
+
+    @pytest.mark.asyncio
+    async def test_fetcher_compacts_history_pages(self) -> None:
+        """Test that fetched history pages hold compact rows when configured."""
+        fetcher = DataFetcher("http://tautulli", "key", compact_history=True)
+        page = {"recordsFiltered": 1, "data": [TAUTULLI_ROW]}
+
+        with patch.object(fetcher, "_make_request", return_value=page):
+            async with fetcher:
+                result = await fetcher.get_play_history(
+                    time_range=30, use_date_filtering=False
+                )
+
+        assert result["data"] == [compact_history_row(TAUTULLI_ROW)]
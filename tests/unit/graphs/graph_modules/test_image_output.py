@@ -0,0 +1,141 @@
+"""
+Tests for graph image output in TGraph Bot.
+
+This module tests saving figures with the different image output options
+and that BaseGraph saves graphs in the configured image format.
+"""
+
+from collections.abc import Generator, Mapping
+from pathlib import Path
+from typing import override
+
+import matplotlib.pyplot as plt
+import pytest
+from matplotlib.figure import Figure
+from PIL import Image
+
+from src.tgraph_bot.graphs.graph_modules import BaseGraph
+from src.tgraph_bot.graphs.graph_modules.utils.image_output import (
+    ImageOutputOptions,
+    image_format_for_path,
+    save_figure_image,
+)
+from src.tgraph_bot.utils.core.image_store import get_graph_image_store
+from tests.utils.test_helpers import create_test_config_custom
+
+
+class OutputTestGraph(BaseGraph):
+    """Minimal graph that draws a bar plot."""
+
+    @override
+    def generate(self, data: Mapping[str, object]) -> str:
+        """Draw a bar plot and save it to the graph storage."""
+        try:
+            _, axes = self.setup_figure()
+            _ = axes.bar([0, 1, 2], [3, 1, 2])  # pyright: ignore[reportUnknownMemberType]
+            return self.finalize_and_save_figure("output_test")
+        finally:
+            self.cleanup()
+
+    @override
+    def get_title(self) -> str:
+        """Get the title of the test graph."""
+        return "Output Test Graph"
+
+
+@pytest.fixture
+def figure() -> Generator[Figure]:
+    """Create a 4x3 inch figure with a bar plot."""
+    figure, axes = plt.subplots(figsize=(4, 3), dpi=50)
+    _ = axes.bar([0, 1, 2], [3, 1, 2])  # pyright: ignore[reportUnknownMemberType]
+    yield figure
+    plt.close(figure)
+
+
+def _save(figure: Figure, path: Path, options: ImageOutputOptions) -> Image.Image:
+    """Save a figure and load the resulting image."""
+    save_figure_image(figure, path, options, dpi=50, facecolor="#ffffff")
+    with Image.open(path) as image:
+        _ = image.load()
+        return image
+
+
+class TestSaveFigureImage:
+    """Test cases for save_figure_image()."""
+
+    def test_fixed_layout_keeps_figure_size(
+        self, figure: Figure, tmp_path: Path
+    ) -> None:
+        """Test that the fixed layout saves the full figure size."""
+        image = _save(
+            figure, tmp_path / "graph.png", ImageOutputOptions(tight_bbox=False)
+        )
+
+        assert image.format == "PNG"
+        assert image.size == (200, 150)
+
+    def test_compression_level_changes_file_size(
+        self, figure: Figure, tmp_path: Path
+    ) -> None:
+        """Test that the PNG compression level is passed to the encoder."""
+        fast = tmp_path / "fast.png"
+        small = tmp_path / "small.png"
+        _ = _save(figure, fast, ImageOutputOptions(png_compress_level=0))
+        _ = _save(figure, small, ImageOutputOptions(png_compress_level=9))
+
+        assert small.stat().st_size < fast.stat().st_size
+
+    def test_quantized_png_uses_palette(self, figure: Figure, tmp_path: Path) -> None:
+        """Test that quantized PNG images are saved with a color palette."""
+        image = _save(
+            figure, tmp_path / "graph.png", ImageOutputOptions(png_quantize=True)
+        )
+
+        assert image.format == "PNG"
+        assert image.mode == "P"
+
+    def test_webp_output(self, figure: Figure, tmp_path: Path) -> None:
+        """Test saving lossless WebP images."""
+        image = _save(figure, tmp_path / "graph.webp", ImageOutputOptions("webp"))
+
+        assert image.format == "WEBP"
+
+    def test_image_format_for_path(self) -> None:
+        """Test that the image format follows the file extension."""
+        assert image_format_for_path("graph.WEBP") == "webp"
+        assert image_format_for_path("graph.png") == "png"
+
+
+class TestBaseGraphImageOutput:
+    """Test cases for saving graphs with the configured image output."""
+
+    def test_graphs_are_saved_in_configured_format(self) -> None:
+        """Test that graphs are saved as WebP files when configured."""
+        config = create_test_config_custom(
+            graphs_overrides={"rendering": {"image_format": "webp"}}
+        )
+
+        output_path = Path(OutputTestGraph(config=config).generate({}))
+        try:
+            assert output_path.suffix == ".webp"
+            with Image.open(output_path) as image:
+                assert image.format == "WEBP"
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_graphs_rendered_in_memory(self) -> None:
+        """Test that graphs rendered in memory are not written without archive."""
+        config = create_test_config_custom(
+            graphs_overrides={"rendering": {"in_memory": True, "archive_graphs": False}}
+        )
+
+        output_path = OutputTestGraph(config=config).generate({})
+        image = get_graph_image_store().take(output_path)
+
+        assert image is not None
+        assert image.startswith(b"\x89PNG")
+        assert not Path(output_path).exists()
+
+    def test_defaults_without_config(self) -> None:
+        """Test that graphs without a configuration use the PNG defaults."""
+        assert OutputTestGraph().get_image_output_options() == ImageOutputOptions()
@@ -0,0 +1,139 @@
+"""
+Tests for the persistent media resolution cache in TGraph Bot.
+
+This module tests expiry of known and unknown resolutions and that the
+resolution graphs' metadata lookup only fetches rating keys it has not
+cached yet.
+"""
+
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.data.data_fetcher import DataFetcher
+from src.tgraph_bot.graphs.graph_modules.data.data_processor import DataProcessor
+from src.tgraph_bot.graphs.graph_modules.data.metadata_cache import (
+    MISSING_RESOLUTION_TTL_SECONDS,
+    RESOLUTION_TTL_SECONDS,
+    ResolutionMetadataCache,
+)
+from tests.utils.test_helpers import create_test_config
+
+KNOWN = {"video_resolution": "1920x1080", "stream_video_resolution": "1920x1080"}
+UNKNOWN = {"video_resolution": "unknown", "stream_video_resolution": "unknown"}
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResolutionMetadataCache:
+    """Create a cache in a temporary directory."""
+    return ResolutionMetadataCache(tmp_path / "resolution_metadata.sqlite3")
+
+
+class TestResolutionMetadataCache:
+    """Test cases for ResolutionMetadataCache."""
+
+    def test_round_trip(self, cache: ResolutionMetadataCache) -> None:
+        """Test storing and reading resolutions."""
+        cache.store_many({"1": KNOWN, "2": UNKNOWN}, now=1000.0)
+
+        assert cache.get_many(["1", "2", "3"], now=1000.0) == {"1": KNOWN, "2": UNKNOWN}
+
+    def test_unknown_resolutions_expire_sooner(
+        self, cache: ResolutionMetadataCache
+    ) -> None:
+        """Test that negative entries use the shorter time to live."""
+        cache.store_many({"1": KNOWN, "2": UNKNOWN}, now=0.0)
+
+        later = MISSING_RESOLUTION_TTL_SECONDS + 1.0
+        assert cache.get_many(["1", "2"], now=later) == {"1": KNOWN}
+
+        much_later = RESOLUTION_TTL_SECONDS + 1.0
+        assert cache.get_many(["1", "2"], now=much_later) == {}
+
+    def test_many_rating_keys(self, cache: ResolutionMetadataCache) -> None:
+        """Test lookups with more keys than fit in one query."""
+        keys = [str(key) for key in range(1200)]
+        cache.store_many(dict.fromkeys(keys, KNOWN))
+
+        assert len(cache.get_many(keys)) == 1200
+
+
+class TestResolutionMetadataLookup:
+    """Test cases for the cached metadata lookup in DataProcessor."""
+
+    @pytest.mark.asyncio
+    async def test_only_new_rating_keys_are_fetched(
+        self, cache: ResolutionMetadataCache
+    ) -> None:
+        """Test that cached and negatively cached keys are not fetched again."""
+        requested: list[str] = []
+
+        async def fake_fetch(_fetcher: DataFetcher, rating_key: str) -> dict[str, str]:
+            requested.append(rating_key)
+            if rating_key == "3":
+                raise TimeoutError("Tautulli did not respond")
+            return KNOWN if rating_key == "1" else UNKNOWN
+
+        processor = DataProcessor()
+        with (
+            patch(
+                "tgraph_bot.config.manager.ConfigManager.load_config",
+                return_value=create_test_config(),
+            ),
+            patch(
+                "src.tgraph_bot.graphs.graph_modules.data.metadata_cache.get_resolution_metadata_cache",
+                return_value=cache,
+            ),
+            patch.object(processor, "_fetch_single_metadata", side_effect=fake_fetch),
+        ):
+            first = await processor._fetch_resolution_metadata_optimized(  # pyright: ignore[reportPrivateUsage]
+                {"1", "2", "3"}
+            )
+            requested_first = sorted(requested)
+            requested.clear()
+            second = await processor._fetch_resolution_metadata_optimized(  # pyright: ignore[reportPrivateUsage]
+                {"1", "2", "3"}
+            )
+
+        assert requested_first == ["1", "2", "3"]
+        # Only the failed lookup is retried
+        assert requested == ["3"]
+        assert first == second == {"1": KNOWN, "2": UNKNOWN, "3": UNKNOWN}
+
+    @pytest.mark.asyncio
+    async def test_unparseable_rating_keys_are_cached_as_missing(
+        self, cache: ResolutionMetadataCache
+    ) -> None:
+        """Test that non-numeric rating keys are not requested or retried."""
+        fetcher = MagicMock()
+        fetcher.get_media_metadata = AsyncMock(return_value={})
+        fetcher.get_concurrency_stats.return_value = {"limit": 1, "throughput": 0}
+
+        async def fetch_many(
+            fetch: Callable[[str], Awaitable[dict[str, str]]], keys: list[str]
+        ) -> list[dict[str, str]]:
+            return [await fetch(key) for key in keys]
+
+        fetcher.fetch_many = fetch_many
+
+        processor = DataProcessor()
+        with (
+            patch(
+                "tgraph_bot.config.manager.ConfigManager.load_config",
+                return_value=create_test_config(),
+            ),
+            patch(
+                "src.tgraph_bot.graphs.graph_modules.data.metadata_cache.get_resolution_metadata_cache",
+                return_value=cache,
+            ),
+        ):
+            for _ in range(2):
+                result = await processor._fetch_resolution_metadata_optimized(  # pyright: ignore[reportPrivateUsage]
+                    {"abc"}, fetcher
+                )
+                assert result == {"abc": UNKNOWN}
+
+        fetcher.get_media_metadata.assert_not_awaited()
+        assert cache.get_many({"abc"}) == {"abc": UNKNOWN}
@@ -39,6 +39,9 @@ from tests.utils.graph_helpers import (
 )
 
 if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
     from src.tgraph_bot.config.schema import TGraphBotConfig
 
 
@@ -336,6 +339,33 @@ class TestPerformanceRegression:
             f"Slowest cleanup {max_cleanup_time:.3f}s, expected < 0.1s"
         )
 
+    def test_figure_pool_reuses_figures_across_graphs(self) -> None:
+        """Test that graphs of the same size draw on one pooled figure."""
+        from tests.utils.test_helpers import create_test_config_custom
+
+        figures: list[Figure] = []
+
+        class RecordingGraph(PerformanceTestGraph):
+            @override
+            def setup_figure(self) -> tuple[Figure, Axes]:
+                figure, axes = super().setup_figure()
+                figures.append(figure)
+                return figure, axes
+
+        # Timings are compared by scripts/benchmarks/figure_pool.py
+        with matplotlib_cleanup():
+            for figure_pool in (False, True):
+                config = create_test_config_custom(
+                    graphs_overrides={"rendering": {"figure_pool": figure_pool}}
+                )
+                for _ in range(3):
+                    graph = RecordingGraph(config=config, complexity_level=3)
+                    Path(graph.generate({})).unlink(missing_ok=True)
+
+        created, pooled = figures[:3], figures[3:]
+        assert len({id(figure) for figure in created}) == 3
+        assert all(figure is pooled[0] for figure in pooled)
+
     def test_large_data_processing_performance(self) -> None:
         """Test performance with larger datasets."""
         # Create larger test dataset
@@ -0,0 +1,250 @@
+"""
+Tests for the shared ProcessedHistory container in TGraph Bot.
+
+This module tests that play history is processed once per update cycle,
+shared across graphs, and that graphs fall back to processing raw data
+when no shared history is present. It also tests the resolution-enriched
+history shared by the resolution graphs.
+"""
+
+import dataclasses
+from collections.abc import Mapping
+from typing import override
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.core.base_graph import BaseGraph
+from src.tgraph_bot.graphs.graph_modules.data.data_processor import data_processor
+from src.tgraph_bot.graphs.graph_modules.data.processed_history import (
+    PROCESSED_HISTORY_KEY,
+    RESOLUTION_HISTORY_KEY,
+    ProcessedHistory,
+    get_processed_history,
+    get_resolution_history,
+    with_processed_history,
+    with_resolution_history,
+)
+from src.tgraph_bot.graphs.graph_modules.utils.record_store import PlayRecordStore
+
+
+def _make_graph_data() -> dict[str, object]:
+    """Create graph data in the structure produced by GraphManager."""
+    return {
+        "data": {
+            "data": [
+                {
+                    "date": 1704100000,
+                    "user": "alice",
+                    "platform": "Plex Web",
+                    "media_type": "movie",
+                    "duration": 3600,
+                    "transcode_decision": "direct play",
+                    "rating_key": 101,
+                },
+                {
+                    "date": 1704200000,
+                    "user": "bob",
+                    "platform": "Android",
+                    "media_type": "episode",
+                    "duration": 1800,
+                    "transcode_decision": "transcode",
+                    "rating_key": 202,
+                },
+            ],
+            "recordsFiltered": 2,
+            "recordsTotal": 2,
+        },
+        "monthly_plays": {},
+        "time_range_days": 30,
+    }
+
+
+class RecordingGraph(BaseGraph):
+    """Minimal graph that only records the processed records it receives."""
+
+    @override
+    def generate(self, data: Mapping[str, object]) -> str:
+        """Return the number of processed records as the 'path'."""
+        return str(len(self.get_processed_records(data)))
+
+    @override
+    def get_title(self) -> str:
+        """Get the title for this test graph."""
+        return "Recording Graph"
+
+
+class ResolutionRecordingGraph(BaseGraph):
+    """Minimal graph that returns the source resolutions it receives."""
+
+    @override
+    def generate(self, data: Mapping[str, object]) -> str:
+        """Return the source resolutions joined as the 'path'."""
+        records = self.get_resolution_records(data)
+        return ",".join(str(record.get("video_resolution")) for record in records)
+
+    @override
+    def get_title(self) -> str:
+        """Get the title for this test graph."""
+        return "Resolution Recording Graph"
+
+
+RESOLUTIONS = {
+    "101": {"video_resolution": "3840x2160", "stream_video_resolution": "1920x1080"},
+    "202": {"video_resolution": "1280x720", "stream_video_resolution": "1280x720"},
+}
+
+
+class TestProcessedHistory:
+    """Test cases for the ProcessedHistory container."""
+
+    def test_from_graph_data_processes_records(self) -> None:
+        """Test building processed history from graph data."""
+        history = ProcessedHistory.from_graph_data(_make_graph_data())
+
+        assert len(history) == 2
+        assert len(history.raw_records) == 2
+        assert history.records[0]["user"] == "alice"
+        assert history.records[1].get("transcode_decision") == "transcode"
+
+    def test_history_is_immutable(self) -> None:
+        """Test that the history cannot be reassigned or mutated in place."""
+        history = ProcessedHistory.from_graph_data(_make_graph_data())
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            history.records = PlayRecordStore.empty()  # pyright: ignore[reportAttributeAccessIssue]
+        assert isinstance(history.records, PlayRecordStore)
+        assert isinstance(history.raw_records, tuple)
+
+    def test_get_records_returns_shared_store(self) -> None:
+        """Test that the read-only columnar store is shared without copying."""
+        history = ProcessedHistory.from_graph_data(_make_graph_data())
+
+        records = history.get_records()
+
+        assert records is history.records
+        assert [record["user"] for record in records] == ["alice", "bob"]
+
+    def test_get_processed_history(self) -> None:
+        """Test retrieving the shared history from graph data."""
+        data = _make_graph_data()
+        assert get_processed_history(data) is None
+
+        data[PROCESSED_HISTORY_KEY] = "not a history"
+        assert get_processed_history(data) is None
+
+        history = ProcessedHistory.from_graph_data(data)
+        data[PROCESSED_HISTORY_KEY] = history
+        assert get_processed_history(data) is history
+
+    def test_with_processed_history_does_not_mutate_input(self) -> None:
+        """Test that attaching the history returns a new dictionary."""
+        data = _make_graph_data()
+
+        result = with_processed_history(data)
+
+        assert PROCESSED_HISTORY_KEY not in data
+        history = get_processed_history(result)
+        assert history is not None
+        assert len(history) == 2
+
+    def test_with_processed_history_reuses_existing_history(self) -> None:
+        """Test that existing shared history is not rebuilt."""
+        data = with_processed_history(_make_graph_data())
+
+        with patch.object(ProcessedHistory, "from_graph_data") as mock_build:
+            result = with_processed_history(data)
+
+        mock_build.assert_not_called()
+        assert result[PROCESSED_HISTORY_KEY] is data[PROCESSED_HISTORY_KEY]
+
+    def test_with_processed_history_tolerates_processing_errors(self) -> None:
+        """Test that processing errors leave graphs to fall back on raw data."""
+        data = _make_graph_data()
+
+        with patch.object(
+            ProcessedHistory, "from_graph_data", side_effect=ValueError("bad data")
+        ):
+            result = with_processed_history(data)
+
+        assert PROCESSED_HISTORY_KEY not in result
+        assert result["data"] is data["data"]
+
+
+class TestBaseGraphProcessedRecords:
+    """Test cases for BaseGraph.get_processed_records."""
+
+    def test_uses_shared_history_without_reprocessing(self) -> None:
+        """Test that graphs consume the shared history instead of parsing again."""
+        data = with_processed_history(_make_graph_data())
+        graph = RecordingGraph()
+
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.core.base_graph.data_processor"
+        ) as mock_processor:
+            assert graph.generate(data) == "2"
+
+        mock_processor.extract_and_process_play_history.assert_not_called()  # pyright: ignore[reportAny]
+
+    def test_falls_back_to_processing_raw_data(self) -> None:
+        """Test that graphs still work when no shared history is provided."""
+        graph = RecordingGraph()
+
+        assert graph.generate(_make_graph_data()) == "2"
+
+
+class TestResolutionHistory:
+    """Test cases for the resolution-enriched history."""
+
+    @pytest.mark.asyncio
+    async def test_metadata_is_looked_up_once_with_given_fetcher(self) -> None:
+        """Test that resolutions are looked up once with the manager's fetcher."""
+        fetcher = MagicMock()
+        lookup = AsyncMock(return_value=RESOLUTIONS)
+
+        with patch.object(
+            data_processor, "_fetch_resolution_metadata_optimized", lookup
+        ):
+            data = await with_resolution_history(_make_graph_data(), fetcher=fetcher)
+            data = await with_resolution_history(data, fetcher=fetcher)
+
+        lookup.assert_awaited_once()
+        assert lookup.await_args is not None
+        assert lookup.await_args.args == ({"101", "202"}, fetcher, None)
+        history = get_resolution_history(data)
+        assert history is not None
+        assert [
+            record.get("stream_video_resolution") for record in history.records
+        ] == [
+            "1920x1080",
+            "1280x720",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_lookup_errors_leave_data_unchanged(self) -> None:
+        """Test that a failed lookup does not attach an enriched history."""
+        lookup = AsyncMock(side_effect=RuntimeError("Tautulli is down"))
+
+        with patch.object(
+            data_processor, "_fetch_resolution_metadata_optimized", lookup
+        ):
+            result = await with_resolution_history(_make_graph_data())
+
+        assert RESOLUTION_HISTORY_KEY not in result
+
+    @pytest.mark.asyncio
+    async def test_graphs_consume_enriched_history(self) -> None:
+        """Test that graphs read resolutions from the enriched history."""
+        lookup = AsyncMock(return_value=RESOLUTIONS)
+        with patch.object(
+            data_processor, "_fetch_resolution_metadata_optimized", lookup
+        ):
+            data = await with_resolution_history(_make_graph_data())
+
+        assert ResolutionRecordingGraph().generate(data) == "3840x2160,1280x720"
+
+    def test_graphs_fall_back_to_play_history_resolutions(self) -> None:
+        """Test that graphs work without the enriched history."""
+        assert (
+            ResolutionRecordingGraph().generate(_make_graph_data()) == "unknown,unknown"
+        )
@@ -0,0 +1,260 @@
+"""
+Tests for the columnar PlayRecordStore in TGraph Bot.
+
+This module tests that the store round-trips processed records, keeps its
+columns compact and read-only, and is accepted by the aggregation functions
+in place of a list of processed records.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.utils.record_store import (
+    MISSING_CODE,
+    CategoricalColumn,
+    PlayRecordStore,
+    filter_records_since,
+)
+from src.tgraph_bot.graphs.graph_modules.utils.utils import (
+    ProcessedPlayRecord,
+    ProcessedRecords,
+    aggregate_by_date,
+    aggregate_by_day_of_week,
+    aggregate_by_hour_of_day,
+    aggregate_by_month,
+    aggregate_by_month_separated,
+    aggregate_by_platform_and_stream_type,
+    aggregate_by_resolution,
+    aggregate_by_stream_type,
+    aggregate_top_platforms,
+    aggregate_top_users,
+    aggregate_top_users_separated,
+    calculate_concurrent_streams_by_date,
+    filter_records_by_stream_type,
+)
+
+
+def _make_record(
+    timestamp: int,
+    user: str,
+    platform: str,
+    media_type: str,
+    transcode_decision: str | None = "direct play",
+) -> ProcessedPlayRecord:
+    """Create a processed record the way process_play_history_data does."""
+    record: ProcessedPlayRecord = {
+        "date": str(timestamp),
+        "user": user,
+        "platform": platform,
+        "media_type": media_type,
+        "duration": 1800,
+        "stopped": timestamp + 1800,
+        "paused_counter": 0,
+        "datetime": datetime.fromtimestamp(timestamp),
+        "video_resolution": "1080",
+        "stream_video_resolution": "720",
+        "video_codec": "h264",
+        "audio_codec": "aac",
+        "container": "mkv",
+    }
+    if transcode_decision is not None:
+        record["transcode_decision"] = transcode_decision
+    return record
+
+
+@pytest.fixture
+def records() -> ProcessedRecords:
+    """Create a small history spread over several days and hours."""
+    base = int(datetime(2024, 3, 1, 8, 0).timestamp())
+    users = ["alice", "bob", "carol", "alice", "alice", "bob"]
+    platforms = ["Plex Web", "Android", "Roku", "Plex Web", "Android", "Roku"]
+    media_types = ["movie", "episode", "movie", "track", "episode", "movie"]
+    decisions = ["direct play", "transcode", "copy", None, "transcode", "direct play"]
+
+    return [
+        _make_record(base + index * 27_000, user, platform, media_type, decision)
+        for index, (user, platform, media_type, decision) in enumerate(
+            zip(users, platforms, media_types, decisions)
+        )
+    ]
+
+
+class TestCategoricalColumn:
+    """Test cases for dictionary-encoded columns."""
+
+    def test_encode_assigns_codes_in_first_seen_order(self) -> None:
+        """Test that repeated values share one code."""
+        column = CategoricalColumn.encode(["b", "a", "b", None])
+
+        assert column.categories == ("b", "a")
+        assert column.codes.tolist() == [0, 1, 0, MISSING_CODE]
+        assert column.codes.dtype == np.int32
+
+    def test_value_at_decodes_missing_values(self) -> None:
+        """Test decoding values including missing ones."""
+        column = CategoricalColumn.encode(["x", None])
+
+        assert column.value_at(0) == "x"
+        assert column.value_at(1) is None
+
+
+class TestPlayRecordStore:
+    """Test cases for PlayRecordStore."""
+
+    def test_round_trip_preserves_records(self, records: ProcessedRecords) -> None:
+        """Test that records materialized from the store equal the input."""
+        store = PlayRecordStore.from_records(records)
+
+        assert len(store) == len(records)
+        assert store.to_records() == records
+        assert store[-1] == records[-1]
+
+    def test_missing_optional_fields_stay_missing(
+        self, records: ProcessedRecords
+    ) -> None:
+        """Test that absent NotRequired fields are not invented."""
+        store = PlayRecordStore.from_records(records)
+
+        assert "transcode_decision" not in store[3]
+        assert store[3].get("transcode_decision", "unknown") == "unknown"
+
+    def test_original_date_strings_are_kept(self) -> None:
+        """Test that non-timestamp 'date' values survive the round trip."""
+        record = _make_record(1_709_280_000, "alice", "Roku", "movie")
+        record["date"] = "2024-03-01"
+
+        store = PlayRecordStore.from_records([record])
+
+        assert store[0]["date"] == "2024-03-01"
+
+    def test_columns_use_compact_dtypes(self, records: ProcessedRecords) -> None:
+        """Test the storage types of the numeric and categorical columns."""
+        store = PlayRecordStore.from_records(records)
+
+        assert store.timestamps.dtype == np.int64
+        assert store.durations.dtype == np.int32
+        assert store.column("user").categories == ("alice", "bob", "carol")
+        assert store.column("user").codes.dtype == np.int32
+
+    def test_columns_are_read_only(self, records: ProcessedRecords) -> None:
+        """Test that shared stores cannot be modified in place."""
+        store = PlayRecordStore.from_records(records)
+
+        with pytest.raises(ValueError):
+            store.timestamps[0] = 0
+
+    def test_slicing_and_take_return_stores(self, records: ProcessedRecords) -> None:
+        """Test selecting subsets of records."""
+        store = PlayRecordStore.from_records(records)
+
+        sliced = store[1:3]
+        assert isinstance(sliced, PlayRecordStore)
+        assert sliced.to_records() == records[1:3]
+
+        taken = store.take(np.array([True, False, False, False, False, True]))
+        assert taken.to_records() == [records[0], records[5]]
+
+    def test_fingerprint_identifies_contents(self, records: ProcessedRecords) -> None:
+        """Test that equal records have equal fingerprints and others do not."""
+        store = PlayRecordStore.from_records(records)
+
+        assert (
+            store.fingerprint() == PlayRecordStore.from_records(records).fingerprint()
+        )
+        assert store.fingerprint() != store[1:].fingerprint()
+        changed: ProcessedPlayRecord = {**records[-1], "platform": "Apple TV"}
+        other = PlayRecordStore.from_records([*records[:-1], changed])
+        assert store.fingerprint() != other.fingerprint()
+
+    def test_index_out_of_range(self, records: ProcessedRecords) -> None:
+        """Test that out-of-range positions raise IndexError."""
+        store = PlayRecordStore.from_records(records)
+
+        with pytest.raises(IndexError):
+            _ = store[len(records)]
+
+    def test_empty_store(self) -> None:
+        """Test that an empty store behaves like an empty list."""
+        store = PlayRecordStore.empty()
+
+        assert len(store) == 0
+        assert not store
+        assert aggregate_by_hour_of_day(store) == {hour: 0 for hour in range(24)}
+
+    def test_uses_less_memory_than_records(self) -> None:
+        """Test that repeated values are stored far more compactly."""
+        base = int(datetime(2024, 1, 1).timestamp())
+        records = [
+            _make_record(base + index * 60, f"user{index % 20}", "Roku", "movie")
+            for index in range(5000)
+        ]
+
+        store = PlayRecordStore.from_records(records)
+
+        # Timestamps, durations, stop times, pause counters and nine code columns
+        assert store.nbytes < len(records) * 64
+
+
+class TestFilterRecordsSince:
+    """Test cases for filter_records_since."""
+
+    def test_store_and_list_filter_identically(
+        self, records: ProcessedRecords
+    ) -> None:
+        """Test that filtering a store matches filtering a list."""
+        store = PlayRecordStore.from_records(records)
+        cutoff = records[2]["datetime"] - timedelta(seconds=1)
+
+        filtered_store = filter_records_since(store, cutoff)
+
+        assert isinstance(filtered_store, PlayRecordStore)
+        assert list(filtered_store) == filter_records_since(records, cutoff)
+        assert len(filtered_store) == 4
+
+
+class TestAggregationAcceptsStore:
+    """Test that aggregation functions accept a PlayRecordStore."""
+
+    def test_time_aggregations_match(self, records: ProcessedRecords) -> None:
+        """Test date, day-of-week, hour and month aggregations."""
+        store = PlayRecordStore.from_records(records)
+
+        assert aggregate_by_date(store, fill_missing_dates=False) == aggregate_by_date(
+            records, fill_missing_dates=False
+        )
+        assert aggregate_by_day_of_week(store) == aggregate_by_day_of_week(records)
+        assert aggregate_by_hour_of_day(store) == aggregate_by_hour_of_day(records)
+        assert aggregate_by_month(store) == aggregate_by_month(records)
+        assert aggregate_by_month_separated(store) == aggregate_by_month_separated(
+            records
+        )
+
+    def test_top_n_aggregations_match(self, records: ProcessedRecords) -> None:
+        """Test top users and platforms aggregations."""
+        store = PlayRecordStore.from_records(records)
+
+        assert aggregate_top_users(store, censor=False) == aggregate_top_users(
+            records, censor=False
+        )
+        assert aggregate_top_platforms(store) == aggregate_top_platforms(records)
+        assert aggregate_top_users_separated(store) == aggregate_top_users_separated(
+            records
+        )
+
+    def test_stream_type_aggregations_match(self, records: ProcessedRecords) -> None:
+        """Test stream type, resolution and concurrent stream aggregations."""
+        store = PlayRecordStore.from_records(records)
+
+        assert aggregate_by_stream_type(store) == aggregate_by_stream_type(records)
+        assert aggregate_by_resolution(store) == aggregate_by_resolution(records)
+        assert aggregate_by_platform_and_stream_type(
+            store
+        ) == aggregate_by_platform_and_stream_type(records)
+        assert calculate_concurrent_streams_by_date(
+            store
+        ) == calculate_concurrent_streams_by_date(records)
+        assert filter_records_by_stream_type(
+            store, "transcode"
+        ) == filter_records_by_stream_type(records, "transcode")
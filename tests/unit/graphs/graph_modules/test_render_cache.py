@@ -0,0 +1,160 @@
+"""
+Tests for the rendered graph cache in TGraph Bot.
+
+This module tests the render cache index, the cache keys of date dependent
+graphs and that GraphFactory reuses graphs whose inputs have not changed.
+"""
+
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules import GraphFactory
+from src.tgraph_bot.graphs.graph_modules.core.render_cache import (
+    RENDER_CACHE_TTL_SECONDS,
+    RenderCache,
+    compute_render_key,
+    fingerprint_graph_data,
+)
+from src.tgraph_bot.graphs.graph_modules.data.processed_history import (
+    RESOLUTION_HISTORY_KEY,
+    ProcessedHistory,
+    with_processed_history,
+)
+from tests.utils.test_helpers import create_test_config_custom
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> RenderCache:
+    """Create a cache in a temporary directory."""
+    return RenderCache(tmp_path / "render_cache.sqlite3")
+
+
+def _graph_data(plays: list[dict[str, object]]) -> dict[str, object]:
+    """Create graph data with a shared processed history."""
+    return with_processed_history(
+        {"play_history": {"data": plays}, "time_range_days": 30}
+    )
+
+
+class TestRenderCache:
+    """Test cases for RenderCache."""
+
+    def test_round_trip(self, cache: RenderCache, tmp_path: Path) -> None:
+        """Test remembering and looking up a rendered image."""
+        image = tmp_path / "top_10_users.png"
+        _ = image.write_bytes(b"png")
+        cache.store("key", "top_10_users", str(image), now=1000.0)
+
+        assert cache.get("key", now=1000.0) == str(image)
+        assert cache.get("other", now=1000.0) is None
+        assert cache.get("key", now=1000.0 + RENDER_CACHE_TTL_SECONDS + 1) is None
+
+    def test_deleted_image_is_not_reused(
+        self, cache: RenderCache, tmp_path: Path
+    ) -> None:
+        """Test that images removed from the graph storage are rendered again."""
+        image = tmp_path / "top_10_users.png"
+        _ = image.write_bytes(b"png")
+        cache.store("key", "top_10_users", str(image))
+        image.unlink()
+
+        assert cache.get("key") is None
+
+
+class TestRenderKeys:
+    """Test cases for render cache keys."""
+
+    def test_daily_graphs_change_with_the_date(self) -> None:
+        """Test that only date dependent graphs are keyed by the date."""
+        today = date(2024, 3, 1)
+        tomorrow = date(2024, 3, 2)
+
+        for graph_type, changes in (
+            ("daily_play_count", True),
+            ("top_10_users", False),
+        ):
+            key_today = compute_render_key(graph_type, "data", "config", "en", today)
+            key_tomorrow = compute_render_key(
+                graph_type, "data", "config", "en", tomorrow
+            )
+            assert (key_today != key_tomorrow) is changes
+
+    def test_data_without_processed_history_is_not_cached(self) -> None:
+        """Test that graphs without the shared history are always rendered."""
+        assert fingerprint_graph_data({"play_history": {"data": []}}) is None
+        assert fingerprint_graph_data(_graph_data([])) is not None
+
+    def test_resolution_history_changes_the_fingerprint(self) -> None:
+        """Test that looked up resolutions are part of the data fingerprint."""
+        play: dict[str, object] = {"date": 1704100000, "user": "alice", "duration": 60}
+        data = _graph_data([play])
+        enriched = {
+            **data,
+            RESOLUTION_HISTORY_KEY: ProcessedHistory.from_graph_data(
+                {"data": [{**play, "video_resolution": "1920x1080"}]}
+            ),
+        }
+
+        assert fingerprint_graph_data(enriched) is not None
+        assert fingerprint_graph_data(enriched) != fingerprint_graph_data(data)
+
+
+class TestGraphFactoryRenderCache:
+    """Test cases for reusing rendered graphs in GraphFactory."""
+
+    def test_unchanged_graphs_are_reused(self, cache: RenderCache) -> None:
+        """Test that graphs are only rendered again when their data changes."""
+        config = create_test_config_custom(
+            graphs_overrides={
+                "features": {
+                    "enabled_types": {
+                        "daily_play_count": False,
+                        "play_count_by_dayofweek": False,
+                        "play_count_by_hourofday": True,
+                        "top_10_platforms": False,
+                        "top_10_users": True,
+                        "play_count_by_month": False,
+                        "daily_play_count_by_stream_type": False,
+                        "daily_concurrent_stream_count_by_stream_type": False,
+                        "play_count_by_source_resolution": False,
+                        "play_count_by_stream_resolution": False,
+                        "play_count_by_platform_and_stream_type": False,
+                        "play_count_by_user_and_stream_type": False,
+                    }
+                }
+            }
+        )
+        factory = GraphFactory(config)
+        play: dict[str, object] = {
+            "date": 1709280000,
+            "user": "alice",
+            "platform": "Plex Web",
+            "media_type": "movie",
+            "duration": 1800,
+            "stopped": 1709281800,
+        }
+
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.core.graph_factory.get_render_cache",
+            return_value=cache,
+        ):
+            first = factory.generate_all_graphs(_graph_data([play]))
+            with patch.object(
+                factory,
+                "_render_graph",
+                wraps=factory._render_graph,  # pyright: ignore[reportPrivateUsage]
+            ) as render_graph:
+                second = factory.generate_all_graphs(_graph_data([play]))
+                assert render_graph.call_count == 0
+
+                third = factory.generate_all_graphs(
+                    _graph_data([play, {**play, "user": "bob"}])
+                )
+                assert render_graph.call_count == 2
+
+        assert len(first) == 2
+        assert second == first
+        assert len(third) == 2
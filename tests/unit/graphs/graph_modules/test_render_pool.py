@@ -0,0 +1,236 @@
+"""
+Tests for parallel graph rendering in TGraph Bot.
+
+This module tests the render payload shared with worker processes and that
+GraphFactory returns graphs rendered in the process pool in graph order,
+falling back to in-process rendering where needed.
+"""
+
+from collections.abc import Generator
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules import GraphFactory
+from src.tgraph_bot.graphs.graph_modules.core.graph_errors import (
+    GraphGenerationError,
+)
+from src.tgraph_bot.graphs.graph_modules.core.graph_factory import (
+    _render_graph_in_worker,  # pyright: ignore[reportPrivateUsage]
+)
+from src.tgraph_bot.graphs.graph_modules.core.render_pool import (
+    create_render_payload,
+    get_render_pool,
+    load_render_payload,
+    shutdown_render_pool,
+    warm_up_rendering,
+    write_render_payload,
+)
+from src.tgraph_bot.graphs.graph_modules.data.processed_history import (
+    with_processed_history,
+)
+from src.tgraph_bot.utils.core.image_store import get_graph_image_store
+from tests.utils.test_helpers import create_test_config_custom
+
+ENABLED_TYPES = {
+    "daily_play_count": True,
+    "play_count_by_dayofweek": True,
+    "play_count_by_hourofday": True,
+    "top_10_platforms": False,
+    "top_10_users": False,
+    "play_count_by_month": False,
+    "daily_play_count_by_stream_type": False,
+    "daily_concurrent_stream_count_by_stream_type": False,
+    "play_count_by_source_resolution": False,
+    "play_count_by_stream_resolution": False,
+    "play_count_by_platform_and_stream_type": False,
+    "play_count_by_user_and_stream_type": False,
+}
+
+
+@pytest.fixture
+def factory() -> Generator[GraphFactory]:
+    """Create a factory that renders three graphs with two workers."""
+    config = create_test_config_custom(
+        graphs_overrides={
+            "features": {"enabled_types": ENABLED_TYPES},
+            "rendering": {"workers": 2, "cache_enabled": False},
+        }
+    )
+    yield GraphFactory(config)
+    shutdown_render_pool()
+
+
+@pytest.fixture
+def graph_data() -> dict[str, object]:
+    """Create graph data with a shared processed history."""
+    return with_processed_history({"play_history": {"data": []}, "time_range_days": 30})
+
+
+class TestRenderPayload:
+    """Test cases for the render payload."""
+
+    def test_round_trip(self, graph_data: dict[str, object]) -> None:
+        """Test that a worker loads the payload once per update."""
+        config = create_test_config_custom()
+        path = write_render_payload(create_render_payload(config, graph_data))
+
+        try:
+            payload = load_render_payload(path)
+            assert payload.config == config
+            assert payload.data.keys() == graph_data.keys()
+            assert load_render_payload(path) is payload
+        finally:
+            path.unlink()
+
+
+class TestWarmUp:
+    """Test cases for warming up rendering at startup."""
+
+    def test_warm_up_starts_all_workers(self) -> None:
+        """Test that every render worker is running after the warm-up."""
+        try:
+            warm_up_rendering(2)
+            pool = get_render_pool(2)
+
+            assert len(pool._processes) == 2
+        finally:
+            shutdown_render_pool()
+
+
+class TestParallelRendering:
+    """Test cases for rendering graphs in the process pool."""
+
+    def test_results_in_graph_order(
+        self, factory: GraphFactory, graph_data: dict[str, object]
+    ) -> None:
+        """Test that graphs rendered by workers are returned in graph order."""
+        paths = factory.generate_all_graphs(graph_data)
+
+        assert [Path(path).name.rsplit("_", 2)[0] for path in paths] == [
+            "daily_play_count",
+            "play_count_by_dayofweek",
+            "play_count_by_hourofday",
+        ]
+        assert all(Path(path).exists() for path in paths)
+
+    def test_images_rendered_in_memory_reach_the_bot(
+        self, graph_data: dict[str, object]
+    ) -> None:
+        """Test that images rendered in memory by workers are handed back."""
+        config = create_test_config_custom(
+            graphs_overrides={
+                "features": {"enabled_types": ENABLED_TYPES},
+                "rendering": {
+                    "workers": 2,
+                    "cache_enabled": False,
+                    "in_memory": True,
+                    "archive_graphs": False,
+                },
+            }
+        )
+
+        try:
+            paths = GraphFactory(config).generate_all_graphs(graph_data)
+        finally:
+            shutdown_render_pool()
+
+        image_store = get_graph_image_store()
+        assert len(paths) == 3
+        assert all(image_store.take(path) is not None for path in paths)
+        assert not any(Path(path).exists() for path in paths)
+
+    def test_broken_pool_renders_sequentially(
+        self, factory: GraphFactory, graph_data: dict[str, object]
+    ) -> None:
+        """Test that graphs are rendered in-process when the pool breaks."""
+        pool = MagicMock()
+        pool.submit.return_value.result.side_effect = BrokenProcessPool("worker died")  # pyright: ignore[reportAny]
+
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.core.graph_factory.get_render_pool",
+            return_value=pool,
+        ):
+            paths = factory.generate_all_graphs(graph_data)
+
+        assert len(paths) == 3
+
+    def test_worker_reports_graph_failures(
+        self, graph_data: dict[str, object]
+    ) -> None:
+        """Test that a graph failing in a worker is reported as a graph error."""
+        graph = MagicMock()
+        graph.generate.side_effect = ValueError("bad data")  # pyright: ignore[reportAny]
+        path = write_render_payload(
+            create_render_payload(create_test_config_custom(), graph_data)
+        )
+
+        try:
+            with (
+                patch.object(GraphFactory, "create_graph_by_type", return_value=graph),
+                pytest.raises(GraphGenerationError, match="bad data"),
+            ):
+                _ = _render_graph_in_worker(path, "daily_play_count")
+        finally:
+            path.unlink()
+
+    def test_failed_graph_is_skipped(
+        self, factory: GraphFactory, graph_data: dict[str, object]
+    ) -> None:
+        """Test that one graph failing in a worker does not affect the others."""
+        results = [
+            ("first.png", None),
+            GraphGenerationError("PlayCountByDayOfWeekGraph: bad data"),
+            ("third.png", None),
+        ]
+        pool = MagicMock()
+        pool.submit.return_value.result.side_effect = results  # pyright: ignore[reportAny]
+
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.core.graph_factory.get_render_pool",
+            return_value=pool,
+        ):
+            paths = factory._render_in_pool(  # pyright: ignore[reportPrivateUsage]
+                factory.create_enabled_graphs(), graph_data, 2
+            )
+
+        assert paths == ["first.png", None, "third.png"]
+
+    def test_unexpected_errors_are_not_hidden(
+        self, factory: GraphFactory, graph_data: dict[str, object]
+    ) -> None:
+        """Test that errors other than graph and pool failures propagate."""
+        pool = MagicMock()
+        pool.submit.return_value.result.side_effect = RuntimeError("bug")  # pyright: ignore[reportAny]
+
+        with (
+            patch(
+                "src.tgraph_bot.graphs.graph_modules.core.graph_factory.get_render_pool",
+                return_value=pool,
+            ),
+            pytest.raises(RuntimeError, match="bug"),
+        ):
+            _ = factory._render_in_pool(  # pyright: ignore[reportPrivateUsage]
+                factory.create_enabled_graphs(), graph_data, 2
+            )
+
+    def test_single_worker_renders_in_process(
+        self, graph_data: dict[str, object]
+    ) -> None:
+        """Test that one worker keeps rendering in the bot process."""
+        config = create_test_config_custom(
+            graphs_overrides={
+                "features": {"enabled_types": ENABLED_TYPES},
+                "rendering": {"cache_enabled": False},
+            }
+        )
+
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.core.graph_factory.get_render_pool"
+        ) as mock_get_pool:
+            paths = GraphFactory(config).generate_all_graphs(graph_data)
+
+        mock_get_pool.assert_not_called()
+        assert len(paths) == 3
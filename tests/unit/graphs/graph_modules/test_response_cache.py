@@ -0,0 +1,166 @@
+"""
+Tests for the Tautulli API response cache in TGraph Bot.
+
+This module tests expiry per command, LRU eviction, hit and miss counters
+and sharing one cache between several DataFetcher instances.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.data.data_fetcher import DataFetcher
+from src.tgraph_bot.graphs.graph_modules.data.response_cache import (
+    ResponseCache,
+    get_response_cache,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_entries_expire_per_command(self) -> None:
+        """Test that each command uses its own time to live."""
+        clock = FakeClock()
+        cache = ResponseCache(
+            command_ttls={"get_history": 60.0, "get_users": 3600.0}, clock=clock
+        )
+        cache.set("history", "get_history", {"rows": 1})
+        cache.set("users", "get_users", {"users": 2})
+
+        clock.now = 61.0
+
+        assert cache.get("history") is None
+        assert cache.get("users") == {"users": 2}
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """Test that the size bound evicts the least recently used entry."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "get_users", {"key": "a"})
+        cache.set("b", "get_users", {"key": "b"})
+        _ = cache.get("a")
+
+        cache.set("c", "get_users", {"key": "c"})
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == {"key": "a"}
+
+    def test_expired_entries_are_evicted_first(self) -> None:
+        """Test that expired entries make room before live ones are evicted."""
+        clock = FakeClock()
+        cache = ResponseCache(
+            max_entries=2,
+            command_ttls={"get_history": 10.0, "get_users": 100.0},
+            clock=clock,
+        )
+        cache.set("users", "get_users", {})
+        cache.set("history", "get_history", {})
+        clock.now = 20.0
+
+        cache.set("more_users", "get_users", {})
+
+        assert cache.get("users") == {}
+        assert cache.get("more_users") == {}
+
+    def test_hit_and_miss_counters(self) -> None:
+        """Test that lookups are counted."""
+        cache = ResponseCache()
+        cache.set("a", "get_users", {})
+
+        _ = cache.get("a")
+        _ = cache.get("a")
+        _ = cache.get("b")
+
+        assert cache.get_stats() == {
+            "entries": 1,
+            "hits": 2,
+            "misses": 1,
+            "hit_rate": 2 / 3,
+        }
+
+    def test_zero_ttl_is_not_cached(self) -> None:
+        """Test that commands with a zero time to live bypass the cache."""
+        cache = ResponseCache(command_ttls={"get_activity": 0.0})
+
+        cache.set("a", "get_activity", {})
+
+        assert len(cache) == 0
+
+    def test_shared_instance(self) -> None:
+        """Test that the shared cache is a single instance."""
+        assert get_response_cache() is get_response_cache()
+
+
+class TestDataFetcherResponseCache:
+    """Test cases for DataFetcher with a shared response cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_between_fetchers(self) -> None:
+        """Test that a second fetcher reuses the first fetcher's response."""
+        cache = ResponseCache()
+        mock_response = Mock()
+        mock_response.json.return_value = {  # pyright: ignore[reportAny]
+            "response": {"result": "success", "data": {"user_id": 1}}
+        }
+        mock_response.raise_for_status.return_value = None  # pyright: ignore[reportAny]
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = mock_response
+            for _ in range(2):
+                async with DataFetcher(
+                    base_url="http://localhost:8181",
+                    api_key="key",
+                    response_cache=cache,
+                ) as fetcher:
+                    result = await fetcher.get_user_stats(user_id=1)
+                    assert result == {"user_id": 1}
+
+        assert mock_get.call_count == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_play_history_is_not_cached(self) -> None:
+        """Test that play history pages always come from Tautulli."""
+        cache = ResponseCache()
+        mock_response = Mock()
+        mock_response.json.return_value = {  # pyright: ignore[reportAny]
+            "response": {"result": "success", "data": {"data": []}}
+        }
+        mock_response.raise_for_status.return_value = None  # pyright: ignore[reportAny]
+
+        with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = mock_response
+            async with DataFetcher(
+                base_url="http://localhost:8181",
+                api_key="key",
+                response_cache=cache,
+            ) as fetcher:
+                for _ in range(2):
+                    _ = await fetcher._make_request("get_history", {"start": 0})  # pyright: ignore[reportPrivateUsage]
+
+        assert mock_get.call_count == 2
+        assert len(cache) == 0
+        assert cache.get_stats()["misses"] == 0
+
+    def test_cache_key_includes_server(self) -> None:
+        """Test that fetchers for different servers do not share entries."""
+        first = DataFetcher(base_url="http://server-a:8181", api_key="key")
+        second = DataFetcher(base_url="http://server-b:8181", api_key="key")
+
+        assert first._get_cache_key("get_users") != second._get_cache_key(  # pyright: ignore[reportPrivateUsage]
+            "get_users"
+        )
@@ -0,0 +1,92 @@
+"""
+Tests for the pooled Tautulli HTTP client in TGraph Bot.
+
+This module tests the client lifecycle and that DataFetcher borrows the
+client's connection pool without closing it.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.data.data_fetcher import DataFetcher
+from src.tgraph_bot.graphs.graph_modules.data.tautulli_client import TautulliClient
+
+
+class TestTautulliClient:
+    """Test cases for TautulliClient."""
+
+    @pytest.mark.asyncio
+    async def test_lifecycle(self) -> None:
+        """Test starting and closing the connection pool."""
+        tautulli_client = TautulliClient(max_connections=3)
+        assert not tautulli_client.is_open
+        with pytest.raises(RuntimeError, match="not started"):
+            _ = tautulli_client.client
+
+        await tautulli_client.start()
+        client = tautulli_client.client
+        await tautulli_client.start()
+
+        assert tautulli_client.is_open
+        assert tautulli_client.client is client
+
+        await tautulli_client.close()
+
+        assert not tautulli_client.is_open
+        assert client.is_closed
+
+    def test_http2_needs_h2_package(self) -> None:
+        """Test that HTTP/2 is only used when the h2 package is installed."""
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.data.tautulli_client.is_http2_available",
+            return_value=False,
+        ):
+            assert not TautulliClient(http2=True).http2
+
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.data.tautulli_client.is_http2_available",
+            return_value=True,
+        ):
+            assert TautulliClient(http2=True).http2
+            assert not TautulliClient(http2=False).http2
+
+
+class TestDataFetcherBorrowedClient:
+    """Test cases for DataFetcher with a borrowed HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_borrowed_client_stays_open(self) -> None:
+        """Test that DataFetcher uses the shared client and leaves it open."""
+        tautulli_client = TautulliClient()
+        await tautulli_client.start()
+
+        try:
+            for _ in range(2):
+                async with DataFetcher(
+                    base_url="http://localhost:8181",
+                    api_key="key",
+                    client=tautulli_client.client,
+                ) as fetcher:
+                    assert fetcher._client is tautulli_client.client  # pyright: ignore[reportPrivateUsage]
+
+            assert tautulli_client.is_open
+        finally:
+            await tautulli_client.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self) -> None:
+        """Test that a closed shared client falls back to a private one."""
+        tautulli_client = TautulliClient()
+        await tautulli_client.start()
+        borrowed = tautulli_client.client
+        await tautulli_client.close()
+
+        async with DataFetcher(
+            base_url="http://localhost:8181", api_key="key", client=borrowed
+        ) as fetcher:
+            private = fetcher._client  # pyright: ignore[reportPrivateUsage]
+            assert private is not None
+            assert private is not borrowed
+
+        assert private.is_closed
@@ -23,9 +23,13 @@ from src.tgraph_bot.graphs.graph_modules import (
     validate_graph_data,
 )
 from src.tgraph_bot.graphs.graph_modules.utils.utils import (
+    MODERN_AXES_STYLE,
+    MODERN_FONT_RC,
+    MODERN_PALETTE,
     format_date,
     format_duration,
     get_date_range,
+    get_time_range_cutoff,
     parse_date,
     sanitize_filename,
     validate_color,
@@ -91,6 +95,17 @@ class TestDateUtilities:
         assert time_diff < 1
 
 
+    @pytest.mark.parametrize("hour", [0, 9, 23])
+    def test_get_time_range_cutoff_is_stable_during_the_day(self, hour: int) -> None:
+        """Test that the time range starts at midnight whatever the time of day."""
+        with patch(
+            "src.tgraph_bot.graphs.graph_modules.utils.utils.datetime", wraps=datetime
+        ) as mock_datetime:
+            mock_datetime.now.return_value = datetime(2023, 12, 25, hour, 30)  # pyright: ignore[reportAny]
+
+            assert get_time_range_cutoff(7) == datetime(2023, 12, 19)
+            assert get_time_range_cutoff(1) == datetime(2023, 12, 25)
+
 class TestDirectoryUtilities:
     """Test cases for directory management utility functions."""
 
@@ -244,6 +259,13 @@ class TestFilenameUtilities:
         result = generate_graph_filename(graph_type, timestamp, user_id)
         assert result == "daily_play_count_user_user123_20231225_153045.png"
 
+    def test_generate_graph_filename_with_extension(self) -> None:
+        """Test graph filename generation for other image formats."""
+        timestamp = datetime(2023, 12, 25, 15, 30, 45)
+
+        result = generate_graph_filename("top_10_users", timestamp, extension=".webp")
+        assert result == "top_10_users_20231225_153045.webp"
+
     def test_generate_graph_filename_no_timestamp(self) -> None:
         """Test graph filename generation without timestamp."""
         graph_type = "daily_play_count"
@@ -451,6 +473,26 @@ class TestGraphStorageUtilities:
         # The styling effects are hard to test directly
         assert sns is not None
 
+    @pytest.mark.parametrize("grid_enabled", [True, False])
+    def test_modern_style_matches_seaborn(self, grid_enabled: bool) -> None:
+        """Test that the cached style equals the one Seaborn would set."""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        with plt.rc_context():  # pyright: ignore[reportUnknownMemberType]  # matplotlib stubs
+            apply_modern_seaborn_styling(grid_enabled=grid_enabled)
+            cached = dict(plt.rcParams)
+
+        with plt.rc_context():  # pyright: ignore[reportUnknownMemberType]  # matplotlib stubs
+            sns.set_style("whitegrid", MODERN_AXES_STYLE)
+            sns.set_palette(MODERN_PALETTE)
+            plt.rcParams.update(MODERN_FONT_RC)  # pyright: ignore[reportCallIssue, reportArgumentType]  # valid rc names
+            if not grid_enabled:
+                sns.set_style("white")
+            expected = dict(plt.rcParams)
+
+        assert cached == expected
+
 
 class TestSeparationUtilityFunctions:
     """Test cases for media type separation utility functions.
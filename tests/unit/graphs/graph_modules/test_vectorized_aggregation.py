@@ -0,0 +1,158 @@
+"""
+Parity tests for the vectorized aggregation backend in TGraph Bot.
+
+This module checks that the date, day-of-week, hour-of-day, month and top-N
+aggregations produce exactly the same output, including key order, for a
+columnar PlayRecordStore as for the equivalent list of processed records.
+"""
+
+import random
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime
+
+import pytest
+
+from src.tgraph_bot.graphs.graph_modules.utils.record_store import PlayRecordStore
+from src.tgraph_bot.graphs.graph_modules.utils.utils import (
+    PlayRecords,
+    ProcessedPlayRecord,
+    ProcessedRecords,
+    aggregate_by_date,
+    aggregate_by_date_separated,
+    aggregate_by_day_of_week,
+    aggregate_by_day_of_week_separated,
+    aggregate_by_hour_of_day,
+    aggregate_by_hour_of_day_separated,
+    aggregate_by_month,
+    aggregate_by_month_separated,
+    aggregate_top_platforms,
+    aggregate_top_platforms_separated,
+    aggregate_top_users,
+    aggregate_top_users_separated,
+)
+
+USERS = ["alice", "bob", "carol", "dave", "erin", "", "frank", "grace"]
+PLATFORMS = ["Plex Web", "Android", "Roku", "Apple TV", "Chromecast", ""]
+MEDIA_TYPES = ["movie", "episode", "track", "clip", "photo", "", "live"]
+
+
+def _make_records(count: int, seed: int) -> ProcessedRecords:
+    """Create random records spanning more than a year of history."""
+    rng = random.Random(seed)
+    start = int(datetime(2023, 1, 1).timestamp())
+    end = int(datetime(2024, 6, 30).timestamp())
+
+    records: ProcessedRecords = []
+    for _ in range(count):
+        timestamp = rng.randrange(start, end)
+        record: ProcessedPlayRecord = {
+            "date": str(timestamp),
+            "user": rng.choice(USERS),
+            "platform": rng.choice(PLATFORMS),
+            "media_type": rng.choice(MEDIA_TYPES),
+            "duration": rng.randrange(60, 10_800),
+            "stopped": timestamp,
+            "paused_counter": 0,
+            "datetime": datetime.fromtimestamp(timestamp),
+        }
+        records.append(record)
+    return records
+
+
+@pytest.fixture(params=["UTC", "Europe/Berlin", "America/New_York"])
+def local_timezone(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[str]:
+    """Run a test in several local time zones, including DST transitions."""
+    timezone_name = str(request.param)  # pyright: ignore[reportAny]
+    monkeypatch.setenv("TZ", timezone_name)
+    time.tzset()
+    yield timezone_name
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _assert_parity(
+    aggregate: Callable[[PlayRecords], object], records: ProcessedRecords
+) -> None:
+    """Assert that an aggregation gives identical, identically ordered output."""
+    expected = aggregate(records)
+    actual = aggregate(PlayRecordStore.from_records(records))
+
+    assert actual == expected
+    assert repr(actual) == repr(expected)
+
+
+AGGREGATIONS: dict[str, Callable[[PlayRecords], object]] = {
+    "date": lambda records: aggregate_by_date(records, fill_missing_dates=False),
+    "date_filled": lambda records: aggregate_by_date(records, time_range_days=30),
+    "date_separated": lambda records: aggregate_by_date_separated(
+        records, fill_missing_dates=False
+    ),
+    "day_of_week": aggregate_by_day_of_week,
+    "day_of_week_separated": aggregate_by_day_of_week_separated,
+    "hour_of_day": aggregate_by_hour_of_day,
+    "hour_of_day_separated": aggregate_by_hour_of_day_separated,
+    "month": aggregate_by_month,
+    "month_separated": aggregate_by_month_separated,
+    "top_users": lambda records: aggregate_top_users(records, limit=5),
+    "top_users_uncensored": lambda records: aggregate_top_users(
+        records, limit=10, censor=False
+    ),
+    "top_users_separated": aggregate_top_users_separated,
+    "top_platforms": lambda records: aggregate_top_platforms(records, limit=3),
+    "top_platforms_separated": aggregate_top_platforms_separated,
+}
+
+
+class TestVectorizedAggregationParity:
+    """Parity tests between list-based and vectorized aggregation."""
+
+    @pytest.mark.parametrize("name", sorted(AGGREGATIONS))
+    @pytest.mark.usefixtures("local_timezone")
+    def test_parity_on_random_history(self, name: str) -> None:
+        """Test parity for each aggregation on a random history."""
+        _assert_parity(AGGREGATIONS[name], _make_records(2000, seed=7))
+
+    @pytest.mark.parametrize("name", sorted(AGGREGATIONS))
+    def test_parity_on_empty_history(self, name: str) -> None:
+        """Test parity for each aggregation with no records."""
+        _assert_parity(AGGREGATIONS[name], [])
+
+    @pytest.mark.parametrize("name", sorted(AGGREGATIONS))
+    def test_parity_on_filtered_store(self, name: str) -> None:
+        """Test parity when the store's first-seen order differs from its categories."""
+        records = _make_records(500, seed=11)
+        subset = records[250:]
+        store = PlayRecordStore.from_records(records)[250:]
+
+        assert AGGREGATIONS[name](store) == AGGREGATIONS[name](subset)
+        assert repr(AGGREGATIONS[name](store)) == repr(AGGREGATIONS[name](subset))
+
+    def test_top_users_counts_missing_user_as_unknown(self) -> None:
+        """Test records without a user are counted under 'Unknown'."""
+        records = _make_records(50, seed=3)
+        for record in records[:5]:
+            del record["user"]  # pyright: ignore[reportGeneralTypeIssues]
+
+        _assert_parity(
+            lambda recs: aggregate_top_users(recs, limit=20, censor=False), records
+        )
+
+    @pytest.mark.usefixtures("local_timezone")
+    def test_dst_transition_hours(self) -> None:
+        """Test that plays around DST changes land in the same local hour."""
+        base = int(datetime(2024, 3, 31).timestamp())
+        records = [
+            record
+            for offset in range(0, 2 * 86_400, 600)
+            for record in _make_records(1, seed=offset)
+        ]
+        for offset, record in zip(range(0, 2 * 86_400, 600), records):
+            record["datetime"] = datetime.fromtimestamp(base + offset)
+
+        _assert_parity(aggregate_by_hour_of_day, records)
+        _assert_parity(
+            lambda recs: aggregate_by_date(recs, fill_missing_dates=False), records
+        )
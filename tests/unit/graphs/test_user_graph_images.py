@@ -0,0 +1,61 @@
+"""
+Tests for personal graph images in TGraph Bot.
+
+This module tests that personal graphs kept in memory are sent to the
+user's DM straight from their images.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from src.tgraph_bot.graphs.user_graph_manager import (
+    UserGraphImages,
+    send_user_graph_images_dm,
+)
+
+
+def _graph_images() -> UserGraphImages:
+    """Create personal graph images whose files no longer exist."""
+    return UserGraphImages(
+        user_email="user@example.com",
+        graph_files=("/missing/daily_play_count.png", "/missing/top_10_users.png"),
+        images=(b"\x89PNG first", b"\x89PNG second"),
+        processing_time=0.1,
+    )
+
+
+class TestUserGraphImages:
+    """Test cases for UserGraphImages."""
+
+    def test_discord_files_are_read_from_memory(self) -> None:
+        """Test that Discord files hold the images under their graph names."""
+        files = _graph_images().to_discord_files()
+
+        assert [file.filename for file in files] == [
+            "daily_play_count.png",
+            "top_10_users.png",
+        ]
+        assert [file.fp.read() for file in files] == [
+            b"\x89PNG first",
+            b"\x89PNG second",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_images_are_sent_without_their_files(self) -> None:
+        """Test that held images are uploaded although their files were removed."""
+        user = AsyncMock(spec=discord.User)
+        user.send.return_value = MagicMock(spec=discord.Message)  # pyright: ignore[reportAny]
+        bot = MagicMock()
+        bot.fetch_user = AsyncMock(return_value=user)
+
+        sent = await send_user_graph_images_dm(42, _graph_images(), bot)
+
+        assert sent is True
+        files: list[discord.File] = user.send.await_args.kwargs["files"]  # pyright: ignore[reportAny]
+        assert [file.filename for file in files] == [
+            "daily_play_count.png",
+            "top_10_users.png",
+        ]
+        assert all(file.fp.closed for file in files)
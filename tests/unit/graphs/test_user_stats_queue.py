@@ -0,0 +1,133 @@
+"""
+Tests for the personal statistics queue in TGraph Bot.
+
+This module tests that UserStatsQueue bounds the jobs running at once,
+reports queue positions, lets repeated requests share a job and answers
+requests from recently generated graphs.
+"""
+
+import asyncio
+
+import pytest
+
+from src.tgraph_bot.graphs.user_graph_manager import UserGraphImages
+from src.tgraph_bot.graphs.user_stats_queue import UserStatsQueue
+
+
+class _FakeGenerator:
+    """Graph generation that finishes when the test releases it."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.running: int = 0
+        self.peak: int = 0
+        self.release: asyncio.Event = asyncio.Event()
+
+    async def __call__(self, email: str) -> UserGraphImages:
+        self.calls.append(email)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            _ = await self.release.wait()
+        finally:
+            self.running -= 1
+        if email.startswith("missing"):
+            raise ValueError(f"No user found for {email}")
+        return UserGraphImages(
+            user_email=email,
+            graph_files=(f"/tmp/{email}.png",),
+            images=(b"\x89PNG",),
+            processing_time=0.1,
+        )
+
+
+class TestUserStatsQueue:
+    """Test cases for UserStatsQueue."""
+
+    @pytest.mark.asyncio
+    async def test_workers_are_bounded(self) -> None:
+        """Test that jobs beyond the worker count wait in arrival order."""
+        generate = _FakeGenerator()
+        queue = UserStatsQueue(generate, max_workers=2)
+
+        tickets = [queue.submit(f"user{index}@example.com") for index in range(4)]
+        await asyncio.sleep(0)
+
+        assert [ticket.position for ticket in tickets] == [0, 0, 1, 2]
+        assert queue.running == 2
+        assert queue.waiting == 2
+
+        generate.release.set()
+        results = await asyncio.gather(*(ticket.result() for ticket in tickets))
+
+        assert [images.user_email for images in results] == generate.calls
+        assert generate.peak == 2
+        assert queue.running == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_share_a_job(self) -> None:
+        """Test that a request for a queued email joins its job."""
+        generate = _FakeGenerator()
+        queue = UserStatsQueue(generate, max_workers=1)
+
+        _ = queue.submit("other@example.com")
+        first = queue.submit("user@example.com")
+        second = queue.submit(" User@Example.com ")
+
+        assert not first.coalesced
+        assert second.coalesced
+        assert second.position == first.position == 1
+
+        generate.release.set()
+        assert await first.result() is await second.result()
+        assert generate.calls == ["other@example.com", "user@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_generation_gets_the_submitted_email(self) -> None:
+        """Test that graphs are generated for the email as it was submitted."""
+        generate = _FakeGenerator()
+        generate.release.set()
+        queue = UserStatsQueue(generate)
+
+        images = await queue.submit("User@Example.com").result()
+        cached = queue.submit("user@example.com")
+
+        assert generate.calls == ["User@Example.com"]
+        assert await cached.result() is images
+        queue.clear()
+
+    @pytest.mark.asyncio
+    async def test_recent_graphs_answer_repeated_requests(self) -> None:
+        """Test that finished graphs are reused until the result TTL passes."""
+        generate = _FakeGenerator()
+        generate.release.set()
+        queue = UserStatsQueue(generate, result_ttl=0.05)
+
+        images = await queue.submit("user@example.com").result()
+        cached = queue.submit("user@example.com")
+
+        assert cached.cached
+        assert await cached.result() is images
+
+        await asyncio.sleep(0.06)
+        expired = queue.submit("user@example.com")
+        assert not expired.cached
+        assert await expired.result() is not images
+        assert len(generate.calls) == 2
+        queue.clear()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self) -> None:
+        """Test that a failed job fails its requests and is retried next time."""
+        generate = _FakeGenerator()
+        generate.release.set()
+        queue = UserStatsQueue(generate)
+
+        with pytest.raises(ValueError, match="No user found"):
+            _ = await queue.submit("missing@example.com").result()
+
+        retry = queue.submit("missing@example.com")
+        assert not retry.cached
+        with pytest.raises(ValueError, match="No user found"):
+            _ = await retry.result()
+        assert len(generate.calls) == 2
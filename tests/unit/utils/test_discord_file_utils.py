@@ -5,6 +5,7 @@ This module tests file validation, Discord file creation, and upload functionali
 for both channel and DM uploads with comprehensive error handling scenarios.
 """
 
+import io
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,6 +15,7 @@ import discord
 import pytest
 
 from tgraph_bot.utils.time import get_system_timezone, ensure_timezone_aware
+from src.tgraph_bot.utils.core.image_store import GraphImageStore
 from src.tgraph_bot.utils.discord.discord_file_utils import (
     DISCORD_FILE_SIZE_LIMIT_NITRO,
     DISCORD_FILE_SIZE_LIMIT_REGULAR,
@@ -25,6 +27,7 @@ from src.tgraph_bot.utils.discord.discord_file_utils import (
     format_file_size,
     format_next_update_timestamp,
     upload_files_to_channel,
+    upload_discord_files_to_user_dm,
     upload_files_to_user_dm,
     validate_file_for_discord,
 )
@@ -170,6 +173,23 @@ class TestDiscordFileCreation:
             _, kwargs = call_args  # pyright: ignore[reportAny]
             assert kwargs.get("filename") == "custom.png"  # pyright: ignore[reportAny]
 
+    def test_create_discord_file_in_memory(self, tmp_path: Path) -> None:
+        """Test creating Discord file object from a graph rendered in memory."""
+        graph_path = tmp_path / "daily_play_count.png"
+        image_store = GraphImageStore()
+        image_store.put(graph_path, b"test image data", archive=False)
+
+        with patch(
+            "src.tgraph_bot.utils.discord.discord_file_utils.get_graph_image_store",
+            return_value=image_store,
+        ):
+            result = create_discord_file_safe(graph_path)
+
+        assert result is not None
+        assert result.filename == "daily_play_count.png"
+        assert result.fp.read() == b"test image data"
+        assert not graph_path.exists()
+
 
 class TestChannelUpload:
     """Test cases for channel file upload functionality."""
@@ -319,6 +339,20 @@ class TestUserDMUpload:
             _, kwargs = call_args  # pyright: ignore[reportAny]
             assert kwargs.get("embed") == test_embed  # pyright: ignore[reportAny]
 
+    @pytest.mark.asyncio
+    async def test_uploaded_files_are_closed(self) -> None:
+        """Test that Discord files uploaded to a DM are closed afterwards."""
+        mock_user = AsyncMock(spec=discord.User)
+        mock_user.send.side_effect = discord.HTTPException(  # pyright: ignore[reportAny]
+            response=MagicMock(), message="Request failed"
+        )
+        discord_file = discord.File(io.BytesIO(b"\x89PNG"), filename="graph.png")
+
+        result = await upload_discord_files_to_user_dm(mock_user, [discord_file])
+
+        assert result.success is False
+        assert discord_file.fp.closed
+
 
 class TestUtilityFunctions:
     """Test cases for utility functions."""
@@ -0,0 +1,280 @@
+"""
+Tests for graph posting in TGraph Bot.
+
+This module tests that GraphPoster packs graphs into as few messages as
+Discord's limits allow, sends messages concurrently within its bound,
+edits previous graph messages in place and reports the outcome of every
+graph file.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+import pytest
+
+from src.tgraph_bot.utils.discord.discord_file_utils import create_discord_file_safe
+from src.tgraph_bot.utils.discord.graph_posting import GraphPoster
+
+
+def _graph_files(directory: Path, count: int, size: int = 100) -> list[str]:
+    """Create graph image files of the given size."""
+    paths: list[str] = []
+    for index in range(count):
+        path = directory / f"graph_{index}.png"
+        _ = path.write_bytes(b"\x89PNG" + b"\0" * (size - 4))
+        paths.append(str(path))
+    return paths
+
+
+def _channel() -> MagicMock:
+    """Create a channel whose messages get increasing IDs."""
+    channel = MagicMock(spec=discord.TextChannel)
+    message_ids = iter(range(1, 100))
+
+    async def send(**_kwargs: object) -> MagicMock:
+        message = MagicMock(spec=discord.Message)
+        message.id = next(message_ids)
+        return message
+
+    channel.send = AsyncMock(side_effect=send)
+    return channel
+
+
+def _http_error(status: int) -> discord.HTTPException:
+    """Create a Discord HTTP error with the given status."""
+    response = MagicMock()
+    response.status = status
+    if status == 403:
+        return discord.Forbidden(response=response, message="Missing Permissions")
+    return discord.HTTPException(response=response, message="Request failed")
+
+
+class TestGraphPoster:
+    """Test cases for GraphPoster."""
+
+    @pytest.mark.asyncio
+    async def test_graphs_are_packed_into_messages(self, tmp_path: Path) -> None:
+        """Test that up to 10 graphs with their embeds share one message."""
+        channel = _channel()
+        graph_files = _graph_files(tmp_path, 12)
+
+        report = await GraphPoster(channel).post(graph_files)
+
+        send_mock = cast(AsyncMock, channel.send)
+        assert send_mock.await_count == 2
+        sizes = sorted(
+            len(call.kwargs["files"])  # pyright: ignore[reportAny]
+            for call in send_mock.await_args_list
+        )
+        assert sizes == [2, 10]
+        first_call = send_mock.await_args_list[0]
+        embeds: list[discord.Embed] = first_call.kwargs["embeds"]  # pyright: ignore[reportAny]
+        assert len(embeds) == len(first_call.kwargs["files"])  # pyright: ignore[reportAny]
+
+        assert report.posted_count == 12
+        assert [outcome.graph_file for outcome in report.outcomes] == graph_files
+        assert sorted(report.message_ids) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_message_size_limit(self, tmp_path: Path) -> None:
+        """Test that graphs are split when a message would be too large."""
+        channel = _channel()
+        graph_files = _graph_files(tmp_path, 4, size=1000)
+
+        report = await GraphPoster(channel, max_message_bytes=2500).post(graph_files)
+
+        send_mock = cast(AsyncMock, channel.send)
+        assert send_mock.await_count == 2
+        assert report.posted_count == 4
+
+    @pytest.mark.asyncio
+    async def test_invalid_files_are_reported(self, tmp_path: Path) -> None:
+        """Test that missing files fail without stopping the others."""
+        channel = _channel()
+        graph_files = [*_graph_files(tmp_path, 2), str(tmp_path / "missing.png")]
+
+        report = await GraphPoster(channel).post(graph_files)
+
+        assert report.posted_count == 2
+        assert [failure.graph_file for failure in report.failures] == [graph_files[2]]
+        assert isinstance(report.failures[0].error, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_rejected_message_is_posted_separately(self, tmp_path: Path) -> None:
+        """Test that graphs of a rejected message are retried one by one."""
+        graph_files = _graph_files(tmp_path, 3)
+        channel = _channel()
+        error = _http_error(400)
+        sent_files: list[int] = []
+
+        async def send(**kwargs: object) -> MagicMock:
+            files = kwargs["files"]
+            assert isinstance(files, list)
+            sent_files.append(len(files))  # pyright: ignore[reportUnknownArgumentType]
+            # The combined message and the message of the second graph fail
+            if len(sent_files) in (1, 3):
+                raise error
+            message = MagicMock(spec=discord.Message)
+            message.id = len(sent_files)
+            return message
+
+        channel.send = AsyncMock(side_effect=send)
+
+        report = await GraphPoster(channel).post(graph_files)
+
+        assert sent_files == [3, 1, 1, 1]
+        assert [outcome.posted for outcome in report.outcomes] == [True, False, True]
+        assert report.outcomes[1].error is error
+
+    @pytest.mark.asyncio
+    async def test_missing_permissions_fail_all_graphs(self, tmp_path: Path) -> None:
+        """Test that a permission error is not retried graph by graph."""
+        channel = _channel()
+        channel.send = AsyncMock(side_effect=_http_error(403))
+
+        report = await GraphPoster(channel).post(_graph_files(tmp_path, 3))
+
+        send_mock = cast(AsyncMock, channel.send)
+        assert send_mock.await_count == 1
+        assert report.posted_count == 0
+        assert all(
+            isinstance(failure.error, discord.Forbidden) for failure in report.failures
+        )
+
+    @pytest.mark.asyncio
+    async def test_messages_are_sent_concurrently(self, tmp_path: Path) -> None:
+        """Test that messages are sent at the same time within the bound."""
+        channel = _channel()
+        in_flight = 0
+        peak = 0
+
+        async def send(**_kwargs: object) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(spec=discord.Message)
+
+        channel.send = AsyncMock(side_effect=send)
+        poster = GraphPoster(
+            channel, max_concurrent_messages=2, max_attachments_per_message=1
+        )
+
+        report = await poster.post(_graph_files(tmp_path, 5))
+
+        assert report.posted_count == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_previous_messages_are_edited(self, tmp_path: Path) -> None:
+        """Test that graphs replace their previous message, new graphs are sent."""
+        channel = _channel()
+        edited = MagicMock(spec=discord.Message)
+        edited.id = 500
+        partial_message = MagicMock(spec=discord.PartialMessage)
+        partial_message.edit = AsyncMock(return_value=edited)
+        channel.get_partial_message = MagicMock(return_value=partial_message)
+        graph_files = [
+            str(path)
+            for path in (
+                tmp_path / "top_10_users_20250101_120000.png",
+                tmp_path / "top_10_platforms_20250101_120000.png",
+            )
+        ]
+        for graph_file in graph_files:
+            _ = Path(graph_file).write_bytes(b"\x89PNG" + b"\0" * 96)
+
+        report = await GraphPoster(channel).post(graph_files, {"top_10_users": 500})
+
+        cast(MagicMock, channel.get_partial_message).assert_called_once_with(500)
+        edit_mock = cast(AsyncMock, partial_message.edit)
+        attachments: list[discord.File] = edit_mock.await_args.kwargs["attachments"]  # pyright: ignore[reportOptionalMemberAccess, reportAny]
+        assert [file.filename for file in attachments] == [Path(graph_files[0]).name]
+        assert cast(AsyncMock, channel.send).await_count == 1
+        assert [outcome.edited for outcome in report.outcomes] == [True, False]
+        assert report.graph_messages == {"top_10_users": 500, "top_10_platforms": 1}
+
+    @pytest.mark.asyncio
+    async def test_deleted_previous_message_is_replaced(self, tmp_path: Path) -> None:
+        """Test that graphs whose message was deleted are posted anew."""
+        channel = _channel()
+        partial_message = MagicMock(spec=discord.PartialMessage)
+        partial_message.edit = AsyncMock(
+            side_effect=discord.NotFound(response=MagicMock(), message="Unknown")
+        )
+        channel.get_partial_message = MagicMock(return_value=partial_message)
+        graph_files = _graph_files(tmp_path, 2)
+
+        report = await GraphPoster(channel).post(
+            graph_files, {"graph_0": 500, "graph_1": 500}
+        )
+
+        assert cast(AsyncMock, channel.send).await_count == 1
+        assert report.posted_count == 2
+        assert report.message_ids == [1]
+
+    @pytest.mark.asyncio
+    async def test_sent_files_are_closed(self, tmp_path: Path) -> None:
+        """Test that graph files are closed once their message was sent."""
+        channel = _channel()
+        graph_files = _graph_files(tmp_path, 2)
+
+        _ = await GraphPoster(channel).post(graph_files)
+
+        files: list[discord.File] = cast(AsyncMock, channel.send).await_args.kwargs[  # pyright: ignore[reportOptionalMemberAccess]
+            "files"
+        ]
+        assert all(file.fp.closed for file in files)
+
+    @pytest.mark.asyncio
+    async def test_files_are_closed_when_one_cannot_be_read(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that files created before an unreadable graph are closed."""
+        channel = _channel()
+        graph_files = _graph_files(tmp_path, 2)
+        created: list[discord.File] = []
+
+        def create_file(path: str | Path) -> discord.File | None:
+            if Path(path).name == "graph_1.png" and len(created) == 1:
+                return None
+            discord_file = create_discord_file_safe(path)
+            assert discord_file is not None
+            created.append(discord_file)
+            return discord_file
+
+        with patch(
+            "src.tgraph_bot.utils.discord.graph_posting.create_discord_file_safe",
+            side_effect=create_file,
+        ):
+            report = await GraphPoster(channel).post(graph_files)
+
+        assert [outcome.posted for outcome in report.outcomes] == [True, False]
+        assert len(created) == 2
+        assert all(file.fp.closed for file in created)
+
+    @pytest.mark.asyncio
+    async def test_files_of_failed_edits_are_closed(self, tmp_path: Path) -> None:
+        """Test that files are closed when an edit falls back to a new message."""
+        channel = _channel()
+        edited_files: list[discord.File] = []
+
+        async def edit(**kwargs: object) -> None:
+            edited_files.extend(cast(list[discord.File], kwargs["attachments"]))
+            raise discord.NotFound(response=MagicMock(), message="Unknown")
+
+        partial_message = MagicMock(spec=discord.PartialMessage)
+        partial_message.edit = AsyncMock(side_effect=edit)
+        channel.get_partial_message = MagicMock(return_value=partial_message)
+
+        report = await GraphPoster(channel).post(
+            _graph_files(tmp_path, 1), {"graph_0": 500}
+        )
+
+        assert report.posted_count == 1
+        assert edited_files
+        assert all(file.fp.closed for file in edited_files)
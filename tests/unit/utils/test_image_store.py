@@ -0,0 +1,84 @@
+"""
+Tests for in-memory graph images in TGraph Bot.
+
+This module tests keeping graph images in memory, the size bound of the
+store and that archiving, moving and deleting files on disk happen in the
+order they were requested.
+"""
+
+from pathlib import Path
+
+from src.tgraph_bot.utils.core.image_store import GraphImageStore
+
+
+class TestGraphImageStore:
+    """Test cases for GraphImageStore."""
+
+    def test_images_without_archive_stay_in_memory(self, tmp_path: Path) -> None:
+        """Test that images are available without writing a file."""
+        store = GraphImageStore()
+        path = tmp_path / "graph.png"
+
+        store.put(path, b"image", archive=False)
+
+        assert store.exists(path)
+        assert store.size(path) == 5
+        with store.open(path) as image:
+            assert image.read() == b"image"
+        assert not path.exists()
+
+    def test_archive_is_written_in_background(self, tmp_path: Path) -> None:
+        """Test that archived images are written to their path."""
+        store = GraphImageStore()
+        path = tmp_path / "2024-03-01" / "graph.png"
+
+        store.put(path, b"image")
+        store.flush()
+
+        assert path.read_bytes() == b"image"
+        store.shutdown()
+
+    def test_move_and_delete_follow_the_archive(self, tmp_path: Path) -> None:
+        """Test that archived files are moved and deleted after being written."""
+        store = GraphImageStore()
+        source = tmp_path / "graph.png"
+        destination = tmp_path / "user" / "graph.png"
+        destination.parent.mkdir()
+
+        store.put(source, b"image")
+        store.move(source, destination)
+        store.flush()
+
+        assert store.get(source) is None
+        assert store.get(destination) == b"image"
+        assert destination.read_bytes() == b"image"
+        assert not source.exists()
+
+        store.delete(destination)
+        store.flush()
+
+        assert not store.exists(destination)
+        store.shutdown()
+
+    def test_oldest_images_are_evicted(self, tmp_path: Path) -> None:
+        """Test that the store keeps at most max_bytes of images."""
+        store = GraphImageStore(max_bytes=10)
+
+        store.put(tmp_path / "first.png", b"123456", archive=False)
+        store.put(tmp_path / "second.png", b"123456", archive=False)
+
+        assert store.get(tmp_path / "first.png") is None
+        assert store.get(tmp_path / "second.png") == b"123456"
+
+    def test_take_keeps_archived_file(self, tmp_path: Path) -> None:
+        """Test that taking an image only removes it from memory."""
+        store = GraphImageStore()
+        path = tmp_path / "graph.png"
+
+        store.put(path, b"image")
+        store.flush()
+
+        assert store.take(path) == b"image"
+        assert store.get(path) is None
+        assert store.exists(path)
+        store.shutdown()
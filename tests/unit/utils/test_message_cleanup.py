@@ -0,0 +1,227 @@
+"""
+Tests for message cleanup in TGraph Bot.
+
+This module tests that tracked graph messages are deleted by ID, in bulk
+when they are young enough, that untracked channels fall back to scanning
+the channel history, and that graph messages edited in place are kept.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from pathlib import Path
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from src.tgraph_bot.bot.scheduling.persistence import PostedMessageStore
+from src.tgraph_bot.utils.discord.graph_posting import (
+    GraphPostOutcome,
+    GraphPostReport,
+)
+from src.tgraph_bot.utils.discord.message_cleanup import (
+    cleanup_bot_messages,
+    track_posted_graphs,
+)
+
+BOT_USER_ID = 123456789
+CHANNEL_ID = 987654321
+
+
+def _message_id(age: timedelta) -> int:
+    """Create a message ID for a message posted the given time ago."""
+    return discord.utils.time_snowflake(discord.utils.utcnow() - age)
+
+
+def _channel(manage_messages: bool = True) -> MagicMock:
+    """Create a channel whose partial messages can be deleted."""
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.id = CHANNEL_ID
+    channel.name = "graphs"
+    channel.permissions_for.return_value.manage_messages = manage_messages  # pyright: ignore[reportAny]
+    channel.delete_messages = AsyncMock()
+    partial_messages: dict[int, MagicMock] = {}
+
+    def get_partial_message(message_id: int) -> MagicMock:
+        message = partial_messages.setdefault(
+            message_id, MagicMock(spec=discord.PartialMessage)
+        )
+        message.id = message_id
+        message.delete = AsyncMock()
+        return message
+
+    channel.get_partial_message = MagicMock(side_effect=get_partial_message)
+    return channel
+
+
+def _deleted_ids(channel: MagicMock) -> list[int]:
+    """Get the IDs of the messages deleted one at a time."""
+    get_partial_message = cast(MagicMock, channel.get_partial_message)
+    return [cast(int, call.args[0]) for call in get_partial_message.call_args_list]
+
+
+class TestCleanupBotMessages:
+    """Test cases for cleanup_bot_messages."""
+
+    @pytest.mark.asyncio
+    async def test_young_messages_are_bulk_deleted(self, tmp_path: Path) -> None:
+        """Test that tracked messages under 14 days old are bulk deleted."""
+        store = PostedMessageStore(tmp_path / "posted_messages.json")
+        young = [_message_id(timedelta(days=days)) for days in (1, 2, 3)]
+        old = _message_id(timedelta(days=20))
+        store.set_message_ids(CHANNEL_ID, [*young, old])
+        channel = _channel()
+
+        report = await cleanup_bot_messages(channel, BOT_USER_ID, store)
+
+        delete_messages = cast(AsyncMock, channel.delete_messages)
+        delete_messages.assert_awaited_once()
+        bulk: list[discord.Object] = delete_messages.await_args.args[0]  # pyright: ignore[reportOptionalMemberAccess, reportAny]
+        assert [message.id for message in bulk] == young
+        assert _deleted_ids(channel) == [old]
+        assert report.deleted == 4
+        assert store.get_message_ids(CHANNEL_ID) == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_needs_manage_messages(self, tmp_path: Path) -> None:
+        """Test that messages are deleted one by one without Manage Messages."""
+        store = PostedMessageStore(tmp_path / "posted_messages.json")
+        message_ids = [_message_id(timedelta(hours=hours)) for hours in (1, 2)]
+        store.set_message_ids(CHANNEL_ID, message_ids)
+        channel = _channel(manage_messages=False)
+
+        report = await cleanup_bot_messages(channel, BOT_USER_ID, store)
+
+        cast(AsyncMock, channel.delete_messages).assert_not_awaited()
+        assert _deleted_ids(channel) == message_ids
+        assert report.deleted == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_bulk_delete_falls_back(self, tmp_path: Path) -> None:
+        """Test that a rejected bulk delete is retried one message at a time."""
+        store = PostedMessageStore(tmp_path / "posted_messages.json")
+        message_ids = [_message_id(timedelta(hours=hours)) for hours in (1, 2)]
+        store.set_message_ids(CHANNEL_ID, message_ids)
+        channel = _channel()
+        channel.delete_messages = AsyncMock(
+            side_effect=discord.HTTPException(
+                response=MagicMock(status=400), message="Bad Request"
+            )
+        )
+
+        report = await cleanup_bot_messages(channel, BOT_USER_ID, store)
+
+        assert _deleted_ids(channel) == message_ids
+        assert report.deleted == 2
+
+    @pytest.mark.asyncio
+    async def test_untracked_channel_scans_history(self, tmp_path: Path) -> None:
+        """Test that an untracked channel is cleaned up from its history once."""
+        store = PostedMessageStore(tmp_path / "posted_messages.json")
+        bot_message = MagicMock(spec=discord.Message)
+        bot_message.author.id = BOT_USER_ID  # pyright: ignore[reportAny]
+        bot_message.delete = AsyncMock()
+        user_message = MagicMock(spec=discord.Message)
+        user_message.author.id = 42  # pyright: ignore[reportAny]
+        user_message.delete = AsyncMock()
+
+        async def history(**_kwargs: object) -> AsyncIterator[MagicMock]:
+            for message in (bot_message, user_message):
+                yield message
+
+        channel = _channel()
+        channel.history = history
+
+        _ = await cleanup_bot_messages(channel, BOT_USER_ID, store)
+
+        cast(AsyncMock, bot_message.delete).assert_awaited_once()
+        cast(AsyncMock, user_message.delete).assert_not_awaited()
+        assert store.get_message_ids(CHANNEL_ID) == []
+
+    @pytest.mark.asyncio
+    async def test_undeleted_messages_stay_tracked(self, tmp_path: Path) -> None:
+        """Test that messages that could not be deleted are retried next time."""
+        store = PostedMessageStore(tmp_path / "posted_messages.json")
+        message_id = _message_id(timedelta(days=30))
+        store.set_message_ids(CHANNEL_ID, [message_id])
+        channel = _channel()
+        failing_message = MagicMock(spec=discord.PartialMessage)
+        failing_message.id = message_id
+        failing_message.delete = AsyncMock(
+            side_effect=discord.Forbidden(response=MagicMock(), message="Forbidden")
+        )
+        channel.get_partial_message = MagicMock(return_value=failing_message)
+
+        report = await cleanup_bot_messages(channel, BOT_USER_ID, store)
+
+        assert report.errors == 1
+        assert store.get_message_ids(CHANNEL_ID) == [message_id]
+
+
+class TestPostedMessageStore:
+    """Test cases for PostedMessageStore."""
+
+    def test_message_ids_are_persisted(self, tmp_path: Path) -> None:
+        """Test that added message IDs are kept per channel across instances."""
+        path = tmp_path / "posted_messages.json"
+        PostedMessageStore(path).add_message_ids(CHANNEL_ID, [1, 2])
+        PostedMessageStore(path).add_message_ids(CHANNEL_ID, [2, 3])
+
+        store = PostedMessageStore(path)
+        assert store.get_message_ids(CHANNEL_ID) == [1, 2, 3]
+        assert store.get_message_ids(1) is None
+
+    def test_corrupted_file_is_ignored(self, tmp_path: Path) -> None:
+        """Test that a corrupted file leaves channels untracked."""
+        path = tmp_path / "posted_messages.json"
+        _ = path.write_text("{not json", encoding="utf-8")
+
+        assert PostedMessageStore(path).get_message_ids(CHANNEL_ID) is None
+
+
+class TestTrackPostedGraphs:
+    """Test cases for tracking graphs edited in place."""
+
+    @pytest.mark.asyncio
+    async def test_graph_messages_are_kept_for_editing(self, tmp_path: Path) -> None:
+        """Test that cleanup keeps messages whose graphs are edited in place."""
+        store = PostedMessageStore(tmp_path / "posted_messages.json")
+        message_id = _message_id(timedelta(days=1))
+        store.set_message_ids(CHANNEL_ID, [message_id])
+        store.set_graph_messages(CHANNEL_ID, {"top_10_users": message_id})
+        channel = _channel()
+
+        report = await cleanup_bot_messages(
+            channel, BOT_USER_ID, store, keep_graph_messages=True
+        )
+
+        assert report.deleted == 0
+        cast(AsyncMock, channel.delete_messages).assert_not_awaited()
+        assert store.get_message_ids(CHANNEL_ID) == [message_id]
+
+    @pytest.mark.asyncio
+    async def test_messages_without_graphs_are_deleted(self, tmp_path: Path) -> None:
+        """Test that messages left without graphs after editing are deleted."""
+        store = PostedMessageStore(tmp_path / "posted_messages.json")
+        kept, emptied = (_message_id(timedelta(days=days)) for days in (1, 2))
+        store.set_message_ids(CHANNEL_ID, [kept, emptied])
+        channel = _channel()
+        report = GraphPostReport(
+            outcomes=(
+                GraphPostOutcome(
+                    "top_10_users_20250101_120000.png",
+                    posted=True,
+                    message_id=kept,
+                    edited=True,
+                ),
+            )
+        )
+
+        await track_posted_graphs(channel, report, store, edited_in_place=True)
+
+        delete_messages = cast(AsyncMock, channel.delete_messages)
+        bulk: list[discord.Object] = delete_messages.await_args.args[0]  # pyright: ignore[reportOptionalMemberAccess, reportAny]
+        assert [message.id for message in bulk] == [emptied]
+        assert store.get_message_ids(CHANNEL_ID) == [kept]
+        assert store.get_graph_messages(CHANNEL_ID) == {"top_10_users": kept}